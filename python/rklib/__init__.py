@@ -0,0 +1,237 @@
+#
+# Python interface to rklib (through its C interface, `src/rklib_c_module.F90`).
+#
+# The derivative function is a compiled C function with the interface:
+#
+#   void rhs(int n, double t, const double *x, double *xdot, void *data);
+#
+# so there is no Python in the inner loop of the integration. It can be, for example,
+# a Numba `cfunc` (with the signature `RHS_SIGNATURE`), a function from a C library
+# loaded with ctypes, or any function address. A Python callable `f(t, x) -> xdot` is
+# also accepted, for convenience (but it is much slower).
+#
+# Example:
+#
+#   import numba
+#   import numpy as np
+#   import rklib
+#
+#   @numba.cfunc(rklib.RHS_SIGNATURE)
+#   def rhs(n, t, x, xdot, data):
+#       xdot[0] = x[1]
+#       xdot[1] = -x[0]
+#
+#   s = rklib.Integrator('rkdp54', 2, rhs, rtol=1e-10, atol=1e-10)
+#   xf = s.integrate(0.0, [1.0, 0.0], 10.0)
+#   xf, status = s.integrate_batch(0.0, np.random.rand(1000, 2), 10.0)
+#
+# The library must be compiled as a shared library (see the README). Its path can be
+# given with the `RKLIB_LIBRARY` environment variable, or with `load_library`.
+#
+# The `rklib.reference` module is a NumPy integrator that uses the same tableaus, and
+# doesn't need the library. The `rklib.trajectory` module reads the trajectory files
+# written by the library.
+#
+
+import ctypes
+import os
+from ctypes import POINTER, c_char_p, c_double, c_int, c_void_p
+
+import numpy as np
+
+__all__ = ['RKLibError', 'Integrator', 'load_library', 'methods', 'RHS_CTYPE', 'RHS_SIGNATURE']
+
+RHS_CTYPE = ctypes.CFUNCTYPE(None, c_int, c_double, POINTER(c_double), POINTER(c_double), c_void_p)
+"""The ctypes type of the derivative function."""
+
+RHS_SIGNATURE = 'void(intc, float64, CPointer(float64), CPointer(float64), voidptr)'
+"""The Numba `cfunc` signature of the derivative function."""
+
+RKLIB_ERROR_NO_DENSE_OUTPUT = -12
+
+_lib = None
+
+class RKLibError(RuntimeError):
+    """An integration failed. `status` is the status code (see `rk_class_status`)."""
+    def __init__(self, message : str, status : int):
+        super().__init__(f'{message} (status {status})')
+        self.status = status
+
+def load_library(path : str = None):
+    """Load the rklib shared library (by default, from the `RKLIB_LIBRARY`
+    environment variable, or `librklib.so` in the library search path)."""
+    global _lib
+    if path is None:
+        path = os.environ.get('RKLIB_LIBRARY', 'librklib.so')
+    lib = ctypes.CDLL(path)
+    p = POINTER(c_double)
+    lib.rklib_create.argtypes = [c_char_p, c_int, c_void_p, c_void_p, c_double, c_double]
+    lib.rklib_create.restype = c_void_p
+    lib.rklib_destroy.argtypes = [c_void_p]
+    lib.rklib_destroy.restype = None
+    lib.rklib_integrate.argtypes = [c_void_p, c_double, p, c_double, c_double, p]
+    lib.rklib_integrate.restype = c_int
+    lib.rklib_integrate_batch.argtypes = [c_void_p, c_int, p, p, c_double, p, p, POINTER(c_int)]
+    lib.rklib_integrate_batch.restype = c_int
+    lib.rklib_integrate_dense.argtypes = [c_void_p, c_double, p, c_double, c_int, p, p]
+    lib.rklib_integrate_dense.restype = c_int
+    lib.rklib_evaluations.argtypes = [c_void_p]
+    lib.rklib_evaluations.restype = c_int
+    lib.rklib_status_message.argtypes = [c_void_p, c_char_p, c_int]
+    lib.rklib_status_message.restype = c_int
+    lib.rklib_method_name.argtypes = [c_int, c_char_p, c_int]
+    lib.rklib_method_name.restype = c_int
+    _lib = lib
+    return lib
+
+def _library():
+    return _lib if _lib is not None else load_library()
+
+def methods():
+    """The short names of all the methods in the library."""
+    lib = _library()
+    names = []
+    buffer = ctypes.create_string_buffer(64)
+    while lib.rklib_method_name(len(names) + 1, buffer, len(buffer)) > 0:
+        names.append(buffer.value.decode())
+    return names
+
+def _input(x, shape : tuple = None):
+    """A C-contiguous float64 array (no copy if `x` already is one)."""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    if shape is not None:
+        x = np.broadcast_to(x, shape)
+        if not x.flags.c_contiguous:
+            x = np.ascontiguousarray(x)
+    return x
+
+def _output(out, shape : tuple, *inputs):
+    """The output array: `out` if it is given (it is checked, and must not overlap
+    the `inputs`, since the arrays are used in place), otherwise a new one."""
+    if out is None:
+        return np.empty(shape, dtype=np.float64)
+    if out.shape != shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+        raise ValueError(f'out must be a C-contiguous float64 array with shape {shape}')
+    if any(np.may_share_memory(out, x) for x in inputs):
+        raise ValueError('out must not overlap the inputs')
+    return out
+
+def _ptr(x, ctype=c_double):
+    return x.ctypes.data_as(POINTER(ctype))
+
+class Integrator:
+    """An integrator for the method `method` (its short name, see `methods`), for a
+    system of `n` equations with the derivative function `rhs`. `data` is a pointer
+    (or an object with a ctypes address, e.g. a NumPy array) that is passed to `rhs`.
+    The tolerances are only used by the variable-step methods."""
+
+    def __init__(self, method : str, n : int, rhs, rtol : float = 1e-8, atol : float = 1e-8, data=None):
+        self._handle = None
+        self._lib = _library()
+        self.n = n
+        self.method = method
+        self._rhs_wrapper = None  # the ctypes function of `rhs` (a reference is kept while it is used)
+        self._rhs = self._function_pointer(rhs)
+        self._data = data
+        self._handle = self._lib.rklib_create(method.encode(), n, self._rhs, self._data_pointer(data),
+                                              rtol, atol)
+        if not self._handle:
+            raise ValueError(f'unknown method: {method}')
+
+    def _function_pointer(self, rhs):
+        if hasattr(rhs, 'address'):  # Numba cfunc
+            return rhs.address
+        if isinstance(rhs, int):
+            return rhs
+        if isinstance(rhs, ctypes._CFuncPtr):
+            self._rhs_wrapper = rhs
+            return ctypes.cast(rhs, c_void_p).value
+        if callable(rhs):  # Python function f(t, x) -> xdot
+            def f(n, t, x, xdot, data):
+                xdot_array = np.ctypeslib.as_array(xdot, shape=(n,))
+                xdot_array[:] = rhs(t, np.ctypeslib.as_array(x, shape=(n,)))
+            self._rhs_wrapper = RHS_CTYPE(f)
+            return ctypes.cast(self._rhs_wrapper, c_void_p).value
+        raise TypeError('rhs must be a C function pointer, a Numba cfunc, or a callable')
+
+    @staticmethod
+    def _data_pointer(data):
+        if data is None:
+            return None
+        if isinstance(data, int):
+            return data
+        if isinstance(data, np.ndarray):
+            return data.ctypes.data
+        return ctypes.addressof(data)
+
+    def close(self):
+        """Destroy the integrator (it cannot be used after that)."""
+        if self._handle:
+            self._lib.rklib_destroy(self._handle)
+            self._handle = None
+        self._rhs_wrapper = None
+
+    def _open_handle(self):
+        """The handle of the integrator (it is an error if it is closed)."""
+        if not self._handle:
+            raise ValueError('the integrator is closed')
+        return self._handle
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def evaluations(self):
+        """Number of derivative function evaluations of the last integration."""
+        return self._lib.rklib_evaluations(self._open_handle())
+
+    def _check(self, status : int):
+        if status < 0:
+            buffer = ctypes.create_string_buffer(128)
+            self._lib.rklib_status_message(self._handle, buffer, len(buffer))
+            raise RKLibError(buffer.value.decode() or 'integration failed', status)
+
+    def integrate(self, t0 : float, x0, tf : float, h : float = 0.0, out=None):
+        """Integrate from `t0` to `tf`, and return the final state. `h` is the step size
+        (fixed-step methods) or the initial step size (variable-step methods, 0 to compute it)."""
+        x0 = _input(x0, (self.n,))
+        xf = _output(out, (self.n,), x0)
+        self._check(self._lib.rklib_integrate(self._open_handle(), t0, _ptr(x0), h, tf, _ptr(xf)))
+        return xf
+
+    def integrate_batch(self, t0, x0, tf, h : float = 0.0, out=None):
+        """Integrate a batch of initial states `x0` (shape `(m, n)`), from `t0` to `tf`
+        (scalars, or arrays of size `m`). Returns the final states (shape `(m, n)`) and
+        the status code of each integration. If the library is compiled with OpenMP,
+        the batch is distributed over the threads (so `rhs` must be thread-safe)."""
+        x0 = _input(x0)
+        if x0.ndim != 2 or x0.shape[1] != self.n:
+            raise ValueError(f'x0 must have shape (m, {self.n})')
+        m = x0.shape[0]
+        t0 = _input(t0, (m,))
+        tf = _input(tf, (m,))
+        xf = _output(out, (m, self.n), x0, t0, tf)
+        status = np.empty(m, dtype=np.intc)
+        self._lib.rklib_integrate_batch(self._open_handle(), m, _ptr(t0), _ptr(x0), h, _ptr(tf), _ptr(xf),
+                                        _ptr(status, c_int))
+        return xf, status
+
+    def integrate_dense(self, t0 : float, x0, tout, h : float = 0.0, out=None):
+        """Integrate from `t0`, and return the states at the output times `tout` (shape
+        `(len(tout), n)`), computed with the dense output of the method. The last output
+        time is the final time."""
+        x0 = _input(x0, (self.n,))
+        tout = _input(tout)
+        xout = _output(out, (tout.size, self.n), x0, tout)
+        status = self._lib.rklib_integrate_dense(self._open_handle(), t0, _ptr(x0), h, tout.size, _ptr(tout),
+                                                 _ptr(xout))
+        if status == RKLIB_ERROR_NO_DENSE_OUTPUT:
+            raise RKLibError(f'{self.method} does not have a dense output', status)
+        self._check(status)
+        return xout
@@ -0,0 +1,235 @@
+#
+# Reference integrator for a batch of states, in pure Python and NumPy.
+#
+# It uses the Butcher tableaus of the library (`tableaus.py`, which is generated from the
+# same registry as the Fortran step functions), so the methods can be used, and the
+# results of the library cross-checked, without compiling it. The low-storage methods
+# that are not in the registry are not available.
+#
+# The whole batch is integrated at once: the stages are `(m, n)` arrays, and their
+# combinations are matrix products with the rows of the tableau. For the variable-step
+# methods, each member of the batch has its own step size, and the steps are accepted
+# or rejected member by member (the step size controller is the elementary one of
+# `stepsize_class`, with its default parameters). The members that are finished are
+# removed from the batch.
+#
+# The derivative function is vectorized over the batch: `f(t, x)`, with `t` of shape
+# `(m,)` and `x` of shape `(m, n)`, returns the derivatives with shape `(m, n)`. Since
+# the finished members are removed, `m` changes during the integration.
+#
+# Example:
+#
+#   import numpy as np
+#   from rklib import reference
+#
+#   def f(t, x):
+#       return np.stack([x[:, 1], -x[:, 0]], axis=1)
+#
+#   result = reference.integrate('rkdp54', f, 0.0, np.random.rand(1000, 2), 10.0,
+#                                rtol=1e-10, atol=1e-10)
+#   result.x, result.status, result.num_steps
+#
+
+from collections import namedtuple
+
+import numpy as np
+
+from .tableaus import methods as _tableaus
+
+__all__ = ['Method', 'Result', 'methods', 'integrate']
+
+# status codes (the same as in the library):
+RKLIB_ERROR_NONE                = 0
+RKLIB_ERROR_TOO_MANY_REDUCTIONS = -4
+RKLIB_ERROR_TOO_MANY_STEPS      = -10
+
+# default parameters of `stepsize_class`:
+HFACTOR_REJECT = 0.5
+HFACTOR_ACCEPT = 2.0
+SAFETY_FACTOR  = 0.9
+MAX_ATTEMPTS   = 10000
+SMALL          = 10.0 * np.finfo(float).eps
+
+Result = namedtuple('Result', ['x', 't', 'status', 'num_steps', 'num_rejected', 'num_f_evals'])
+Result.__doc__ = """The result of `integrate`, for each member of the batch: the final state
+(shape `(m, n)`) and time, the status code (0 if the integration was successful), and
+the numbers of accepted steps, rejected steps and function evaluations."""
+
+def methods():
+    """The short names of the methods that are available."""
+    return list(_tableaus)
+
+def _weights(coefficients : dict, s : int):
+    w = np.zeros(s)
+    for j, b in coefficients.items():
+        w[j] = b
+    return w
+
+class Method:
+    """The Butcher tableau of a method (`name` is its short name, see `methods`)."""
+
+    def __init__(self, name : str):
+        if name not in _tableaus:
+            raise ValueError(f'unknown method: {name}')
+        t = _tableaus[name]
+        self.name = name
+        self.variable = t['type'] == 'variable'
+        self.order = t['order']
+        self.fsal = t['fsal']
+        self.nodes = np.array(t['nodes'])
+        s = self.nodes.size
+        self.matrix = np.zeros((s, s))
+        for i, row in enumerate(t['matrix']):
+            self.matrix[i] = _weights(row, s)
+        self.weights = _weights(t['weights'], s)
+        self.error_weights = self.weights - _weights(t['embedded_weights'], s) if self.variable else None
+
+    @property
+    def stages(self):
+        return self.nodes.size
+
+    def step(self, f, t, x, h, f0, error : bool = True):
+        """Take a step of size `h` (shape `(m,)`) from `(t, x)` for each member, with
+        the derivative `f0` at the start of the step. Returns the solution at `t+h`,
+        the error estimate (`None` for a fixed-step method, or if `error` is false),
+        and the stages (shape `(s, m, n)`)."""
+        s = self.stages
+        k = np.empty((s,) + x.shape)
+        ks = k.reshape(s, -1)  # the stages as the rows of a matrix
+        k[0] = f0
+        hc = h[:, None]
+        for i in range(1, s):
+            xi = x + hc * (self.matrix[i, :i] @ ks[:i]).reshape(x.shape)
+            k[i] = f(t + self.nodes[i] * h, xi)
+        xf = x + hc * (self.weights @ ks).reshape(x.shape)
+        xerr = hc * (self.error_weights @ ks).reshape(x.shape) if self.variable and error else None
+        return xf, xerr, k
+
+def _initial_step(method, f, t, x, f0, direction, hmax, rtol, atol):
+    """Initial step size of each member (the `hinit` algorithm of Hairer, as with
+    `hinit_method=2` in the library). It costs one function evaluation."""
+    sk = atol + rtol * np.abs(x)
+    dnf = np.sum((f0 / sk)**2, axis=1)
+    dny = np.sum((x / sk)**2, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.where((dnf <= 1.0e-10) | (dny <= 1.0e-10), 1.0e-6, np.sqrt(dny / dnf) * 0.01)
+    h = np.minimum(h, hmax) * direction
+    f1 = f(t + h, x + h[:, None] * f0)
+    der2 = np.sqrt(np.sum(((f1 - f0) / sk)**2, axis=1)) / np.abs(h)
+    der12 = np.maximum(der2, np.sqrt(dnf))
+    with np.errstate(divide='ignore'):
+        h1 = np.where(der12 <= 1.0e-15, np.maximum(1.0e-6, np.abs(h) * 1.0e-3),
+                      (0.01 / der12)**(1.0 / method.order))
+    return np.minimum(np.minimum(100.0 * np.abs(h), h1), hmax) * direction
+
+def integrate(method, f, t0, x0, tf, h : float = 0.0, rtol=1.0e-8, atol=1.0e-8,
+              fixed_step : bool = False, hmin : float = 1.0e-6, hmax : float = 1.0e6,
+              max_steps : int = None):
+    """Integrate a batch of initial states `x0` (shape `(m, n)`) from `t0` to `tf`
+    (scalars, or arrays of size `m`) with a method (a `Method`, or its short name).
+
+    For the fixed-step methods (or with `fixed_step`), `h` is the step size. For the
+    variable-step methods, it is the initial step size (0 to compute it). `rtol` and
+    `atol` (scalars or arrays of size `n`), `hmin` and `hmax` are the tolerances and
+    step size bounds of the variable-step methods. `max_steps` is the maximum number
+    of steps of each member (no limit by default). Returns a `Result`."""
+
+    if not isinstance(method, Method):
+        method = Method(method)
+    x = np.array(x0, dtype=float, ndmin=2)
+    m, n = x.shape
+    t = np.array(np.broadcast_to(np.asarray(t0, dtype=float), (m,)))
+    tf = np.array(np.broadcast_to(np.asarray(tf, dtype=float), (m,)))
+    rtol = np.broadcast_to(np.asarray(rtol, dtype=float), (n,))
+    atol = np.broadcast_to(np.asarray(atol, dtype=float), (n,))
+    adaptive = method.variable and not fixed_step
+    direction = np.where(tf >= t, 1.0, -1.0)
+    h0 = abs(h)
+    if not adaptive and h0 <= 0.0:
+        raise ValueError('the step size must be nonzero for fixed-step integration')
+
+    result = Result(x=x.copy(), t=t.copy(), status=np.zeros(m, dtype=int), num_steps=np.zeros(m, dtype=int),
+                    num_rejected=np.zeros(m, dtype=int), num_f_evals=np.zeros(m, dtype=int))
+    attempts = np.zeros(m, dtype=int)  # consecutive rejected steps
+    ids = np.arange(m)                 # the members that are still being integrated
+
+    def remove(done):
+        """Store the results of the `done` members, and remove them from the batch."""
+        nonlocal ids, t, x, tf, h, f0, direction, attempts
+        result.x[ids[done]] = x[done]
+        result.t[ids[done]] = t[done]
+        keep = ~done
+        ids, t, x, tf, h, f0, direction, attempts = \
+            ids[keep], t[keep], x[keep], tf[keep], h[keep], f0[keep], direction[keep], attempts[keep]
+
+    f0 = np.zeros_like(x)
+    h = np.zeros(m)
+    remove(t == tf)
+    if ids.size == 0:
+        return result
+
+    f0 = f(t, x)
+    result.num_f_evals[ids] += 1
+    if adaptive and h0 <= 0.0:
+        h = _initial_step(method, f, t, x, f0, direction, hmax, rtol, atol)
+        result.num_f_evals[ids] += 1
+    else:
+        h = direction * h0
+
+    while ids.size > 0:
+
+        # adjust the last step:
+        last = direction * (t + h - tf) >= 0.0
+        h = np.where(last, tf - t, h)
+
+        xf, xerr, k = method.step(f, t, x, h, f0, adaptive)
+        result.num_f_evals[ids] += method.stages - 1
+
+        if adaptive:
+            # elementary controller of `stepsize_class`, for each member:
+            err = np.abs(xerr)
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                max_err = np.max(err / (rtol * np.abs(xf) + atol), axis=1)
+                hfactor = SAFETY_FACTOR * (1.0 / max_err)**(1.0 / (method.order + 1))
+            small = np.all(err <= SMALL, axis=1)
+            accept = small | (max_err <= 1.0)
+            hfactor = np.where(small, HFACTOR_ACCEPT,
+                               np.where(accept, np.fmin(HFACTOR_ACCEPT, hfactor), np.fmax(HFACTOR_REJECT, hfactor)))
+            h_new = np.copysign(np.clip(np.abs(h) * hfactor, hmin, hmax), h)
+        else:
+            accept = np.ones(ids.size, dtype=bool)
+            h_new = h
+
+        # the accepted members move to the end of the step:
+        t = np.where(accept, np.where(last, tf, t + h), t)
+        np.copyto(x, xf, where=accept[:, None])
+        result.num_steps[ids] += accept
+        result.num_rejected[ids] += ~accept
+        attempts = np.where(accept, 0, attempts + 1)
+        h = h_new
+        done = accept & last
+
+        # derivative at the start of the next step:
+        if method.fsal:
+            np.copyto(f0, k[-1], where=accept[:, None])
+        else:
+            new = accept & ~last
+            if np.all(new):
+                f0 = f(t, x)
+            elif np.any(new):
+                f0[new] = f(t[new], x[new])
+            result.num_f_evals[ids[new]] += 1
+
+        # failures:
+        too_many_reductions = attempts > MAX_ATTEMPTS
+        result.status[ids[too_many_reductions]] = RKLIB_ERROR_TOO_MANY_REDUCTIONS
+        done |= too_many_reductions
+        if max_steps is not None:
+            too_many_steps = ~done & (result.num_steps[ids] >= max_steps)
+            result.status[ids[too_many_steps]] = RKLIB_ERROR_TOO_MANY_STEPS
+            done |= too_many_steps
+
+        if np.any(done):
+            remove(done)
+
+    return result
@@ -0,0 +1,1377 @@
+#
+# Butcher tableaus of the methods, for the NumPy reference integrator (`reference.py`).
+#
+# This file is generated by `scripts/generate_files.py` from `scripts/tableaus.py`.
+# Do not edit it by hand. The coefficients are rounded to double precision, and the
+# stage numbers are 0-based. For each method:
+#
+#   * `type` : `fixed` or `variable`.
+#   * `order` : the order of the method.
+#   * `fsal` : if the last stage is the first stage of the next step.
+#   * `nodes` : the nodes (one per stage).
+#   * `matrix` : the rows of the stage matrix, as `{j: a_ij}` dicts of the nonzero entries.
+#   * `weights` : the weights of the solution, as a `{j: b_j}` dict.
+#   * `embedded_weights` : the weights of the embedded solution (variable-step methods only).
+#
+
+methods = {}
+
+methods['euler'] = {
+    'type': 'fixed',
+    'order': 1,
+    'fsal': False,
+    'nodes': [0.0],
+    'matrix': [{}],
+    'weights': {0: 1.0},
+    }
+
+methods['midpoint'] = {
+    'type': 'fixed',
+    'order': 2,
+    'fsal': False,
+    'nodes': [0.0, 0.5],
+    'matrix': [{},
+               {0: 0.5}],
+    'weights': {1: 1.0},
+    }
+
+methods['heun'] = {
+    'type': 'fixed',
+    'order': 2,
+    'fsal': False,
+    'nodes': [0.0, 1.0],
+    'matrix': [{},
+               {0: 1.0}],
+    'weights': {0: 0.5, 1: 0.5},
+    }
+
+methods['rk3'] = {
+    'type': 'fixed',
+    'order': 3,
+    'fsal': False,
+    'nodes': [0.0, 0.5, 1.0],
+    'matrix': [{},
+               {0: 0.5},
+               {0: -1.0, 1: 2.0}],
+    'weights': {0: 0.16666666666666666, 1: 0.6666666666666666, 2: 0.16666666666666666},
+    }
+
+methods['rk4'] = {
+    'type': 'fixed',
+    'order': 4,
+    'fsal': False,
+    'nodes': [0.0, 0.5, 0.5, 1.0],
+    'matrix': [{},
+               {0: 0.5},
+               {1: 0.5},
+               {2: 1.0}],
+    'weights': {0: 0.16666666666666666, 1: 0.3333333333333333, 2: 0.3333333333333333, 3: 0.16666666666666666},
+    }
+
+methods['rks4'] = {
+    'type': 'fixed',
+    'order': 4,
+    'fsal': False,
+    'nodes': [0.0, 0.01, 0.6, 1.0],
+    'matrix': [{},
+               {0: 0.01},
+               {0: -17.461224489795917, 1: 18.06122448979592},
+               {0: 59.691275167785236, 1: -60.53065635308839, 2: 1.839381185303151}],
+    'weights': {0: -2.5555555555555554, 1: 2.8533926839011583, 2: 0.5767419962335216, 3: 0.12542087542087543},
+    }
+
+methods['rkr4'] = {
+    'type': 'fixed',
+    'order': 4,
+    'fsal': False,
+    'nodes': [0.0, 0.4, 0.4557372542187894, 1.0],
+    'matrix': [{},
+               {0: 0.4},
+               {0: 0.2969776092477536, 1: 0.15875964497103584},
+               {0: 0.21810038822592046, 1: -3.050965148692931, 2: 3.8328647604670105}],
+    'weights': {0: 0.17476028226269036, 1: -0.551480662878733, 2: 1.2055355993965235, 3: 0.17118478121951902},
+    }
+
+methods['rks5'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.00011111111111111112, 0.3, 0.75, 1.0],
+    'matrix': [{},
+               {0: 0.00011111111111111112},
+               {0: -404.7, 1: 405.0},
+               {0: 2530.125, 1: -2531.25, 2: 1.875},
+               {0: -11494.333333333334, 1: 11500.0, 2: -6.049382716049383, 3: 1.382716049382716}],
+    'weights': {0: 0.09259259259259259, 2: 0.4409171075837742, 3: 0.3950617283950617, 4: 0.07142857142857142},
+    }
+
+methods['rk5'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.2, 0.4, 1.0, 0.6, 0.8],
+    'matrix': [{},
+               {0: 0.2},
+               {1: 0.4},
+               {0: 2.25, 1: -5.0, 2: 3.75},
+               {0: -0.63, 1: 1.8, 2: -0.65, 3: 0.08},
+               {0: -0.24, 1: 0.8, 2: 0.13333333333333333, 3: 0.10666666666666667}],
+    'weights': {0: 0.11805555555555555, 2: 0.6944444444444444, 3: 0.013888888888888888, 4: -0.3472222222222222, 5: 0.5208333333333334},
+    }
+
+methods['rkc5'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.14285714285714285, 0.35714285714285715, 0.6428571428571429, 0.8571428571428571, 1.0],
+    'matrix': [{},
+               {0: 0.14285714285714285},
+               {0: -0.08977495107632094, 1: 0.4469178082191781},
+               {0: 20.54354207436399, 1: -34.15068493150685, 2: 14.25},
+               {0: -0.5524961268754077, 1: 0.8999663649706457, 2: 0.3125, 3: 0.19717261904761904},
+               {0: -3.4656686559066867, 1: 2.4384409331344092, 2: 0.8465346534653465, 3: 5.457920792079208, 4: -4.2772277227722775}],
+    'weights': {0: 0.1111111111111111, 1: 0.0025925925925925925, 2: 0.5098765432098765, 3: 0.015555555555555555, 4: 0.37333333333333335, 5: -0.012469135802469136},
+    }
+
+methods['rkl5'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.08333333333333333, 0.25, 0.5, 0.75, 1.0],
+    'matrix': [{},
+               {0: 0.08333333333333333},
+               {0: -0.125, 1: 0.375},
+               {0: 0.6, 1: -0.9, 2: 0.8},
+               {0: 0.4875, 1: -0.45, 2: 0.15, 3: 0.5625},
+               {0: -1.6857142857142857, 1: 1.8857142857142857, 2: 1.3714285714285714, 3: -1.7142857142857142, 4: 1.1428571428571428}],
+    'weights': {0: 0.07777777777777778, 2: 0.35555555555555557, 3: 0.13333333333333333, 4: 0.35555555555555557, 5: 0.07777777777777778},
+    }
+
+methods['rklk5a'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.5, 0.276393202250021, 0.5, 0.7236067977499789, 1.0],
+    'matrix': [{},
+               {0: 0.5},
+               {0: 0.2, 1: 0.07639320225002103},
+               {0: 0.25, 1: 0.25},
+               {0: -0.061803398874989486, 1: -0.2, 2: 0.5854101966249684, 3: 0.4},
+               {0: 0.30901699437494745, 1: 0.6180339887498949, 2: 0.6909830056250525, 3: -2.0, 4: 1.381966011250105}],
+    'weights': {0: 0.08333333333333333, 2: 0.4166666666666667, 4: 0.4166666666666667, 5: 0.08333333333333333},
+    }
+
+methods['rklk5b'] = {
+    'type': 'fixed',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.4, 0.5, 1.0, 0.11270166537925831, 0.8872983346207417],
+    'matrix': [{},
+               {0: 0.4},
+               {0: 0.1875, 1: 0.3125},
+               {0: 0.25, 1: -1.25, 2: 2.0},
+               {0: 0.11127016653792583, 1: -0.25, 2: 0.2901613323034066, 3: -0.03872983346207417},
+               {0: -0.3436491673103708, 1: -0.25, 2: 0.6, 3: 0.10635083268962915, 4: 0.7745966692414834}],
+    'weights': {2: 0.4444444444444444, 4: 0.2777777777777778, 5: 0.2777777777777778},
+    }
+
+methods['rkb6'] = {
+    'type': 'fixed',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.3333333333333333, 0.6666666666666666, 0.3333333333333333, 0.5, 0.5, 1.0],
+    'matrix': [{},
+               {0: 0.3333333333333333},
+               {1: 0.6666666666666666},
+               {0: 0.08333333333333333, 1: 0.3333333333333333, 2: -0.08333333333333333},
+               {0: -0.0625, 1: 1.125, 2: -0.1875, 3: -0.375},
+               {1: 1.125, 2: -0.375, 3: -0.75, 4: 0.5},
+               {0: 0.20454545454545456, 1: -0.8181818181818182, 2: 1.4318181818181819, 3: 1.6363636363636365, 5: -1.4545454545454546}],
+    'weights': {0: 0.09166666666666666, 2: 0.675, 3: 0.675, 4: -0.26666666666666666, 5: -0.26666666666666666, 6: 0.09166666666666666},
+    }
+
+methods['rk7'] = {
+    'type': 'fixed',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.2222222222222222, 0.3333333333333333, 0.5, 0.16666666666666666, 0.8888888888888888, 0.1111111111111111, 0.8333333333333334, 1.0],
+    'matrix': [{},
+               {0: 0.2222222222222222},
+               {0: 0.08333333333333333, 1: 0.25},
+               {0: 0.125, 2: 0.375},
+               {0: 0.10648148148148148, 2: 0.09722222222222222, 3: -0.037037037037037035},
+               {0: -5.673525377229081, 2: -18.633744855967077, 3: 7.220850480109739, 4: 17.97530864197531},
+               {0: 0.6933299039780522, 2: 1.991769547325103, 3: -0.710562414266118, 4: -1.8746438746438747, 5: 0.011217948717948718},
+               {0: -0.5634259259259259, 2: -2.013888888888889, 3: 1.2610733182161753, 4: 1.8512820512820514, 5: 0.05951726844583988, 6: 0.23877551020408164},
+               {0: 0.09356936416184972, 2: -0.48554913294797686, 3: -0.08092485549132948, 4: 2.7612272120942642, 5: -0.39649764974909485, 6: -1.8522517944483263, 7: 0.9604268563806136}],
+    'weights': {0: 0.051488095238095236, 3: 0.35879494655004857, 4: 0.2967032967032967, 5: -0.027588865216416236, 6: -0.027588865216416236, 7: 0.2967032967032967, 8: 0.051488095238095236},
+    }
+
+methods['rk8_10'] = {
+    'type': 'fixed',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.14814814814814814, 0.2222222222222222, 0.3333333333333333, 0.5, 0.6666666666666666, 0.16666666666666666, 1.0, 0.8333333333333334, 1.0],
+    'matrix': [{},
+               {0: 0.14814814814814814},
+               {0: 0.05555555555555555, 1: 0.16666666666666666},
+               {0: 0.08333333333333333, 2: 0.25},
+               {0: 0.125, 3: 0.375},
+               {0: 0.24074074074074073, 2: -0.5, 3: 0.7777777777777778, 4: 0.14814814814814814},
+               {0: 0.09004629629629629, 2: -0.0125, 3: 0.22361111111111112, 4: -0.19074074074074074, 5: 0.05625},
+               {0: -11.55, 2: 4.05, 3: -58.2, 4: 32.8, 5: -6.1, 6: 40.0},
+               {0: -0.4409722222222222, 2: 0.0625, 3: -2.3541666666666665, 4: 1.5833333333333333, 5: -0.03125, 6: 2.0, 7: 0.013888888888888888},
+               {0: 1.8060975609756098, 2: -0.09878048780487805, 3: 8.663414634146342, 4: -4.117073170731707, 5: 0.08780487804878048, 6: -6.146341463414634, 7: -0.07317073170731707, 8: 0.8780487804878049}],
+    'weights': {0: 0.04880952380952381, 3: 0.03214285714285714, 4: 0.3238095238095238, 5: 0.03214285714285714, 6: 0.2571428571428571, 8: 0.2571428571428571, 9: 0.04880952380952381},
+    }
+
+methods['rkcv8'] = {
+    'type': 'fixed',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.5, 0.5, 0.17267316464601143, 0.17267316464601143, 0.5, 0.8273268353539885, 0.8273268353539885, 0.5, 0.17267316464601143, 1.0],
+    'matrix': [{},
+               {0: 0.5},
+               {0: 0.25, 1: 0.25},
+               {0: 0.14285714285714285, 1: 0.06885435800885224, 2: -0.03903833621998368},
+               {0: 0.07639790839338285, 2: -0.005242901267037461, 3: 0.10151815751966603},
+               {0: 0.00869633968842, 2: 0.12270623069567112, 3: -0.8198779436927272, 4: 1.188475373308636},
+               {0: 0.34720418321323426, 2: -2.709831631542658, 3: 14.41637195298441, 4: -14.728517213141737, 5: 3.5020995438407407},
+               {0: 0.07142857142857142, 4: 0.2202200562291073, 5: 0.42456709658519876, 6: 0.1111111111111111},
+               {0: 0.03125, 4: 0.3250591833230428, 5: 0.1527777777777778, 6: -0.035856617081868054, 7: 0.0267696559810475},
+               {0: 0.07142857142857142, 4: 0.1111111111111111, 5: -0.026921257524485948, 6: 0.012567654483932062, 7: -0.010565488490817142, 8: 0.015052573637699917},
+               {4: -4.115446103593937, 5: -3.2513804324169673, 6: -0.4183817801019511, 7: 0.80727066899084, 8: 3.473602654639189, 9: 4.504334992482827}],
+    'weights': {0: 0.05, 7: 0.2722222222222222, 8: 0.35555555555555557, 9: 0.2722222222222222, 10: 0.05},
+    }
+
+methods['rk8_12'] = {
+    'type': 'fixed',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.1111111111111111, 0.16666666666666666, 0.25, 0.1, 0.16666666666666666, 0.5, 0.6666666666666666, 0.3333333333333333, 0.8333333333333334, 0.8333333333333334, 1.0],
+    'matrix': [{},
+               {0: 0.1111111111111111},
+               {0: 0.041666666666666664, 1: 0.125},
+               {0: 0.0625, 2: 0.1875},
+               {0: 0.058, 2: 0.066, 3: -0.024},
+               {0: 0.033950617283950615, 3: 0.00411522633744856, 4: 0.1286008230452675},
+               {0: -0.5833333333333334, 3: 2.111111111111111, 4: 3.4722222222222223, 5: -4.5},
+               {0: -0.12345679012345678, 3: -0.13168724279835392, 4: 0.51440329218107, 6: 0.4074074074074074},
+               {0: 3.626543209876543, 3: -10.666666666666666, 4: -19.290123456790123, 5: 26.0, 6: 0.7469135802469136, 7: -0.08333333333333333},
+               {0: 0.904320987654321, 3: -2.6296296296296298, 4: -4.243827160493828, 5: 5.666666666666667, 6: -0.36419753086419754, 7: 0.5, 8: 1.0},
+               {0: 0.804320987654321, 3: -2.6296296296296298, 4: -4.243827160493828, 5: 6.166666666666667, 6: 0.6358024691358025, 9: 0.1},
+               {0: -1.9410569105691058, 3: 6.937669376693767, 4: 11.009485094850948, 5: -14.926829268292684, 6: 0.08536585365853659, 7: -0.16463414634146342, 8: -0.43902439024390244, 9: -0.2926829268292683, 10: 0.7317073170731707}],
+    'weights': {0: 0.04880952380952381, 5: 0.2571428571428571, 6: 0.3238095238095238, 7: 0.03214285714285714, 8: 0.03214285714285714, 9: 0.04285714285714286, 10: 0.21428571428571427, 11: 0.04880952380952381},
+    }
+
+methods['rks10'] = {
+    'type': 'fixed',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.13333333333333333, 0.26666666666666666, 0.4, 0.5714285714285714, 0.7787407615362918, 0.6426157582403226, 0.8825276619647323, 0.11747233803526766, 0.11747233803526766, 0.3573842417596775, 0.3573842417596775, 0.6426157582403226, 0.8825276619647323, 1.0],
+    'matrix': [{},
+               {0: 0.13333333333333333},
+               {1: 0.26666666666666666},
+               {0: 0.1, 2: 0.3},
+               {0: 0.13411078717201166, 2: 0.08746355685131195, 3: 0.3498542274052478},
+               {0: 0.32865893899779125, 2: -0.8431230447116361, 3: 1.2303830647211609, 4: 0.0628218025289758},
+               {0: 0.13018699084453347, 3: 0.5807389729173741, 4: -0.13206101704292822, 5: 0.06375081152134318},
+               {0: 0.11696914466403235, 3: 0.804791321585223, 4: -1.0324424073033935, 5: 0.14123750757742515, 6: 0.8519720954414453},
+               {0: 0.07230137681531805, 3: 0.27844935379385793, 4: -0.7203557425293995, 5: 0.07147830972300757, 6: 0.48054612710039024, 7: -0.06494708686790669},
+               {0: -0.0336045800754256, 3: -0.8576693886686749, 4: 2.054105395119576, 5: -0.20990904266184918, 6: -1.3339722359516115, 7: 0.18080634838458134, 8: 0.31771584188867136},
+               {0: 0.03781005386193373, 3: 0.04559155864157964, 4: 0.37485824729474737, 5: -0.018981904165238088, 6: -0.3360388626375594, 7: 0.04220771637555915, 8: 0.05190036098369083, 9: 0.1600370714049642},
+               {0: 0.025378474265434523, 3: 0.3623063275434741, 4: -2.13002206625995, 5: 0.1672715948594377, 6: 1.5827509418646633, 7: -0.20472018513908158, 8: 0.3192653281448061, 9: -0.19948525625469693, 10: 0.43463908273559},
+               {0: 0.02102955512349265, 3: -0.20853138834469356, 4: 0.32686349865476766, 5: -0.04029159506346634, 6: -0.06216857011008511, 7: 0.019401511635634607, 8: 0.0336189343221497, 9: 0.184057539066669, 10: 0.12671904245006307, 11: 0.2419172305057909},
+               {0: 0.05901543960114423, 3: 0.34675352940043946, 4: -0.5435204392509414, 5: 0.06699832051343939, 6: -0.2091059262738907, 7: 0.03419681921537739, 8: 0.656808691640117, 9: -0.5300230864912716, 10: 0.6823707136215755, 11: -0.5243167946491541, 12: 0.8433503946378972},
+               {0: -0.04044086632866268, 3: -0.9361744121603922, 4: 1.4674109549590162, 5: -0.18088384977898705, 6: 1.1675891022744105, 7: -0.28011360481035336, 8: -1.8716683763485165, 9: 2.2415881161250515, 10: -1.5725720826914185, 11: 2.151700399601059, 12: -1.8133404509027644, 13: 0.6669050700615575}],
+    'weights': {0: 0.03333333333333333, 8: 0.13516962724923107, 9: 0.054067850899692425, 10: 0.21577825773602247, 11: 0.06165093078172071, 12: 0.2774291885177432, 13: 0.1892374781489235, 14: 0.03333333333333333},
+    }
+
+methods['rkz10'] = {
+    'type': 'fixed',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.06888096612188652, 0.4155848451833123, 0.06888096612188652, 0.7158687154450273, 0.8850622527248472, 0.1106915583677458, 0.30113422596409006, 0.6563450699325809, 0.4155848451833123, 0.4155848451833123, 0.6838026328894994, 0.884965138580995, 0.4155848451833123, 0.4155848451833123, 1.0],
+    'matrix': [{},
+               {0: 0.06888096612188652},
+               {0: -0.8381052035336424, 1: 1.2536900487169547},
+               {0: -0.004909486759326801, 1: 0.08232173030768021, 2: -0.008531277426466892},
+               {0: 1.0489319537643595, 1: -0.7538281773175958, 2: 0.8052281597406491, 3: -0.3844632207423856},
+               {0: -0.23992383433329995, 1: -0.0636426116392923, 2: 0.19967543135197896, 3: 0.61035379509547, 4: 0.37859947224999047},
+               {0: 0.017788339463161724, 1: -0.011050219055018254, 2: -0.004393428550528929, 3: 0.10597527290509019, 4: 0.0040508906963833075, 5: -0.0016792970913422345},
+               {0: 0.23566046225418538, 1: 0.0889336268970156, 2: 0.04138834709876858, 3: -0.8529030360326307, 4: -0.023080875481136257, 5: 0.009685921885918524, 6: 0.8014497793419689},
+               {0: 0.0904869376070533, 1: 0.032044272024792264, 2: 0.12433768215891056, 3: -0.3073152175503816, 4: 0.16447843681160268, 5: -0.041006811673447684, 6: 0.40661989930773196, 7: 0.1866998712463194},
+               {0: -0.12815849137721058, 1: -0.09494292242532246, 2: -0.1445034451182626, 3: 0.9213494070440691, 4: -0.13265301054949047, 5: 0.016614858726314644, 6: -0.6446177324399183, 7: 0.47148463683422026, 8: 0.15101154448891263},
+               {0: -0.3539426288992648, 1: -0.12999250061102427, 2: 0.07296717474130959, 3: 1.2340928820343768, 4: 0.2432547931441479, 5: -0.048864153403476704, 6: -0.5144237140797892, 7: 0.07088500449199304, 8: -0.20555333994396552, 9: 0.047161327709005454},
+               {0: -1.2888359640118732, 1: -0.28020869761589695, 2: 2.955025310605815, 3: 2.687294528042776, 4: 4.940623429919356, 5: -1.106697480032125, 6: -1.0149918428444973, 7: 2.5375098260937348, 8: -3.050854355253033, 9: -4.482483690129648, 10: -1.2125784318851087},
+               {0: -0.26440344286774076, 1: -0.06681118811399607, 2: 0.2298317880682731, 3: 0.6407414964573618, 4: 0.4294291108157683, 5: -0.00967078876662303, 6: 0.016136666729996814, 7: -0.035963143184877276, 8: -0.04902670091896966, 9: 0.013885376734988969, 10: -0.02329475109524908, 11: 0.004110714722061967},
+               {0: 1.2899592788108203, 1: 0.13503265202676398, 2: -1.575337353386263, 3: -1.1361414412576738, 4: -2.606299763273403, 5: -0.14225514857221283, 6: -1.3005027939753018, 7: 2.707971631146456, 8: 2.4355429694675017, 9: -0.26458182516447, 10: 0.28431747275350666, 11: -0.01567336501605445, 12: 0.603552531623642},
+               {0: -0.8217014523948573, 1: 1.2559122161982184, 2: -0.016152841165258218, 3: -0.022970389872010485, 4: -0.027960343767071114, 5: -0.7509429872708069, 6: -0.008310290892780086, 7: 0.027855238620770578, 8: 0.040214215393336514, 9: 1.6171364636009542, 10: -1.3962837774124321, 11: -0.014244391590610642, 12: 0.7570905433664327, 13: -0.2240573576305733},
+               {0: 0.2772640185318553, 1: 0.0945381837072823, 2: 0.8417275429545429, 3: -0.9066525983284448, 4: -0.09334858033923264, 5: 4.08887758914114, 6: 0.7953998649942899, 7: -0.04859175145875636, 8: 0.1481985145749843, 9: -1.770211480621896, 10: 1.8382108449200818, 11: 0.04909344463430917, 12: -3.8037882306700754, 13: 0.33157239872339855, 14: -0.8422897607634792}],
+    'weights': {0: 0.0318192745802341, 2: 0.04681369289018422, 5: 1.3755353617054575, 6: 0.1750656714396425, 7: 0.14924798653008456, 8: 0.2718099231266237, 9: -0.17077940511361075, 10: 0.30035519768848523, 11: -0.010142544032027986, 12: -1.1917781578209319, 13: 0.03639139354170714, 14: -0.04683316086510646, 15: 0.03249476632925818},
+    }
+
+methods['rko10'] = {
+    'type': 'fixed',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.3357505083417036, 0.5263563553500218, 0.7895345330250326, 0.1852155685265047, 0.2895345330250327, 0.7659879027055932, 0.10807390095788245, 0.3573842417596775, 0.8825276619647323, 0.6426157582403226, 0.11747233803526766, 0.7659879027055932, 0.2895345330250327, 0.5263563553500218, 0.3357505083417036, 1.0],
+    'matrix': [{},
+               {0: 0.3357505083417036},
+               {0: 0.1137717040478783, 1: 0.4125846513021435},
+               {0: 0.19738363325625816, 2: 0.5921508997687746},
+               {0: 0.13600017179925283, 2: 0.08247208052028113, 3: -0.03325668379302925},
+               {0: 0.0654678519948111, 3: 0.0006858715620423034, 4: 0.22338080946817926},
+               {0: 0.23794399991359944, 3: 0.1285793626493546, 4: -0.7303763776380165, 5: 1.1298409177806559},
+               {0: 0.060627808964417204, 4: 0.07888222248692023, 5: -0.03213213504125939, 6: 0.0006960045478044111},
+               {0: 0.03104415865438722, 5: 0.1571656120644442, 6: 0.00011176385413840843, 7: 0.1690627071867076},
+               {0: 0.014306142014226777, 5: -0.3914725335338579, 6: 0.2848400967322985, 7: 0.2559426777170805, 8: 0.7189112790349845},
+               {0: 0.010066684574266318, 5: -0.3683271809355001, 6: 0.08575502624022299, 7: 0.2633792404483482, 8: 0.6783120744401824, 9: -0.026570086527197216},
+               {0: 0.04212573015701458, 5: -0.011407302573949866, 6: -0.0035773235838810415, 7: 0.08478085069047181, 8: -8.23689740384519e-05, 9: 0.000792017493664916, 10: 0.004840734825985701},
+               {0: 0.18661685841946427, 3: 0.1285793626493546, 4: -0.7303763776380165, 5: 0.33656207466513544, 6: 0.34391521956961374, 7: 0.6116809614283796, 8: 0.8555642651045021, 9: -0.0891392852486696, 10: -0.42633175310982013, 11: -0.4510834231343502},
+               {0: 0.08132722174581178, 3: 0.0006858715620423034, 4: 0.22338080946817926, 5: -0.35431526695956145, 6: -0.16142283374713573, 7: -1.267989518319082, 8: 0.24825056609650578, 9: 0.00189401507220433, 10: -0.023671085042504047, 11: 1.3763735440470062, 12: 0.16502120910156626},
+               {0: 0.1137717040478783, 1: 0.4125846513021435, 5: -0.5266141894222269, 6: 0.4270299995350464, 12: -0.4270299995350464, 13: 0.5266141894222269},
+               {0: 0.3357505083417036, 2: -0.43683670838914074, 14: 0.43683670838914074},
+               {0: 0.035284009145390656, 1: -0.4368588562339555, 2: -0.5185253025751911, 5: 0.08353882146318348, 6: 0.3357324883823616, 7: -0.11803468532901977, 8: -0.20281215249997184, 9: 0.4018734442526046, 10: 0.6982808681238487, 11: 0.27459533401274605, 12: -0.8071051158813288, 13: 0.2986469883301854, 14: 0.5185253025751911, 15: 0.4368588562339555}],
+    'weights': {0: 0.03333333333333333, 1: -0.021922428330522766, 2: -0.05671077504725898, 5: -0.05604719764011799, 6: 0.17892976588628762, 8: 0.2774291885177432, 9: 0.1892374781489235, 10: 0.2774291885177432, 11: 0.1892374781489235, 12: -0.17892976588628762, 13: 0.05604719764011799, 14: 0.05671077504725898, 15: 0.021922428330522766, 16: 0.03333333333333333},
+    }
+
+methods['rkh10'] = {
+    'type': 'fixed',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.5233584004620048, 0.5265091001416126, 0.7897636502124189, 0.39392357012567203, 0.7666539862535506, 0.28976365021241884, 0.1084776892195673, 0.3573842417596775, 0.8825276619647323, 0.6426157582403226, 0.11747233803526766, 0.7666539862535506, 0.28976365021241884, 0.5265091001416126, 0.5233584004620048, 1.0],
+    'matrix': [{},
+               {0: 0.5233584004620048},
+               {0: 0.2616697163778127, 1: 0.26483938376379984},
+               {0: 0.19744091255310472, 2: 0.5923227376593141},
+               {0: 0.1973205486287023, 2: 0.2950833340926722, 3: -0.09848031259570249},
+               {0: 0.13131341734446164, 3: 0.11015443953863963, 4: 0.5251861293704493},
+               {0: 0.1342003418463226, 3: 0.6960887032881161, 4: 0.25049772157033984, 5: -0.7910231164923597},
+               {0: 0.07221827418966262, 4: -0.05833632293645611, 5: 0.0030475576685745254, 6: 0.09154818029778626},
+               {0: 0.03125500813516618, 5: 0.0001091238215424129, 6: 0.15672575863099383, 7: 0.16929435117197503},
+               {0: 0.01190660441466862, 5: 0.28343708202460277, 6: -0.4163121675706282, 7: 0.2646463339497664, 8: 0.7388498091463228},
+               {0: 0.023406573691331978, 5: 0.09449313018949365, 6: -0.27287205590199526, 7: 0.2240220461156058, 8: 0.6043814410751658, 9: -0.03081537692927938},
+               {0: 0.04544377531017616, 5: -0.0011879966718640286, 6: 0.012035654990922611, 7: 0.07512690298764967, 8: -0.018220924098880126, 9: -0.00025715285408410435, 10: 0.0045320783713474685},
+               {0: 0.1767137782592772, 3: 0.11015443953863963, 4: 0.5251861293704493, 5: -0.4716207672801958, 6: 0.8990310498491876, 7: -0.7467230306916289, 8: -1.0171015167561461, 9: 0.1263508715195989, 10: 0.5660138272355064, 11: 0.5986492052088624},
+               {0: 0.12775349474808698, 3: 0.6960887032881161, 4: 0.25049772157033984, 5: -0.7368246436028417, 6: -0.2778578777108242, 7: -0.5997526313598404, 8: 0.20246923389107047, 9: 0.0054320369823638495, 10: -0.01074472474155048, 11: 0.6951688484570234, 12: -0.06246651130952503},
+               {0: 0.2616697163778127, 1: 0.26483938376379984, 5: -0.1998011270205325, 6: -0.6510499873052827, 12: 0.1998011270205325, 13: 0.6510499873052827},
+               {0: 0.5233584004620048, 2: -0.5558812136754302, 14: 0.5558812136754302},
+               {0: 0.05732079543206559, 1: -0.5499710763899945, 2: -0.649937417400875, 5: -1.0616673704017563, 6: -0.04040156689806358, 7: -0.18283023664076073, 8: -0.3336592706492787, 9: 0.39564854237605673, 10: 0.6950570494599736, 11: 0.27148737645737486, 12: 0.6071810560414042, 13: 0.5918636248229843, 14: 0.649937417400875, 15: 0.5499710763899945}],
+    'weights': {0: 0.03333333333333333, 1: -0.038461538461538464, 2: -0.09090909090909091, 5: -0.1348314606741573, 6: -0.1111111111111111, 8: 0.2774291885177432, 9: 0.1892374781489235, 10: 0.2774291885177432, 11: 0.1892374781489235, 12: 0.1348314606741573, 13: 0.1111111111111111, 14: 0.09090909090909091, 15: 0.038461538461538464, 16: 0.03333333333333333},
+    }
+
+methods['rkbs32'] = {
+    'type': 'variable',
+    'order': 3,
+    'fsal': True,
+    'nodes': [0.0, 0.5, 0.75, 1.0],
+    'matrix': [{},
+               {0: 0.5},
+               {1: 0.75},
+               {0: 0.2222222222222222, 1: 0.3333333333333333, 2: 0.4444444444444444}],
+    'weights': {0: 0.2222222222222222, 1: 0.3333333333333333, 2: 0.4444444444444444},
+    'embedded_weights': {0: 0.2916666666666667, 1: 0.25, 2: 0.3333333333333333, 3: 0.125},
+    }
+
+methods['rkf45'] = {
+    'type': 'variable',
+    'order': 4,
+    'fsal': False,
+    'nodes': [0.0, 0.25, 0.375, 0.9230769230769231, 1.0, 0.5],
+    'matrix': [{},
+               {0: 0.25},
+               {0: 0.09375, 1: 0.28125},
+               {0: 0.8793809740555303, 1: -3.277196176604461, 2: 3.3208921256258535},
+               {0: 2.0324074074074074, 1: -8.0, 2: 7.173489278752436, 3: -0.20589668615984405},
+               {0: -0.2962962962962963, 1: 2.0, 2: -1.3816764132553607, 3: 0.4529727095516569, 4: -0.275}],
+    'weights': {0: 0.11574074074074074, 2: 0.5489278752436647, 3: 0.5353313840155945, 4: -0.2},
+    'embedded_weights': {0: 0.11296296296296296, 2: 0.578869395711501, 3: 0.5645312776891724, 4: -0.22, 5: -0.03636363636363636},
+    }
+
+methods['rkck54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.2, 0.3, 0.6, 1.0, 0.875],
+    'matrix': [{},
+               {0: 0.2},
+               {0: 0.075, 1: 0.225},
+               {0: 0.3, 1: -0.9, 2: 1.2},
+               {0: -0.2037037037037037, 1: 2.5, 2: -2.5925925925925926, 3: 1.2962962962962963},
+               {0: 0.029495804398148147, 1: 0.341796875, 2: 0.041594328703703706, 3: 0.40034541377314814, 4: 0.061767578125}],
+    'weights': {0: 0.09788359788359788, 2: 0.4025764895330113, 3: 0.21043771043771045, 5: 0.2891022021456804},
+    'embedded_weights': {0: 0.10217737268518519, 2: 0.38390790343915343, 3: 0.24459273726851852, 4: 0.019321986607142856, 5: 0.25},
+    }
+
+methods['rkdp54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': True,
+    'nodes': [0.0, 0.2, 0.3, 0.8, 0.8888888888888888, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.2},
+               {0: 0.075, 1: 0.225},
+               {0: 0.9777777777777777, 1: -3.7333333333333334, 2: 3.5555555555555554},
+               {0: 2.9525986892242035, 1: -11.595793324188385, 2: 9.822892851699436, 3: -0.2908093278463649},
+               {0: 2.8462752525252526, 1: -10.757575757575758, 2: 8.906422717743473, 3: 0.2784090909090909, 4: -0.2735313036020583},
+               {0: 0.09114583333333333, 2: 0.44923629829290207, 3: 0.6510416666666666, 4: -0.322376179245283, 5: 0.13095238095238096}],
+    'weights': {0: 0.09114583333333333, 2: 0.44923629829290207, 3: 0.6510416666666666, 4: -0.322376179245283, 5: 0.13095238095238096},
+    'embedded_weights': {0: 0.08991319444444444, 2: 0.4534890685834082, 3: 0.6140625, 4: -0.2715123820754717, 5: 0.08904761904761904, 6: 0.025},
+    }
+
+methods['rkt54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': True,
+    'nodes': [0.0, 0.161, 0.327, 0.9, 0.9800255409045097, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.161},
+               {0: -0.008480655492356989, 1: 0.335480655492357},
+               {0: 2.8971530571054935, 1: -6.359448489975075, 2: 4.3622954328695815},
+               {0: 5.325864828439257, 1: -11.748883564062828, 2: 7.4955393428898365, 3: -0.09249506636175525},
+               {0: 5.86145544294642, 1: -12.92096931784711, 2: 8.159367898576159, 3: -0.071584973281401, 4: -0.028269050394068383},
+               {0: 0.09646076681806523, 1: 0.01, 2: 0.4798896504144996, 3: 1.379008574103742, 4: -3.290069515436081, 5: 2.324710524099774}],
+    'weights': {0: 0.09646076681806523, 1: 0.01, 2: 0.4798896504144996, 3: 1.379008574103742, 4: -3.290069515436081, 5: 2.324710524099774},
+    'embedded_weights': {0: 0.09468075576583945, 1: 0.009183565540343254, 2: 0.4877705284247616, 3: 1.234297566930479, 4: -2.7077123499835256, 5: 1.866628418170587, 6: 0.015151515151515152},
+    }
+
+methods['rks54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': True,
+    'nodes': [0.0, 0.2, 0.3230769230769231, 0.9, 0.975, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.2},
+               {0: 0.0621301775147929, 1: 0.26094674556213016},
+               {0: 1.6301020408163265, 1: -5.207142857142857, 2: 4.4770408163265305},
+               {0: 2.8811124102418746, 1: -9.263950892857142, 2: 7.442850056689342, 3: -0.08501157407407407},
+               {0: 3.2522024583580915, 1: -10.435540069686411, 2: 8.27662100358286, 3: -0.05432098765432099, 4: -0.03896240460022027},
+               {0: 0.09774793108126441, 2: 0.48629574293291106, 3: 1.4567901234567902, 4: -2.904470161107329, 5: 1.8636363636363635}],
+    'weights': {0: 0.09774793108126441, 2: 0.48629574293291106, 3: 1.4567901234567902, 4: -2.904470161107329, 5: 1.8636363636363635},
+    'embedded_weights': {0: 0.10141093474426807, 2: 0.4736707572990759, 3: 1.7234567901234568, 4: -3.775811209439528, 5: 2.50377523144635, 6: -0.026502504173622706},
+    }
+
+methods['rkpp54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': True,
+    'nodes': [0.0, 0.20317460317460317, 0.30183727034120733, 0.8149732620320855, 0.8928571428571429, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.20317460317460317},
+               {0: 0.07763174380515428, 1: 0.22420552653605308},
+               {0: 0.9970542259106498, 1: -3.922958309835977, 2: 3.7408773459574123},
+               {0: 2.4110719521382014, 1: -9.694930110387865, 2: 8.370965776026198, 3: -0.19425047491939046},
+               {0: 2.7168057625061817, 1: -10.546836035293106, 2: 8.824384546694526, 3: 0.3302319349379919, 4: -0.3245862088455942},
+               {0: 0.09151025143596181, 2: 0.45308868796368257, 3: 0.7702123546837687, 4: -0.46993115056469337, 5: 0.15511985648128027}],
+    'weights': {0: 0.09151025143596181, 2: 0.45308868796368257, 3: 0.7702123546837687, 4: -0.46993115056469337, 5: 0.15511985648128027},
+    'embedded_weights': {0: 0.090054075482504, 2: 0.45809304135508144, 3: 0.7171417368220026, 4: -0.39730095904319873, 5: 0.10820258157408692, 6: 0.023809523809523808},
+    }
+
+methods['rkpp54b'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': True,
+    'nodes': [0.0, 0.22012578616352202, 0.32061068702290074, 0.916083916083916, 0.9545454545454546, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.22012578616352202},
+               {0: 0.08712778975584173, 1: 0.23348289726705904},
+               {0: 1.2291311202445523, 1: -5.174619722997219, 2: 4.861572518836583},
+               {0: 1.635985585148686, 1: -6.911673476406501, 2: 6.264598153851822, 3: -0.03436480804855246},
+               {0: 2.080199455181079, 1: -8.741042793278798, 2: 7.7059475706358995, 3: 0.08908088473605148, 4: -0.13418511727423216},
+               {0: 0.09660368812495312, 2: 0.4847050840514515, 3: 2.9857215040665706, 4: -3.882058366130616, 5: 1.3150280898876405}],
+    'weights': {0: 0.09660368812495312, 2: 0.4847050840514515, 3: 2.9857215040665706, 4: -3.882058366130616, 5: 1.3150280898876405},
+    'embedded_weights': {0: 0.09532926220038257, 2: 0.4890503958633595, 3: 2.782787369422591, 4: -3.5443208475455745, 5: 1.1682252486306697, 6: 0.008928571428571428},
+    }
+
+methods['rkbs54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.16666666666666666, 0.2222222222222222, 0.42857142857142855, 0.6666666666666666, 0.75, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.16666666666666666},
+               {0: 0.07407407407407407, 1: 0.14814814814814814},
+               {0: 0.13338192419825073, 1: -0.47230320699708456, 2: 0.7674927113702624},
+               {0: 0.22895622895622897, 1: -0.36363636363636365, 2: 0.2937062937062937, 3: 0.5076405076405076},
+               {0: 0.026500355113636364, 1: 0.23011363636363635, 2: 0.10772747760052448, 3: 0.1602190777972028, 4: 0.225439453125},
+               {0: 0.18159821692916506, 1: -0.38707982536247293, 2: 0.41288268560074054, 3: 0.6409913191253497, 4: -1.0121439383514517, 5: 1.1637515420586695},
+               {0: 0.07279265873015874, 2: 0.28662437773692473, 3: 0.19513621794871794, 4: 0.008638392857142857, 5: 0.3595655806182122, 6: 0.07724277210884353}],
+    'weights': {0: 0.07279265873015874, 2: 0.28662437773692473, 3: 0.19513621794871794, 4: 0.008638392857142857, 5: 0.3595655806182122, 6: 0.07724277210884353},
+    'embedded_weights': {0: 0.07084476451760402, 2: 0.2956730769230769, 3: 0.17965747482208388, 4: 0.029861111111111113, 5: 0.3462886755067825, 6: 0.07176240133870539, 7: 0.005912495780636172},
+    }
+
+methods['rkss54'] = {
+    'type': 'variable',
+    'order': 5,
+    'fsal': False,
+    'nodes': [0.0, 0.1523809523809524, 0.22857142857142856, 0.45, 0.6666666666666666, 0.7777777777777778, 1.0],
+    'matrix': [{},
+               {0: 0.1523809523809524},
+               {0: 0.05714285714285714, 1: 0.17142857142857143},
+               {0: 0.2146728515625, 1: -0.6229248046875, 2: 0.858251953125},
+               {0: 0.23799725651577502, 1: -0.35, 2: 0.3380127439267224, 3: 0.4406566662241692},
+               {0: -0.132962448897027, 1: 0.4892296846578198, 2: 0.1795608088416515, 3: -0.11805026682466653, 4: 0.36},
+               {0: 0.2964718732359188, 1: -0.4319641861761427, 2: 0.26063151392059936, 3: 0.7340070984288296, 4: -0.5975471167754384, 5: 0.7384008173662333}],
+    'weights': {0: 0.07228835978835979, 2: 0.31428017927452456, 3: 0.1545221884204935, 4: 0.1346989966555184, 5: 0.24921027586110372, 6: 0.075},
+    'embedded_weights': {0: 0.08474977102347463, 2: 0.25740950432385684, 3: 0.25934133689728117, 4: 0.013356251902205794, 5: 0.3131431358531816, 6: 0.072},
+    }
+
+methods['rkdp65'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.1, 0.2222222222222222, 0.42857142857142855, 0.6, 0.8, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.1},
+               {0: -0.024691358024691357, 1: 0.24691358024691357},
+               {0: 0.44825072886297374, 1: -0.7871720116618076, 2: 0.7674927113702624},
+               {0: 0.5896363636363636, 1: -0.9818181818181818, 2: 0.7125734265734266, 3: 0.2796083916083916},
+               {0: -0.7135892255892256, 1: 1.309090909090909, 2: 0.12012834224598931, 3: -0.652013468013468, 4: 0.7363834422657952},
+               {0: 2.3404882154882154, 1: -3.1818181818181817, 2: -0.7631237540739804, 3: 4.482612117227502, 4: -2.8458605664488017, 5: 0.9677021696252466},
+               {0: 1.74913946007696, 1: -2.3904220779220777, 2: -0.3962525737836824, 3: 3.272858329348714, 4: -2.063516378773732, 5: 0.828193241053818}],
+    'weights': {0: 0.07060185185185185, 2: 0.30584941077022526, 3: 0.11510382423843962, 4: 0.18722766884531591, 5: 0.25425295857988167, 6: -0.033035714285714286, 7: 0.1},
+    'embedded_weights': {0: 0.07601851851851851, 2: 0.27404107205012185, 3: 0.19205895244356783, 4: 0.10757080610021787, 5: 0.29031065088757396, 6: 0.06},
+    }
+
+methods['rkc65'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.13333333333333333, 0.2, 0.3, 0.56, 0.76, 0.987063763988171, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.13333333333333333},
+               {0: 0.05, 1: 0.15},
+               {0: 0.075, 2: 0.225},
+               {0: 0.4405706415737548, 1: -1.142601464498276, 2: 0.694623849442529, 3: 0.5674069734819922},
+               {0: -1.9036339130798205, 1: 4.317187063691864, 2: 1.0679961599194303, 3: -3.937090154185222, 4: 1.2155408436537471},
+               {0: 4.830848347031681, 1: -7.633070775839958, 2: -7.400776169941999, 3: 13.164919430915027, 4: -2.682304918646675, 5: 0.7074478504700943},
+               {0: 6.047924614619111, 1: -9.41410412495294, 2: -9.717250122181479, 3: 16.745653641718636, 4: -3.5114710548514543, 5: 0.8670224434355431, 6: -0.017775397787416717},
+               {0: 0.06074879254233705, 2: 0.2849093437792972, 3: 0.043969638712828156, 4: 0.3054819380127994, 5: 0.16440587624234634, 6: 0.5160328170687718, 7: -0.37554840635837994}],
+    'weights': {0: 0.06074879254233705, 2: 0.2849093437792972, 3: 0.043969638712828156, 4: 0.3054819380127994, 5: 0.16440587624234634, 6: 0.5160328170687718, 7: -0.37554840635837994},
+    'embedded_weights': {0: 0.029817463815686403, 2: 0.5123029856808481, 3: -0.23194251595860094, 4: 0.41364566653581786, 5: 0.15938143749574485, 6: 0.1889475836465963, 7: -0.12215262121609256, 8: 0.05},
+    }
+
+methods['rktp64'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.14814814814814814, 0.2222222222222222, 0.42857142857142855, 0.6875, 0.7692307692307693, 1.0],
+    'matrix': [{},
+               {0: 0.14814814814814814},
+               {0: 0.05555555555555555, 1: 0.16666666666666666},
+               {0: 0.1924198250728863, 1: -0.5313411078717201, 2: 0.7674927113702624},
+               {0: 0.2713826497395833, 1: -0.28179931640625, 2: 0.10191932091346154, 3: 0.5959973457532052},
+               {0: -0.12140681348692273, 1: 0.4776141018744569, 2: 0.12192296968479081, 3: 0.008207866862482694, 4: 0.28289264429596156},
+               {0: 0.32310946589106293, 1: -0.6103913273400318, 2: 0.4584686754163932, 3: 0.5750574080671157, 4: -0.5737923452226769, 5: 0.8275481231881368}],
+    'weights': {0: 0.07277777777777777, 2: 0.28752127070690503, 3: 0.18974846220396832, 4: 0.10581736348682551, 5: 0.2690954432848408, 6: 0.07503968253968255},
+    'embedded_weights': {0: 0.10322666047518118, 2: 0.1561154205613407, 3: 0.3863491885106391, 4: -0.12073095208684351, 5: 0.4, 6: 0.07503968253968255},
+    }
+
+methods['rkv65e'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': True,
+    'nodes': [0.0, 0.06, 0.09593333333333333, 0.1439, 0.4973, 0.9725, 0.9995, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.06},
+               {0: 0.019239962962962962, 1: 0.07669337037037037},
+               {0: 0.035975, 2: 0.107925},
+               {0: 1.3186834152331484, 2: -5.042058063628562, 3: 4.220674648395414},
+               {0: -41.872591664327516, 2: 159.4325621631375, 3: -122.11921356501003, 4: 5.531743066200054},
+               {0: -54.430156935316504, 2: 207.06725136501848, 3: -158.61081378459, 4: 6.991816585950242, 5: -0.018597231062203234},
+               {0: -54.66374178728198, 2: 207.95280625538936, 3: -159.2889574744995, 4: 7.018743740796944, 5: -0.018338785905045722, 6: -0.0005119484997882099},
+               {0: 0.03438957868357036, 3: 0.2582624555633503, 4: 0.4209371189673537, 5: 4.40539646966931, 6: -176.48311902429865, 7: 172.36413340141507}],
+    'weights': {0: 0.03438957868357036, 3: 0.2582624555633503, 4: 0.4209371189673537, 5: 4.40539646966931, 6: -176.48311902429865, 7: 172.36413340141507},
+    'embedded_weights': {0: 0.0490996764838249, 3: 0.22511122295165242, 4: 0.4694682253029562, 5: 0.8065792249988868, 7: -0.607119489177796, 8: 0.056861139440475696},
+    }
+
+methods['rkv65r'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': True,
+    'nodes': [0.0, 0.18, 0.16666666666666666, 0.25, 0.53, 0.6, 0.8, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.18},
+               {0: 0.08950617283950617, 1: 0.07716049382716049},
+               {0: 0.0625, 2: 0.1875},
+               {0: 0.316516, 2: -1.044948, 3: 1.258432},
+               {0: 0.2723261273648563, 2: -0.8251336032388664, 3: 1.0480917678812416, 4: 0.10471570799276857},
+               {0: -0.16699418599716515, 2: 0.6317085020242915, 3: 0.17461044552773877, 4: -1.0665356459086066, 5: 1.2272108843537415},
+               {0: 0.36423751686909583, 2: -0.2040485829959514, 3: -0.34883737816068644, 4: 3.2619323032856866, 5: -2.7551020408163267, 6: 0.6818181818181818},
+               {0: 0.0763888888888889, 3: 0.3694083694083694, 5: 0.24801587301587302, 6: 0.23674242424242425, 7: 0.06944444444444445}],
+    'weights': {0: 0.0763888888888889, 3: 0.3694083694083694, 5: 0.24801587301587302, 6: 0.23674242424242425, 7: 0.06944444444444445},
+    'embedded_weights': {0: 0.05870020964360587, 3: 0.48072562358276644, 4: -0.8534124207691909, 5: 1.2046485260770976, 7: -0.059242373072160306, 8: 0.16858043453788135},
+    }
+
+methods['rkv65'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.14285714285714285, 0.2222222222222222, 0.42857142857142855, 0.6666666666666666, 0.75, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.14285714285714285},
+               {0: 0.04938271604938271, 1: 0.1728395061728395},
+               {0: 0.21209912536443148, 1: -0.5510204081632653, 2: 0.7674927113702624},
+               {0: 0.2895622895622896, 1: -0.42424242424242425, 2: 0.2937062937062937, 3: 0.5076405076405076},
+               {0: -0.011851917613636364, 1: 0.2684659090909091, 2: 0.10772747760052448, 3: 0.1602190777972028, 4: 0.225439453125},
+               {0: 1.584056712962963, 1: -2.15625, 2: -1.3347480028195489, 3: 4.356905864197531, 4: -3.8984933035714286, 5: 2.4485287292304836},
+               {0: 0.07896675084175084, 1: -0.23863636363636365, 2: 0.6312080189547294, 3: 0.17677523094189762, 4: -0.6515625, 5: 1.0032488628979856}],
+    'weights': {0: 0.07314814814814814, 2: 0.28460092539039905, 3: 0.19951329534662868, 5: 0.3659519168291098, 6: 0.01, 7: 0.06678571428571428},
+    'embedded_weights': {0: 0.07064814814814815, 2: 0.298830971659919, 3: 0.1687312440645774, 4: 0.06075, 5: 0.3210396361273554, 7: 0.08},
+    }
+
+methods['dverk65'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': False,
+    'nodes': [0.0, 0.16666666666666666, 0.26666666666666666, 0.6666666666666666, 0.8333333333333334, 1.0, 0.06666666666666667, 1.0],
+    'matrix': [{},
+               {0: 0.16666666666666666},
+               {0: 0.05333333333333334, 1: 0.21333333333333335},
+               {0: 0.8333333333333334, 1: -2.6666666666666665, 2: 2.5},
+               {0: -2.578125, 1: 9.166666666666666, 2: -6.640625, 3: 0.8854166666666666},
+               {0: 2.4, 1: -8.0, 2: 6.560457516339869, 3: -0.3055555555555556, 4: 0.34509803921568627},
+               {0: -0.5508666666666666, 1: 1.6533333333333333, 2: -0.9455882352941176, 3: -0.324, 4: 0.23378823529411766},
+               {0: 2.03546511627907, 1: -6.976744186046512, 2: 5.648179814561484, 3: -0.13738156761412576, 4: 0.2863022661036103, 6: 0.1441785567164738}],
+    'weights': {0: 0.075, 2: 0.3899286987522282, 3: 0.3194444444444444, 4: 0.1350383631713555, 6: 0.010783298826777088, 7: 0.0698051948051948},
+    'embedded_weights': {0: 0.08125, 2: 0.39689171122994654, 3: 0.3125, 4: 0.1411764705882353, 5: 0.06818181818181818},
+    }
+
+methods['rktf65'] = {
+    'type': 'variable',
+    'order': 6,
+    'fsal': True,
+    'nodes': [0.0, 0.09289617486338798, 0.14457831325301204, 0.21686746987951808, 0.568, 0.711864406779661, 0.995, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.09289617486338798},
+               {0: 0.032071588978166386, 1: 0.11250672427484566},
+               {0: 0.05421686746987952, 2: 0.16265060240963855},
+               {0: 0.656598126617284, 2: -2.4972770465185183, 3: 2.4086789199012344},
+               {0: -1.7212338830272755, 2: 7.223107511920211, 3: -5.4959191727393515, 4: 0.7059099506260772},
+               {0: 4.128671897161615, 2: -16.91402530428944, 3: 14.328981321740587, 4: -1.553355090373531, 5: 1.004727175760767},
+               {0: 4.468607842844296, 2: -18.34544186942965, 3: 15.52377072335432, 4: -1.7228800213316942, 5: 1.0815157174021452, 6: -0.005572392839416983},
+               {0: 0.06423090937210832, 3: 0.3328618246994211, 4: 0.2678592291657781, 5: 0.17986389967093872, 6: 1.5107578480576216, 7: -1.3555737109658679}],
+    'weights': {0: 0.06423090937210832, 3: 0.3328618246994211, 4: 0.2678592291657781, 5: 0.17986389967093872, 6: 1.5107578480576216, 7: -1.3555737109658679},
+    'embedded_weights': {0: 0.06229809541712388, 3: 0.34020351963578366, 4: 0.235997541364109, 5: 0.22064027639604253, 6: 1.1504413395286892, 7: -1.0029141056750814, 8: -0.006666666666666667},
+    }
+
+methods['rktp75'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.05555555555555555, 0.1111111111111111, 0.16666666666666666, 0.445, 0.4908533140984974, 0.7789473684210526, 0.8888888888888888, 1.0],
+    'matrix': [{},
+               {0: 0.05555555555555555},
+               {1: 0.1111111111111111},
+               {0: 0.041666666666666664, 2: 0.125},
+               {0: 0.54599275, 2: -2.08520325, 3: 1.9842105},
+               {0: 0.09321972641166316, 2: -0.2573578730175699, 3: 0.5116433274558552, 4: 0.14334813324854906},
+               {0: -1.4176460982947718, 2: 5.417551680947622, 3: -3.6957370570612493, 4: -1.83931573936193, 5: 2.314094582191381},
+               {0: 4.027366603681875, 2: -13.893751405017722, 3: 9.821993583456603, 4: 6.948634674844082, 5: -6.5788068379457565, 6: 0.5634522698698085},
+               {0: -3.639820516841943, 2: 12.199086990863163, 3: -7.580623421906959, 4: -8.386999372337376, 5: 8.466692807198577, 6: -0.32879551462326584, 7: 0.27045902764780333}],
+    'weights': {0: 0.04832452014645872, 3: 0.26221633878091855, 4: 0.061253766845397226, 5: 0.2814600225907228, 6: 0.20066029452920714, 7: 0.10354589755797534, 8: 0.04253915954932026},
+    'embedded_weights': {0: 0.030782228319244858, 3: 0.3287087220583171, 4: -0.46398182767600177, 5: 0.809940131628202, 6: 0.11300671298318886, 7: 0.13900487313772877, 8: 0.04253915954932026},
+    }
+
+methods['rktmy7'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.07816646510113846, 0.1172496976517077, 0.17587454647756157, 0.4987401101913988, 0.7721216901844838, 0.9911856696047768, 0.9995019582097662, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.07816646510113846},
+               {0: 0.029312424412926925, 1: 0.08793727323878078},
+               {0: 0.04396863661939039, 2: 0.13190590985817116},
+               {0: 0.7361834837738384, 2: -2.8337999624233308, 3: 2.5963565888408913},
+               {0: -12.062819391370866, 2: 48.20838100175243, 3: -38.05863046463434, 4: 2.6851905444372632},
+               {0: 105.21957276320198, 2: -417.92888626241256, 3: 332.3155504499333, 4: -19.827591183572938, 5: 1.2125399024549859},
+               {0: 114.67755718631742, 2: -455.5612169896097, 3: 362.24095553923144, 4: -21.67190442182809, 5: 1.3189132007137807, 6: -0.0048025566150346555},
+               {0: 115.21334870553768, 2: -457.69356568613233, 3: 363.93688218862735, 4: -21.776682078900294, 5: 1.3250670887878468, 6: -0.004518190986768983, 7: -0.0005320269334859959},
+               {0: 115.18928245800194, 2: -457.59802227164295, 3: 363.8610256312148, 4: -21.77212754027556, 5: 1.3248804645074317, 6: -0.0045057252106918315, 7: -0.0005330165949429136}],
+    'weights': {0: 0.05126014249744686, 3: 0.27521638456212627, 4: 0.33696650340710543, 5: 0.18986072244906577, 6: 8.461099418514403, 7: -130.15941672640542, 8: 121.84501355497528},
+    'embedded_weights': {0: 0.05151786740451655, 3: 0.2742934740775871, 4: 0.34014440474452484, 5: 0.1777561335073176, 6: 11.167123377986993, 7: -174.70086236767148, 8: 243.69002710995056, 9: -80.0},
+    }
+
+methods['rktmy7s'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.08861369109047128, 0.1329205366357069, 0.19938080495356036, 0.25193798449612403, 0.022646643302093667, 0.6782608695652174, 0.7661290322580645, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.08861369109047128},
+               {0: 0.03323013415892673, 1: 0.09969040247678018},
+               {0: 0.04984520123839009, 2: 0.14953560371517027},
+               {0: 0.055134740196780316, 2: 0.11288572014198933, 3: 0.08391752415735439},
+               {0: 0.015378035365962425, 2: 0.032016883385768594, 3: -0.042539659878681656, 4: 0.017791384429044307},
+               {0: -15.25687339255491, 2: -0.40883456759270365, 3: -13.608204533866463, 4: 10.114904423696782, 5: 19.837268939882513},
+               {0: 1.8848664518756053, 2: 0.07387234007363162, 3: 0.8045720705665, 4: 0.004636646448314295, 5: -2.2571634399585374, 6: 0.2553449632525505},
+               {0: -5.934625458772476, 2: -0.07825443792492694, 3: -7.81908506973114, 4: 6.628389526165371, 5: 8.023083707285215, 6: -0.9042880305599429, 7: 1.0847797635378986},
+               {0: 16.21792538691099, 2: 0.21666488848433982, 3: 12.822426568456487, 4: -8.108967287633698, 5: -20.667128454690445, 6: -0.3183360394677675, 7: 0.8374149379400899}],
+    'weights': {0: -0.705096075764089, 3: -1.3042081566303485, 4: 1.4816031126459965, 5: 1.068950753636748, 6: 0.06135774831628442, 7: 0.3269125476049417, 8: 0.07048007019046698},
+    'embedded_weights': {0: -0.3683150779599127, 3: -0.8095009119119675, 4: 1.0817384916981332, 5: 0.6136017031650216, 6: 0.13892548732448975, 7: 0.2685503076842357, 9: 0.075},
+    }
+
+methods['rkv76e'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.005, 0.10888888888888888, 0.16333333333333333, 0.4555, 0.6095094489978381, 0.884, 0.925, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.005},
+               {0: -1.07679012345679, 1: 1.185679012345679},
+               {0: 0.04083333333333333, 2: 0.1225},
+               {0: 0.6389139236255726, 2: -2.455672638223657, 3: 2.272258714598084},
+               {0: -2.6615773750187572, 2: 10.804513886456137, 3: -8.3539146573962, 4: 0.820487594956657},
+               {0: 6.067741434696771, 2: -24.711273635911084, 3: 20.427517930788895, 4: -1.9061579788166472, 5: 1.006172249242068},
+               {0: 12.054670076253203, 2: -49.75478495046899, 3: 41.142888638604674, 4: -4.461760149974004, 5: 2.042334822239175, 6: -0.09834843665406108},
+               {0: 10.138146522881808, 2: -42.6411360317175, 3: 35.76384003992257, 4: -4.3480228403929075, 5: 2.0098622683770357, 6: 0.3487490460338272, 7: -0.27143900510483127},
+               {0: -45.030072034298676, 2: 187.3272437654589, 3: -154.02882369350186, 4: 18.56465306347536, 5: -7.141809679295079, 6: 1.3088085781613785}],
+    'weights': {0: 0.04715561848627222, 3: 0.25750564298434153, 4: 0.2621665397741262, 5: 0.15216092656738558, 6: 0.49399691700324844, 7: -0.29430311714032503, 8: 0.0813174723249511},
+    'embedded_weights': {0: 0.044608606606341174, 3: 0.26716403785713727, 4: 0.2201018300177293, 5: 0.2188431703143157, 6: 0.22898717054112028, 9: 0.020295184663356284},
+    }
+
+methods['rkv76r'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.005, 0.10888888888888888, 0.16333333333333333, 0.455, 0.6059617471462914, 0.835, 0.915, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.005},
+               {0: -1.07679012345679, 1: 1.185679012345679},
+               {0: 0.04083333333333333, 2: 0.1225},
+               {0: 0.6360714285714286, 2: -2.4444642857142855, 3: 2.263392857142857},
+               {0: -2.5351211079349247, 2: 10.299374654449268, 3: -7.951303288599058, 4: 0.793011489231006},
+               {0: 1.0018765812524633, 2: -4.16657128244238, 3: 3.8343432929128642, 4: -0.5023333356071085, 5: 0.6676847438841608},
+               {0: 27.255018354630767, 2: -42.00461727841064, 3: -10.53571312661949, 4: 80.49553671141194, 5: -67.34388227179052, 6: 13.048657610777937},
+               {0: -3.0397378057114963, 2: 10.1381614103298, 3: -6.429305674864722, 4: -1.5864371483408277, 5: 1.8921781841968424, 6: 0.01969933540760887, 7: 0.005441698982793323},
+               {0: -1.4449518916777735, 2: 8.031891385995593, 3: -7.583174166340135, 4: 3.5816169353190075, 5: -2.436972263219953, 6: 0.8515899999232618}],
+    'weights': {0: 0.047425837833706755, 3: 0.2562236165937056, 4: 0.2695137683307421, 5: 0.12686622409092782, 6: 0.2488722594206007, 7: 0.003074483740820063, 8: 0.04802380998949694},
+    'embedded_weights': {0: 0.04748524769929963, 3: 0.25599412588690634, 4: 0.2705847808106769, 5: 0.12505618684425993, 6: 0.2520446872374386, 9: 0.048834971521418614},
+    }
+
+methods['rkss76'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.02, 0.216, 0.41, 0.57, 0.86, 0.18973441556755472, 0.72, 0.8333333333333334, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.02},
+               {0: -0.9504, 1: 1.1664},
+               {0: 0.02087962962962963, 2: 0.3891203703703704},
+               {0: 0.11875, 2: 0.11630154639175258, 3: 0.33494845360824743},
+               {0: -0.155, 2: 1.2641995262779817, 3: -1.4923539518900344, 4: 1.2431544256120528},
+               {0: 0.05324048184608472, 2: 0.2631909050059442, 3: -0.2299238258461125, 4: 0.1150206468345033, 5: -0.011793792272865037},
+               {0: 0.1018332505257794, 2: 3.6765040226402155, 3: -1.3855064886371957, 4: 1.1058553654324281, 5: -0.10442483660597753, 6: -2.6742613133552497},
+               {0: -0.07044727872544156, 2: 2.578490226910319, 3: -1.7350648742705534, 4: 1.4207692584265628, 5: -0.029994002356151423, 6: -1.2738969184577296, 7: -0.056523078193672326},
+               {0: 0.11218892956649759, 2: -9.44781797124636, 3: 4.729286859695065, 4: -2.153586297378452, 5: -1.5003176034455323, 6: 7.322284935163815, 7: -1.0171881348813827, 8: 2.95514928252635},
+               {0: 0.012677716595342461, 2: -10.06996058259304, 3: 4.625342428292135, 4: -2.161028333755277, 5: -1.6781218510451494, 6: 8.107205582962195, 7: -0.9903404669748168, 8: 3.154225506518613}],
+    'weights': {0: 0.054969993202218514, 4: 0.5270178995459013, 5: -0.5764001046025318, 6: 0.2994737660758575, 7: -0.43511367243178106, 8: 1.069721200959942, 9: 0.06033091725039352},
+    'embedded_weights': {0: 0.05519485966049739, 4: 0.5387714729592106, 5: -0.7200241573822275, 6: 0.2985353851848852, 7: -0.48443496217457505, 8: 1.2461137803530324, 10: 0.06584362139917696},
+    }
+
+methods['rkf78'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.07407407407407407, 0.1111111111111111, 0.16666666666666666, 0.4166666666666667, 0.5, 0.8333333333333334, 0.16666666666666666, 0.6666666666666666, 0.3333333333333333, 1.0, 0.0, 1.0],
+    'matrix': [{},
+               {0: 0.07407407407407407},
+               {0: 0.027777777777777776, 1: 0.08333333333333333},
+               {0: 0.041666666666666664, 2: 0.125},
+               {0: 0.4166666666666667, 2: -1.5625, 3: 1.5625},
+               {0: 0.05, 3: 0.25, 4: 0.2},
+               {0: -0.23148148148148148, 3: 1.1574074074074074, 4: -2.4074074074074074, 5: 2.314814814814815},
+               {0: 0.10333333333333333, 4: 0.27111111111111114, 5: -0.2222222222222222, 6: 0.014444444444444444},
+               {0: 2.0, 3: -8.833333333333334, 4: 15.644444444444444, 5: -11.88888888888889, 6: 0.7444444444444445, 7: 3.0},
+               {0: -0.8425925925925926, 3: 0.21296296296296297, 4: -7.229629629629629, 5: 5.7592592592592595, 6: -0.31666666666666665, 7: 2.8333333333333335, 8: -0.08333333333333333},
+               {0: 0.5812195121951219, 3: -2.0792682926829267, 4: 4.3863414634146345, 5: -3.6707317073170733, 6: 0.5202439024390244, 7: 0.5487804878048781, 8: 0.27439024390243905, 9: 0.43902439024390244},
+               {0: 0.014634146341463415, 5: -0.14634146341463414, 6: -0.014634146341463415, 7: -0.07317073170731707, 8: 0.07317073170731707, 9: 0.14634146341463414},
+               {0: -0.43341463414634146, 3: -2.0792682926829267, 4: 4.3863414634146345, 5: -3.524390243902439, 6: 0.5348780487804878, 7: 0.6219512195121951, 8: 0.20121951219512196, 9: 0.2926829268292683, 11: 1.0}],
+    'weights': {5: 0.3238095238095238, 6: 0.2571428571428571, 7: 0.2571428571428571, 8: 0.03214285714285714, 9: 0.03214285714285714, 11: 0.04880952380952381, 12: 0.04880952380952381},
+    'embedded_weights': {0: -0.04880952380952381, 5: 0.3238095238095238, 6: 0.2571428571428571, 7: 0.2571428571428571, 8: 0.03214285714285714, 9: 0.03214285714285714, 10: -0.04880952380952381, 11: 0.09761904761904762, 12: 0.09761904761904762},
+    }
+
+methods['rkv78'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.25, 0.08333333333333333, 0.125, 0.4, 0.5, 0.8571428571428571, 0.14285714285714285, 0.6666666666666666, 0.2857142857142857, 1.0, 0.3333333333333333, 1.0],
+    'matrix': [{},
+               {0: 0.25},
+               {0: 0.06944444444444445, 1: 0.013888888888888888},
+               {0: 0.03125, 2: 0.09375},
+               {0: 0.848, 2: -3.264, 3: 2.816},
+               {0: 0.020833333333333332, 3: 0.24242424242424243, 4: 0.23674242424242425},
+               {0: -0.5260308204914619, 3: 1.5120972322138504, 4: -2.4279656203854456, 5: 2.299042065805914},
+               {0: 0.09438775510204081, 4: 0.17272534013605442, 5: -0.13333333333333333, 6: 0.009077380952380953},
+               {0: 0.6731726435430139, 3: -1.8461297276112092, 4: 2.628968253968254, 5: -1.6379384675680972, 6: 0.1387997256515775, 7: 0.7097942386831275},
+               {0: -0.13235596279328057, 3: -0.03928868022162483, 4: -1.0043716002170813, 5: 0.8464739691795086, 6: -0.02614285714285714, 7: 0.7272727272727273, 8: -0.08587331036310628},
+               {0: 1.6753947368421052, 3: -3.8338755980861245, 4: 5.68786134370016, 5: -5.9788070175438595, 6: 0.3719594298245614, 7: -0.24617224880382776, 8: 1.2080965909090908, 9: 2.1155427631578947},
+               {0: -0.1325739760924946, 3: 0.14411487004079596, 4: -1.1304972676500453, 5: 0.692220262590633, 6: -0.06146004801097394, 7: 0.43555555555555553, 8: 0.0625, 9: 0.3234739368998628},
+               {0: 1.290668202764977, 3: -3.1959782153330543, 4: 5.137256057114928, 5: -5.164116743471582, 6: 0.41135691593352885, 7: 0.5517888563049853, 8: 0.8684934017595308, 9: -1.0372983870967742, 11: 2.1378299120234603}],
+    'weights': {0: 0.04513888888888889, 5: 0.256, 6: 0.21675694444444443, 7: 0.194020202020202, 8: 0.12080965909090909, 9: 0.12505208333333334, 10: 0.042222222222222223},
+    'embedded_weights': {0: 0.04722222222222222, 5: 0.2986666666666667, 6: 0.22130429292929293, 7: 0.1758308080808081, 8: 0.10355113636363636, 9: 0.2501041666666667, 10: 0.08444444444444445, 11: -0.1380681818181818, 12: -0.043055555555555555},
+    }
+
+methods['dverk78'] = {
+    'type': 'variable',
+    'order': 7,
+    'fsal': False,
+    'nodes': [0.0, 0.0625, 0.10516431924882629, 0.15774647887323945, 0.39, 0.4666666666666667, 0.156, 0.96, 0.8922672615828766, 0.9166666666666666, 0.95, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.0625},
+               {0: 0.016688046904273845, 1: 0.08847627234455245},
+               {0: 0.03943661971830986, 2: 0.11830985915492957},
+               {0: 0.3766560865752551, 2: -1.406276295440051, 3: 1.419620208864796},
+               {0: 0.04783554922443811, 3: 0.23446467743263782, 4: 0.18436644000959074},
+               {0: 0.06114542571428572, 3: 0.112966312083735, 4: -0.03652312621615208, 5: 0.01841138841813136},
+               {0: -1.129019034481282, 3: -1.4, 4: -8.88029287046486, 5: 7.130944096777573, 6: 5.23836780816857},
+               {0: -0.6152935332131024, 3: -4.951873062730721, 4: -5.142556882122354, 5: 4.401192576384304, 6: 7.191353170605057, 7: 0.009444992659692788},
+               {0: -0.8048775495001265, 3: -4.592913194094832, 4: -6.534479642987198, 5: 5.436537216458481, 6: 7.414283767862391, 7: 0.016296919876149292, 8: -0.018180850948197737},
+               {0: -1.057858105660263, 3: -2.490274787006667, 4: -8.367865364118767, 5: 6.767063913725102, 6: 6.101875757547507, 7: 0.022634692659126827, 8: 0.024211528897066605, 9: -0.04978763604310583},
+               {0: -2.2141388211521593, 3: 4.563558047246469, 4: -16.957036205517106, 5: 13.110521792864143, 6: 2.6577422474987027, 7: 2.7459293410443686, 8: -1.1506549223705345, 9: 2.423022961214488, 10: -4.1789444408283725},
+               {0: -1.5511316950026917, 3: 5.460927226234091, 4: -11.979220224305761, 5: 9.352132875099858, 6: -0.2680515143578687, 7: -0.29111005885695085, 8: -0.5734260821299738, 9: 0.8498794733192964}],
+    'weights': {0: 0.04462884896530702, 5: 0.35384967280805696, 6: 0.24921413782403465, 7: -5.22833847098025, 8: 5.151165492368612, 9: -9.509792872164367, 10: 10.05963413734315, 11: -0.12036094616454239},
+    'embedded_weights': {0: 0.04469383369747454, 5: 0.35484907853485725, 6: 0.24897282754625455, 7: 2.6656317330488437, 8: 3.9232639487183896, 9: -5.6804277609880005, 12: -0.5569836605578194},
+    }
+
+methods['rkdp85'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.05260015195876773, 0.0789002279381516, 0.1183503419072274, 0.2816496580927726, 0.3333333333333333, 0.25, 0.3076923076923077, 0.6512820512820513, 0.6, 0.8571428571428571, 1.0],
+    'matrix': [{},
+               {0: 0.05260015195876773},
+               {0: 0.0197250569845379, 1: 0.0591751709536137},
+               {0: 0.02958758547680685, 2: 0.08876275643042054},
+               {0: 0.2413651341592667, 2: -0.8845494793282861, 3: 0.924834003261792},
+               {0: 0.037037037037037035, 3: 0.17082860872947386, 4: 0.12546768756682242},
+               {0: 0.037109375, 3: 0.17025221101954405, 4: 0.06021653898045596, 5: -0.017578125},
+               {0: 0.03709200011850479, 3: 0.17038392571223998, 4: 0.10726203044637328, 5: -0.015319437748624402, 6: 0.008273789163814023},
+               {0: 0.6241109587160757, 3: -3.3608926294469414, 4: -0.868219346841726, 5: 27.59209969944671, 6: 20.154067550477894, 7: -43.48988418106996},
+               {0: 0.47766253643826434, 3: -2.4881146199716677, 4: -0.590290826836843, 5: 21.230051448181193, 6: 15.279233632882423, 7: -33.28821096898486, 8: -0.020331201708508627},
+               {0: -0.9371424300859873, 3: 5.186372428844064, 4: 1.0914373489967295, 5: -8.149787010746927, 6: -18.52006565999696, 7: 22.739487099350505, 8: 2.4936055526796523, 9: -3.0467644718982196},
+               {0: 2.273310147516538, 3: -10.53449546673725, 4: -2.0008720582248625, 5: -17.9589318631188, 6: 27.94888452941996, 7: -2.8589982771350235, 8: -8.87285693353063, 9: 12.360567175794303, 10: 0.6433927460157636}],
+    'weights': {0: 0.054293734116568765, 5: 4.450312892752409, 6: 1.8915178993145003, 7: -5.801203960010585, 8: 0.3111643669578199, 9: -0.1521609496625161, 10: 0.20136540080403034, 11: 0.04471061572777259},
+    'embedded_weights': {0: 0.04117368912237388, 5: 5.675469339128614, 6: 2.3872768489717506, 7: -7.465581142465571, 8: 0.6614932157077936, 9: -0.48634006837553356, 10: 0.11944219431891463, 11: 0.06706592359165889},
+    }
+
+methods['rktp86'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.06338028169014084, 0.1027879458763643, 0.15418191881454646, 0.3875968992248062, 0.4657534246575342, 0.1554054054054054, 1.0070921985815602, 0.876141078561489, 0.9120879120879121, 0.959731543624161, 1.0],
+    'matrix': [{},
+               {0: 0.06338028169014084},
+               {0: 0.019438980427336498, 1: 0.08334896544902781},
+               {0: 0.038545479703636615, 2: 0.11563643911090984},
+               {0: 0.39436557770112496, 2: -1.4818719321673373, 3: 1.4751032536910185},
+               {0: 0.045994489107698204, 3: 0.23235070626395474, 4: 0.18740822928588133},
+               {0: 0.06005228953244051, 3: 0.11220383194636774, 4: -0.03357232951906142, 5: 0.016721613445658576},
+               {0: -1.5733292732086859, 3: -1.3167087730223663, 4: -11.723515296181773, 5: 9.107825028173874, 6: 6.512820512820513},
+               {0: -0.48107625624391254, 3: -6.6506103607463904, 4: -4.530206099782572, 5: 3.894414525020157, 6: 8.634217645525526, 7: 0.009401624788681498},
+               {0: -0.7754121446230569, 3: -7.996604718235832, 4: -6.726558607230182, 5: 5.532184454327406, 6: 10.89757332024991, 7: 0.020091650280045396, 8: -0.039186042680376856},
+               {0: -1.1896363245449992, 3: -7.128368483301214, 4: -9.53722789710108, 5: 7.574470108980868, 6: 11.267486382070919, 7: 0.051009801223058315, 8: 0.08019413469508256, 9: -0.15819617839847347},
+               {0: -0.39200039047127266, 3: 3.916659042493856, 4: -2.8017459289080557, 5: 2.441204566481742, 6: -2.4183655778824718, 7: -0.33943326290032927, 8: 0.19496450383103364, 9: -0.19437176762508154, 10: 0.5930888149805791}],
+    'weights': {0: 0.04441161093250152, 5: 0.35395063113733116, 6: 0.2485219684184965, 7: -0.3326913171720666, 8: 1.921248828652836, 9: -2.7317783000882523, 10: 1.4012004409899175, 11: 0.0951361371292365},
+    'embedded_weights': {0: 0.04814406760577095, 5: 0.3834226632975234, 6: 0.23694140229034227, 7: 0.43001667874641764, 8: -0.12508153836538882, 9: 1.431420589296098, 10: -1.5, 11: 0.0951361371292365},
+    }
+
+methods['rkdp87'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.05555555555555555, 0.08333333333333333, 0.125, 0.3125, 0.375, 0.1475, 0.465, 0.5648654513822595, 0.65, 0.9246562776405044, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.05555555555555555},
+               {0: 0.020833333333333332, 1: 0.0625},
+               {0: 0.03125, 2: 0.09375},
+               {0: 0.3125, 2: -1.171875, 3: 1.171875},
+               {0: 0.0375, 3: 0.1875, 4: 0.15},
+               {0: 0.04791013711111111, 3: 0.11224871277777777, 4: -0.02550567377777778, 5: 0.012846823888888888},
+               {0: 0.01691798978729228, 3: 0.3878482784860432, 4: 0.03597736985150033, 5: 0.19697021421566607, 6: -0.17271385234050185},
+               {0: 0.0690957533591923, 3: -0.6342479767288541, 4: -0.16119757522460407, 5: 0.13865030945882525, 6: 0.9409286140357562, 7: 0.21163632648194397},
+               {0: 0.1835569968390454, 3: -2.4687680843155926, 4: -0.29128688781630047, 5: -0.026473020233117376, 6: 2.8478387641928005, 7: 0.2813873314698498, 8: 0.12374489986331466},
+               {0: -1.2154248173958881, 3: 16.672608665945774, 4: 0.915741828416818, 5: -6.056605804357471, 6: -16.00357359415618, 7: 14.849303086297663, 8: -13.371575735289849, 9: 5.134182648179638},
+               {0: 0.25886091643826425, 3: -4.774485785489205, 4: -0.4350930137770325, 5: -3.0494833320722416, 6: 5.5779200399360995, 7: 6.15583158986104, 8: -5.062104586736939, 9: 2.193926173180679, 10: 0.13462799865933495},
+               {0: 0.8224275996265075, 3: -11.658673257277664, 4: -0.7576221166909362, 5: 0.7139735881595816, 6: 12.075774986890057, 7: -2.127659113920403, 8: 1.9901662070489554, 9: -0.23428647154404028, 10: 0.17589857770794226}],
+    'weights': {0: 0.041747491141530244, 5: -0.05545232861123931, 6: 0.2393128072011801, 7: 0.703510669403443, 8: -0.7597596138144609, 9: 0.6605630309222863, 10: 0.15818748251012332, 11: -0.2381095387528628, 12: 0.25},
+    'embedded_weights': {0: 0.0295532136763535, 5: -0.828606276487797, 6: 0.3112409000511183, 7: 2.467345190599887, 8: -2.546941651841909, 9: 1.4435485836767752, 10: 0.07941559588112729, 11: 0.044444444444444446},
+    }
+
+methods['rkv87e'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.05, 0.1065625, 0.15984375, 0.39, 0.465, 0.155, 0.943, 0.901802041735857, 0.909, 0.94, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.05},
+               {0: -0.0069931640625, 1: 0.1135556640625},
+               {0: 0.0399609375, 2: 0.1198828125},
+               {0: 0.36139756280045754, 2: -1.3415240667004928, 3: 1.3701265039000352},
+               {0: 0.049047202797202795, 3: 0.23509720422144048, 4: 0.18085559298135673},
+               {0: 0.06169289044289044, 3: 0.11236568314640277, 4: -0.03885046071451367, 5: 0.01979188712522046},
+               {0: -1.767630240222327, 3: -62.5, 4: -6.061889377376669, 5: 5.6508231982227635, 6: 65.62169641937624},
+               {0: -1.1809450665549708, 3: -41.50473441114321, 4: -4.434438319103725, 5: 4.260408188586133, 6: 43.75364022446172, 7: 0.00787142548991231},
+               {0: -1.2814059994414884, 3: -45.047139960139866, 4: -4.731362069449577, 5: 4.514967016593808, 6: 47.44909557172985, 7: 0.010592282971116612, 8: -0.0057468422638446166},
+               {0: -1.7244701342624853, 3: -60.92349008483054, 4: -5.951518376222393, 5: 5.556523730698456, 6: 63.98301198033305, 7: 0.014642028250414961, 8: 0.06460408772358203, 9: -0.0793032316900888},
+               {0: -3.301622667747079, 3: -118.01127235975251, 4: -10.141422388456112, 5: 9.139311332232058, 6: 123.37594282840426, 7: 4.62324437887458, 8: -3.3832777380682018, 9: 4.527592100324618, 10: -5.828495485811623},
+               {0: -3.039515033766309, 3: -109.26086808941763, 4: -9.290642497400293, 5: 8.43050498176491, 6: 114.20100103783314, 7: -0.9637271342145479, 8: -5.0348840888021895, 9: 5.958130824002923}],
+    'weights': {0: 0.04427989419007951, 5: 0.3541049391724449, 6: 0.2479692154956438, 7: -15.694202038838084, 8: 25.084064965558564, 9: -31.738367786260277, 10: 22.938283273988784, 11: -0.2361324633071542},
+    'embedded_weights': {0: 0.044312615229089795, 5: 0.35460956423432266, 6: 0.2478480431366653, 7: 4.4481347324757845, 8: 19.846886366118735, 9: -23.58162337746562, 12: -0.36016794372897754},
+    }
+
+methods['rkv87r'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.25, 0.11288845144356956, 0.16933267716535433, 0.424, 0.509, 0.867, 0.15, 0.7090680365138684, 0.32, 0.45, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.25},
+               {0: 0.08740084650491524, 1: 0.02548760493865432},
+               {0: 0.04233316929133858, 2: 0.12699950787401576},
+               {0: 0.4260950588874226, 2: -1.5987952846591522, 3: 1.5967002257717298},
+               {0: 0.05071933729671393, 3: 0.2543337726460041, 4: 0.203946890057282},
+               {0: -0.2900037471752311, 3: 1.344187391026079, 4: -2.864777943361443, 5: 2.677594299510595},
+               {0: 0.09853501133799354, 4: 0.22192680630751385, 5: -0.18140622911806994, 6: 0.010944411472562547},
+               {0: 0.38711052545731145, 3: -1.4424454974855279, 4: 2.9053981890699507, 5: -1.853771069630106, 6: 0.14003648098728155, 7: 0.5727394081149582},
+               {0: -0.1612440344443931, 3: -0.17339602957358985, 4: -1.3012892814065147, 5: 1.1379503751738618, 6: -0.03174764966396688, 7: 0.9335129382493367, 8: -0.08378631833473385},
+               {0: -0.019199444881589534, 3: 0.27330857265264286, 4: -0.6753497320694437, 5: 0.34151849813846014, 6: -0.06795006480337577, 7: 0.09659175224762388, 8: 0.13253082511182102, 9: 0.36854959360386114},
+               {0: 0.6091877403645289, 3: -2.272569085898002, 4: 4.757898342694029, 5: -5.516106706692758, 6: 0.2900596369680119, 7: 0.5691423963359037, 8: 0.7926795760332167, 9: 0.15473720453288822, 10: 1.6149708956621815},
+               {0: 0.8873576220853472, 3: -2.975459782108537, 4: 5.600717009488163, 5: -5.915607450536674, 6: 0.22029689156134927, 7: 0.10155097824462217, 8: 1.1514345647386055, 9: 1.929710166527124}],
+    'weights': {0: 0.04472956466669571, 5: 0.156910335277082, 6: 0.18460973408151637, 7: 0.2251638060208699, 8: 0.14794615651970236, 9: 0.07605554244495583, 10: 0.1227729023501862, 11: 0.041811958638991634},
+    'embedded_weights': {0: 0.045847111400495924, 5: 0.26231891404152385, 6: 0.1916937233785261, 7: 0.21709172327902618, 8: 0.12738189624833707, 9: 0.11510530385365327, 12: 0.04056132779843757},
+    }
+
+methods['rkev87'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.0556, 0.10257777296360485, 0.15386665944540728, 0.3846, 0.4615, 0.1538, 0.8571, 0.9505222795498985, 0.7222, 0.9375, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.0556},
+               {0: 0.007953676685071916, 1: 0.09462409627853294},
+               {0: 0.03846666486135182, 2: 0.11539999458405546},
+               {0: 0.3843917952499957, 2: -1.4413754967533896, 3: 1.4415837015033939},
+               {0: 0.04616799272252458, 3: 0.23076667147858013, 4: 0.1845653357988953},
+               {0: 0.059834065698168494, 3: 0.11107098836580696, 4: -0.034214310915191934, 5: 0.017109256851216476},
+               {0: -0.537950077527873, 3: -6.937648213098321, 4: -4.662453820973334, 5: 3.9951521115995274, 6: 9.0},
+               {0: -1.632427440798659, 3: -10.827155649128676, 4: -12.412770216529557, 5: 9.727368979580298, 6: 16.19935091451716, 7: -0.10384430809066836},
+               {0: 0.43796950618238784, 3: 3.939531880407806, 4: 2.860770346856715, 5: -1.7743107088675159, 6: -4.895390517764201, 7: 0.21302485881991975, 8: -0.05939536563511149},
+               {0: -1.474197153008405, 3: -10.994004568773832, 4: -11.347103595550559, 5: 8.956987328058476, 6: 15.89377887267685, 7: -0.09875257420523141, 8: 0.004888504584952203, 9: -0.004096813782251029},
+               {0: -2.6300593327636133, 3: -9.174218051163518, 4: -19.181392627635585, 5: 14.642558693696648, 6: 17.529319464180844, 7: -0.37191756017725563, 8: -0.7009961538315145, 9: 0.05101601661234198, 10: 0.8356895510816525},
+               {0: 0.21576032256147498, 3: 8.345147326678234, 4: 2.1856623854651103, 5: -1.6872364802758613, 6: -8.711897900984477, 7: 0.024441459342989125, 8: 0.08463787994505391, 9: 0.5434850072674758}],
+    'weights': {0: 0.04391770364439903, 5: 0.35102462530119805, 6: 0.246142826354924, 7: 0.9003244930529127, 8: 4.549418727254747, 9: 0.004802501519237061, 10: -4.741054352120046, 11: -0.3545765250073718},
+    'embedded_weights': {0: 0.04332105381221431, 5: 0.33829978623932444, 6: 0.24847984281916968, 7: 0.22378829672638192, 8: -0.04020162862502465, 9: 0.12329231693619831, 12: 0.063020332091736},
+    }
+
+methods['rkk87'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.028003213779531112, 0.11721154245579819, 0.1758173136836973, 0.41241877497226465, 0.48578804012565363, 0.16194543688186486, 0.9699996226367628, 0.9672121871693798, 0.951733593009251, 0.9682027711701542, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.028003213779531112},
+               {0: -0.12809147513766, 1: 0.2453030175934582},
+               {0: 0.043954328420924324, 2: 0.13186298526277299},
+               {0: 0.33779358167877027, 2: -1.2272549349642135, 3: 1.301880128257708},
+               {0: 0.05557071807428549, 3: 0.25120170705633577, 4: 0.17901561499503238},
+               {0: 0.06685743472634999, 3: 0.11846427914544787, 4: -0.04962577604345176, 5: 0.026249499053518765},
+               {0: -2.8828852333227597, 3: -62.44020835850411, 4: -1.8568693804204652, 5: 3.6368027271535905, 6: 64.51315986773051},
+               {0: -2.804417703006221, 3: -60.72492351442399, 4: -1.8439925449308252, 5: 3.583411316834365, 6: 62.75623143363503, 7: 0.0009031990610227395},
+               {0: -2.3867982748517265, 3: -51.62706310912396, 4: -1.753688623113895, 5: 3.280495648588325, 6: 53.43203831809595, 7: -0.05187187174905481, 8: 0.05862150516361397},
+               {0: -2.832184483367819, 3: -61.33178230029981, 4: -1.8486956144396107, 5: 3.6024501737655914, 6: 63.37784912676162, 7: -0.014415990912159638, 8: 0.0179850128395125, 9: -0.0030031531771736375},
+               {0: -4.053861888018879, 3: -89.57342462068873, 4: -2.174160277997156, 5: 4.902779845662998, 6: 92.13088119592615, 7: -106.15798848368367, 8: 715.244888413934, 9: -58.74164155345855, 10: -550.5774726316761},
+               {0: -15.426576117927493, 3: -408.42463342275505, 4: -13.703330210475052, 5: 38.686174838028386, 6: 411.0644811623651, 7: -5262.589642298483, 8: 35912.040146835134, 9: -2942.8565975170827, 10: -27717.7900232688}],
+    'weights': {0: 0.04627101445597495, 5: 0.37002426113057957, 6: 0.25904690643832534, 7: 439.52615194135063, 8: 0.0025469978325444254, 9: 37.11602650087656, 10: -469.57326399687634, 11: -6.884085623127133, 12: 0.13728199791883455},
+    'embedded_weights': {0: 0.046265161497547835, 5: 0.36993034844296074, 6: 0.25906876524654354, 7: 57.37874234550622, 8: -757.5914592587426, 9: 42.173251346011995, 10: 664.4991081730038, 11: -6.258460679093418, 12: 0.1235537981269511},
+    }
+
+methods['rkf89'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.44368940376498184, 0.6655341056474727, 0.9983011584712091, 0.3155, 0.5054410094816907, 0.17142857142857143, 0.8285714285714286, 0.6654396612101157, 0.24878317968062652, 0.109, 0.891, 0.3995, 0.6005, 1.0, 0.0, 1.0],
+    'matrix': [{},
+               {0: 0.44368940376498184},
+               {0: 0.16638352641186818, 1: 0.4991505792356046},
+               {0: 0.2495752896178023, 2: 0.7487258688534069},
+               {0: 0.20661891163400603, 2: 0.17707880377986346, 3: -0.0681977154138695},
+               {0: 0.10927823152666408, 3: 0.0040215962642368, 4: 0.3921411816907898},
+               {0: 0.09889928140916467, 3: 0.003513837022796397, 4: 0.12476099983160016, 5: -0.0557455468349898},
+               {0: -0.368068652862422, 4: -2.2273897469476007, 5: 1.374290825670291, 6: 2.0497390027111604},
+               {0: 0.04546796264134715, 5: 0.3254213170158915, 6: 0.2847666013852791, 7: 0.009783780167597915},
+               {0: 0.06084207106262206, 5: -0.021184565744037008, 6: 0.19596557266170833, 7: -0.00427426403648176, 8: 0.01743436573681491},
+               {0: 0.05405978329693192, 6: 0.11029825597828927, 7: -0.0012565008520072556, 8: 0.003679004347758146, 9: -0.057780542770972075},
+               {0: 0.12732477068667114, 7: 0.11448805006396105, 8: 0.28773020709697994, 9: 0.5094537945961136, 10: -0.14799682244372575},
+               {0: -0.003652679387661674, 5: 0.08162989601231892, 6: -0.3860773563569351, 7: 0.030862242924605106, 8: -0.058077254528320604, 9: 0.3359865932888497, 10: 0.41066880401949957, 11: -0.011840245972355985},
+               {0: -1.2375357921245143, 5: -24.430768551354785, 6: 0.5477956893277866, 7: -4.441386353341325, 8: 10.013104813713266, 9: -14.995773102051759, 10: 5.8946948523217015, 11: 1.7380377503428985, 12: 27.51233069316673},
+               {0: -0.3526085938833452, 5: -0.1839610314484827, 6: -0.6557018944974164, 7: -0.39086144880439866, 8: 0.26794646712850023, 9: -1.0383022991382491, 10: 1.6672327324258671, 11: 0.49551925855315976, 12: 1.1394001132397062, 13: 0.051336696424658615},
+               {0: 0.001046484734061481, 8: -0.006716388684499028, 9: 0.008182876218942502, 10: -0.0042640342864483346, 11: 0.00028009029474168937, 12: -0.008783533387623868, 13: 0.010254505110825558},
+               {0: -1.3536550786174066, 5: -0.1839610314484827, 6: -0.6557018944974164, 7: -0.39086144880439866, 8: 0.27466285581299926, 9: -1.0464851753571915, 10: 1.6714967667123155, 11: 0.49523916825841807, 12: 1.1481836466273303, 13: 0.041082191313833054, 15: 1.0}],
+    'weights': {0: 0.03225608350021625, 8: 0.25983725283715403, 9: 0.09284780599657703, 10: 0.16452339514764344, 11: 0.17665951637860075, 12: 0.2392010232035276, 13: 0.003948427460420285, 14: 0.030726495475860642},
+    'embedded_weights': {0: 0.0015295880243556095, 8: 0.25983725283715403, 9: 0.09284780599657703, 10: 0.16452339514764344, 11: 0.17665951637860075, 12: 0.2392010232035276, 13: 0.003948427460420285, 15: 0.030726495475860642, 16: 0.030726495475860642},
+    }
+
+methods['rkv89'] = {
+    'type': 'variable',
+    'order': 8,
+    'fsal': False,
+    'nodes': [0.0, 0.08333333333333333, 0.1111111111111111, 0.16666666666666666, 0.45993196570442374, 0.5632993161855452, 0.2367006838144548, 0.6666666666666666, 0.5, 0.3333333333333333, 0.25, 1.3333333333333333, 0.8333333333333334, 1.0, 0.16666666666666666, 1.0],
+    'matrix': [{},
+               {0: 0.08333333333333333},
+               {0: 0.037037037037037035, 1: 0.07407407407407407},
+               {0: 0.041666666666666664, 2: 0.125},
+               {0: 0.6246720955243167, 2: -2.398057107150296, 3: 2.2333169773304027},
+               {0: 0.04367006838144548, 3: 0.2739534538730258, 4: 0.24567579393107397},
+               {0: 0.06162164740338976, 3: 0.18153182241228044, 4: -0.013477689611149632, 5: 0.007024903609934228},
+               {0: 0.07407407407407407, 5: 0.25093537513364483, 6: 0.3416572174589477},
+               {0: 0.07421875, 5: 0.12043307796091192, 6: 0.3405044220390881, 7: -0.03515625},
+               {0: 0.0763888888888889, 5: 0.3050353127977046, 6: 0.31070542794303607, 7: -0.0625, 8: -0.2962962962962963},
+               {0: 0.07112936653166925, 6: 0.378528288890093, 7: -0.011746330035023253, 8: 0.07272054197316799, 9: -0.260631867359907},
+               {0: -8.141639713875007, 5: -574.4363925623015, 6: 413.4855110109495, 7: 113.7192018693195, 8: 626.941484897877, 9: -241.54347414394468, 10: -328.69135802469134},
+               {0: 0.08780375928196306, 5: 0.6933735017302034, 6: -1.9030978898017554, 7: 0.22886338868455466, 8: -0.6904282483666235, 9: -0.07691188807155204, 10: 2.4919278252611585, 11: 0.0018028846153846155},
+               {0: -0.10570987654320987, 5: 5.574678190604247, 6: 7.4855069945809385, 7: -6.229166666666667, 8: 2.271604938271605, 9: -4.888888888888889, 10: -4.862298195631529, 11: -0.023504273504273504, 12: 1.7777777777777777},
+               {0: 0.05460359999545924, 5: -0.27271888150851575, 6: 0.07519616653023355, 7: -0.12546017773691093, 8: 0.7010486126362877, 9: -0.8679509557190229, 10: 0.564373897707231, 11: -0.0005208333333333333, 12: 0.0380952380952381},
+               {0: -0.39640169053274327, 5: -5.456847418559753, 6: 6.8152492203252, 7: 1.3810272319620716, 8: 3.730795461620606, 9: 7.805290213782615, 10: -18.706283701991858, 11: -0.002872235061076263, 12: 0.4223175965665236, 14: 5.407725321888412}],
+    'weights': {0: 0.06130952380952381, 7: -0.19285714285714287, 8: 0.7238095238095238, 9: -0.7178571428571429, 10: 0.7501831501831502, 11: 0.0004120879120879121, 12: 0.34285714285714286, 13: 0.03214285714285714},
+    'embedded_weights': {0: 0.07880952380952382, 7: -0.5078571428571429, 8: 1.2838095238095237, 9: -1.7678571428571428, 10: 1.8004395604395604, 11: 0.000989010989010989, 12: 0.46285714285714286, 13: 0.06428571428571428, 14: -0.36, 15: -0.05547619047619048},
+    }
+
+methods['rkt98a'] = {
+    'type': 'variable',
+    'order': 9,
+    'fsal': False,
+    'nodes': [0.0, 0.02040816326530612, 0.08813293914998103, 0.13219940872497155, 0.42857142857142855, 0.5364755392243288, 0.22542922268043314, 0.6349206349206349, 0.47619047619047616, 1.0555555555555556, 0.7777777777777778, 0.14741696242609947, 0.9375, 0.975, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.02040816326530612},
+               {0: -0.10216872744876832, 1: 0.19030166659874934},
+               {0: 0.033049852181242886, 2: 0.09914955654372866},
+               {0: 0.9439263832171292, 2: -3.630115063093482, 3: 3.1147601084477814},
+               {0: 0.020569233286162617, 3: 0.2604824183197403, 4: 0.2554238876184258},
+               {0: 0.04318483705109263, 3: 0.17692848398076896, 4: 0.007715414621876983, 5: -0.002399512973305442},
+               {0: 0.07054673721340388, 5: 0.23898607155585225, 6: 0.3253878261513788},
+               {0: 0.07068452380952381, 5: 0.11469816948658278, 6: 0.32428992575151244, 7: -0.033482142857142856},
+               {0: 0.3828039568865741, 5: -26.281045707631243, 6: -1.7484246434490047, 7: 8.7107466796875, 8: 19.991475270061727},
+               {0: 0.05775788905284689, 5: 0.76, 6: 0.401855328791556, 7: 0.06626589626062798, 8: -0.5150696954976788, 9: 0.006968359170425632},
+               {0: 0.06994103035906396, 5: -0.12061660605654705, 6: 0.13269630173144586, 7: 0.20315325380776278, 8: -0.0754864017502389, 9: 0.0037891036864390114, 10: -0.06605971935182621},
+               {0: 0.6878836016002818, 5: -3.6588085273664515, 6: 5.84550337856467, 7: 5.411412752004689, 8: -1.5820959882696735, 9: 0.09945248865706299, 10: -1.3295934871052344, 11: -4.536254218085344},
+               {0: 0.8075602959459266, 5: -7.835750139557993, 6: 6.1742000259412295, 7: 7.111311052783799, 8: 1.1264139826521842, 9: 0.11388385015897887, 10: -1.4347746786079132, 11: -5.064314742122893, 12: -0.023529647193319736},
+               {0: 0.8101674645254723, 5: -11.92841245677956, 6: 5.36431289849036, 7: 8.059954459759512, 8: 4.6180634390017214, 9: 0.11286016591818945, 10: -1.315207706945003, 11: -4.689892399903609, 12: 0.0067213745543296816, 13: -0.03856723862141421},
+               {0: 0.7081867006810967, 5: -11.351124043591897, 6: 4.439836852763619, 7: 7.160528966855847, 8: 4.944752289066181, 9: 0.09819535610867987, 10: -1.0238357391589519, 11: -3.9351856990315794, 12: -0.021862603745516462, 13: -0.019492079947479913}],
+    'weights': {0: 0.041535560088059593, 7: -0.42522808741698054, 8: 0.4911269629417609, 9: 0.4541782417588474, 10: 1.006032649094428, 11: 0.23969807142877259, 12: -4.455491297731408, 13: 9.288978775706102, 14: -6.410061645100352, 15: 0.7692307692307693},
+    'embedded_weights': {0: 0.03999250134104312, 7: 0.04011325788584546, 8: 0.3925127095625233, 9: -1.0511970947644858, 10: -0.2505083298864025, 11: 0.24654282889396906, 12: 6.839965112378726, 13: -16.02665175464199, 14: 10.0, 15: 0.7692307692307693},
+    }
+
+methods['rkv98e'] = {
+    'type': 'variable',
+    'order': 9,
+    'fsal': False,
+    'nodes': [0.0, 0.03462, 0.09702435063878044, 0.14553652595817068, 0.561, 0.229007911590485, 0.544992088409515, 0.645, 0.48375, 0.06757, 0.25, 0.6590650618730999, 0.8206, 0.9012, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.03462},
+               {0: -0.038933543885728734, 1: 0.13595789452450918},
+               {0: 0.03638413148954267, 2: 0.109152394468628},
+               {0: 2.02576391439397, 2: -7.638023836496292, 3: 6.173259922102322},
+               {0: 0.05112275589406061, 3: 0.17708237945550215, 4: 0.0008027762409222502},
+               {0: 0.13160063579752163, 3: -0.29572762526696367, 4: 0.08781378035642952, 5: 0.6213052975225275},
+               {0: 0.07166666666666667, 5: 0.33055335789153195, 6: 0.24277997544180138},
+               {0: 0.071806640625, 5: 0.3294380283228177, 6: 0.11651900292718229, 7: -0.034013671875},
+               {0: 0.04836757646340647, 5: 0.03928989925676164, 6: 0.10547409458903446, 7: -0.021438652846483126, 8: -0.10412291746271944},
+               {0: -0.026645614872014785, 5: 0.03333333333333333, 6: -0.1631072244872467, 7: 0.033960816841277615, 8: 0.1572319413814626, 9: 0.21522674780318796},
+               {0: 0.036890092487086225, 5: -0.1465181576725543, 6: 0.22425777681720244, 7: 0.022944057170660725, 8: -0.003585005290572876, 9: 0.08669223316444385, 10: 0.43838406519683376},
+               {0: -0.48660122151133406, 5: -6.304602650282853, 6: -0.2812456182894726, 7: -2.6790192362198493, 8: 0.5188156639241576, 9: 1.3653531876033418, 10: 5.8850910885039465, 11: 2.8028087862720628},
+               {0: 0.41853674577534716, 5: 6.724547581906459, 6: -0.4254442801646118, 7: 3.3432791530012658, 8: 0.6170816631175378, 9: -0.9299661239399328, 10: -6.099948804751011, 11: -3.002206187889399, 12: 0.2553202529443446},
+               {0: -0.7793740861228846, 5: -13.937342538107776, 6: 1.2520488533793572, 7: -14.69150040801687, 8: -0.4947050585331417, 9: 2.2429749091462368, 10: 13.367893803828643, 11: 14.396650486650687, 12: -0.79758133317768, 13: 0.4409353709534278},
+               {0: 2.0580513374668863, 5: 22.357937727968032, 6: 0.9094981099755634, 7: 35.89110098240264, 8: -3.4425150276244536, 9: -4.8654813580363685, 10: -18.909803813543427, 11: -34.26354448030452, 12: 1.2647565216956427}],
+    'weights': {0: 0.014611976858423152, 7: -0.3915211862331339, 8: 0.23109325002895065, 9: 0.12747667699928525, 10: 0.2246434176204158, 11: 0.5684352689748513, 12: 0.058258715572158275, 13: 0.13643174034822156, 14: 0.030570139830827976},
+    'embedded_weights': {0: 0.01996996514886773, 7: 2.19149930494933, 8: 0.08857071848208438, 9: 0.11405602348659656, 10: 0.2533163805345107, 11: -2.056564386240941, 12: 0.340809679901312, 15: 0.048342313738239585},
+    }
+
+methods['rkv98r'] = {
+    'type': 'variable',
+    'order': 9,
+    'fsal': False,
+    'nodes': [0.0, 0.04, 0.09648736013787361, 0.1447310402068104, 0.576, 0.2272326564618766, 0.5407673435381234, 0.64, 0.48, 0.06754, 0.25, 0.6770920153543243, 0.8115, 0.906, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.04},
+               {0: -0.01988527319182291, 1: 0.11637263332969652},
+               {0: 0.0361827600517026, 2: 0.10854828015510781},
+               {0: 2.2721142642901775, 2: -8.526886447976398, 3: 6.830772183686221},
+               {0: 0.050943855353893744, 3: 0.1755865049809071, 4: 0.0007022961270757468},
+               {0: 0.1424783668683285, 3: -0.35417994346686843, 4: 0.07595315450295101, 5: 0.6765157656337123},
+               {0: 0.07111111111111111, 5: 0.32799092876058983, 6: 0.24089796012829906},
+               {0: 0.07125, 5: 0.32688424515752457, 6: 0.11561575484247544, 7: -0.03375},
+               {0: 0.048226773224658105, 5: 0.039485599804954, 6: 0.10588511619346581, 7: -0.021520063204743093, 8: -0.10453742601833482},
+               {0: -0.026091134357549235, 5: 0.03333333333333333, 6: -0.1652504006638105, 7: 0.03434664118368617, 8: 0.1595758283215209, 9: 0.21408573218281934},
+               {0: -0.03628423396255659, 5: -1.0961675974272087, 6: 0.1826035504321331, 7: 0.07082254444170684, 8: -0.02313647018482431, 9: 0.27112047263209327, 10: 1.3081337494229808},
+               {0: -0.5074635056416975, 5: -6.631342198657237, 6: -0.2527480100908801, 7: -0.49526123800360955, 8: 0.2932525545253887, 9: 1.440108693768281, 10: 6.237934498647056, 11: 0.7270192054526987},
+               {0: 0.6130118256955932, 5: 9.088803891640463, 6: -0.40737881562934486, 7: 1.7907333894903747, 8: 0.714927166761755, 9: -1.438580857841723, 10: -8.26332931206474, 11: -1.5375705708088652, 12: 0.34538328275648716},
+               {0: -1.2116979103438739, 5: -19.055818715595954, 6: 1.2630606753898752, 7: -6.913916969178458, 8: -0.676462266509498, 9: 3.367860445026608, 10: 18.00675164312591, 11: 6.83882892679428, 12: -1.0315164519219504, 13: 0.41291062321306227},
+               {0: 2.1573890074940536, 5: 23.807122198095804, 6: 0.8862779249216556, 7: 13.139130397598764, 8: -2.6044157092877147, 9: -5.193859949783873, 10: -20.412340711541507, 11: -12.300856252505723, 12: 1.5215530950085394}],
+    'weights': {0: 0.014588852784055396, 7: 0.0020241978878893325, 8: 0.21780470845697167, 9: 0.12748953408543898, 10: 0.2244617745463132, 11: 0.1787254491259903, 12: 0.07594344758096558, 13: 0.12948458791975614, 14: 0.029477447612619417},
+    'embedded_weights': {0: 0.020346666552244347, 7: 1.0696176509827, 8: 0.07680834711303187, 9: 0.11307781868852404, 10: 0.25525873579819625, 11: -0.9825898086919164, 12: 0.3981545824421514, 15: 0.04932600711506839},
+    }
+
+methods['rks98'] = {
+    'type': 'variable',
+    'order': 9,
+    'fsal': False,
+    'nodes': [0.0, 0.02, 0.09662202838005378, 0.14493304257008066, 0.3111111111111111, 0.3514987732997802, 0.1477012267002198, 0.416, 0.312, 0.105, 0.5870020964360587, 0.683818495973559, 0.8790035587188612, 0.916, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.02},
+               {0: -0.13677338082684418, 1: 0.23339540920689794},
+               {0: 0.036233260642520165, 2: 0.1086997819275605},
+               {0: 0.1931012003302054, 2: -0.6477099856031239, 3: 0.7657198963840296},
+               {0: 0.047743944083380625, 3: 0.19693217579535482, 4: 0.10682265342104476},
+               {0: 0.05356535207401003, 3: 0.12062558894772892, 4: -0.0677507562251497, 5: 0.041261041903630544},
+               {0: 0.04622222222222222, 5: 0.15658367408339438, 6: 0.21319410369438338},
+               {0: 0.0463125, 5: 0.07515024064760904, 6: 0.21247475935239096, 7: -0.0219375},
+               {0: 0.047137080516757086, 5: 0.2090887671772457, 6: 0.10017019984533607, 7: -0.04174653593513262, 8: -0.20964951160420625},
+               {0: 0.09625062548049543, 5: -3.2889823940483436, 6: 0.15812059281948293, 7: 1.3847217411075694, 8: 2.3868915310768544, 9: -0.15},
+               {0: -0.41407181780829333, 5: 2.793623292855764, 6: -3.942014889484437, 7: -1.8050833493703233, 8: -0.08241117529910345, 9: 3.767243638399315, 10: 0.3665327966806378},
+               {0: 0.25711880324448216, 5: 3.223674985444157, 6: 3.9564480971576836, 7: 1.9026961086640655, 8: -5.239105540171791, 9: -2.6899481313272986, 10: -1.632651018246895, 11: 1.1007702539544584},
+               {0: 4.085833697887876, 5: -22.27104081270551, 6: 21.494820037704127, 7: -12.574667847036709, 8: 25.402565104986927, 9: -24.865730830721493, 10: 18.24790737495161, 11: -9.429178781539312, 12: 0.8254920564724875},
+               {0: -2.0602212042704653, 5: -2.305556459687618, 6: -18.379647671170325, 7: 0.98006354342133, 8: 6.445891586589943, 9: 16.919274945220323, 10: -2.098842357539496, 11: 1.3202787899032948, 12: 0.12976875318702033, 13: 0.04899007434599288},
+               {0: -0.12158274587431439, 5: -13.009191687212088, 6: -10.172115280165551, 7: -9.137604059768455, 8: 22.027119065679948, 9: 6.061224528908376, 10: 9.497564999386197, 11: -4.796710315165145, 12: 0.6512954942110307}],
+    'weights': {0: 0.029627505302327776, 7: 0.07808381320030469, 8: 0.20762019995825293, 9: 0.16968939553379483, 10: 0.15170561423481516, 11: 0.1442459482851157, 12: 0.16676153021890558, 13: 0.01925342856212436, 14: 0.03301256470435896},
+    'embedded_weights': {0: 0.029860307732727187, 7: 0.06577559759111823, 8: 0.21395677965811913, 9: 0.16872157879699287, 10: 0.17176836073678645, 11: 0.12549268079066248, 12: 0.18926365241723514, 15: 0.0351610422763585},
+    }
+
+methods['rkf108'] = {
+    'type': 'variable',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.1, 0.5393578408029818, 0.8090367612044727, 0.30903676120447265, 0.9810741902197953, 0.8333333333333334, 0.3540173658568024, 0.8825276619647323, 0.6426157582403226, 0.3573842417596775, 0.11747233803526766, 0.8333333333333334, 0.30903676120447265, 0.5393578408029818, 0.1, 1.0],
+    'matrix': [{},
+               {0: 0.1},
+               {0: -0.9151765613752915, 1: 1.4545344021782731},
+               {0: 0.20225919030111816, 2: 0.6067775709033545},
+               {0: 0.18402471470864357, 2: 0.19796683122719236, 3: -0.07295478473136326},
+               {0: 0.08790073402066813, 3: 0.41045970252026065, 4: 0.4827137536788665},
+               {0: 0.08597005049024603, 3: 0.3308859630407222, 4: 0.4896629573094502, 5: -0.07318563750708508},
+               {0: 0.12093044912533372, 4: 0.2601246757582956, 5: 0.032540262154909134, 6: -0.0595780211817361},
+               {0: 0.11085437958039149, 5: -0.06057614882550056, 6: 0.3217637056017784, 7: 0.510485725608063},
+               {0: 0.112054414752879, 5: -0.14494277590286592, 6: -0.3332697190962567, 7: 0.4992692295568801, 8: 0.5095046089296861},
+               {0: 0.11397678396418598, 5: -0.07688133642033569, 6: 0.23952736032439065, 7: 0.3977746623680946, 8: 0.010755895687360746, 9: -0.3277691241640189},
+               {0: 0.07983145282801961, 5: -0.052032968680060306, 6: -0.05769541461685489, 7: 0.19478191571210415, 8: 0.14538492318832508, 9: -0.07829427103516708, 10: -0.11450329936109892},
+               {0: 0.9851156101648573, 3: 0.3308859630407222, 4: 0.4896629573094502, 5: -1.3789648657484357, 6: -0.8611641950276356, 7: 5.784288136375372, 8: 3.2880776198510357, 9: -2.386339050931364, 10: -3.254793424836439, 11: -2.16343541686423},
+               {0: 0.8950802957716328, 2: 0.19796683122719236, 3: -0.07295478473136326, 5: -0.8512362396620076, 6: 0.3983201123185333, 7: 3.639372631810356, 8: 1.5482287703983033, 9: -2.122217147040537, 10: -1.5835039854532618, 11: -1.7156160828593627, 12: -0.024403640575012746},
+               {0: -0.9151765613752915, 1: 1.4545344021782731, 4: -0.7773336436449683, 6: -0.0910895662155176, 12: 0.0910895662155176, 13: 0.7773336436449683},
+               {0: 0.1, 2: -0.15717866579977116, 14: 0.15717866579977116},
+               {0: 0.1817813007000953, 1: 0.675, 2: 0.3427581598471898, 4: 0.25911121454832275, 5: -0.35827896671795206, 6: -1.0459489594088331, 7: 0.930327845415627, 8: 1.7795095943170811, 9: 0.1, 10: -0.2825475695390441, 11: -0.15932735011997254, 12: -0.14551589464700151, 13: -0.25911121454832275, 14: -0.3427581598471898, 15: -0.675}],
+    'weights': {0: 0.03333333333333333, 1: 0.025, 2: 0.03333333333333333, 4: 0.05, 6: 0.04, 8: 0.1892374781489235, 9: 0.2774291885177432, 10: 0.2774291885177432, 11: 0.1892374781489235, 12: -0.04, 13: -0.05, 14: -0.03333333333333333, 15: -0.025, 16: 0.03333333333333333},
+    'embedded_weights': {0: 0.03333333333333333, 1: 0.022222222222222223, 2: 0.03333333333333333, 4: 0.05, 6: 0.04, 8: 0.1892374781489235, 9: 0.2774291885177432, 10: 0.2774291885177432, 11: 0.1892374781489235, 12: -0.04, 13: -0.05, 14: -0.03333333333333333, 15: -0.022222222222222223, 16: 0.03333333333333333},
+    }
+
+methods['rkc108'] = {
+    'type': 'variable',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.14525189603161506, 0.14525189603161506, 0.21787784404742258, 0.5446946101185565, 0.6536335321422677, 0.2746594919905254, 0.7735775201106609, 0.5801831400829958, 0.11747233803526766, 0.3573842417596775, 0.6426157582403226, 0.11747233803526766, 0.8825276619647323, 0.3573842417596775, 0.6426157582403226, 0.8825276619647323, 1.0, 0.3510848126232742, 0.6157407407407407, 1.0],
+    'matrix': [{},
+               {0: 0.14525189603161506},
+               {0: 0.07262594801580753, 1: 0.07262594801580753},
+               {0: 0.054469461011855645, 2: 0.16340838303556693},
+               {0: 0.5446946101185565, 2: -2.0426047879445868, 3: 2.0426047879445868},
+               {0: 0.06536335321422677, 3: 0.32681676607113386, 4: 0.2614534128569071},
+               {0: 0.08233707757482717, 3: 0.21191719632028036, 4: -0.039973435080542186, 5: 0.020378653175960063},
+               {0: 0.08595305779007344, 5: 0.2911769478058851, 6: 0.3964475145147024},
+               {0: 0.08612093485606967, 5: 0.13974648268244422, 6: 0.3951098495815675, 7: -0.04079412703708563},
+               {0: 0.07233144422337948, 5: 0.22002762846899981, 6: 0.08789533425436734, 7: -0.044453839962603506, 8: -0.21832822894887546},
+               {0: 0.08947100936731114, 5: 0.3946008170285562, 6: 0.34430113679633334, 7: -0.07946682664292662, 8: -0.3915218947895966},
+               {0: 0.03210006877963209, 7: -0.00018463759975120503, 8: 0.15608940253132197, 9: 0.19344968576545601, 10: 0.26116123876366365},
+               {0: 0.044237493285249965, 7: 0.00464077443453904, 8: 0.04704660282615136, 9: 0.08620749948011489, 10: -0.02607983024682138, 11: -0.038580201743966216},
+               {0: 0.023180467174294117, 7: 0.3197856784116367, 8: 0.5933233331841898, 9: -1.9375195488784793, 10: 0.18039505570305023, 11: -0.4554014298857221, 12: 2.158764106255763},
+               {0: 0.026243643257981057, 7: 0.04863139423867266, 8: 0.04274382538346479, 9: -0.4862259869465548, 10: 0.13260471949176522, 11: -0.09402962152946516, 12: 0.6993864679941022, 13: -0.01197020013028861},
+               {0: 0.055680666415362165, 7: -0.4324853319508358, 8: -0.9979726994172039, 9: 2.707893755718926, 10: -1.024823023512133, 11: 1.3345652066422469, 12: -2.587748998830691, 13: 0.08992773696348356, 14: 1.4975784462111674},
+               {0: -0.0008434891199686378, 7: 0.7602144218856082, 8: 1.7690839278209594, 9: -4.499239797622297, 10: 1.4905581902120435, 11: -2.5522034801321327, 12: 4.795167551528576, 13: -0.09161854401769483, 14: -1.5257356787468508, 15: 0.7371445601564892},
+               {0: 0.10173669741115766, 7: -1.6962175532094328, 8: -3.825235846211624, 9: 9.754768979885867, 10: -2.5207677892271523, 11: 5.47241714522778, 12: -9.781098113458736, 13: 0.31891526924553343, 14: 3.4472270365277566, 15: -0.6051983612219278, 16: 0.33345253503077876},
+               {0: -0.10129877374782845, 5: -0.024093893289487755, 6: -0.6679880790275182, 7: 1.6002627984931006, 8: 3.706958893826696, 9: -8.58175556014793, 10: 0.05607314974300954, 11: -4.5477614974229, 12: 9.255775439941294, 13: -0.3450876657451632},
+               {0: 0.03826909723812639, 5: 0.7786978965202528, 6: 0.48594541409134484, 7: 1.8149253501546663, 8: 4.551165245704658, 9: -7.1737706703445445, 10: -0.3943009017000923, 11: -6.036544185898101, 12: 7.338904299721888, 13: -0.4143158595971836, 18: -0.37323494515027494},
+               {0: 0.021623390460220458, 5: 0.46118347007443694, 6: 0.19407977595477988, 7: 0.7041001229739959, 8: 2.8774310967927637, 10: -0.43327420887491075, 11: -2.2341787535888344, 12: 0.2235678086885984, 13: 0.12935323383084577, 18: 0.14181369681942785, 19: -1.0856996331313236}],
+    'weights': {0: 0.03333333333333333, 11: 0.1387145942588716, 12: 0.1892374781489235, 13: 0.09461873907446175, 14: 0.2774291885177432, 15: 0.1387145942588716, 16: 0.09461873907446175, 17: 0.03333333333333333},
+    'embedded_weights': {0: 0.03339829895931338, 8: 0.05024509803921569, 9: -0.1423859191318859, 10: 0.21260131994292583, 11: 0.3254854965632843, 12: 0.33126293995859213, 13: 0.188784580923065, 18: 0.061598110942871445, 19: -0.09440109660594088, 20: 0.033411170408558975},
+    }
+
+methods['rkb109'] = {
+    'type': 'variable',
+    'order': 10,
+    'fsal': False,
+    'nodes': [0.0, 0.22321291921237357, 0.33481937881856033, 0.5022290682278405, 0.11769487565484436, 0.6425923677604463, 0.1818265653112105, 0.43416103340779544, 0.7122335424182419, 0.1894400309592476, 0.49439215386910457, 0.6403413702953303, 0.7415882308036569, 0.38291132986252086, 0.10715775582248732, 0.8756913762412457, 0.9640692993701878, 0.2817296105237179, 0.6311454921771767, 0.9738030393770346, 1.0],
+    'matrix': [{},
+               {0: 0.22321291921237357},
+               {0: 0.08370484470464008, 1: 0.25111453411392026},
+               {0: 0.12555726705696013, 2: 0.3766718011708804},
+               {0: 0.08645012631860283, 2: 0.05236243791730284, 3: -0.021117688581061313},
+               {0: -0.026392577213669177, 3: 0.3321586951309943, 4: 0.33682624984312115},
+               {0: 0.04214481430128892, 4: 0.13950910089930899, 5: 0.00017265011061257918},
+               {0: 0.19132235170633177, 4: -0.6549476653170516, 5: 0.017558763237425026, 6: 0.8802275837810902},
+               {0: 0.05819519506251174, 5: 0.16479085589767842, 6: 0.2562758618556535, 7: 0.2329716296023982},
+               {0: 0.06609808969751806, 5: 0.04993798303607936, 6: 0.15362160944548908, 7: -0.05414130381994317, 8: -0.026076347399895707},
+               {0: 0.059772814130674555, 7: 0.1656649460691328, 8: -0.0012704670772193225, 9: 0.2702248607465166},
+               {0: 0.057146463469277264, 8: 0.0170664733327914, 9: 0.2853767151165243, 10: 0.28075171837673735},
+               {0: 0.057136907706674116, 8: 0.0866214607590509, 9: 0.28543295823899845, 10: 0.27976339239592546, 11: 0.03263351170300797},
+               {0: 0.05792154217958511, 8: -0.11685987643948542, 9: 0.2791270024477207, 10: 0.05523482312158897, 11: 0.033138214202304485, 12: 0.07434962435080701},
+               {0: 0.054243491312660486, 8: 0.02555744036484019, 9: 0.10653189486850441, 10: 0.14947391768226176, 11: -0.07541418150821687, 12: 0.0011836627169747062, 13: -0.15441846961453737},
+               {0: -0.03130073355625165, 8: -0.43930410166822376, 9: -0.2971894957150042, 10: 0.12629801957553985, 11: -0.013522356633895014, 12: 0.6695605432945227, 13: 0.39892685045428256, 14: 0.4622226504902752},
+               {0: 0.04254608456033345, 8: -0.18211822965126534, 9: 0.16934885687889933, 10: -0.002812932311380423, 11: 0.43673595004356924, 12: 0.009649623253501192, 13: 0.18275411890264592, 14: 0.08163992629788447, 15: 0.22632590139599995},
+               {0: -0.06162786199706764, 8: 0.026308198164249754, 9: -0.6563819353303825, 10: -0.49969697386399464, 11: -0.07123015625596799, 12: 0.19458870649182533, 13: 0.7502438829684451, 14: 0.677852566553644, 15: -0.10460576474553109, 16: 0.0262789485384975},
+               {0: 0.03796521632874261, 8: -0.2594056416058702, 9: 0.6023088303591702, 10: 0.6119387226913542, 11: -0.8557593281472217, 12: 1.0160140444791508, 13: 0.4174635465318728, 14: -0.0031420687482940114, 15: -0.3113859536805387, 16: 0.07475323182002612, 17: -0.6996051078512155},
+               {0: 0.06354247858004163, 8: 0.13357094272148554, 9: 0.3491939710685403, 10: -0.1284299219085288, 11: 0.582014345460902, 12: -0.07032295749061968, 13: 0.410857235892571, 14: -0.025106547792399625, 15: 0.12231662547060078, 16: 0.04712374572639742, 17: -0.20357731723688283, 18: -0.30737956111507314},
+               {0: 0.11899241378806764, 8: 1.567065389218647, 9: 1.0627422131028728, 10: -0.7051696022721413, 11: 0.9907825344767893, 12: 0.2507980962931108, 13: 1.9725917571536296, 14: -0.3262628387941533, 15: -0.7195961905900189, 16: 0.5802031535291662, 17: -1.5031045631780418, 18: -2.0829174069867333, 19: -0.2061249557411945}],
+    'weights': {0: 0.030744409357932077, 11: 0.44478861243351586, 12: -0.07714472898672552, 13: 0.189596923666696, 14: 0.16967947426607413, 15: 0.310772532762349, 16: -1.0521734164449101, 17: 0.10983531695963106, 18: -0.13345722321873885, 19: 1.1540263285741341, 20: -0.1466682293699578},
+    'embedded_weights': {0: 0.030699358891510563, 11: 0.45010373707651347, 12: -0.06514757933632401, 13: 0.191647630917784, 14: 0.1699093037015862, 15: 0.2831822563446878, 16: -0.7938273328067641, 17: 0.10858051684914082, 18: -0.14429024220090486, 19: 0.8718101111217406, 20: -0.10266776055897046},
+    }
+
+methods['rks1110a'] = {
+    'type': 'variable',
+    'order': 11,
+    'fsal': False,
+    'nodes': [0.0, 0.24945104368773893, 0.3741765655316084, 0.5612648482974126, 0.08546995299174592, 0.7310788517640474, 0.13040494166094715, 0.47126363572028473, 0.7730997092193941, 0.20562922710975692, 0.53664199680743, 0.6950637644720241, 0.804962995211145, 0.19137601392170991, 0.8894442715562033, 0.46801515471260013, 0.9908386187455955, 0.09000188288457918, 0.4031478884213807, 0.24266204647370568, 0.7208245981830887, 0.1999681579366343, 0.9639977912755384, 0.7436137801734239, 1.0, 1.0],
+    'matrix': [{},
+               {0: 0.24945104368773893},
+               {0: 0.0935441413829021, 1: 0.2806324241487063},
+               {0: 0.14031621207435316, 2: 0.42094863622305945},
+               {0: 0.07019164670454382, 2: 0.026311748419244236, 3: -0.011033442132042126},
+               {0: -0.15662112407811837, 3: 0.4022037025415643, 4: 0.48549627330060147},
+               {0: 0.031122490651894544, 4: 0.09925602946470756, 5: 2.6421544345048962e-05},
+               {0: 0.709722115858592, 4: -2.878599621086994, 5: 0.021294465758032025, 6: 2.618846675190655},
+               {0: 0.019711627697516228, 5: 0.13147695839615123, 6: 0.2651026426320722, 7: 0.35680848049365443},
+               {0: 0.04520001981236963, 5: 0.004002799368963269, 6: 0.1601500636916154, 7: -0.0006948308961135588, 8: -0.0030288248670778365},
+               {0: 0.06488088874156601, 7: 0.17982236725195389, 8: -0.0013790388537953746, 9: 0.29331777966770545},
+               {0: 0.062030094989645124, 8: 0.01852494271216683, 9: 0.3097644836067189, 10: 0.30474424316349324},
+               {0: 0.06201972260916893, 8: 0.09402397126314593, 9: 0.30982553316285566, 10: 0.30367145666457973, 11: 0.03542231151139475},
+               {0: 0.06969089344825788, 8: -1.0260683988482215, 9: 0.1707111685325416, 10: -0.22764263178283453, 11: 0.6469733264162559, 12: 0.5577116561557104},
+               {0: 0.05627122376293572, 10: 0.36789832228502095, 11: -0.05195587208803483, 12: 0.22043000247221908, 13: 0.2968005951240623},
+               {0: 0.05634846497340329, 10: 0.21544931349753488, 11: -0.1828038597798339, 12: 0.11150355659643853, 13: 0.29615731769117093, 14: -0.028639638266113588},
+               {0: 0.05768994198724289, 10: -0.03339594153573746, 11: 0.400733703606391, 12: -0.2804910522268063, 13: 0.2860659865450288, 14: 0.3300830129889967, 15: 0.23015296738047988},
+               {0: 0.046283495797190245, 10: 1.6304501073979754, 11: -1.5193890271101258, 12: 1.4511779056128185, 13: 0.11158583008868272, 14: -0.6927910549842218, 15: -1.033967300639155, 16: 0.09665192672141504},
+               {0: -0.020304597709390106, 10: 5.403684273875124, 11: -6.54766787853577, 12: 7.013821350363578, 13: 0.187012920985122, 14: -3.5862216303184664, 15: -2.796807192734125, 16: 0.5350966429298067, 17: 0.21453399956550076},
+               {0: -0.017424859182900442, 10: 1.6246813879712905, 11: -2.3541761345193346, 12: 2.681464673816256, 13: -0.0376915680288754, 14: -1.416558131026522, 15: -0.6949353599391523, 16: 0.21764833724950386, 17: 0.26976024417813377, 18: -0.030106544044694063},
+               {0: -0.005403069633602259, 10: 0.41390453207783123, 11: -0.6225569512435125, 12: 0.8734771329093317, 13: -0.4460631186034506, 14: -0.47700244284295035, 15: 0.3350194037993701, 16: 0.07504248468668828, 17: 0.28686023984120174, 18: -0.310527887610955, 19: 0.5980742748031365},
+               {0: -0.08040637783629853, 10: 14.090038252091924, 11: -16.51095452142836, 12: 17.13478919889389, 13: 0.5162416754963993, 14: -8.738239054447236, 15: -7.928763291217205, 16: 1.2996070958836183, 17: 0.2985974887158638, 18: 0.23068997377777886, 19: -0.41624756127483725, 20: 0.304615279281097},
+               {0: 0.05188944067774665, 10: -1.283277980375441, 11: 3.197031115178587, 12: -4.92573099552877, 13: 0.45568428432496866, 14: 2.6729377383495305, 15: -1.545486350471516, 16: -0.372198796268522, 17: 0.12756101067428313, 18: 1.9556906756734684, 19: 0.31910812223874424, 20: 1.1215460032243525, 21: -0.8107564764218937},
+               {0: -0.007011708297168838, 10: 1.191430397515657, 11: -1.8282248022451766, 12: 2.5876600249985917, 13: -0.46094290337778, 14: -1.3259315016936395, 15: 0.5048216427266367, 16: 0.21942550087599655, 17: 0.25800870373507445, 18: -0.7820644366919762, 19: 0.4981236112353889, 20: -0.2818659230370184, 21: 0.19756306498702014, 22: -0.027377890558181645},
+               {0: 0.06971223157985491, 10: 0.8485072933915981, 11: -1.504790599380062, 12: 2.971661962491066, 13: 0.21892122811353215, 14: -1.3635049161364952, 15: 1.5352566512081296, 16: 0.22551309224811825, 17: -0.12524877253561947, 18: -1.4339474715797726, 19: -0.26536924861451217, 20: -1.0570833538951914, 21: 0.5958992342288875, 22: 0.0564076397400236, 23: 0.22806502914044224},
+               {0: 0.05847724407501708, 10: 0.8482433234853131, 11: -1.8187783372295963, 12: 3.360950949051262, 13: 0.1508779656009113, 14: -1.535625970104296, 15: 1.6897106485964475, 16: 0.27537639163593713, 17: -0.08663993203603435, 18: -1.514109179619983, 19: -0.27310519194324184, 20: -0.7386383863141516, 21: 0.6343578675072523, 22: 0.022199152680098606, 23: -0.07329654538493564}],
+    'weights': {0: 0.025603004224488187, 14: 0.4518777011767389, 15: 0.15716448350504103, 16: 1.5870565740249454, 17: 0.14571641012078407, 18: 0.06756690992874993, 19: 0.22637028293706365, 20: 0.9585657493693419, 21: -0.0573751095225372, 22: -0.82072943631273, 23: -0.8199946795810497, 24: -0.9218218898708361},
+    'embedded_weights': {0: 0.02611453567558047, 14: 0.061307895900440244, 15: 0.22251763872079122, 16: -0.6452541374509687, 17: 0.1428813432326775, 18: 0.019985037035117642, 19: 0.2271215662186804, 20: 0.35556534129631845, 21: -0.05084144204984584, 22: 0.3451056668568212, 23: -0.11829654888388844, 25: 0.41379310344827586},
+    }
+
+methods['rkf1210'] = {
+    'type': 'variable',
+    'order': 12,
+    'fsal': False,
+    'nodes': [0.0, 0.2, 0.5555555555555556, 0.8333333333333334, 0.3333333333333333, 1.0, 0.6718357091705138, 0.2887249411106202, 0.5625, 0.8333333333333334, 0.9476954311791993, 0.054811287686380265, 0.08488805186071653, 0.2655756032646429, 0.5, 0.7344243967353571, 0.9151119481392834, 0.9476954311791993, 0.8333333333333334, 0.2887249411106202, 0.6718357091705138, 0.3333333333333333, 0.5555555555555556, 0.2, 1.0],
+    'matrix': [{},
+               {0: 0.2},
+               {0: -0.21604938271604937, 1: 0.7716049382716049},
+               {0: 0.20833333333333334, 2: 0.625},
+               {0: 0.19333333333333333, 2: 0.22, 3: -0.08},
+               {0: 0.1, 3: 0.4, 4: 0.5},
+               {0: 0.10336447165001048, 3: 0.12405309452894676, 4: 0.4831711675610329, 5: -0.038753024569476324},
+               {0: 0.12403826143183333, 4: 0.21705063219795848, 5: 0.013745579207596677, 6: -0.06610953172676828},
+               {0: 0.0914774894856883, 5: -0.005443485237174697, 6: 0.06807168016884535, 7: 0.40839431558264105},
+               {0: 0.08900136525025511, 5: 0.004995282266455323, 6: 0.397918238819829, 7: 0.4279302107525766, 8: -0.0865117637557827},
+               {0: 0.06950876241349076, 5: 0.12914694190017645, 6: 1.530736381023113, 7: 0.57787476112914, 8: -0.9512947723210889, 9: -0.40827664296563193},
+               {0: 0.044486140329513583, 5: -0.0038047686705696172, 6: 0.01069550640296242, 7: 0.020961624449990432, 8: -0.023314602325932177, 9: 0.0026326598106453697, 10: 0.0031547276897702504},
+               {0: 0.019458881511975546, 8: 6.785129491718125e-05, 9: -4.297958590492736e-05, 10: 1.7635898226028515e-05, 11: 0.0653866627415027},
+               {0: 0.2068368356642771, 8: 0.016679606710415646, 9: -0.008795015632007103, 10: 0.003466754553624639, 11: -0.8612644601057177, 12: 0.9086518820740502},
+               {0: 0.0203926084654484, 8: 0.0869469392016686, 9: -0.019164963041014983, 10: 0.006556291594936633, 11: 0.09874761281274348, 12: 0.005353646955249961, 13: 0.3011678640109679},
+               {0: 0.2284104339177781, 8: -0.4987074007930252, 9: 0.1348411683357245, 10: -0.03874582440558342, 11: -1.2747325747347484, 12: 1.4391636446287717, 13: -0.21400746796799025, 14: 0.9582024177544303},
+               {0: 2.002224776559742, 8: 2.067018099615249, 9: 0.6239781360861395, 10: -0.046228368550031144, 11: -8.849732883626496, 12: 7.7425770785085595, 13: -0.5883585192508692, 14: -1.1068373336238064, 15: -0.929529037579204},
+               {0: 3.1378953341207345, 5: 0.12914694190017645, 6: 1.530736381023113, 7: 0.57787476112914, 8: 5.420882630551267, 9: 0.2315469260348293, 10: 0.07592929955789135, 11: -12.372997338018651, 12: 9.854558834647696, 13: 0.08591114313704365, 14: -5.652427528626439, 15: -1.9430093524281962, 16: -0.12835260184940453},
+               {0: 1.3836005443219601, 5: 0.004995282266455323, 6: 0.397918238819829, 7: 0.4279302107525766, 8: -1.3029910742447577, 9: 0.661292278669377, 10: -0.14455977430695435, 11: -6.965760347317982, 12: 6.6580854323599175, 13: -1.669973751088415, 14: 2.064137023180353, 15: -0.6747439626443065, 16: -0.001156188347949395, 17: -0.005440579086770074},
+               {0: 0.9512362970482877, 4: 0.21705063219795848, 5: 0.013745579207596677, 6: -0.06610953172676828, 8: 0.15228169673641445, 9: -0.33774101835759984, 10: -0.019282598163399577, 11: -3.682592696968668, 12: 3.1619787040698206, 13: -0.3704625221068853, 14: -0.05149742003654404, 15: -0.0008296255321201529, 16: 2.798010414192786e-06, 17: 0.041860391641236026, 18: 0.27908425509087736},
+               {0: 0.10336447165001048, 3: 0.12405309452894676, 4: 0.4831711675610329, 5: -0.038753024569476324, 7: -0.43831382036112243, 9: -0.21863663372167666, 10: -0.031233476439471924, 17: 0.031233476439471924, 18: 0.21863663372167666, 19: 0.43831382036112243},
+               {0: 0.19333333333333333, 2: 0.22, 3: -0.08, 6: 0.0984256130499316, 7: -0.19641088922305466, 9: 0.43645793049306875, 10: 0.06526137216757211, 17: -0.06526137216757211, 18: -0.43645793049306875, 19: 0.19641088922305466, 20: -0.0984256130499316},
+               {0: -0.21604938271604937, 1: 0.7716049382716049, 4: -0.6666666666666666, 6: -0.39069646929597845, 20: 0.39069646929597845, 21: 0.6666666666666666},
+               {0: 0.2, 2: -0.1646090534979424, 22: 0.1646090534979424},
+               {0: 1.4717872488111041, 1: 0.7875, 2: 0.4212962962962963, 4: 0.2916666666666667, 6: 0.34860071762832956, 7: 0.22949954476899484, 8: 5.79046485790482, 9: 0.4185875118565069, 10: 0.307039880222474, 11: -4.687009053506033, 12: 3.1357166559380225, 13: 1.4013482971096571, 14: -5.52931101439499, 15: -0.8531382355080633, 16: 0.10357578037361014, 17: -0.14047441695060095, 18: -0.4185875118565069, 19: -0.22949954476899484, 20: -0.34860071762832956, 21: -0.2916666666666667, 22: -0.4212962962962963, 23: -0.7875}],
+    'weights': {0: 0.023809523809523808, 1: 0.0234375, 2: 0.03125, 4: 0.041666666666666664, 6: 0.05, 7: 0.05, 9: 0.1, 10: 0.07142857142857142, 12: 0.13841302368078298, 13: 0.2158726906049313, 14: 0.2438095238095238, 15: 0.2158726906049313, 16: 0.13841302368078298, 17: -0.07142857142857142, 18: -0.1, 19: -0.05, 20: -0.05, 21: -0.041666666666666664, 22: -0.03125, 23: -0.0234375, 24: 0.023809523809523808},
+    'embedded_weights': {0: 0.023809523809523808, 1: -0.053125, 2: 0.03125, 4: 0.041666666666666664, 6: 0.05, 7: 0.05, 9: 0.1, 10: 0.07142857142857142, 12: 0.13841302368078298, 13: 0.2158726906049313, 14: 0.2438095238095238, 15: 0.2158726906049313, 16: 0.13841302368078298, 17: -0.07142857142857142, 18: -0.1, 19: -0.05, 20: -0.05, 21: -0.041666666666666664, 22: -0.03125, 23: 0.053125, 24: 0.023809523809523808},
+    }
+
+methods['rko129'] = {
+    'type': 'variable',
+    'order': 12,
+    'fsal': False,
+    'nodes': [0.0, 0.4351851851851852, 0.44298245614035087, 0.6644736842105263, 0.10694039941751612, 0.16447368421052633, 0.5843251088534107, 0.06382358235823582, 0.2, 0.3333333333333333, 0.9446116054065563, 0.05179584680428461, 0.08488805186071653, 0.2655756032646429, 0.5, 0.7344243967353571, 0.9151119481392834, 0.9446116054065563, 0.3333333333333333, 0.2, 0.5843251088534107, 0.16447368421052633, 0.44298245614035087, 0.4351851851851852, 1.0, 0.4970267001007476, 0.8043478260869565, 0.8717948717948718, 1.0],
+    'matrix': [{},
+               {0: 0.4351851851851852},
+               {0: 0.21752274022121373, 1: 0.22545971591913716},
+               {0: 0.16611842105263158, 2: 0.49835526315789475},
+               {0: 0.08681163193918509, 2: 0.03456981948164897, 3: -0.014441052003317936},
+               {0: 0.03850951504524953, 3: 9.889604363651382e-05, 4: 0.12586527312164028},
+               {0: 0.5247404461891305, 3: 0.07610651429965942, 4: -2.1355385968252047, 5: 2.1190167451898256},
+               {0: 0.03572122856624484, 4: 0.04596205641509305, 5: -0.0180001695771322, 6: 0.00014046695403012455},
+               {0: 0.018881768091841084, 5: 0.0838119832974094, 6: 9.031585241436451e-06, 7: 0.09729721702550809},
+               {0: -0.04080067703469847, 5: -0.6005539308646711, 6: 0.001585222658367902, 7: 0.30266588517344284, 8: 0.6704368334008922},
+               {0: 6.3443269277336665, 6: 1.9752633196847669, 7: -13.828223375048978, 8: 14.824239269910663, 9: -8.370994536873562},
+               {0: -0.09910783781470375, 5: -1.0463199581326414, 6: -0.000466257880125603, 7: 0.42435184081978067, 8: 0.8350767448298192, 9: -0.06204379562043796, 10: 0.00030511060259344014},
+               {0: 0.017316358058937036, 8: 0.0008690027159880926, 9: -9.19804474615846e-05, 10: 1.8335947773499286e-07, 11: 0.06679448817377526},
+               {0: 0.014977022857878173, 8: 0.12990531981256873, 9: 0.004444252090193421, 10: -2.1853803304340856e-06, 11: 0.06235770138025566, 12: 0.05389349250407736},
+               {0: 0.19568860388617912, 8: 1.132878041352191, 9: 0.975468635777075, 10: 0.0004607633555393392, 11: -0.483341992986944, 12: 0.28372552611464236, 13: -1.6048795774986828},
+               {0: -0.6628581660952109, 8: -5.301219753823165, 9: -5.493744530005152, 10: 0.006448107716343852, 11: 2.2269110968579864, 12: -0.826009454688337, 13: 9.73697373419954, 14: 1.0479233625733528},
+               {0: 9.451896878619703, 8: 74.0783767695182, 9: 80.08971633421253, 10: -0.12417024842601604, 11: -32.04108125365226, 12: 15.51919421000708, 13: -136.4444237346563, 14: -11.361098968582981, 15: 1.7467019610993353},
+               {0: 1.0590867400895305, 6: 1.9752633196847669, 7: -13.828223375048978, 8: -26.72676722061492, 9: -53.497989865537875, 10: 0.07179812487812968, 11: 18.05559723664965, 12: -8.765163819232981, 13: 76.87522358555576, 14: 6.5410072605069045, 15: -0.8461837296739539, 16: 0.030963348150523543},
+               {0: -0.09776673260040047, 5: -0.6005539308646711, 6: 0.001585222658367902, 7: 0.30266588517344284, 8: 0.4285248952296137, 9: -0.024949360499564234, 10: 0.02011342149874706, 11: 0.1265809640150575, 12: -0.007625505511021938, 13: 0.22576832151300236, 14: -0.027454924891677085, 15: 0.007783761260627937, 16: 1.6808304762661754e-05, 17: -0.02135549195295375},
+               {0: 0.04918722777774215, 5: 0.0838119832974094, 6: 9.031585241436451e-06, 7: 0.09729721702550809, 8: -0.07780700010332924, 9: 0.23228160116873528, 10: -0.010697135229716857, 11: -0.12733578550080102, 12: 0.11955963060457703, 13: 0.1268882175226586, 14: 0.02044989775051125, 15: -0.0039098565069842425, 16: -9.117410119332842e-06, 17: 0.011260931510774562, 18: -0.32098684349220713},
+               {0: 0.5247404461891305, 3: 0.07610651429965942, 4: -2.1355385968252047, 5: 2.1190167451898256, 8: -0.6068669292751352, 9: -0.6975023816048119, 10: -0.025395521353833873, 17: 0.025395521353833873, 18: 0.6975023816048119, 19: 0.6068669292751352},
+               {0: 0.03850951504524953, 3: 9.889604363651382e-05, 4: 0.12586527312164028, 6: 0.11485466578247082, 8: -0.12992464629259584, 9: -0.3664591598580917, 18: 0.3664591598580917, 19: 0.12992464629259584, 20: -0.11485466578247082},
+               {0: 0.21752274022121373, 1: 0.22545971591913716, 5: -0.7003676470588235, 6: -0.3841432262252079, 20: 0.3841432262252079, 21: 0.7003676470588235},
+               {0: 0.4351851851851852, 2: -0.4244806610219171, 22: 0.4244806610219171},
+               {0: 14.549909715134786, 1: -2.6094444444444442, 2: -2.0160046092366377, 5: -1.666875, 6: -1.8400101376090496, 8: 112.88500268793936, 9: 123.39420868227762, 10: -0.7912126656078716, 11: -50.051498735585554, 12: 24.88778291494286, 13: -212.11641970573208, 14: -17.89082255740024, 15: 2.50971643408657, 16: 0.11624758869370884, 17: 0.5840328281597422, 18: 1.5844178067127084, 19: 1.3386350063783927, 20: 1.8400101376090496, 21: 1.666875, 22: 2.0160046092366377, 23: 2.6094444444444442},
+               {0: 0.42136592190870825, 5: 2.3603752904137663, 6: 0.07887926811836903, 7: -1.8818506417765304, 8: -1.3047007349060953, 9: 0.11469715320604965, 10: -0.0052236131829420775, 11: 0.7134840563194222},
+               {0: -1.0168676840651791, 5: -7.712044352285818, 6: -0.40340084093748585, 7: 6.739165476490825, 8: 6.014994643407224, 9: -1.138427387973993, 10: 0.050092719731816, 11: -3.1132509325647155, 25: 1.3840861842842822},
+               {0: 1.1310934759490314, 5: -11.304756119554407, 6: 0.08673508908529372, 7: 4.971317844154334, 8: 14.864937720102997, 9: -5.526130551905351, 10: 0.10177904919862, 11: -5.412708567655345, 25: 2.1199059032161243, 26: -0.16037897079642538},
+               {0: 46.12864603958016, 5: 27.913001631194, 6: 16.113626898624513, 7: -125.46967634443187, 8: 76.5718202012053, 9: -48.978055587234905, 10: -1.2428304872440528, 11: 18.8580721338362, 25: -8.871982194511737, 26: -2.0695349826956155, 27: 2.0469126916780165}],
+    'weights': {0: 0.023809523809523808, 1: -0.11, 2: -0.17, 5: -0.19, 6: -0.21, 8: -0.23, 9: -0.27, 10: -0.29, 12: 0.13841302368078298, 13: 0.2158726906049313, 14: 0.2438095238095238, 15: 0.2158726906049313, 16: 0.13841302368078298, 17: 0.29, 18: 0.27, 19: 0.23, 20: 0.21, 21: 0.19, 22: 0.17, 23: 0.11, 24: 0.023809523809523808},
+    'embedded_weights': {0: 0.013572673664220367, 8: 0.19572426080259053, 9: 0.061888663474356086, 10: 0.2356461254963384, 11: 0.09356981277656948, 25: 0.27883826242235976, 26: 0.4265887719284872, 27: -0.2878025166474502, 28: -0.018026053917471623},
+    }
+
+methods['rkf1412'] = {
+    'type': 'variable',
+    'order': 14,
+    'fsal': False,
+    'nodes': [0.0, 0.1111111111111111, 0.5555555555555556, 0.8333333333333334, 0.3333333333333333, 1.0, 0.669986979272773, 0.29706838421381837, 0.7272727272727273, 0.14015279904218877, 0.7007010397701507, 0.36363636363636365, 0.2631578947368421, 0.039217224665027084, 0.8129175029283767, 0.16666666666666666, 0.9, 0.06412992574519669, 0.20414990928342885, 0.3953503910487606, 0.6046496089512394, 0.7958500907165712, 0.9358700742548033, 0.16666666666666666, 0.8129175029283767, 0.039217224665027084, 0.36363636363636365, 0.7007010397701507, 0.14015279904218877, 0.29706838421381837, 0.669986979272773, 0.3333333333333333, 0.5555555555555556, 0.1111111111111111, 1.0],
+    'matrix': [{},
+               {0: 0.1111111111111111},
+               {0: -0.8333333333333334, 1: 1.3888888888888888},
+               {0: 0.20833333333333334, 2: 0.625},
+               {0: 0.19333333333333333, 2: 0.22, 3: -0.08},
+               {0: 0.1, 3: 0.4, 4: 0.5},
+               {0: 0.10348456163667978, 3: 0.12206888730640722, 4: 0.4825744903312466, 5: -0.0381409600015607},
+               {0: 0.12438052665409441, 4: 0.2261202821975843, 5: 0.013788588761808088, 6: -0.06722101339966845},
+               {0: 0.09369190656596738, 5: -0.00613406843450511, 6: 0.21601982562550306, 7: 0.4236950635157619},
+               {0: 0.08384798124090527, 5: -0.01179493671009738, 6: -0.24729902056881264, 7: 0.0978080858367729, 8: 0.21759068924342062},
+               {0: 0.061525535976942825, 5: 0.005922327803245033, 6: 0.47032615996384114, 7: 0.299688863848679, 8: -0.2476568775939949, 9: 0.11089502977143768},
+               {0: 0.04197000733627826, 5: -0.003179876962662051, 6: 0.806397714906192, 7: 0.0975983126412389, 8: 0.778575578158399, 9: 0.20489042383159942, 10: -1.5626157962746818},
+               {0: 0.04377267822337302, 8: 0.006243650275201952, 9: 0.20004309710957732, 10: -0.008053283678049831, 11: 0.021151752806739654},
+               {0: 0.028349925036351455, 8: 0.002491632048558174, 9: 0.023013878785459314, 10: -0.003221559566929771, 11: 0.009884425494476646, 12: -0.021301077132888736},
+               {0: 0.343511894290243, 8: 0.2104519120236274, 9: 1.034274520572304, 10: 0.006003036458644225, 11: 0.8559381250996195, 12: -0.9772350050367669, 13: -0.6600269804792946},
+               {0: -0.014357400167216807, 8: -0.036625327004904, 9: 0.03502549756362137, 10: 0.03609460163621135, 11: -0.02652199675536811, 12: 0.044569901130569814, 13: 0.12434309333135825, 14: 0.004138296932394807},
+               {0: 0.3560324044251203, 8: -0.4501927589475626, 9: 0.4305279070837109, 10: 0.5119730290110223, 11: 0.9083036388864043, 12: -1.2392109337193393, 13: -0.6490486616717615, 14: 0.25170890458681927, 15: 0.7799064703455864},
+               {0: 0.013093568740651306, 12: -9.32053067985114e-05, 13: 0.05053743342622993, 14: 8.04470341944488e-07, 15: 0.0005917260294941712, 16: -4.0161472215455734e-07},
+               {0: 0.0207926484466053, 12: 0.0005826959188000859, 13: -0.00801700732358816, 14: 4.0384764384713694e-06, 15: 0.08546099980555061, 16: -2.0448648093580423e-06, 17: 0.10532857882443189},
+               {0: 1.4015344979573603, 12: -0.23025200098422127, 13: -7.211068404669129, 14: 0.0037290156069483636, 15: -4.7141549572712504, 16: -0.0017636765754534924, 17: 7.641305480386988, 18: 3.5060204365975185},
+               {0: 11.951465069412068, 12: 7.794809321081759, 13: -56.45013938673258, 14: 0.0912376306930645, 15: -12.73362799254349, 16: -0.039689592190471974, 17: 54.43921418835709, 18: -3.6441163792156925, 19: -0.8045032499105099},
+               {0: -148.80942650710048, 12: -91.72952782912564, 13: 707.6561449715983, 14: -1.1056361185748245, 15: 176.13459188381137, 16: 0.49138482421488067, 17: -684.278000449815, 18: 27.991060499839826, 19: 13.193971003028233, 20: 1.2512878128398044},
+               {0: -9.673079469481968, 12: -4.469901508585055, 13: 45.51271286909527, 14: -0.07130850861838268, 15: 11.227361406841274, 16: 0.12624437671762273, 17: -43.54393395494833, 18: 0.787174307543059, 19: 0.5322646967446842, 20: 0.42242273399632535, 21: 0.08591312495030672},
+               {0: -10.06640324470547, 8: -0.036625327004904, 9: 0.03502549756362137, 10: 0.03609460163621135, 11: -0.02652199675536811, 12: -6.270889721814641, 13: 48.2079237442563, 14: -0.06944716891361656, 15: 12.68106902048503, 16: 0.011967116896832376, 17: -46.72497649924824, 18: 1.330296133266267, 19: 1.007667875033983, 20: 0.02095120519336651, 21: 0.02101347063312642, 22: 0.009521960144171218},
+               {0: -409.4780816777437, 8: 0.2104519120236274, 9: 1.034274520572304, 10: 0.006003036458644225, 11: 0.8559381250996195, 12: -250.51699854744786, 13: 1946.4246665238843, 14: -3.0450388210231036, 15: 490.6263795282817, 16: 1.5664758953127091, 17: -1881.9742899401117, 18: 75.25922247248472, 19: 34.57343569803311, 20: 3.21147679440969, 21: -0.4604080417384144, 22: -0.08707183398418106, 23: -7.393518141583031},
+               {0: 3.433474758535509, 8: 0.002491632048558174, 9: 0.023013878785459314, 10: -0.003221559566929771, 11: 0.009884425494476646, 12: 2.162527993779225, 13: -16.269986454645743, 14: -0.12853450212052456, 15: -8.989150426665043, 16: -0.0034859536323202534, 17: 15.793619411333982, 18: -0.574403330914095, 19: -0.3456020390213933, 20: -0.006622414902065851, 21: -0.007777881292422042, 22: -0.0035608419240227493, 23: 4.792825064499308, 24: 0.15372546487306857},
+               {0: 32.30385208719854, 5: -0.003179876962662051, 6: 0.806397714906192, 7: 0.0975983126412389, 8: 0.778575578158399, 9: 0.20489042383159942, 10: -1.5626157962746818, 12: 16.34298918823106, 13: -154.54455529354362, 14: 1.5697108870333487, 15: 3.2768554508724814, 16: -0.05034892451936532, 17: 153.32115185804167, 18: 7.175681863277205, 19: -2.9403674867530047, 20: -0.06658459460768032, 21: -0.04623460549908437, 22: -0.02041987335856794, 23: -53.35231064387359, 24: -1.3554871471507866, 25: -1.5719627580123274},
+               {0: -16.64514674863415, 5: 0.005922327803245033, 6: 0.47032615996384114, 7: 0.299688863848679, 8: -0.2476568775939949, 9: 0.11089502977143768, 11: -0.49171904384622916, 12: -11.47431544272895, 13: 80.25931665762303, 14: -0.38413230398004283, 15: 7.281476674681076, 16: -0.13269938461224837, 17: -81.07998325257307, 18: -1.2503749283562064, 19: 2.592635949695437, 20: -0.30144029834640457, 21: 0.22138446078983234, 22: 0.08275772747718929, 23: 18.99606620406115, 24: 0.2692319464096397, 25: 1.6267482744706654, 26: 0.49171904384622916},
+               {0: 0.08384798124090527, 5: -0.01179493671009738, 6: -0.24729902056881264, 7: 0.0978080858367729, 8: 0.21759068924342062, 10: 0.13758560676332524, 11: 0.04398702297150467, 13: -0.5137008137681933, 14: 0.8263556911513155, 15: 25.701813971981185, 23: -25.701813971981185, 24: -0.8263556911513155, 25: 0.5137008137681933, 26: -0.04398702297150467, 27: -0.13758560676332524},
+               {0: 0.12438052665409441, 4: 0.2261202821975843, 5: 0.013788588761808088, 6: -0.06722101339966845, 9: -0.8562389750854283, 10: -1.963375228668589, 11: -0.2323328227241194, 13: 4.306607190864534, 14: -2.927229632494655, 15: -82.31316663978589, 23: 82.31316663978589, 24: 2.927229632494655, 25: -4.306607190864534, 26: 0.2323328227241194, 27: 1.963375228668589, 28: 0.8562389750854283},
+               {0: 0.10348456163667978, 3: 0.12206888730640722, 4: 0.4825744903312466, 5: -0.0381409600015607, 7: -0.5504995253108024, 9: -0.7119158115851892, 10: -0.5841296056715514, 13: 2.1104630812586493, 14: -0.08374947367395721, 15: 5.1002149907232095, 23: -5.1002149907232095, 24: 0.08374947367395721, 25: -2.1104630812586493, 27: 0.5841296056715514, 28: 0.7119158115851892, 29: 0.5504995253108024},
+               {0: 0.19333333333333333, 2: 0.22, 3: -0.08, 6: 0.10999342558072471, 7: -0.2542970480762702, 9: 0.8655707771166943, 10: 3.3241644911409307, 13: -12.010222331597793, 14: 0.4766014662424932, 15: -29.02430112210364, 23: 29.02430112210364, 24: -0.4766014662424932, 25: 12.010222331597793, 27: -3.3241644911409307, 28: -0.8655707771166943, 29: 0.2542970480762702, 30: -0.10999342558072471},
+               {0: -0.8333333333333334, 1: 1.3888888888888888, 4: -0.75, 6: -0.4925295437180263, 30: 0.4925295437180263, 31: 0.75},
+               {0: 0.1111111111111111, 2: -0.2222222222222222, 32: 0.2222222222222222},
+               {0: 0.28583514038897156, 1: 0.2916666666666667, 2: 0.21875, 4: 0.1640625, 6: 0.21819435494555667, 7: 0.18039289847869777, 9: 0.20571383940484503, 10: 0.24271579158177023, 11: 0.2464657808136293, 12: -3.4499194079089084, 13: 0.22887556216003607, 14: 0.2832905997021514, 15: 3.2108512583776663, 16: -0.2235387773648457, 17: -0.707121157204419, 18: 3.2112334515028707, 19: 1.4095434830966977, 20: -0.15136205344374262, 21: 0.37235057452701426, 22: 0.2529787464063613, 23: -3.2108512583776663, 24: -0.2832905997021514, 25: -0.22887556216003607, 26: -0.2464657808136293, 27: -0.24271579158177023, 28: -0.20571383940484503, 29: -0.18039289847869777, 30: -0.21819435494555667, 31: -0.1640625, 32: -0.21875, 33: -0.2916666666666667}],
+    'weights': {0: 0.017857142857142856, 1: 0.005859375, 2: 0.01171875, 4: 0.017578125, 6: 0.0234375, 7: 0.029296875, 9: 0.03515625, 10: 0.041015625, 11: 0.046875, 13: 0.052734375, 14: 0.05859375, 15: 0.064453125, 17: 0.10535211357175302, 18: 0.17056134624175218, 19: 0.20622939732935194, 20: 0.20622939732935194, 21: 0.17056134624175218, 22: 0.10535211357175302, 23: -0.064453125, 24: -0.05859375, 25: -0.052734375, 26: -0.046875, 27: -0.041015625, 28: -0.03515625, 29: -0.029296875, 30: -0.0234375, 31: -0.017578125, 32: -0.01171875, 33: -0.005859375, 34: 0.017857142857142856},
+    'embedded_weights': {0: 0.017857142857142856, 1: 0.004859375, 2: 0.01171875, 4: 0.017578125, 6: 0.0234375, 7: 0.029296875, 9: 0.03515625, 10: 0.041015625, 11: 0.046875, 13: 0.052734375, 14: 0.05859375, 15: 0.064453125, 17: 0.10535211357175302, 18: 0.17056134624175218, 19: 0.20622939732935194, 20: 0.20622939732935194, 21: 0.17056134624175218, 22: 0.10535211357175302, 23: -0.064453125, 24: -0.05859375, 25: -0.052734375, 26: -0.046875, 27: -0.041015625, 28: -0.03515625, 29: -0.029296875, 30: -0.0234375, 31: -0.017578125, 32: -0.01171875, 33: -0.004859375, 34: 0.017857142857142856},
+    }
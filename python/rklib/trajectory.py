@@ -0,0 +1,68 @@
+#
+# Reader of the trajectory files written by the library (`rklib_recorder`, with the
+# `trajectory_file` option of `initialize`).
+#
+# The records are mapped in memory with `numpy.memmap`, so the file is not read or
+# copied: the times and states are views of the file, and only the parts that are
+# used are loaded.
+#
+# Example:
+#
+#   from rklib import trajectory
+#
+#   tr = trajectory.read('trajectory.bin')
+#   tr.method, tr.t, tr.x[:, 0]
+#
+# The file has a header of `HEADER_SIZE` bytes: 'RKLIBTRJ', the version of the format,
+# the size of a real in bytes, the number of state variables `n`, a reserved value
+# (4 byte integers), the number of records (an 8 byte integer, 0 if the file was not
+# finished), and the short name of the method (32 characters). It is followed by the
+# records `t, x(1), ..., x(n)`. The byte order is the one of the machine.
+#
+
+from collections import namedtuple
+import os
+
+import numpy as np
+
+__all__ = ['HEADER_SIZE', 'Trajectory', 'read']
+
+HEADER_SIZE = 64
+MAGIC = b'RKLIBTRJ'
+VERSION = 1
+
+_header_dtype = np.dtype([('magic', 'S8'), ('version', '=i4'), ('real_size', '=i4'), ('n', '=i4'),
+                          ('reserved', '=i4'), ('num_records', '=i8'), ('method', 'S32')])
+
+# NumPy types of the real kinds (there is no NumPy type for `real128`):
+_real_types = {4: np.float32, 8: np.float64}
+
+Trajectory = namedtuple('Trajectory', ['t', 'x', 'method', 'records'])
+Trajectory.__doc__ = """A trajectory file: the times (shape `(m,)`), the states (shape `(m, n)`),
+the short name of the method, and all the records (shape `(m, n+1)`, with the times in
+the first column). The arrays are views of the memory-mapped file."""
+
+def read(filename, mode : str = 'r'):
+    """Map a trajectory file in memory (`mode` is the mode of `numpy.memmap`).
+    If the number of records was not written (an unfinished file), it is
+    computed from the size of the file."""
+    header = np.fromfile(filename, dtype=_header_dtype, count=1)
+    if header.size != 1 or header['magic'][0] != MAGIC:
+        raise ValueError(f'{filename} is not a trajectory file')
+    header = header[0]
+    if header['version'] != VERSION:
+        raise ValueError(f'unsupported trajectory file version: {header["version"]}')
+    real_size = int(header['real_size'])
+    if real_size not in _real_types:
+        raise ValueError(f'unsupported real size: {real_size} bytes')
+    n = int(header['n'])
+    num_records = int(header['num_records'])
+    if num_records <= 0:
+        num_records = (os.path.getsize(filename) - HEADER_SIZE) // ((n + 1) * real_size)
+    method = header['method'].decode().strip()
+    if num_records == 0:
+        records = np.empty((0, n + 1), dtype=_real_types[real_size])
+    else:
+        records = np.memmap(filename, dtype=_real_types[real_size], mode=mode, offset=HEADER_SIZE,
+                            shape=(num_records, n + 1))
+    return Trajectory(t=records[:, 0], x=records[:, 1:], method=method, records=records)
@@ -0,0 +1,13 @@
+#
+# The tests of the `python/rklib` package. Run them from the root of the repository with:
+#
+#   python -m pytest python/tests
+#
+# The tests of the interface to the compiled library need its path in the
+# `RKLIB_LIBRARY` environment variable (see the README), and are skipped otherwise.
+#
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
@@ -0,0 +1,119 @@
+#
+# Tests of the interface to the compiled library (single, batch and dense integrations),
+# with the harmonic oscillator, which has an exact solution.
+#
+
+import ctypes
+
+import numpy as np
+import pytest
+
+import rklib
+
+try:
+    rklib.load_library()
+except OSError:
+    pytest.skip('the rklib shared library is not available (set RKLIB_LIBRARY)', allow_module_level=True)
+
+def oscillator(t, x):
+    return np.array([x[1], -x[0]])
+
+@rklib.RHS_CTYPE
+def oscillator_c(n, t, x, xdot, data):
+    xdot[0] = x[1]
+    xdot[1] = -x[0]
+
+def solution(t, x0):
+    """The exact solution for the initial states `x0` (shape `(m, 2)`) at the times `t`."""
+    c, s = np.cos(t), np.sin(t)
+    return np.stack([c*x0[:, 0] + s*x0[:, 1], -s*x0[:, 0] + c*x0[:, 1]], axis=-1)
+
+def test_methods():
+    names = rklib.methods()
+    assert 'rk4' in names and 'rkdp54' in names
+    assert len(names) == len(set(names))
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        rklib.Integrator('not_a_method', 2, oscillator)
+
+@pytest.mark.parametrize('rhs', [oscillator, oscillator_c])
+@pytest.mark.parametrize('method, h, tol', [('rk4', 1.0e-3, 1.0e-10), ('rkdp54', 0.0, 1.0e-8)])
+def test_single(rhs, method, h, tol):
+    x0 = np.array([1.0, 0.5])
+    with rklib.Integrator(method, 2, rhs, rtol=1.0e-12, atol=1.0e-12) as s:
+        xf = s.integrate(0.0, x0, 10.0, h=h)
+        assert s.evaluations > 0
+    assert np.allclose(xf, solution(10.0, x0[None, :])[0], rtol=0.0, atol=tol)
+
+def test_single_out():
+    out = np.empty(2)
+    with rklib.Integrator('rkdp54', 2, oscillator_c) as s:
+        xf = s.integrate(0.0, [1.0, 0.0], 1.0, out=out)
+        assert xf is out
+        with pytest.raises(ValueError):
+            s.integrate(0.0, [1.0, 0.0], 1.0, out=np.empty(3))
+
+def test_failure():
+    with rklib.Integrator('rk4', 2, oscillator_c) as s:
+        with pytest.raises(rklib.RKLibError) as error:
+            s.integrate(0.0, [1.0, 0.0], 1.0, h=0.0)  # a fixed-step method needs a step size
+        assert error.value.status < 0
+
+def test_batch():
+    rng = np.random.default_rng(0)
+    x0 = rng.uniform(-1.0, 1.0, (50, 2))
+    tf = np.linspace(1.0, 10.0, 50)
+    with rklib.Integrator('rkdp54', 2, oscillator_c, rtol=1.0e-12, atol=1.0e-12) as s:
+        xf, status = s.integrate_batch(0.0, x0, tf)
+        assert np.all(status == 0)
+        assert np.allclose(xf, solution(tf, x0), rtol=0.0, atol=1.0e-9)
+        # the same as the single integrations:
+        for j in [0, 25, 49]:
+            assert np.array_equal(s.integrate(0.0, x0[j], tf[j]), xf[j])
+        with pytest.raises(ValueError):
+            s.integrate_batch(0.0, x0[:, :1], tf)
+
+def test_dense():
+    x0 = np.array([1.0, 0.5])
+    tout = np.linspace(0.5, 10.0, 20)
+    with rklib.Integrator('rkdp54', 2, oscillator_c, rtol=1.0e-12, atol=1.0e-12) as s:
+        xout = s.integrate_dense(0.0, x0, tout)
+        assert xout.shape == (tout.size, 2)
+        assert np.allclose(xout, solution(tout, x0[None, :]), rtol=0.0, atol=1.0e-8)
+        # the last output time is the final time:
+        assert np.allclose(xout[-1], s.integrate(0.0, x0, tout[-1]), rtol=0.0, atol=1.0e-12)
+    with rklib.Integrator('rkf45', 2, oscillator_c) as s:
+        with pytest.raises(rklib.RKLibError) as error:
+            s.integrate_dense(0.0, x0, tout)
+        assert error.value.status == rklib.RKLIB_ERROR_NO_DENSE_OUTPUT
+
+def test_closed():
+    s = rklib.Integrator('rkdp54', 2, oscillator)
+    assert s._rhs_wrapper is not None
+    s.close()
+    assert s._rhs_wrapper is None  # the callback is released
+    with pytest.raises(ValueError):
+        s.integrate(0.0, [1.0, 0.0], 1.0)
+    with pytest.raises(ValueError):
+        s.integrate_batch(0.0, np.ones((2, 2)), 1.0)
+    with pytest.raises(ValueError):
+        s.integrate_dense(0.0, [1.0, 0.0], [1.0])
+    with pytest.raises(ValueError):
+        s.evaluations
+    s.close()  # closing again does nothing
+
+def test_null_handle():
+    lib = rklib.load_library()
+    x = np.ones(2)
+    assert lib.rklib_integrate(None, 0.0, rklib._ptr(x), 0.0, 1.0, rklib._ptr(x)) < 0
+    assert lib.rklib_evaluations(None) == 0
+    buffer = ctypes.create_string_buffer(16)
+    assert lib.rklib_status_message(None, buffer, len(buffer)) == 0
+    assert buffer.value == b''
+
+def test_overlapping_out():
+    x0 = np.array([1.0, 0.0])
+    with rklib.Integrator('rkdp54', 2, oscillator_c) as s:
+        with pytest.raises(ValueError):
+            s.integrate(0.0, x0, 1.0, out=x0)
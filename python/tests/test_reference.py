@@ -0,0 +1,91 @@
+#
+# Tests of the reference integrator (`rklib.reference`): against the exact solution of
+# the harmonic oscillator, and against the compiled library (if it is available).
+#
+
+import numpy as np
+import pytest
+
+import rklib
+from rklib import reference
+
+def oscillator(t, x):
+    return np.stack([x[:, 1], -x[:, 0]], axis=1)
+
+def solution(t, x0):
+    """The exact solution for the initial states `x0` (shape `(m, 2)`) at the times `t`."""
+    c, s = np.cos(t), np.sin(t)
+    return np.stack([c*x0[:, 0] + s*x0[:, 1], -s*x0[:, 0] + c*x0[:, 1]], axis=-1)
+
+x0 = np.array([[1.0, 0.5], [0.2, -0.3], [-1.0, 2.0]])
+
+def library():
+    """The compiled library, or skip the test."""
+    try:
+        return rklib.load_library()
+    except OSError:
+        pytest.skip('the rklib shared library is not available (set RKLIB_LIBRARY)')
+
+def test_methods():
+    names = reference.methods()
+    assert 'rk4' in names and 'rkdp54' in names
+    assert 'rkls44' not in names  # a hand-written low-storage method
+    with pytest.raises(ValueError):
+        reference.Method('rkls44')
+
+def test_fixed_step():
+    result = reference.integrate('rk4', oscillator, 0.0, x0, 10.0, h=1.0e-3)
+    assert np.all(result.status == reference.RKLIB_ERROR_NONE)
+    assert np.all(result.t == 10.0)
+    assert np.all(result.num_f_evals == 4*result.num_steps)
+    assert np.allclose(result.x, solution(10.0, x0), rtol=0.0, atol=1.0e-12)
+
+@pytest.mark.parametrize('method, order', [('rk4', 4), ('rkdp54', 5), ('rkv89', 8)])
+def test_order(method, order):
+    """the error of the fixed-step integration decreases as `h**order`"""
+    errors = [np.abs(reference.integrate(method, oscillator, 0.0, x0, 2.0, h=h, fixed_step=True).x -
+                     solution(2.0, x0)).max() for h in [0.2, 0.1]]
+    assert abs(np.log2(errors[0] / errors[1]) - order) < 0.3
+
+@pytest.mark.parametrize('method', ['rkdp54', 'rkf45', 'rkv89'])
+def test_variable_step(method):
+    tf = np.array([1.0, 5.0, 10.0])  # a final time for each member
+    result = reference.integrate(method, oscillator, 0.0, x0, tf, rtol=1.0e-10, atol=1.0e-10)
+    assert np.all(result.status == reference.RKLIB_ERROR_NONE)
+    assert np.array_equal(result.t, tf)
+    assert np.all(result.num_steps[1:] > result.num_steps[:-1])
+    assert np.allclose(result.x, solution(tf, x0), rtol=0.0, atol=1.0e-7)
+
+def test_backwards():
+    result = reference.integrate('rkdp54', oscillator, 0.0, x0, -5.0, rtol=1.0e-10, atol=1.0e-10)
+    assert np.allclose(result.x, solution(-5.0, x0), rtol=0.0, atol=1.0e-8)
+
+def test_too_many_steps():
+    result = reference.integrate('rk4', oscillator, 0.0, x0, 10.0, h=1.0e-3, max_steps=100)
+    assert np.all(result.status == reference.RKLIB_ERROR_TOO_MANY_STEPS)
+
+def test_fixed_step_library():
+    library()
+    result = reference.integrate('rk4', oscillator, 0.0, x0, 10.0, h=1.0e-3)
+    with rklib.Integrator('rk4', 2, rklib_oscillator) as s:
+        for j in range(len(x0)):
+            xf = s.integrate(0.0, x0[j], 10.0, h=1.0e-3)
+            assert s.evaluations == result.num_f_evals[j]
+            assert np.allclose(xf, result.x[j], rtol=0.0, atol=1.0e-14)
+
+@pytest.mark.parametrize('method', ['rkdp54', 'rktp64', 'rkv89'])
+def test_variable_step_library(method):
+    """the steps are not exactly the same (e.g., the initial step), so the
+    results agree to the accuracy of the integration"""
+    library()
+    tol = 1.0e-10
+    result = reference.integrate(method, oscillator, 0.0, x0, 10.0, rtol=tol, atol=tol)
+    with rklib.Integrator(method, 2, rklib_oscillator, rtol=tol, atol=tol) as s:
+        xf, status = s.integrate_batch(0.0, x0, 10.0)
+    assert np.all(status == 0)
+    assert np.allclose(xf, result.x, rtol=0.0, atol=1000*tol)
+
+@rklib.RHS_CTYPE
+def rklib_oscillator(n, t, x, xdot, data):
+    xdot[0] = x[1]
+    xdot[1] = -x[0]
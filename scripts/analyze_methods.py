@@ -0,0 +1,198 @@
+#
+# Static analysis of the efficiency of the methods in `tableaus.py`, without running them.
+#
+# For each method, the order conditions are evaluated on all the rooted trees up to
+# order `p+1` (the elementary weights of each subtree are computed once, so this is
+# tractable up to the order 14 methods). This gives:
+#
+#   * the order of the method that is actually satisfied by the tableau,
+#   * its principal error coefficient `A = sqrt(sum(tau(t)**2))`, over the trees `t`
+#     of order `p+1`, where `tau(t) = (b^T Phi(t) - 1/gamma(t)) / sigma(t)` is the
+#     coefficient of the elementary differential of `t` in the local error,
+#   * the stability boundaries on the negative real axis and on the imaginary axis.
+#
+# The cost model is that the local error of a step is `A*h**(p+1)` (for a problem with
+# derivatives of order one), so a tolerance `tol` is met with steps of
+# `h = (tol/A)**(1/(p+1))`, and the number of function evaluations per unit of time
+# is `s/h`, where `s` is the number of function evaluations per step (the number
+# of stages, less one for the FSAL methods).
+#
+# The results are cached in `method_analysis.json`, keyed by a hash of the tableau,
+# so only the methods that are new or have changed are analyzed again. The cache is
+# read by `generate_files.py`, which writes the results into the properties of the
+# methods (`principal_error_coefficient` and `imaginary_stability_boundary`, which are
+# used by `rklib_recommended_method`) and into the `README`.
+#
+# Usage: python scripts/analyze_methods.py [--force] [--tol TOL ...]
+#
+# With `--tol`, the variable-step methods are ranked by their predicted cost for
+# each tolerance.
+#
+
+import argparse
+import json
+from fractions import Fraction
+from functools import lru_cache
+from math import factorial
+
+import numpy as np
+
+from tableaus import tableaus
+from dense_output import rooted_trees, tree_density, coefficient_value, rnd
+from generate_files import (fixed_methods, variable_methods, real_stability_boundary,
+                            tableau_hash, analysis_file, evaluations_per_step, predicted_cost)
+
+order_tolerance = 1.0e-9  # for the order conditions: |b^T Phi(t) - 1/gamma(t)| (some of
+                          # the tableaus are only accurate to about 12 digits)
+max_order = 20            # the order conditions are checked up to this order
+
+@lru_cache(None)
+def tree_symmetry(t : tuple):
+    """sigma(t): the order of the symmetry group of the tree `t`."""
+    s = 1
+    for u in set(t):
+        m = t.count(u)
+        s *= factorial(m) * tree_symmetry(u)**m
+    return s
+
+def float_tableau(name : str):
+    """The stage matrix and the weights of a tableau (in floating point)."""
+    tab = tableaus[name]
+    s = len(tab['a'])
+    A = np.zeros((s, s))
+    for i, row in enumerate(tab['b']):
+        for j, v in row.items():
+            A[i, j-1] = float(coefficient_value(v))
+    b = np.zeros(s)
+    for j, v in tab['c'].items():
+        b[j-1] = float(coefficient_value(v))
+    return A, b
+
+def order_conditions(name : str):
+    """The order of a tableau (the highest order for which all the order conditions
+    are satisfied), and its principal error coefficient."""
+    A, b = float_tableau(name)
+    Aw = {}  # A*w(t) for the subtrees
+
+    def weights(t : tuple):
+        """the vector of the elementary weights of `t` at each stage"""
+        w = np.ones(len(b))
+        for u in t:
+            if u not in Aw:
+                Aw[u] = A @ weights(u)
+            w = w * Aw[u]
+        return w
+
+    verified = 0
+    for q in range(1, max_order + 1):
+        taus = []
+        satisfied = True
+        for t in rooted_trees(q):
+            phi = b @ weights(t)
+            gamma = tree_density(t)
+            if abs(phi - 1.0/gamma) > order_tolerance:
+                satisfied = False
+            taus.append((phi - 1.0/gamma) / tree_symmetry(t))
+        if not satisfied:
+            return verified, float(np.sqrt(np.sum(np.square(taus))))
+        verified = q
+    raise ValueError(f'{name}: the order conditions are satisfied up to order {verified}')
+
+def exact_stability_polynomial(name : str):
+    """The coefficients of the stability polynomial (as Fractions, to 80 digits)."""
+    tab = tableaus[name]
+    s = len(tab['a'])
+    A = [{j-1: coefficient_value(v) for j, v in row.items()} for row in tab['b']]
+    weights = {j-1: coefficient_value(v) for j, v in tab['c'].items()}
+    coefficients = [Fraction(1)]
+    v = [Fraction(1)] * s  # A^(k-1) 1
+    for _ in range(s):
+        coefficients.append(rnd(sum(w * v[j] for j, w in weights.items())))
+        v = [rnd(sum(aij * v[j] for j, aij in row.items())) for row in A]
+    return coefficients
+
+def imaginary_stability_boundary(name : str, order : int):
+    """The stability boundary on the imaginary axis: the largest `r` such that
+    `|R(iy)| <= 1` for `0 <= y <= r` (rounded down to 3 decimals).
+
+    `|R(iy)|**2 - 1` is a polynomial in `y**2`, and its coefficients up to `y**order`
+    are zero (since `R(z) = exp(z) + O(z**(order+1))`), so they are dropped. If the
+    first remaining coefficient is positive, `|R(iy)| > 1` near the origin, and the
+    boundary is 0."""
+    c = exact_stability_polynomial(name)
+    e = {}
+    for j, cj in enumerate(c):
+        for k, ck in enumerate(c):
+            if (j - k) % 2 == 0 and j + k > order:
+                e[j+k] = e.get(j+k, 0) + cj * ck * (-1)**((j-k)//2)
+    e = {m: em for m, em in e.items() if em}
+    if not e:
+        return float('inf')
+    m0 = min(e)
+    coefficients = [(m - m0, float(em)) for m, em in sorted(e.items())]
+    def stable(y):
+        return sum(em * y**k for k, em in coefficients) <= 0.0
+    k = 0
+    while stable((k+1) / 1000) and k < 100000:
+        k += 1
+    return k / 1000
+
+def analyze(method : tuple):
+    """The analysis of a method (a dict, which is stored in the cache)."""
+    name, order = method[0], method[3]
+    verified_order, error_coefficient = order_conditions(name)
+    if verified_order < order:
+        print(f'warning: {name} only satisfies the order conditions up to order {verified_order}')
+    return {'hash': tableau_hash(method),
+            'order': verified_order,
+            'principal_error_coefficient': float(f'{error_coefficient:.6e}'),
+            'real_stability_boundary': real_stability_boundary(method),
+            'imaginary_stability_boundary': imaginary_stability_boundary(name, verified_order)}
+
+def read_cache():
+    try:
+        with open(analysis_file, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def update_cache(force : bool = False):
+    """Analyze the methods that are not in the cache (or have changed), and write it."""
+    cache = read_cache()
+    analysis = {}
+    for method in fixed_methods + variable_methods:
+        name = method[0]
+        if name not in tableaus:
+            continue
+        if not force and name in cache and cache[name]['hash'] == tableau_hash(method):
+            analysis[name] = cache[name]
+        else:
+            print(f'analyzing {name}')
+            analysis[name] = analyze(method)
+    with open(analysis_file, 'w') as f:
+        json.dump(analysis, f, indent=1)
+        f.write('\n')
+    return analysis
+
+def ranking(analysis : dict, tol : float):
+    """The variable-step methods, sorted by their predicted cost for a tolerance."""
+    costs = []
+    for method in variable_methods:
+        a = analysis.get(method[0])
+        if a and a['principal_error_coefficient'] > 0.0:
+            costs.append((predicted_cost(method, a, tol), method[0]))
+    return sorted(costs)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Static analysis of the efficiency of the methods.')
+    parser.add_argument('--force', action='store_true', help='analyze all the methods again')
+    parser.add_argument('--tol', nargs='+', type=float, metavar='TOL',
+                        help='rank the variable-step methods by their predicted cost for these tolerances')
+    args = parser.parse_args()
+
+    analysis = update_cache(args.force)
+    for tol in args.tol or []:
+        print(f'\ntolerance {tol:g} (predicted function evaluations per unit of time):')
+        for cost, name in ranking(analysis, tol)[:10]:
+            print(f'  {name:10} {cost:10.1f}')
@@ -0,0 +1,124 @@
+#
+# Compare the results of the `rk_benchmark` test program with a baseline,
+# and flag the methods that have become slower or less efficient.
+#
+# Usage: python compare_benchmarks.py baseline_file results_file [options]
+#
+# The files can be in CSV or JSON Lines format (from the file extension). The rows
+# are matched by kind, problem, method, tolerance and step size (so, the JSON Lines
+# files from builds with different real kinds can be concatenated). For each method, the
+# geometric mean of the ratios (results/baseline) of the wall time and the number of
+# function evaluations are computed over all its rows, and the method is flagged if:
+#
+#  * the time ratio is larger than `1 + time_tol` (a slowdown),
+#  * the function evaluations ratio is larger than `1 + evals_tol` (an efficiency regression),
+#  * the achieved error of any row is larger than `error_factor` times the baseline one,
+#    or a row that was successful in the baseline now fails (an accuracy regression).
+#
+# The exit code is 1 if there are any regressions.
+#
+
+import argparse
+import csv
+import json
+import math
+import sys
+
+def read_results(filename : str):
+    """Read the rows of a benchmark results file into a dict, indexed by the case."""
+    with open(filename, 'r') as f:
+        if filename.endswith('.json'):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+    results = {}
+    for row in rows:
+        for k in ['order', 'f_evals', 'steps', 'rejected', 'status']:
+            row[k] = int(row[k])
+        for k in ['tolerance', 'h', 'time', 'error']:
+            row[k] = None if row[k] in [None, 'null'] else float(row[k])
+        key = (row['kind'], row['problem'], row['method'], row['tolerance'], row['h'])
+        results[key] = row
+    return results
+
+def geometric_mean(x : list):
+    return math.exp(sum(math.log(v) for v in x) / len(x)) if x else 1.0
+
+def compare(baseline : dict, results : dict, time_tol : float, evals_tol : float,
+            error_factor : float, min_time : float):
+    """Compare the results with the baseline. Returns the summary for each method
+    (in the order of the results file), and the list of rows that are not in both."""
+
+    methods = {}
+    for key, row in results.items():
+        m = methods.setdefault((row['kind'], row['method']),
+                               {'time': [], 'evals': [], 'accuracy': [], 'cases': 0})
+        base = baseline.get(key)
+        if base is None:
+            continue
+        m['cases'] += 1
+        if base['status'] >= 0:
+            if row['status'] < 0:
+                m['accuracy'].append(f"{row['problem']}: failed with status {row['status']}")
+            elif base['error'] and row['error'] is not None and row['error'] > error_factor * base['error']:
+                m['accuracy'].append(f"{row['problem']}: error {row['error']:.3e} (was {base['error']:.3e})")
+        if row['status'] >= 0 and base['status'] >= 0:
+            if base['time'] and row['time'] and base['time'] >= min_time:
+                m['time'].append(row['time'] / base['time'])
+            if base['f_evals'] > 0:
+                m['evals'].append(row['f_evals'] / base['f_evals'])
+
+    summary = {}
+    for (kind, method), m in methods.items():
+        time_ratio = geometric_mean(m['time'])
+        evals_ratio = geometric_mean(m['evals'])
+        flags = []
+        if time_ratio > 1.0 + time_tol:
+            flags.append('slower')
+        if evals_ratio > 1.0 + evals_tol:
+            flags.append('more evaluations')
+        if m['accuracy']:
+            flags.append('less accurate')
+        summary[(kind, method)] = {'cases': m['cases'], 'time_ratio': time_ratio,
+                                   'evals_ratio': evals_ratio, 'flags': flags,
+                                   'accuracy': m['accuracy']}
+
+    missing = [key for key in baseline if key not in results]
+    new = [key for key in results if key not in baseline]
+
+    return summary, missing, new
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Compare rk_benchmark results with a baseline.')
+    parser.add_argument('baseline', help='the baseline results file (CSV or JSON Lines)')
+    parser.add_argument('results', help='the new results file (CSV or JSON Lines)')
+    parser.add_argument('--time-tol', type=float, default=0.25,
+                        help='allowed relative increase of the wall time (default: 0.25)')
+    parser.add_argument('--evals-tol', type=float, default=0.0,
+                        help='allowed relative increase of the function evaluations (default: 0.0)')
+    parser.add_argument('--error-factor', type=float, default=10.0,
+                        help='allowed factor for the increase of the achieved error (default: 10)')
+    parser.add_argument('--min-time', type=float, default=0.0,
+                        help='ignore the wall time of the cases faster than this in the baseline (sec)')
+    parser.add_argument('--all', action='store_true', help='print all the methods (not just the flagged ones)')
+    args = parser.parse_args()
+
+    summary, missing, new = compare(read_results(args.baseline), read_results(args.results),
+                                    args.time_tol, args.evals_tol, args.error_factor, args.min_time)
+
+    print(f"{'kind':8} {'method':10} {'cases':>6} {'time':>8} {'f evals':>8}  flags")
+    for (kind, method), s in summary.items():
+        if s['flags'] or args.all:
+            print(f"{kind:8} {method:10} {s['cases']:6d} {s['time_ratio']:8.3f} "
+                  f"{s['evals_ratio']:8.3f}  {', '.join(s['flags'])}")
+            for a in s['accuracy']:
+                print(f"{'':27}{a}")
+    if missing:
+        print(f'{len(missing)} cases of the baseline are not in the results')
+    if new:
+        print(f'{len(new)} cases of the results are not in the baseline')
+
+    num_flagged = sum(1 for s in summary.values() if s['flags'])
+    print(f'{num_flagged} of {len(summary)} methods have regressions')
+    sys.exit(1 if num_flagged else 0)
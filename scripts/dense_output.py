@@ -0,0 +1,250 @@
+#
+# Compute the coefficients of a continuous extension (dense output) of a method in
+# `tableaus.py`, using the existing stages of the method (plus `f(t+h,xf)` for the
+# methods that are not FSAL).
+#
+# The interpolant is `x(t+theta*h) = x + h*sum(b_j(theta)*f_j)`, where the weights are
+# polynomials `b_j(theta) = sum(b_jk*theta**k, k=1..q)`. The coefficients are
+# found by solving the continuous order conditions up to order `q`, together with the
+# conditions that the interpolant matches `x`, `f(t,x)`, `xf`, and `f(t+h,xf)` at the
+# ends of the step (so it is continuous, with a continuous derivative). When this does
+# not give a unique solution, the free parameters are chosen to minimize the order
+# `q+1` error terms over the step, plus `penalty` times the sum of the squares of the
+# coefficients (without this, the solution can have very large coefficients, which
+# would amplify roundoff).
+#
+# Usage: python dense_output.py method_name order [penalty]
+#
+# The result is printed in the `dense` format of `tableaus.py`.
+#
+
+import sys
+from fractions import Fraction
+from functools import lru_cache
+from math import isqrt
+
+from tableaus import tableaus
+from generate_files import parse_coefficient, variable_methods, fixed_methods
+
+digits = 80  # number of digits kept in the intermediate calculations
+tolerance = Fraction(1, 10**22)  # for the rank determination (the
+                                 # tableaus are only accurate to about 30 digits)
+
+def rnd(x : Fraction):
+    """round to `digits` digits after the decimal point"""
+    return Fraction(round(x * 10**digits), 10**digits)
+
+@lru_cache(None)
+def rooted_trees(order : int):
+    """All the rooted trees with `order` nodes. A tree is a sorted tuple of its subtrees."""
+    if order == 1:
+        return [()]
+    trees = set()
+    for forest in forests(order - 1):
+        trees.add(tuple(sorted(forest)))
+    return sorted(trees)
+
+@lru_cache(None)
+def forests(n : int, largest=None):
+    """All the multisets of trees with `n` nodes in total (with no tree larger than `largest`)."""
+    if n == 0:
+        return [()]
+    out = []
+    for k in range(1, n+1):
+        for t in rooted_trees(k):
+            if largest is not None and t > largest:
+                continue
+            for f in forests(n-k, t):
+                out.append((t,) + f)
+    return out
+
+def tree_order(t : tuple):
+    return 1 + sum(tree_order(u) for u in t)
+
+def tree_density(t : tuple):
+    """gamma(t)"""
+    g = tree_order(t)
+    for u in t:
+        g *= tree_density(u)
+    return g
+
+def coefficient_value(s : str):
+    r, q, k = parse_coefficient(s)
+    if q:
+        r += q * Fraction(isqrt(k * 10**(2*digits)), 10**digits)
+    return r
+
+def stages(name : str, fsal : bool):
+    """The stage matrix and weights. For non-FSAL methods, `f(t+h,xf)` is added as an extra stage."""
+    tab = tableaus[name]
+    s = len(tab['a'])
+    A = [[coefficient_value(tab['b'][i].get(j+1, '0')) for j in range(s)] for i in range(s)]
+    c = [coefficient_value(tab['c'].get(j+1, '0')) for j in range(s)]
+    if not fsal:
+        for row in A:
+            row.append(Fraction(0))
+        A.append(c + [Fraction(0)])
+        c.append(Fraction(0))
+    return A, c
+
+def elementary_weights(A : list, t : tuple, cache : dict):
+    """The vector of the elementary weights of the tree `t` at each stage."""
+    if t not in cache:
+        s = len(A)
+        v = [Fraction(1)] * s
+        for u in t:
+            w = elementary_weights(A, u, cache)
+            Aw = [rnd(sum(A[i][j]*w[j] for j in range(s) if A[i][j])) for i in range(s)]
+            v = [rnd(v[i]*Aw[i]) for i in range(s)]
+        cache[t] = v
+    return cache[t]
+
+def conditions(A : list, c : list, q : int):
+    """The linear system for the coefficients `b_jk` (unknown `j*q + k-1`)."""
+    s = len(A)
+    cache = {}
+    rows, rhs = [], []
+    def row():
+        return [Fraction(0)] * (s*q)
+    # order conditions: sum(b_j(theta)*phi_j(t)) = theta**|t| / gamma(t)
+    for order in range(1, q+1):
+        for t in rooted_trees(order):
+            phi = elementary_weights(A, t, cache)
+            for k in range(1, q+1):
+                r = row()
+                for j in range(s):
+                    r[j*q + k-1] = phi[j]
+                rows.append(r)
+                rhs.append(Fraction(1, tree_density(t)) if k == order else Fraction(0))
+    for j in range(s):
+        # b_j(1) = c_j:
+        r = row()
+        for k in range(1, q+1):
+            r[j*q + k-1] = Fraction(1)
+        rows.append(r)
+        rhs.append(c[j])
+        # b_j'(1) is 1 for the stage at (t+h,xf), and zero for the others:
+        r = row()
+        for k in range(1, q+1):
+            r[j*q + k-1] = Fraction(k)
+        rows.append(r)
+        rhs.append(Fraction(1) if j == s-1 else Fraction(0))
+        # b_j'(0) is 1 for the first stage, and zero for the others:
+        r = row()
+        r[j*q] = Fraction(1)
+        rows.append(r)
+        rhs.append(Fraction(1) if j == 0 else Fraction(0))
+    return rows, rhs, cache
+
+def solve(rows : list, rhs : list):
+    """Returns a particular solution and a basis for the null space (or `None` if inconsistent)."""
+    m = [r[:] + [b] for r, b in zip(rows, rhs)]
+    n = len(rows[0])
+    pivots = []
+    r = 0
+    for col in range(n):
+        p = max((i for i in range(r, len(m)) if abs(m[i][col]) > tolerance),
+                key=lambda i: abs(m[i][col]), default=None)
+        if p is None:
+            continue
+        m[r], m[p] = m[p], m[r]
+        pv = m[r][col]
+        m[r] = [rnd(x/pv) for x in m[r]]
+        for i in range(len(m)):
+            if i != r and m[i][col] != 0:
+                f = m[i][col]
+                m[i] = [rnd(a - f*b) for a, b in zip(m[i], m[r])]
+        pivots.append(col)
+        r += 1
+    if any(abs(row[-1]) > tolerance for row in m[r:]):
+        return None
+    x0 = [Fraction(0)] * n
+    for i, col in enumerate(pivots):
+        x0[col] = m[i][-1]
+    basis = []
+    for free in (col for col in range(n) if col not in pivots):
+        v = [Fraction(0)] * n
+        v[free] = Fraction(1)
+        for i, col in enumerate(pivots):
+            v[col] = -m[i][free]
+        basis.append(v)
+    return x0, basis
+
+def linear_solve(M : list, y : list):
+    """solve a small square system"""
+    n = len(y)
+    m = [M[i][:] + [y[i]] for i in range(n)]
+    for col in range(n):
+        p = max(range(col, n), key=lambda i: abs(m[i][col]))
+        m[col], m[p] = m[p], m[col]
+        for i in range(n):
+            if i != col and m[i][col] != 0:
+                f = m[i][col] / m[col][col]
+                m[i] = [rnd(a - f*b) for a, b in zip(m[i], m[col])]
+    return [rnd(m[i][-1] / m[i][i]) for i in range(n)]
+
+def continuous_extension(name : str, fsal : bool, q : int, penalty : Fraction):
+    """Coefficients `b[j][k-1]` of the interpolant of order `q`."""
+    A, c = stages(name, fsal)
+    s = len(A)
+    rows, rhs, cache = conditions(A, c, q)
+    sol = solve(rows, rhs)
+    if sol is None:
+        raise ValueError(f'{name}: there is no interpolant of order {q} with these stages')
+    x0, basis = sol
+    if basis:
+        # minimize the integral over [0,1] of the sum of the squares of the order q+1 error terms.
+        # The residual of tree t is sum((u_tk - delta_k,q+1/gamma)*theta**k, k=1..q+1)
+        hilbert = [[Fraction(1, k+l+1) for l in range(1, q+2)] for k in range(1, q+2)]
+        nb = len(basis)
+        M = [[Fraction(0)] * nb for _ in range(nb)]
+        y = [Fraction(0)] * nb
+        for t in rooted_trees(q+1):
+            phi = elementary_weights(A, t, cache)
+            def u(v):
+                return [rnd(sum(v[j*q + k] * phi[j] for j in range(s))) for k in range(q)] + [Fraction(0)]
+            r0 = u(x0)
+            r0[q] -= Fraction(1, tree_density(t))
+            U = [u(v) for v in basis]
+            HU = [[sum(hilbert[k][l] * U[a][l] for l in range(q+1)) for k in range(q+1)] for a in range(nb)]
+            for a in range(nb):
+                for b in range(nb):
+                    M[a][b] += rnd(sum(HU[a][k] * U[b][k] for k in range(q+1)))
+                y[a] -= rnd(sum(HU[a][k] * r0[k] for k in range(q+1)))
+        for a in range(nb):
+            for b in range(nb):
+                M[a][b] += rnd(penalty * sum(u*v for u, v in zip(basis[a], basis[b]) if u and v))
+            y[a] -= rnd(penalty * sum(u*v for u, v in zip(basis[a], x0) if u and v))
+        z = linear_solve(M, y)
+        x0 = [x0[i] + sum(z[a] * basis[a][i] for a in range(nb)) for i in range(len(x0))]
+    # remove the roundoff in the coefficients that should be zero:
+    x0 = [x if abs(x) > tolerance else Fraction(0) for x in x0]
+    return [[x0[j*q + k] for k in range(q)] for j in range(s)]
+
+def decimal_string(x : Fraction, n : int = 40):
+    """`x` as a decimal string with `n` significant digits"""
+    if x == 0:
+        return '0'
+    e = 0
+    while abs(x) >= 10**(e+1):
+        e += 1
+    while abs(x) < 10**e:
+        e -= 1
+    k = max(n - 1 - e, 0)  # digits after the decimal point
+    m = str(abs(round(x * 10**k))).rjust(k + 1, '0')
+    s = f'{m[:len(m)-k]}.{m[len(m)-k:]}'.rstrip('0').rstrip('.')
+    return '-' + s if x < 0 else s
+
+if __name__ == '__main__':
+
+    name = sys.argv[1]
+    q = int(sys.argv[2])
+    penalty = Fraction(sys.argv[3]) if len(sys.argv) > 3 else Fraction(1, 10**6)
+    method = next(m for m in fixed_methods + variable_methods if m[0] == name)
+    b = continuous_extension(name, 'FSAL' in method[2], q, penalty)
+    print(f"    'dense': {{'order': {q},")
+    items = []
+    for j, bj in enumerate(b):
+        if any(x != 0 for x in bj):
+            items.append(f"{j+1}: [" + ', '.join(f"'{decimal_string(x)}'" for x in bj) + ']')
+    print("              'b': {" + ',\n                    '.join(items) + '}},')
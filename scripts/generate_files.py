@@ -1,94 +1,130 @@
 #
-# Generate files for the methods. This generates everything but the step function.
+# Generate files for the methods.
 #
-# The intent here is that a user has to add a method to the table, and then
-# everything but the step functions are automatically updated.
+# The intent here is that a user has to add a method to the table (and its Butcher
+# tableau to `tableaus.py`), and then everything, including the step functions,
+# is automatically updated. The exceptions are the low-storage methods, whose
+# step functions are hand-written in `scripts/low_storage_steps.f90`.
+#
+# Each method is in its own file, so the methods can be compiled in parallel.
+# The `--methods` option builds a library with only some of them
+# (e.g., `python scripts/generate_files.py --methods rk4 rkdp54`).
+#
+# The tableaus are also written to `python/rklib/tableaus.py`, for the NumPy
+# reference integrator.
 #
 # It also updates the `README.md` file. Note that the text of the readme is in this file,
 # so changes to that file should only be made here and this script run to update it.
 #
 
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+
+from tableaus import tableaus
+
+# the root of the repository (the paths of the files are relative to it,
+# so that the script can be run from any directory):
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def repo_path(path : str):
+    """The absolute path of a file of the repository"""
+    return os.path.join(root_dir, path)
+
+# the real kinds of the library (the suffixes of the kind modules):
+real_kinds = ['r32', 'r64', 'r128']
+
 # fixed:
+#
+# The number of registers of the methods that are generated from a tableau is
+# computed by `stage_schedule` (use `None` in the table).
+#
 #                 Name       |  Description                                               | Properties | Order | Stages   | Registers | CFL  | Reference
-fixed_methods = [('euler'    , 'Euler'                                                        , '     ', 1     , 1        , 1         , 1.0  , '[Euler (1768)](https://archive.org/details/institutionescal020326mbp)'),
-                 ('midpoint' , 'Midpoint'                                                     , '     ', 2     , 2        , 2         , None , '?'),
-                 ('heun'     , 'Heun'                                                         , '     ', 2     , 2        , 2         , None , '?'),
+fixed_methods = [('euler'    , 'Euler'                                                        , '     ', 1     , 1        , None      , 1.0  , '[Euler (1768)](https://archive.org/details/institutionescal020326mbp)'),
+                 ('midpoint' , 'Midpoint'                                                     , '     ', 2     , 2        , None      , None , '?'),
+                 ('heun'     , 'Heun'                                                         , '     ', 2     , 2        , None      , None , '?'),
                  ('rkssp22'  , '2-stage, 2nd order TVD Runge-Kutta Shu-Osher'                 , ' SSP ', 2     , 2        , 1         , 1.0  , '[Shu & Oscher (1988)](https://ntrs.nasa.gov/api/citations/19880014833/downloads/19880014833.pdf)'),
-                 ('rk3'      , '3th order Runge-Kutta'                                        , '     ', 3     , 3        , 3         , None , '?'),
+                 ('rk3'      , '3th order Runge-Kutta'                                        , '     ', 3     , 3        , None      , None , '?'),
                  ('rkssp33'  , '3-stage, 3rd order TVD Runge-Kutta Shu-Osher'                 , ' SSP ', 3     , 3        , 1         , 1.0  , '[Shu & Oscher (1988)](https://ntrs.nasa.gov/api/citations/19880014833/downloads/19880014833.pdf)'),
                  ('rkssp53'  , '5-stage, 3rd order SSP Runge-Kutta Spiteri-Ruuth'             , ' SSP ', 3     , 5        , 2         , 2.65 , '[Ruuth (2006)](https://www.ams.org/journals/mcom/2006-75-253/S0025-5718-05-01772-2/S0025-5718-05-01772-2.pdf)'),
-                 ('rk4'      , 'Classic 4th order Runge-Kutta'                                 , '     ', 4     , 4        , 4         , None , '[Kutta (1901)](https://archive.org/stream/zeitschriftfrma12runggoog#page/n449/mode/2up)'),
-                 ('rks4'     , '4th order Runge-Kutta Shanks'                                 , '     ', 4     , 4        , 4         , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
-                 ('rkr4'     , '4th order Runge-Kutta Ralston'                                , '     ', 4     , 4        , 4         , None , '[Ralston (1962)](https://doi.org/10.1090%2FS0025-5718-1962-0150954-0)'),
+                 ('rk4'      , 'Classic 4th order Runge-Kutta'                                 , '     ', 4     , 4        , None      , None , '[Kutta (1901)](https://archive.org/stream/zeitschriftfrma12runggoog#page/n449/mode/2up)'),
+                 ('rks4'     , '4th order Runge-Kutta Shanks'                                 , '     ', 4     , 4        , None      , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
+                 ('rkr4'     , '4th order Runge-Kutta Ralston'                                , '     ', 4     , 4        , None      , None , '[Ralston (1962)](https://doi.org/10.1090%2FS0025-5718-1962-0150954-0)'),
                  ('rkls44'   , '4-stage, 4th order low storage non-TVD Runge-Kutta Jiang-Shu' , ' LS  ', 4     , 4        , 2         , None , '[Jiang and Shu (1988)](https://ntrs.nasa.gov/api/citations/19960007052/downloads/19960007052.pdf)'),
                  ('rkls54'   , '5-stage, 4th order low storage Runge-Kutta Carpenter-Kennedy' , ' LS  ', 4     , 5        , 2         , 0.32 , '[Carpenter & Kennedy (1994)](https://ntrs.nasa.gov/api/citations/19940028444/downloads/19940028444.pdf)'),
                  ('rkssp54'  , '5-stage, 4th order SSP Runge-Kutta Spiteri-Ruuth'             , ' SSP ', 4     , 5        , 4         , 1.51 , '[Ruuth (2006)](https://www.ams.org/journals/mcom/2006-75-253/S0025-5718-05-01772-2/S0025-5718-05-01772-2.pdf)'),
-                 ('rks5'     , '5th order Runge-Kutta Shanks'                                 , '     ', 5     , 5        , 5         , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
-                 ('rk5'      , '5th order Runge-Kutta'                                        , '     ', 5     , 6        , 6         , None , '?'),
-                 ('rkc5'     , '5th order Runge-Kutta Cassity'                                , '     ', 5     , 6        , 6         , None , '[Cassity (1966)](https://epubs.siam.org/doi/10.1137/0703052)'),
-                 ('rkl5'     , '5th order Runge-Kutta Lawson'                                 , '     ', 5     , 6        , 6         , None , '[Lawson (1966)](https://epubs.siam.org/doi/abs/10.1137/0703051)'),
-                 ('rklk5a'   , '5th order Runge-Kutta Luther-Konen 1'                       , '     ', 5     , 6        , 6         , None , '[Luther & Konen (1965)](https://epubs.siam.org/doi/abs/10.1137/1007112)'),
-                 ('rklk5b'   , '5th order Runge-Kutta Luther-Konen 2'                       , '     ', 5     , 6        , 6         , None , '[Luther & Konen (1965)](https://epubs.siam.org/doi/abs/10.1137/1007112)'),
-                 ('rkb6'     , '6th order Runge-Kutta Butcher'                                , '     ', 6     , 7        , 7         , None , '[Butcher (1963)](https://www.cambridge.org/core/services/aop-cambridge-core/content/view/40DFE501CAB781C9AAE1439B6B8F481A/S1446788700023387a.pdf/div-class-title-on-runge-kutta-processes-of-high-order-div.pdf)'),
-                 ('rk7'      , '7th order Runge-Kutta Shanks'                                 , '     ', 7     , 9        , 9         , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
-                 ('rk8_10'   , '10-stage, 8th order Runge-Kutta Shanks'                       , '     ', 8     , 10       , 10        , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
-                 ('rkcv8'    , '11-stage, 8th order Runge-Kutta Cooper-Verner'                , '     ', 8     , 11       , 11        , None , '[Cooper & Verner (1972)](https://epubs.siam.org/doi/abs/10.1137/0709037)'),
-                 ('rk8_12'   , '12-stage, 8th order Runge-Kutta Shanks'                       , '     ', 8     , 12       , 12        , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
-                 ('rks10'  , '10th order Runge-Kutta Stepanov'                              , '     ', 10    , 15       , 15        , None , '[Stepanov (2025)](https://arxiv.org/abs/2504.17329)'),
-                 ('rkz10'    , '10th order Runge-Kutta Zhang'                                 , '     ', 10    , 16       , 16        , None , '[Zhang (2019)](https://arxiv.org/abs/1911.00318)'),
-                 ('rko10'    , '10th order Runge-Kutta Ono'                                   , '     ', 10    , 17       , 17        , None , '[Ono (2003)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10f_1.pdf)'),
-                 ('rkh10'    , '10th order Runge-Kutta Hairer'                                , '     ', 10    , 17       , 17        , None , '[Hairer (1978)](https://www.researchgate.net/publication/31221486_A_Runge-Kutta_Method_of_Order_10)')]
+                 ('rks5'     , '5th order Runge-Kutta Shanks'                                 , '     ', 5     , 5        , None      , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
+                 ('rk5'      , '5th order Runge-Kutta'                                        , '     ', 5     , 6        , None      , None , '?'),
+                 ('rkc5'     , '5th order Runge-Kutta Cassity'                                , '     ', 5     , 6        , None      , None , '[Cassity (1966)](https://epubs.siam.org/doi/10.1137/0703052)'),
+                 ('rkl5'     , '5th order Runge-Kutta Lawson'                                 , '     ', 5     , 6        , None      , None , '[Lawson (1966)](https://epubs.siam.org/doi/abs/10.1137/0703051)'),
+                 ('rklk5a'   , '5th order Runge-Kutta Luther-Konen 1'                       , '     ', 5     , 6        , None      , None , '[Luther & Konen (1965)](https://epubs.siam.org/doi/abs/10.1137/1007112)'),
+                 ('rklk5b'   , '5th order Runge-Kutta Luther-Konen 2'                       , '     ', 5     , 6        , None      , None , '[Luther & Konen (1965)](https://epubs.siam.org/doi/abs/10.1137/1007112)'),
+                 ('rkb6'     , '6th order Runge-Kutta Butcher'                                , '     ', 6     , 7        , None      , None , '[Butcher (1963)](https://www.cambridge.org/core/services/aop-cambridge-core/content/view/40DFE501CAB781C9AAE1439B6B8F481A/S1446788700023387a.pdf/div-class-title-on-runge-kutta-processes-of-high-order-div.pdf)'),
+                 ('rk7'      , '7th order Runge-Kutta Shanks'                                 , '     ', 7     , 9        , None      , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
+                 ('rk8_10'   , '10-stage, 8th order Runge-Kutta Shanks'                       , '     ', 8     , 10       , None      , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
+                 ('rkcv8'    , '11-stage, 8th order Runge-Kutta Cooper-Verner'                , '     ', 8     , 11       , None      , None , '[Cooper & Verner (1972)](https://epubs.siam.org/doi/abs/10.1137/0709037)'),
+                 ('rk8_12'   , '12-stage, 8th order Runge-Kutta Shanks'                       , '     ', 8     , 12       , None      , None , '[Shanks (1965)](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)'),
+                 ('rks10'  , '10th order Runge-Kutta Stepanov'                              , '     ', 10    , 15       , None      , None , '[Stepanov (2025)](https://arxiv.org/abs/2504.17329)'),
+                 ('rkz10'    , '10th order Runge-Kutta Zhang'                                 , '     ', 10    , 16       , None      , None , '[Zhang (2019)](https://arxiv.org/abs/1911.00318)'),
+                 ('rko10'    , '10th order Runge-Kutta Ono'                                   , '     ', 10    , 17       , None      , None , '[Ono (2003)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10f_1.pdf)'),
+                 ('rkh10'    , '10th order Runge-Kutta Hairer'                                , '     ', 10    , 17       , None      , None , '[Hairer (1978)](https://www.researchgate.net/publication/31221486_A_Runge-Kutta_Method_of_Order_10)')]
 
 #variable:
 #                         Name  |  Description                                         | Properties | Order | Stages | Registers | CFL  | Reference
-variable_methods = [('rkbs32'   , 'Bogacki & Shampine 3(2)'                            , 'FSAL    ' , 3     , 4      , 4         , None , '[Bogacki & Shampine (1989)](https://www.sciencedirect.com/science/article/pii/0893965989900797)'),
+variable_methods = [('rkbs32'   , 'Bogacki & Shampine 3(2)'                            , 'FSAL    ' , 3     , 4      , None      , None , '[Bogacki & Shampine (1989)](https://www.sciencedirect.com/science/article/pii/0893965989900797)'),
                     ('rkssp43'  , '4-stage, 3rd order SSP'                             , 'SSP, LS ' , 3     , 4      , 2         , 2.0  , '[Kraaijevanger (1991)](https://doi.org/10.1007/BF01933264), [Conde et al. (2018)](https://doi.org/10.48550/arXiv.1806.08693)'),
-                    ('rkf45'    , 'Fehlberg 4(5)'                                      , '        ' , 4     , 6      , 6         , None , '[Fehlberg (1969)](https://ntrs.nasa.gov/api/citations/19690021375/downloads/19690021375.pdf)'),
-                    ('rkck54'   , 'Cash & Karp 5(4)'                                   , '        ' , 5     , 6      , 6         , None , '[Cash & Karp (1990)](http://www.elegio.it/mc2/rk/doc/p201-cash-karp.pdf)'),
-                    ('rkdp54'   , 'Dormand-Prince 5(4)'                                , 'FSAL    ' , 5     , 7      , 7         , None , '[Dormand & Prince (1980)](https://www.sciencedirect.com/science/article/pii/0771050X80900133?via%3Dihub)'),
-                    ('rkt54'    , 'Tsitouras 5(4)'                                     , 'FSAL    ' , 5     , 7      , 7         , None , '[Tsitouras (2011)](https://www.sciencedirect.com/science/article/pii/S0898122111004706/pdf)'),
-                    ('rks54'    , 'Stepanov 5(4)'                                      , 'FSAL    ' , 5     , 7      , 7         , None , '[Stepanov (2022)](https://arxiv.org/pdf/2108.12590.pdf)'),
-                    ('rkpp54'   , 'Papakostas-PapaGeorgiou 5(4)'                       , 'FSAL    ' , 5     , 7      , 7         , None , '[Papakostas & Papageorgiou (1996)](https://www.jstor.org/stable/2153797)'),
-                    ('rkpp54b'  , 'Papakostas-PapaGeorgiou 5(4) b'                     , 'FSAL    ' , 5     , 7      , 7         , None , '[Papakostas & Papageorgiou (1996)](https://www.jstor.org/stable/2153797)'),
-                    ('rkbs54'   , 'Bogacki & Shampine 5(4)'                            , '        ' , 5     , 8      , 8         , None , '[Bogacki & Shampine (1996)](https://www.sciencedirect.com/science/article/pii/0898122196001411)'),
-                    ('rkss54'   , 'Sharp & Smart 5(4)'                                 , '        ' , 5     , 7      , 7         , None , '[Sharp & Smart (1993)](https://epubs.siam.org/doi/10.1137/0914021)'),
-                    ('rkdp65'   , 'Dormand-Prince 6(5)'                                , '        ' , 6     , 8      , 8         , None , '[Dormand & Prince (1981)](https://www.sciencedirect.com/science/article/pii/0771050X81900103)'),
-                    ('rkc65'    , 'Calvo 6(5)'                                         , '        ' , 6     , 9      , 9         , None , '[Calvo (1990)](https://www.sciencedirect.com/science/article/pii/089812219090064Q)'),
-                    ('rktp64'   , 'Tsitouras & Papakostas NEW6(4)'                     , '        ' , 6     , 7      , 7         , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
-                    ('rkv65e'   , 'Verner efficient (9,6(5))'                          , 'FSAL    ' , 6     , 9      , 9         , None , '[Verner (1994)](https://www.sfu.ca/~jverner/RKV65.IIIXb.Efficient.00000144617.081204.CoeffsOnlyFLOAT)'),
-                    ('rkv65r'   , 'Verner robust (9,6(5))'                             , 'FSAL    ' , 6     , 9      , 9         , None , '[Verner (1994)](https://www.sfu.ca/~jverner/RKV65.IIIXb.Robust.00010102836.081204.RATOnWeb)'),
-                    ('rkv65'    , 'Verner 6(5)'                                        , '        ' , 6     , 8      , 8         , None , '[Verner (2006)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK6/RKcoeff6e_3.pdf)'),
-                    ('dverk65'  , 'Verner 6(5) "DVERK"'                                , '        ' , 6     , 8      , 8         , None , 'Verner (?)'),
-                    ('rktf65'   , 'Tsitouras & Famelis 6(5)'                           , 'FSAL    ' , 6     , 9      , 9         , None , '[Tsitouras & Famelis (2006)](http://users.uoa.gr/~tsitourasc/ModifiedRK-ICNAAM2006.pdf)'),
-                    ('rktp75'   , 'Tsitouras & Papakostas NEW7(5)'                     , '        ' , 7     , 9      , 9         , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
-                    ('rktmy7'   , '7th order Tanaka-Muramatsu-Yamashita'               , '        ' , 7     , 10     , 10        , None , '[Tanaka, Muramatsu & Yamashita (1992)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_4.pdf)'),
-                    ('rktmy7s'  , '7th order Stable Tanaka-Muramatsu-Yamashita'        , '        ' , 7     , 10     , 10        , None , '[Tanaka, Muramatsu & Yamashita (1992)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_3.pdf)'),
-                    ('rkv76e'   , 'Verner efficient (10:7(6))'                         , '        ' , 7     , 10     , 10        , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
-                    ('rkv76r'   , 'Verner robust (10:7(6))'                            , '        ' , 7     , 10     , 10        , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
-                    ('rkss76'   , 'Sharp & Smart 7(6)'                                 , '        ' , 7     , 11     , 11        , None , '[Sharp & Smart (1993)](https://epubs.siam.org/doi/10.1137/0914021)'),
-                    ('rkf78'    , 'Fehlberg 7(8)'                                      , '        ' , 7     , 13     , 13        , None , '[Fehlberg (1968)](https://ntrs.nasa.gov/citations/19680027281)'),
-                    ('rkv78'    , 'Verner 7(8)'                                        , '        ' , 7     , 13     , 13        , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
-                    ('dverk78'  , 'Verner "Maple" 7(8)'                                , '        ' , 7     , 13     , 13        , None , '[Verner (?)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK8/RKcoeff8c_2.pdf)'),
-                    ('rkdp85'   , 'Dormand-Prince 8(5)'                                , '        ' , 8     , 12     , 12        , None , '[Hairer (1993)](https://github.com/jacobwilliams/dop853)'),
-                    ('rktp86'   , 'Tsitouras & Papakostas NEW8(6)'                     , '        ' , 8     , 12     , 12        , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
-                    ('rkdp87'   , 'Dormand & Prince RK8(7)13M'                         , '        ' , 8     , 13     , 13        , None , '[Prince & Dormand (1981)](https://www.sciencedirect.com/science/article/pii/0771050X81900103)'),
-                    ('rkv87e'   , 'Verner efficient (8)7'                              , '        ' , 8     , 13     , 13        , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
-                    ('rkv87r'   , 'Verner robust (8)7'                                 , '        ' , 8     , 13     , 13        , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
-                    ('rkev87'   , 'Enright-Verner (8)7'                                , '        ' , 8     , 13     , 13        , None , '[Enright (1993)](https://epubs.siam.org/doi/10.1137/0730074)'),
-                    ('rkk87'    , 'Kovalnogov-Fedorov-Karpukhina-Simos-Tsitouras 8(7)' , '        ' , 8     , 13     , 13        , None , '[Kovalnogov, Fedorov, Karpukhina, Simos, Tsitouras (2022)](https://www.researchgate.net/publication/363396601_Runge-Kutta_Embedded_Methods_of_Orders_87_for_Use_in_Quadruple_Precision_Computations)'),
-                    ('rkf89'    , 'Fehlberg 8(9)'                                      , '        ' , 8     , 17     , 17        , None , '[Fehlberg (1968)](https://ntrs.nasa.gov/citations/19680027281)'),
-                    ('rkv89'    , 'Verner 8(9)'                                        , '        ' , 8     , 16     , 16        , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
-                    ('rkt98a'   , 'Tsitouras 9(8) A'                                   , '        ' , 9     , 16     , 16        , None , '[Tsitouras (2001)](https://www.sciencedirect.com/science/article/abs/pii/S0168927401000253)'),
-                    ('rkv98e'   , 'Verner efficient (16:9(8))'                         , '        ' , 9     , 16     , 16        , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
-                    ('rkv98r'   , 'Verner robust (16:9(8))'                            , '        ' , 9     , 16     , 16        , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
-                    ('rks98'    , 'Sharp 9(8)'                                         , '        ' , 9     , 16     , 16        , None , '[Sharp (2000)](https://www.hindawi.com/journals/ads/2000/853972/)'),
-                    ('rkf108'   , 'Feagin 8(10)'                                       , '        ' , 10    , 17     , 17        , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk108.txt)'),
-                    ('rkc108'   , 'Curtis 10(8)'                                       , '        ' , 10    , 21     , 21        , None , '[Curtis (1975)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10a(8)_2.pdf)'),
-                    ('rkb109'   , 'Baker 10(9)'                                        , '        ' , 10    , 21     , 21        , None , '[Baker (?)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10c_1.pdf)'),
-                    ('rks1110a' , 'Stone 11(10)'                                       , '        ' , 11    , 26     , 26        , None , '[Stone (2015)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK11/RKcoeff11_a.pdf)'),
-                    ('rkf1210'  , 'Feagin 12(10)'                                      , '        ' , 12    , 25     , 25        , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk1210.txt)'),
-                    ('rko129'   , 'Ono 12(9)'                                          , '        ' , 12    , 29     , 29        , None , '[Ono (2006)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK12/RKcoeff12h(9)_1.pdf)'),
-                    ('rkf1412'  , 'Feagin 14(12)'                                      , '        ' , 14    , 35     , 35        , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk1412.txt)') ]
+                    ('rkf45'    , 'Fehlberg 4(5)'                                      , '        ' , 4     , 6      , None      , None , '[Fehlberg (1969)](https://ntrs.nasa.gov/api/citations/19690021375/downloads/19690021375.pdf)'),
+                    ('rkck54'   , 'Cash & Karp 5(4)'                                   , '        ' , 5     , 6      , None      , None , '[Cash & Karp (1990)](http://www.elegio.it/mc2/rk/doc/p201-cash-karp.pdf)'),
+                    ('rkdp54'   , 'Dormand-Prince 5(4)'                                , 'FSAL    ' , 5     , 7      , None      , None , '[Dormand & Prince (1980)](https://www.sciencedirect.com/science/article/pii/0771050X80900133?via%3Dihub)'),
+                    ('rkt54'    , 'Tsitouras 5(4)'                                     , 'FSAL    ' , 5     , 7      , None      , None , '[Tsitouras (2011)](https://www.sciencedirect.com/science/article/pii/S0898122111004706/pdf)'),
+                    ('rks54'    , 'Stepanov 5(4)'                                      , 'FSAL    ' , 5     , 7      , None      , None , '[Stepanov (2022)](https://arxiv.org/pdf/2108.12590.pdf)'),
+                    ('rkpp54'   , 'Papakostas-PapaGeorgiou 5(4)'                       , 'FSAL    ' , 5     , 7      , None      , None , '[Papakostas & Papageorgiou (1996)](https://www.jstor.org/stable/2153797)'),
+                    ('rkpp54b'  , 'Papakostas-PapaGeorgiou 5(4) b'                     , 'FSAL    ' , 5     , 7      , None      , None , '[Papakostas & Papageorgiou (1996)](https://www.jstor.org/stable/2153797)'),
+                    ('rkbs54'   , 'Bogacki & Shampine 5(4)'                            , '        ' , 5     , 8      , None      , None , '[Bogacki & Shampine (1996)](https://www.sciencedirect.com/science/article/pii/0898122196001411)'),
+                    ('rkss54'   , 'Sharp & Smart 5(4)'                                 , '        ' , 5     , 7      , None      , None , '[Sharp & Smart (1993)](https://epubs.siam.org/doi/10.1137/0914021)'),
+                    ('rkdp65'   , 'Dormand-Prince 6(5)'                                , '        ' , 6     , 8      , None      , None , '[Dormand & Prince (1981)](https://www.sciencedirect.com/science/article/pii/0771050X81900103)'),
+                    ('rkc65'    , 'Calvo 6(5)'                                         , '        ' , 6     , 9      , None      , None , '[Calvo (1990)](https://www.sciencedirect.com/science/article/pii/089812219090064Q)'),
+                    ('rktp64'   , 'Tsitouras & Papakostas NEW6(4)'                     , '        ' , 6     , 7      , None      , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
+                    ('rkv65e'   , 'Verner efficient (9,6(5))'                          , 'FSAL    ' , 6     , 9      , None      , None , '[Verner (1994)](https://www.sfu.ca/~jverner/RKV65.IIIXb.Efficient.00000144617.081204.CoeffsOnlyFLOAT)'),
+                    ('rkv65r'   , 'Verner robust (9,6(5))'                             , 'FSAL    ' , 6     , 9      , None      , None , '[Verner (1994)](https://www.sfu.ca/~jverner/RKV65.IIIXb.Robust.00010102836.081204.RATOnWeb)'),
+                    ('rkv65'    , 'Verner 6(5)'                                        , '        ' , 6     , 8      , None      , None , '[Verner (2006)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK6/RKcoeff6e_3.pdf)'),
+                    ('dverk65'  , 'Verner 6(5) "DVERK"'                                , '        ' , 6     , 8      , None      , None , 'Verner (?)'),
+                    ('rktf65'   , 'Tsitouras & Famelis 6(5)'                           , 'FSAL    ' , 6     , 9      , None      , None , '[Tsitouras & Famelis (2006)](http://users.uoa.gr/~tsitourasc/ModifiedRK-ICNAAM2006.pdf)'),
+                    ('rktp75'   , 'Tsitouras & Papakostas NEW7(5)'                     , '        ' , 7     , 9      , None      , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
+                    ('rktmy7'   , '7th order Tanaka-Muramatsu-Yamashita'               , '        ' , 7     , 10     , None      , None , '[Tanaka, Muramatsu & Yamashita (1992)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_4.pdf)'),
+                    ('rktmy7s'  , '7th order Stable Tanaka-Muramatsu-Yamashita'        , '        ' , 7     , 10     , None      , None , '[Tanaka, Muramatsu & Yamashita (1992)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_3.pdf)'),
+                    ('rkv76e'   , 'Verner efficient (10:7(6))'                         , '        ' , 7     , 10     , None      , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
+                    ('rkv76r'   , 'Verner robust (10:7(6))'                            , '        ' , 7     , 10     , None      , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
+                    ('rkss76'   , 'Sharp & Smart 7(6)'                                 , '        ' , 7     , 11     , None      , None , '[Sharp & Smart (1993)](https://epubs.siam.org/doi/10.1137/0914021)'),
+                    ('rkf78'    , 'Fehlberg 7(8)'                                      , '        ' , 7     , 13     , None      , None , '[Fehlberg (1968)](https://ntrs.nasa.gov/citations/19680027281)'),
+                    ('rkv78'    , 'Verner 7(8)'                                        , '        ' , 7     , 13     , None      , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
+                    ('dverk78'  , 'Verner "Maple" 7(8)'                                , '        ' , 7     , 13     , None      , None , '[Verner (?)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK8/RKcoeff8c_2.pdf)'),
+                    ('rkdp85'   , 'Dormand-Prince 8(5)'                                , '        ' , 8     , 12     , None      , None , '[Hairer (1993)](https://github.com/jacobwilliams/dop853)'),
+                    ('rktp86'   , 'Tsitouras & Papakostas NEW8(6)'                     , '        ' , 8     , 12     , None      , None , '[Tsitouras & Papakostas (1999)](https://epubs.siam.org/doi/abs/10.1137/S1064827596302230?journalCode=sjoce3)'),
+                    ('rkdp87'   , 'Dormand & Prince RK8(7)13M'                         , '        ' , 8     , 13     , None      , None , '[Prince & Dormand (1981)](https://www.sciencedirect.com/science/article/pii/0771050X81900103)'),
+                    ('rkv87e'   , 'Verner efficient (8)7'                              , '        ' , 8     , 13     , None      , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
+                    ('rkv87r'   , 'Verner robust (8)7'                                 , '        ' , 8     , 13     , None      , None , '[Verner (1978)](https://epubs.siam.org/doi/10.1137/0715051)'),
+                    ('rkev87'   , 'Enright-Verner (8)7'                                , '        ' , 8     , 13     , None      , None , '[Enright (1993)](https://epubs.siam.org/doi/10.1137/0730074)'),
+                    ('rkk87'    , 'Kovalnogov-Fedorov-Karpukhina-Simos-Tsitouras 8(7)' , '        ' , 8     , 13     , None      , None , '[Kovalnogov, Fedorov, Karpukhina, Simos, Tsitouras (2022)](https://www.researchgate.net/publication/363396601_Runge-Kutta_Embedded_Methods_of_Orders_87_for_Use_in_Quadruple_Precision_Computations)'),
+                    ('rkf89'    , 'Fehlberg 8(9)'                                      , '        ' , 8     , 17     , None      , None , '[Fehlberg (1968)](https://ntrs.nasa.gov/citations/19680027281)'),
+                    ('rkv89'    , 'Verner 8(9)'                                        , '        ' , 8     , 16     , None      , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
+                    ('rkt98a'   , 'Tsitouras 9(8) A'                                   , '        ' , 9     , 16     , None      , None , '[Tsitouras (2001)](https://www.sciencedirect.com/science/article/abs/pii/S0168927401000253)'),
+                    ('rkv98e'   , 'Verner efficient (16:9(8))'                         , '        ' , 9     , 16     , None      , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
+                    ('rkv98r'   , 'Verner robust (16:9(8))'                            , '        ' , 9     , 16     , None      , None , '[Verner (1978)](https://www.jstor.org/stable/2156853)'),
+                    ('rks98'    , 'Sharp 9(8)'                                         , '        ' , 9     , 16     , None      , None , '[Sharp (2000)](https://www.hindawi.com/journals/ads/2000/853972/)'),
+                    ('rkf108'   , 'Feagin 8(10)'                                       , '        ' , 10    , 17     , None      , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk108.txt)'),
+                    ('rkc108'   , 'Curtis 10(8)'                                       , '        ' , 10    , 21     , None      , None , '[Curtis (1975)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10a(8)_2.pdf)'),
+                    ('rkb109'   , 'Baker 10(9)'                                        , '        ' , 10    , 21     , None      , None , '[Baker (?)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10c_1.pdf)'),
+                    ('rks1110a' , 'Stone 11(10)'                                       , '        ' , 11    , 26     , None      , None , '[Stone (2015)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK11/RKcoeff11_a.pdf)'),
+                    ('rkf1210'  , 'Feagin 12(10)'                                      , '        ' , 12    , 25     , None      , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk1210.txt)'),
+                    ('rko129'   , 'Ono 12(9)'                                          , '        ' , 12    , 29     , None      , None , '[Ono (2006)](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK12/RKcoeff12h(9)_1.pdf)'),
+                    ('rkf1412'  , 'Feagin 14(12)'                                      , '        ' , 14    , 35     , None      , None , '[Feagin (2006)](https://sce.uhcl.edu/rungekutta/rk1412.txt)') ]
 
 def readme_template():
 
@@ -112,9 +148,21 @@ The focus of this library is single-step, explicit Runge-Kutta solvers for 1st o
 
   * The library includes a wide range of both fixed and variable-step Runge-Kutta methods, from very low to very high order.
   * It is object-oriented and written in modern Fortran.
-  * It allows for defining a variable-step size integrator with a custom-tuned step size selection method. See `stepsize_class` in the code.
-  * The `real` kind is selectable via a compiler directive (`REAL32`, `REAL64`, or `REAL128`).
-  * Integration to an event is also supported. The root-finding method is also selectable (via the [roots-fortran](https://github.com/jacobwilliams/roots-fortran) library).
+  * It allows for defining a variable-step size integrator with a custom-tuned step size selection method. See `stepsize_class` in the code. Besides the elementary controller, PI and PID controllers are available (`RKLIB_CONTROLLER_PI` and `RKLIB_CONTROLLER_PID`), which use the errors of the previous steps and usually reject fewer steps.
+  * The library is built for the `real32`, `real64` and `real128` kinds, which can be used in the same program (see `rklib_kinds_module`). The default kind of `rklib_module` is selectable via a compiler directive (`REAL32`, `REAL64`, or `REAL128`).
+  * Integration to an event is also supported. The root-finding method is also selectable (via the [roots-fortran](https://github.com/jacobwilliams/roots-fortran) library). With the `interpolate_events` option, the root finder is applied to an interpolant of the step that brackets the event (the dense output interpolant if the method has one, otherwise a cubic Hermite interpolant), which requires far fewer function evaluations. The number of function evaluations can be checked with `evaluations`.
+  * Several events can be tracked at once with `integrate_to_events`, which takes a vector of event functions, the direction of the crossings to locate for each one (`RKLIB_EVENT_RISING`, `RKLIB_EVENT_FALLING` or `RKLIB_EVENT_BOTH`), and which of them are terminal. All the crossings are returned in a log (in time order), and the integration stops at the first terminal event.
+  * An ensemble of initial conditions can be integrated with `integrate_ensemble`, which distributes the members over the threads if the library is compiled with OpenMP (e.g., `fpm build --flag -fopenmp`).
+  * Dense output: `integrate_dense` computes the solution at a list of output times by interpolation, without changing the steps that are taken. This is available for: $DENSE_METHODS.
+  * The stages of the methods that don't depend on each other (the ones on the same level of the stage dependency graph, given by the `stage_levels` property) can be evaluated concurrently as OpenMP tasks, with the `parallel_stages` option. This is only useful if the derivative function is expensive (and thread-safe), and the library is compiled with OpenMP. This is done for the methods where the levels save at least 10% of the stage evaluations of a step (the `concurrent_stages` property): $PARALLEL_METHODS.
+  * The `statistics` method returns the statistics of the last integration (`rklib_stats`): the number of function evaluations, accepted and rejected steps (by cause), FSAL cache hits and misses, root solver iterations for the events, and a histogram of the accepted step sizes. With the `timers` option, the time spent in the user functions and the total time are also measured. To remove this instrumentation, compile the library with `RKLIB_NO_STATS` (only the function evaluations and the steps are counted then).
+  * The trajectory of an integration can be recorded without a `report` function: with the `record_trajectory` option of `initialize`, it is stored in memory (see `trajectory`), and with the `trajectory_file` option, it is written to an unformatted stream file, with large buffered writes and a small header (the method, `n` and the real kind). The `trajectory_interval` option sets a minimum time interval between the recorded points. The recorder (`rklib_recorder`) can also be used on its own.
+  * The state of an integration (the time, state, next step size, counters, step size controller memory and FSAL cache) can be saved with `save_state` (to a binary blob) or `write_state` (to a file), and restored with `restore_state` or `read_state`. `resume` then continues the integration, with exactly the same result as the uninterrupted one. With the `checkpoint_file` and `checkpoint_rate` options, `integrate` saves its state periodically, so that a long integration can be resumed after the program is killed.
+  * Stiffness detection for the variable-step methods (`stiffness_test_rate` option): the dominant eigenvalue of the Jacobian is estimated from two derivatives at the end of the step (as in `DOPRI5` and `DOP853` by Hairer), and the integration is stopped with `RKLIB_ERROR_STIFF` after `max_stiff_steps` steps that are limited by the stability of the method instead of its accuracy, so that the problem can be handed to a stiff solver early. The stability boundary of each method on the real axis is in its properties (`real_stability_boundary`).
+  * Integration in segments (e.g., between maneuvers or output epochs) with `continue_integration`, or with the `continuation` option of `integrate`: the step size, the memory of the step size controller and the FSAL cache of the last integration are carried over, so no initial step size is computed for each segment. Use `invalidate_continuation` after a discontinuity of the derivative function.
+  * A method can be selected at run time by its name with `rklib_allocate` (e.g., `call rklib_allocate(s, 'rkdp54')`). `rklib_recommended_method` gives the variable-step method with the lowest predicted cost for a tolerance, from a static analysis of the tableaus (see [below](#predicted-efficiency-of-the-methods)).
+  * The fastest method for a given problem can also be found empirically with `rklib_tune`, which runs pilot integrations with all the variable-step methods, compares them with a reference solution, and tunes the step size parameters of the fastest one that reaches the accuracy (`safety_factor`, `hfactor_reject`, `hfactor_accept` and `p_exponent_offset`). The result (`rklib_tuning`) can be saved in a cache file, keyed by a problem ID, so that it is only computed once for a family of problems.
+  * The library can be called from C and Python (see below).
 
 ### Available Runge-Kutta methods:
 
@@ -132,6 +180,19 @@ $VARIABLE_STEP_TABLE
   * FSAL = First same as last
   * CFL = Courant-Friedrichs-Lewy
 
+### Predicted efficiency of the methods:
+
+These are computed from the Butcher tableaus by `scripts/analyze_methods.py`, without running the methods:
+
+  * Order: the highest order for which all the order conditions are satisfied by the tableau.
+  * Error coefficient: the principal error coefficient `A = sqrt(sum(tau(t)**2))`, over the rooted trees `t` of order `p+1`, where `tau(t)` is the coefficient of the elementary differential of `t` in the local error (`principal_error_coefficient` property).
+  * Real stability, Imaginary stability: the stability boundaries on the negative real axis and on the imaginary axis (`real_stability_boundary` and `imaginary_stability_boundary` properties).
+  * Cost: the predicted number of function evaluations per unit of time to meet a tolerance, for a problem with derivatives of order one: `s*(A/tol)**(1/(p+1))`, where `s` is the number of function evaluations per step. The cheapest method for each tolerance is in bold. `rklib_recommended_method(tol)` returns the cheapest method for a tolerance.
+
+$FIXED_STEP_EFFICIENCY_TABLE
+
+$VARIABLE_STEP_EFFICIENCY_TABLE
+
 ### Example use case
 
 Basic use of the library is shown here (this uses the `rktp86` method):
@@ -154,6 +215,15 @@ Running the unit tests will generate some performance plots. The following is fo
 
 ![rk_test_variable_step_R16](media/rk_test_variable_step_R16.pdf)
 
+For tracking the performance between versions (or compilers and flags), the `rk_benchmark` test runs all the methods on a set of standard problems, and writes the number of function evaluations, the number of accepted and rejected steps, the wall time and the achieved error for each case, in CSV or JSON Lines format. The results can be compared with a baseline using `scripts/compare_benchmarks.py`, which flags the methods that have become slower, less efficient or less accurate. For example:
+
+```
+fpm test rk_benchmark --profile release -- baseline.json
+# ...make some changes...
+fpm test rk_benchmark --profile release -- results.json
+python scripts/compare_benchmarks.py baseline.json results.json
+```
+
 ### Compiling
 
 A [Fortran Package Manager](https://github.com/fortran-lang/fpm) manifest file is included, so that the library and test cases can be compiled with FPM. For example:
@@ -177,18 +247,56 @@ Preprocessor flag | Kind  | Number of bytes
 `REAL64`  | `real(kind=real64)`  | 8
 `REAL128` | `real(kind=real128)` | 16
 
-For example, to build a single precision version of the library, use:
+For example, to build a library with single precision as the default kind, use:
 
 ```
 fpm build --profile release --flag "-DREAL32"
 ```
 
+The flag only selects the kind of `rklib_module`: the three kinds are always in the library, in `rklib_module_r32`, `rklib_module_r64` and `rklib_module_r128` (which are generated from the same source, `src/rklib_kind_module.inc`). They can be used together through `rklib_kinds_module`, where the classes have a suffix for their kind (e.g., `rkdp87_class_r64` and `rkf78_class_r128`), and `rklib_allocate` is generic over the kinds. For example, a trajectory can be computed in double precision and refined in quadruple precision in the same program. The `real32` or `real128` versions can be left out with the `RKLIB_NO_REAL32` or `RKLIB_NO_REAL128` flags (e.g., for compilers that do not support `real128`). Note that the root finder used for the events is only compiled for the default kind, so the event times of the other kinds are located in the default kind. Also, some of the methods have coefficients that are only published to about 18 digits, which limits their accuracy with `real128`.
+
+Each method is in its own file in `src/methods` (with a submodule for each real kind, listed in `src/methods/manifest.txt` for other build systems), so the methods can be compiled in parallel. To build a smaller library that only contains some of the methods, regenerate the files with the `--methods` option before compiling. For example:
+
+```
+python scripts/generate_files.py --methods rk4 rkdp54 rkv89
+fpm build --profile release
+```
+
+The class and interface include files and the manifest are trimmed to match (note that most of the tests need the full set of methods). Run the script again without `--methods` to restore all of them.
+
 To generate the documentation using [FORD](https://github.com/Fortran-FOSS-Programmers/ford), run:
 
 ```
 ford ford.md
 ```
 
+### C and Python interfaces
+
+The `rklib_c_module` module provides a C interface to the library (with `bind(c)` functions). An integrator is created for a method by its name, with a C derivative function `void f(int n, double t, const double *x, double *xdot, void *data)`:
+
+```c
+void *s = rklib_create("rkdp54", n, f, data, rtol, atol);
+int istatus = rklib_integrate(s, t0, x0, h, tf, xf);
+rklib_destroy(s);
+```
+
+`rklib_integrate_batch` integrates a batch of initial states (in parallel, if the library is compiled with OpenMP), and `rklib_integrate_dense` computes the solution at a list of output times. The real type is always `double`, and the arrays of the caller are used in place. If the library is compiled with another real kind (`REAL32` or `REAL128`), the values are converted at the boundary, so the arrays are copied (the kind used in the computations is given by `rklib_real_size`). A `NULL` handle gives the `RKLIB_ERROR_INVALID_HANDLE` status.
+
+The `python/rklib` package is a Python interface (using `ctypes` and [NumPy](https://numpy.org), without copying the arrays). The derivative function can be a [Numba](https://numba.pydata.org) `cfunc`, so that the integration doesn't call any Python code. The library must be compiled as a shared library (with the `roots-fortran` library), for example:
+
+```
+fpm build --profile release --flag "-fPIC -fopenmp"
+gfortran -shared -fopenmp -o librklib.so -Wl,--whole-archive build/gfortran_*/rklib/librklib.a -Wl,--no-whole-archive \\
+    build/gfortran_*/roots-fortran/libroots-fortran.a
+export RKLIB_LIBRARY=$PWD/librklib.so
+```
+
+See the docstring of the package for an example. Its tests are in `python/tests` (run them with `python -m pytest python/tests`, the ones of the interface are skipped if `RKLIB_LIBRARY` is not set).
+
+The `rklib.reference` module is a reference integrator written in NumPy, which doesn't need the compiled library. It uses the same Butcher tableaus (which are written to `python/rklib/tableaus.py` by `generate_files.py`), and integrates a batch of states at once, with a vectorized derivative function. Each member of the batch has its own step size for the variable-step methods. It can be used for prototyping, and to cross-check the results of the library. The low-storage methods with hand-written step functions are not available.
+
+The `rklib.trajectory` module reads the trajectory files written by the library (with the `trajectory_file` option), as `numpy.memmap` arrays, so that they can be analyzed without reading or copying the whole file.
+
 ### 3rd Party Dependencies
 
   * The library requires [roots-fortran](https://github.com/jacobwilliams/roots-fortran).
@@ -209,9 +317,12 @@ The original version of this code was split off from the [Fortran Astrodynamics
 
 To add a new method to this library:
 
-  * Update the tables (either the fixed or variable one in `scripts/generate_files.py`)
-  * Run `python scripts/generate_files.py` to update all the include files. This script will generate all the boilerplate code for all the methods. It will also this `README` file.
-  * Add a step function (either in `rklib_fixed_steps.f90` or `rklib_variable_steps.f90`). Note that you can generate a template of an RK step function using the `scripts/generate_rk_code.py` script. The two command line arguments are the number of function evaluations required and the method name (e.g., `'rk4'`). Edit the template accordingly (note at the FSAL ones have a slightly different format).
+  * Update the tables (either the fixed or variable one in `scripts/generate_files.py`). For methods with a Butcher tableau, the number of registers is computed by the script (by reusing the storage of stages that are no longer needed), so use `None` in that column.
+  * Add the Butcher tableau of the method to `scripts/tableaus.py`. The coefficients are written as exact strings (integers, rationals, terminating decimals or quadratic surds), so they can be emitted at any precision.
+  * Run `python scripts/generate_files.py` to update all the include files. This script will generate all the boilerplate code for all the methods, as well as the submodules for each method (in `src/methods`) with its properties and step functions, and the kind-suffixed class names of `src/rklib_kind_classes.inc`. It will also update this `README` file and the list of method submodules in `src/methods/manifest.txt`.
+  * Run `python scripts/analyze_methods.py` to compute the principal error coefficient and the stability boundaries of the method (they are cached in `scripts/method_analysis.json`, keyed by a hash of the tableau), then `python scripts/generate_files.py` again to write them into the properties of the method and this `README`.
+  * Optionally, add a continuous extension (the `dense` entry) for the dense output. `scripts/dense_output.py` can be used to compute one from the tableau.
+  * The step functions of methods that are not written as a Butcher tableau (e.g., the low-storage ones) are added by hand to `scripts/low_storage_steps.f90`, and are copied to the submodules by the script.
   * Update the unit tests.
 
 ### License
@@ -252,56 +363,51 @@ The `rklib` source code and related files and documentation are distributed unde
 """
 
 ################################################################################################
-def header(fixed_or_variable : str):
-    return f"""
-!*****************************************************************************************
-!>
-!  Procedures specifying the properties of the various {fixed_or_variable}-step RK methods.
-
-    submodule(rklib_module) rklib_{fixed_or_variable}_properties
-
-    implicit none
-
-    contains
-!*****************************************************************************************
-"""
-
-################################################################################################
-def footer(fixed_or_variable : str):
-    return f"""!*****************************************************************************************
-    end submodule rklib_{fixed_or_variable}_properties
-!*****************************************************************************************"""
-
-################################################################################################
-def write_property_file(fixed_or_variable : str, methods : list):
-    """Creates the property methods in a submodule"""
-    with open(f'./src/rklib_{fixed_or_variable}_properties.f90', 'w') as f:
-        f.write(header(fixed_or_variable)+'\n')
-        for m in methods:
-            short_name, long_name, props, order, stages, registers, cfl, reference = m
-            f.write(f'    module procedure {short_name}_properties\n')
-            f.write(f'        !! Returns the properties of the [[{short_name}]] method\n')
-            f.write(f'        p%short_name = \'{short_name}\'\n')
-            f.write(f'        p%long_name = \'{long_name}\'\n')
-            f.write(f'        p%order = {order}\n')
-            f.write(f'        p%number_of_stages = {stages}\n')
-            if registers:
-                f.write(f'        p%number_of_registers = {registers}\n')
-            if 'FSAL' in props:
-                f.write(f'        p%fsal = .true.\n')
-            if 'LS' in props:
-                f.write(f'        p%low_storage = .true.\n')
-            if 'SSP' in props:
-                f.write(f'        p%strong_stability_preserving = .true.\n')
-            if cfl:
-                f.write(f'        p%cfl = {float(cfl)}_wp\n')
-            f.write(f'    end procedure {short_name}_properties\n\n')
-        f.write(footer(fixed_or_variable))
+def property_function(fixed_or_variable : str, method : tuple):
+    """Generate the properties function of a method"""
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    code = []
+    code.append(f'    module procedure {short_name}_properties')
+    code.append(f'        !! Returns the properties of the [[{short_name}]] method')
+    code.append(f'        p%short_name = \'{short_name}\'')
+    code.append(f'        p%long_name = \'{long_name}\'')
+    code.append(f'        p%order = {order}')
+    code.append(f'        p%number_of_stages = {stages}')
+    registers = number_of_registers(fixed_or_variable, method)
+    if registers:
+        code.append(f'        p%number_of_registers = {registers}')
+    if short_name in tableaus:
+        levels = stage_levels(method)
+        code.append(f'        p%number_of_levels = {max(levels)}')
+        values = [','.join(str(l) for l in levels[i:i+20]) for i in range(0, len(levels), 20)]
+        code.append(f'        allocate(p%stage_levels, source=[' + (', &\n' + ' '*41).join(values) + '])')
+        if has_concurrent_stages(method):
+            code.append(f'        p%concurrent_stages = .true.')
+    if short_name in tableaus and 'dense' in tableaus[short_name]:
+        code.append(f'        p%dense_output_order = {tableaus[short_name]["dense"]["order"]}')
+    if 'FSAL' in props:
+        code.append(f'        p%fsal = .true.')
+    if 'LS' in props:
+        code.append(f'        p%low_storage = .true.')
+    if 'SSP' in props:
+        code.append(f'        p%strong_stability_preserving = .true.')
+    if cfl:
+        code.append(f'        p%cfl = {float(cfl)}_wp')
+    if short_name in tableaus:
+        code.append(f'        p%real_stability_boundary = {real_stability_boundary(method)}_wp')
+        analysis = method_analysis().get(short_name)
+        if analysis:
+            code.append(f'        p%imaginary_stability_boundary = {analysis["imaginary_stability_boundary"]}_wp')
+            code.append(f'        p%principal_error_coefficient = {analysis["principal_error_coefficient"]:.6e}_wp')
+        if fixed_or_variable == 'variable' and stiffness_stage(method):
+            code.append(f'        p%stiffness_detection = .true.')
+    code.append(f'    end procedure {short_name}_properties')
+    return '\n'.join(code) + '\n'
 
 ################################################################################################
 def write_property_interface_file(fixed_or_variable : str, methods : list):
     """Interfaces for the property methods (creates an include file)"""
-    with open(f'./src/rklib_{fixed_or_variable}_property_interfaces.inc', 'w') as f:
+    with open(repo_path(f'src/rklib_{fixed_or_variable}_property_interfaces.inc'), 'w') as f:
         for m in methods:
             short_name, long_name, props, order, stages, registers, cfl, reference = m
             f.write(f'pure module function {short_name}_properties(me) result(p)\n')
@@ -313,7 +419,7 @@ def write_property_interface_file(fixed_or_variable : str, methods : list):
 ################################################################################################
 def write_class_file(fixed_or_variable : str, methods : list):
     """Defines the integrator classes (creates an include file)"""
-    with open(f'./src/rklib_{fixed_or_variable}_classes.inc', 'w') as f:
+    with open(repo_path(f'src/rklib_{fixed_or_variable}_classes.inc'), 'w') as f:
         f.write(f'    ! {fixed_or_variable.capitalize()} step methods:\n\n')
         for m in methods:
             short_name, long_name, props, order, stages, registers, cfl, reference = m
@@ -330,7 +436,7 @@ def write_class_file(fixed_or_variable : str, methods : list):
 
 def write_step_interface_file(fixed_or_variable : str, methods : list):
     """Interfaces for the step methods (creates an include file)"""
-    with open(f'./src/rklib_{fixed_or_variable}_step_interfaces.inc', 'w') as f:
+    with open(repo_path(f'src/rklib_{fixed_or_variable}_step_interfaces.inc'), 'w') as f:
         f.write(f'    ! {fixed_or_variable} step interfaces\n\n')
         for m in methods:
             short_name, long_name, props, order, stages, registers, cfl, reference = m
@@ -348,12 +454,670 @@ def write_step_interface_file(fixed_or_variable : str, methods : list):
                 f.write(f'        real(wp),dimension(me%n),intent(out) :: xerr !! truncation error estimate for `x`\n')
             f.write(f'    end subroutine {short_name}\n\n')
 
+def write_allocate_method_file(methods : list):
+    """Allocation of the integrator class of each method from its index (creates an include file)"""
+    with open(repo_path(f'src/rklib_allocate_method.inc'), 'w') as f:
+        f.write('    select case (i)\n')
+        for i, m in enumerate(methods, start=1):
+            f.write(f'    case({i}); allocate({m[0]}_class :: me)\n')
+        f.write('    end select\n')
+
 def write_allocate_and_test_file(methods : list):
     """Generate list of method allocations and test calls (creates an include file)"""
-    with open(f'./test/rklib_allocate_and_test.inc', 'w') as f:
+    with open(repo_path(f'test/rklib_allocate_and_test.inc'), 'w') as f:
         for m in methods:
             f.write(f"    allocate({m[0]}_class :: s); call run_test()\n")
 
+################################################################################################
+def parse_coefficient(s : str):
+    """Parse an exact coefficient string from the tableau registry.
+    Returns `(r, q, k)`, meaning `r + q*sqrt(k)`, with `r` and `q` rational."""
+    s = s.replace(' ', '')
+    m = re.fullmatch(r'(.*?)([+-]?[^+-]*)\*sqrt\((\d+)\)', s)
+    if m:
+        r = Fraction(m.group(1)) if m.group(1) else Fraction(0)
+        return r, Fraction(m.group(2)), int(m.group(3))
+    return Fraction(s), Fraction(0), 0
+
+def coefficient_difference(s1 : str, s2 : str):
+    """Exact `s1 - s2` for two coefficient strings (either may be `None` for zero)."""
+    r1, q1, k1 = parse_coefficient(s1) if s1 else (Fraction(0), Fraction(0), 0)
+    r2, q2, k2 = parse_coefficient(s2) if s2 else (Fraction(0), Fraction(0), 0)
+    if q1 and q2 and k1 != k2:
+        raise ValueError(f'incompatible surds: {s1}, {s2}')
+    return r1 - r2, q1 - q2, max(k1, k2)
+
+def fortran_rational(r : Fraction):
+    """Fortran real expression for an exact rational."""
+    if r.denominator == 1:
+        return f'{r.numerator}.0_wp'
+    q, n2, n5 = r.denominator, 0, 0
+    while q % 2 == 0: q //= 2; n2 += 1
+    while q % 5 == 0: q //= 5; n5 += 1
+    if q == 1 and r.denominator > 10**6:
+        # a long terminating decimal: write all the digits
+        k = max(n2, n5)
+        digits = str(abs(r.numerator) * 10**k // r.denominator).rjust(k + 1, '0')
+        mantissa = f'{digits[:-k]}.{digits[-k:]}'.rstrip('0')
+        return f'{"-" if r < 0 else ""}{mantissa}0_wp' if mantissa.endswith('.') else \
+               f'{"-" if r < 0 else ""}{mantissa}_wp'
+    return f'{r.numerator}.0_wp / {r.denominator}.0_wp'
+
+def fortran_coefficient(c):
+    """Fortran real expression for a parsed coefficient `(r, q, k)`."""
+    r, q, k = c
+    if not q:
+        return fortran_rational(r)
+    if not r:
+        return f'{fortran_rational(q)} * sqrt({k}.0_wp)'
+    sign = '-' if q < 0 else '+'
+    return f'{fortran_rational(r)} {sign} {fortran_rational(abs(q))} * sqrt({k}.0_wp)'
+
+def is_one(s : str):
+    return parse_coefficient(s) == (Fraction(1), Fraction(0), 0)
+
+def linear_combination(terms : list, indent : int):
+    """Fortran sum `coef*f(i) + ...` of a list of `(coef, f)` tuples,
+    continued onto new lines so they stay short."""
+    s = ''
+    for k, (coef, f) in enumerate(terms):
+        if not f.endswith(')'): f = f'{f}(i)'
+        term = f if coef is None else f'{coef}*{f}'
+        if k > 0:
+            s += ' + &\n' + ' '*indent if k % 4 == 0 else ' + '
+        s += term
+    return s
+
+def stage_levels(method : tuple):
+    """The levels of the stage dependency graph of a tableau.
+
+    Stage `i` depends on stage `j` if `b_ij` is nonzero. Stages with no dependencies
+    are on level 1, and the others are on the level after the last one they depend on,
+    so all the stages on a level can be evaluated concurrently. For FSAL methods,
+    the last stage is always on its own final level, since it is `f(t+h,xf)`.
+
+    Returns the level of each stage."""
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    b = tableaus[short_name]['b']
+    levels = []
+    for i, row in enumerate(b, start=1):
+        deps = [j for j, v in row.items() if parse_coefficient(v)[:2] != (0, 0)]
+        levels.append(1 + max((levels[j-1] for j in deps), default=0))
+    if 'FSAL' in props:
+        levels[-1] = max(levels[:-1]) + 1
+    return levels
+
+min_concurrency_saving = 0.1  # the fraction of the sequential stage evaluations of a step that
+                              # the levels must save, for the stages to be evaluated concurrently
+
+def has_concurrent_stages(method : tuple):
+    """If the step function of a method can evaluate the stages of a level concurrently
+    (with the `parallel_stages` option). The levels of the stage dependency graph must
+    save at least `min_concurrency_saving` of the sequential evaluations of a step,
+    otherwise the OpenMP tasks are not worth their overhead."""
+    if method[0] not in tableaus:
+        return False
+    levels = stage_levels(method)
+    return len(levels) - max(levels) >= min_concurrency_saving * len(levels)
+
+def stage_groups(method : tuple, concurrent : bool = False):
+    """The groups of stages that are evaluated together by the step function, in order.
+
+    This is each stage in turn, or if `concurrent` is true, the stages are evaluated
+    level by level (see [[stage_levels]])."""
+    levels = stage_levels(method)
+    if not concurrent:
+        return [[i] for i in range(1, len(levels)+1)]
+    return [[i for i, l in enumerate(levels, start=1) if l == level]
+            for level in range(1, max(levels)+1)]
+
+def stage_schedule(fixed_or_variable : str, method : tuple, concurrent : bool = False):
+    """Liveness analysis and register allocation for the stages of a tableau.
+
+    The stages are evaluated in the groups given by [[stage_groups]]: for each group,
+    a single loop computes the states of all its stages, then they are evaluated.
+    The `xf` and `xerr` sums (and the dense output vectors) are accumulated as the
+    step proceeds: the `c`, `e` (and dense) weights of stage `j` are added in the last loop that reads `f{j}` (or the
+    first loop after it is computed, if no later stage uses it). After that,
+    `f{j}` is dead and its register can be reused by a later stage.
+
+    Returns `(fold, register, number_of_registers)`, where `fold[k]` is the list of
+    stages whose weights are added in the loop before group `k` is evaluated
+    (`k = number of groups + 1` is the final loop), and `register[j]` is the register
+    (the column of `me%funcs`) that holds `f{j}`. When each group is a single stage,
+    `k` is the stage number."""
+
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    tab = tableaus[short_name]
+    fsal = 'FSAL' in props
+    variable = fixed_or_variable == 'variable'
+    b, c = tab['b'], tab['c']
+    s = len(b)
+    groups = stage_groups(method, concurrent)
+    g = len(groups)
+    group = {i: k for k, stages_k in enumerate(groups, start=1) for i in stages_k}
+
+    # the loops that are generated (the one before each group with a nonzero `b`
+    # row, and the final one). For FSAL methods, the loop before the last stage
+    # computes `xf`, and the final one is only needed for `xerr`.
+    loops = [k for k in range(2, g+1) if any(b[i-1] for i in groups[k-1]) or (fsal and k == g)]
+    if not fsal or variable:
+        loops.append(g+1)
+
+    weighted = set(c)
+    if variable:
+        d = tab['d']
+        weighted |= {j for j in range(1, s+1) if coefficient_difference(c.get(j), d.get(j))[:2] != (0, 0)}
+        if 'dense' in tab:
+            weighted |= {j for j in tab['dense']['b'] if j <= s}
+
+    fold = {k: [] for k in loops}
+    last_use = {}
+    for j in range(1, s+1):
+        uses = [k for k in loops if k <= g and any(j in b[i-1] for i in groups[k-1])
+                and not (fsal and k == g)]
+        if j in weighted:
+            k = max(uses) if uses else min(k for k in loops if k > group[j])
+            fold[k].append(j)
+            uses.append(k)
+        last_use[j] = max(uses) if uses else group[j]
+
+    register = {}
+    live, free, n = [], [], 0
+    for k in range(1, g+1):
+        # the registers of the stages that were last read in the loop before this group are free:
+        for j in [j for j in live if last_use[j] <= k]:
+            live.remove(j)
+            free.append(register[j])
+        free.sort()
+        for i in groups[k-1]:
+            if free:
+                register[i] = free.pop(0)
+            else:
+                n += 1
+                register[i] = n
+            live.append(i)
+
+    return fold, register, n
+
+def number_of_registers(fixed_or_variable : str, method : tuple):
+    """Number of `f` vectors needed by a method. For the methods generated from a
+    tableau, this is computed by [[stage_schedule]] (for both versions of the step
+    if the stages can be evaluated concurrently), otherwise it's given in the table."""
+    if method[0] in tableaus:
+        n = stage_schedule(fixed_or_variable, method)[2]
+        if has_concurrent_stages(method):
+            n = max(n, stage_schedule(fixed_or_variable, method, True)[2])
+        return n
+    return method[5]
+
+def stability_polynomial(method : tuple):
+    """The coefficients of the stability polynomial `R(z) = 1 + z b^T (I - zA)^-1 1` of a
+    tableau (in floating point), from the constant term (`b^T A^(k-1) 1` for `z^k`)."""
+    tab = tableaus[method[0]]
+    s = len(tab['b'])
+    A = [{j: float_coefficient(v) for j, v in row.items()} for row in tab['b']]
+    weights = {j: float_coefficient(v) for j, v in tab['c'].items()}
+    coefficients = [1.0]
+    v = [1.0] * s  # A^(k-1) 1
+    for _ in range(s):
+        coefficients.append(sum(w * v[j-1] for j, w in weights.items()))
+        v = [sum(aij * v[j-1] for j, aij in row.items()) for row in A]
+    return coefficients
+
+def real_stability_boundary(method : tuple):
+    """The stability boundary of a tableau on the negative real axis: the largest `r`
+    such that `|R(-x)| <= 1` for `0 <= x <= r` (rounded down to 3 decimals)."""
+    coefficients = stability_polynomial(method)
+    def stable(x):
+        return abs(sum(c * (-x)**k for k, c in enumerate(coefficients))) <= 1.0 + 1.0e-12
+    k = 0
+    while stable((k+1) / 1000) and k < 100000:
+        k += 1
+    return k / 1000
+
+def stiffness_stage(method : tuple):
+    """The stage that is used for the stiffness detection of a variable-step method
+    generated from a tableau: the last one with a node of 1 (`f(t+h,xs)`), other than
+    the last stage of a FSAL method (which is `f(t+h,xf)`). Returns `None` if there is none."""
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    a = tableaus[short_name]['a']
+    s = len(a)
+    if 'FSAL' in props:
+        s -= 1
+    return max((i for i in range(2, s+1) if parse_coefficient(a[i-1]) == (1, 0, 0)), default=None)
+
+analysis_file = repo_path('scripts/method_analysis.json')
+
+def tableau_hash(method : tuple):
+    """The hash of the tableau of a method (and of its entries in the tables), which
+    is the key of its analysis in the cache of `analyze_methods.py`."""
+    t = tableaus[method[0]]
+    data = json.dumps([t['a'], [sorted(row.items()) for row in t['b']], sorted(t['c'].items()),
+                       method[2].strip(), method[3], method[4]])
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+@lru_cache(None)
+def method_analysis():
+    """The analysis of the methods (see `analyze_methods.py`). The entries of the
+    methods whose tableau has changed since they were analyzed are removed."""
+    try:
+        with open(analysis_file, 'r') as f:
+            analysis = json.load(f)
+    except FileNotFoundError:
+        analysis = {}
+    for m in fixed_methods + variable_methods:
+        if m[0] in analysis and analysis[m[0]]['hash'] != tableau_hash(m):
+            print(f'warning: the analysis of {m[0]} is out of date (run scripts/analyze_methods.py)')
+            del analysis[m[0]]
+    return analysis
+
+def evaluations_per_step(method : tuple):
+    """The number of function evaluations per step (the last stage of a FSAL method is
+    the first one of the next step)."""
+    return method[4] - 1 if 'FSAL' in method[2] else method[4]
+
+readme_tolerances = [1.0e-3, 1.0e-6, 1.0e-9, 1.0e-12, 1.0e-15]  # for the predicted costs in the README
+
+def predicted_cost(method : tuple, analysis : dict, tol : float):
+    """The predicted number of function evaluations per unit of time to meet a tolerance,
+    for a problem with derivatives of order one (see `analyze_methods.py`).
+    This is the same model as `rklib_recommended_method`."""
+    order = analysis['order']
+    return evaluations_per_step(method) * (analysis['principal_error_coefficient'] / tol)**(1.0/(order+1))
+
+def step_function(fixed_or_variable : str, method : tuple):
+    """Generate the step function for a method from its tableau.
+
+    Each stage combination is evaluated in a single fused pass into the
+    preallocated `me%xs` work vector (so no array temporaries are created
+    for the `f` arguments) and zero coefficients are dropped. The `xf` and
+    `xerr` sums are accumulated in the same passes, so that the `f` vectors
+    can share registers (see [[stage_schedule]]). For methods with a `dense`
+    entry, the interpolant vectors are accumulated in separate loops that
+    are only done when `me%dense_output` is true. If the levels of the stage
+    dependency graph save enough evaluations (see [[has_concurrent_stages]]),
+    there is also an internal `concurrent_step` that is called instead when
+    `me%parallel_stages` is true: the states of the stages of a level are
+    computed in the same pass (into `me%xs_stages`), and the stages are
+    evaluated as OpenMP tasks. For the stiffness
+    detection, the state and derivative of the stage given by [[stiffness_stage]]
+    are saved when `me%stiffness_test` is true."""
+
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    tab = tableaus[short_name]
+    fsal = 'FSAL' in props
+    variable = fixed_or_variable == 'variable'
+    a, b, c = tab['a'], tab['b'], tab['c']
+    s = len(a)
+    if s != stages or len(b) != s:
+        raise ValueError(f'{short_name}: tableau size does not match the number of stages')
+    if fsal and b[-1] != c:
+        raise ValueError(f'{short_name}: the last row of an FSAL tableau must be `c`')
+    concurrent = has_concurrent_stages(method)
+    stiff_stage = stiffness_stage(method) if variable else None
+
+    params = []  # (name, value) for the parameter declarations
+    def coef(name, value):
+        if is_one(value):
+            return None
+        params.append((name, fortran_coefficient(parse_coefficient(value))))
+        return name
+
+    # nodes:
+    tstage = []
+    for i in range(1, s+1):
+        ai = parse_coefficient(a[i-1])
+        if ai == (0, 0, 0):
+            tstage.append('t')
+        elif ai == (1, 0, 0):
+            tstage.append('t+h')
+        else:
+            params.append((f'a{i}', fortran_coefficient(ai)))
+            tstage.append(f't+a{i}*h')
+
+    # stage matrix (the last row of FSAL methods is `c`):
+    rows = []
+    for i in range(1, s+1):
+        if fsal and i == s:
+            rows.append(None)
+        else:
+            rows.append([(coef(f'b{i}{j}', v), f'f{j}') for j, v in sorted(b[i-1].items())])
+
+    # weights:
+    cterm = {j: (coef(f'c{j}', v), f'f{j}') for j, v in sorted(c.items())}
+    eterm = {}
+    if variable:
+        d = tab['d']
+        for j in range(1, s+1):
+            e = coefficient_difference(c.get(j), d.get(j))
+            if e[:2] != (0, 0):
+                params.append((f'e{j}', fortran_coefficient(e)))
+                eterm[j] = (f'e{j}', f'f{j}')
+
+    # dense output (the weights of stage `s+1` are for `f(t+h,xf)`):
+    dterm = {}  # {j: [(k, term)]}
+    if 'dense' in tab:
+        for j, bj in sorted(tab['dense']['b'].items()):
+            for k, v in enumerate(bj, start=1):
+                if parse_coefficient(v)[:2] != (0, 0):
+                    dterm.setdefault(j, []).append((k, (coef(f'd{k}{j}', v), f'f{j}')))
+
+    def kernel(concurrent=False):
+        """the statements of the step (its `associate` block), with the stages
+        evaluated one at a time, or level by level if `concurrent` is true"""
+        fold, register, _ = stage_schedule(fixed_or_variable, method, concurrent)
+        level_groups = stage_groups(method, concurrent)
+        num_groups = len(level_groups)
+        code = []
+        uses_xs = any(r for r in rows)
+
+        assoc = [f'f{i} => me%funcs(:,{register[i]})' for i in range(1, s+1)]
+        if s+1 in dterm:
+            # all the registers are free at the end of the step
+            assoc.append(f'f{s+1} => me%funcs(:,1)')
+        if uses_xs:
+            assoc.append('xs => me%xs')
+            # the state vectors of the other stages of a level:
+            for m in range(2, max(len(group) for group in level_groups)+1):
+                assoc.append(f'xs{m} => me%xs_stages(:,{m-1})')
+        code.append('    associate (' + ', &\n               '.join(assoc) + ')')
+        code.append('')
+
+        started = {'xf': False, 'xerr': False}  # if the partial sums have been initialized
+        def accumulate(acc, terms, final):
+            """statement adding `terms` to the `acc` partial sum"""
+            if started[acc]:
+                terms = [(None, acc)] + terms
+            started[acc] = True
+            if final and acc == 'xf':
+                return ['            xf(i) = x(i) + h*(' + linear_combination(terms, 30) + ')']
+            elif final:
+                return ['            xerr(i) = h*(' + linear_combination(terms, 25) + ')']
+            lhs = f'            {acc}(i) = '
+            return [lhs + linear_combination(terms, len(lhs))]
+
+        def sums(k, final_xf=False, final_xerr=False):
+            """the partial sum statements in the loop before stage `k`"""
+            lines = []
+            cterms = [cterm[j] for j in fold[k] if j in cterm]
+            eterms = [eterm[j] for j in fold[k] if j in eterm]
+            if cterms or final_xf:
+                lines.extend(accumulate('xf', cterms, final_xf))
+            if eterms or final_xerr:
+                lines.extend(accumulate('xerr', eterms, final_xerr))
+            return lines
+
+        loop = '        do i = 1, me%n'
+        endloop = '        end do'
+
+        dense_started = set()  # the dense vectors that have been initialized
+        def dense(stages):
+            """the loop adding the dense output weights of `stages` (only done when requested)"""
+            terms = {}
+            for j in stages:
+                for k, term in dterm.get(j, []):
+                    terms.setdefault(k, []).append(term)
+            if not terms:
+                return []
+            lines = ['        if (me%dense_output) then', '    ' + loop]
+            for k, t in sorted(terms.items()):
+                acc = f'me%dense(i,{k})'
+                if k in dense_started:
+                    t = [(None, acc)] + t
+                dense_started.add(k)
+                lhs = f'                {acc} = '
+                lines.append(lhs + linear_combination(t, len(lhs)))
+            lines.extend(['    ' + endloop, '        end if'])
+            return lines
+        for k, group in enumerate(level_groups, start=1):
+            if fsal and k == num_groups:
+                # FSAL: the last stage is evaluated at the solution
+                i = group[0]
+                code.append('')
+                code.append(loop)
+                code.extend(sums(k, final_xf=True))
+                code.append(endloop)
+                code.extend(dense(fold[k]))
+                code.append('        ! last point is cached for the next step:')
+                code.append(f'        call me%set_fsal_cache({tstage[i-1]},xf,f{i})')
+                continue
+            states = {}  # the state vector of each stage of the group
+            for i in group:
+                if rows[i-1]:
+                    states[i] = 'xs' if not states else f'xs{len(states)+1}'
+            if k in fold:
+                code.append(loop)
+                for i, xs in states.items():
+                    lhs = f'            {xs}(i) = x(i) + h*('
+                    code.append(lhs + linear_combination(rows[i-1], len(lhs)) + ')')
+                code.extend(sums(k))
+                code.append(endloop)
+                code.extend(dense(fold[k]))
+            calls = []
+            for i in group:
+                if i == 1 and fsal:
+                    calls.append(['        ! check the cached function eval of the last step:',
+                                  '        call me%check_fsal_cache(t,x,f1)'])
+                else:
+                    calls.append([f'        call me%f({tstage[i-1]},{states.get(i, "x")},f{i})'])
+            if len(group) == 1:
+                code.extend(calls[0])
+            else:
+                # the stages of a level can be evaluated concurrently
+                # (they are counted after, so that the counter is not shared):
+                code.append(f'        !$omp parallel num_threads({len(group)})')
+                code.append('        !$omp single')
+                for lines in calls:
+                    code.append('        !$omp task')
+                    code.extend(l.replace('call me%f(', 'call me%f_concurrent(') for l in lines)
+                    code.append('        !$omp end task')
+                code.append('        !$omp end single')
+                code.append('        !$omp end parallel')
+                code.append(f'        me%num_f_evals = me%num_f_evals + {len(group)}')
+            if stiff_stage in group:
+                code.append('        if (me%stiffness_test) then')
+                code.append(f'            me%x_stiff = {states[stiff_stage]}')
+                code.append(f'            me%f_stiff = f{stiff_stage}')
+                code.append('        end if')
+            if k == 1:
+                # the derivative at the start, for the interpolant of the step:
+                if group != [1]:
+                    raise ValueError(f'{short_name}: the first stage must be evaluated alone')
+                code.append('        if (me%interpolate_events) call me%save_first_stage(t,x,f1)')
+                code.append('')
+
+        if num_groups+1 in fold:
+            code.append('')
+            code.append(loop)
+            code.extend(sums(num_groups+1, final_xf=not fsal, final_xerr=variable))
+            code.append(endloop)
+            code.extend(dense(fold[num_groups+1]))
+        if s+1 in dterm:
+            # the interpolant also uses the derivative at the end of the step:
+            dlines = dense([s+1])
+            code.append('')
+            code.extend(dlines[:1] + [f'            call me%f(t+h,xf,f{s+1})'] + dlines[1:])
+        code.append('')
+        code.append('    end associate')
+        return code
+
+    code = []
+    code.append('!*****************************************************************************************')
+    code.append('!>')
+    code.extend([f'!{l}' for l in tab['doc'].split('\n')])
+    code.append('')
+    code.append(f'    module procedure {short_name}')
+    code.append('')
+    groups = ['a', 'b', 'c', 'e', 'd']
+    for g in groups:
+        p = [x for x in params if x[0][0] == g]
+        if p:
+            width = max(len(x[0]) for x in p)
+            for name, value in p:
+                code.append(f'    real(wp),parameter :: {name:<{width}} = {value}')
+            code.append('')
+    code.append('    integer :: i !! counter')
+    code.append('')
+    if concurrent:
+        code.append('    if (me%parallel_stages) then')
+        code.append('        call concurrent_step()')
+        code.append('        return')
+        code.append('    end if')
+        code.append('')
+    code.extend(kernel())
+    if concurrent:
+        code.append('')
+        code.append('    contains')
+        code.append('')
+        code.append('        subroutine concurrent_step()')
+        code.append('')
+        code.append('        !! the step, with the stages of each level evaluated concurrently.')
+        code.append('')
+        code.append('        integer :: i !! counter')
+        code.append('')
+        code.extend(['\n'.join('    ' + l if l else l for l in c.split('\n')) for c in kernel(True)])
+        code.append('')
+        code.append('        end subroutine concurrent_step')
+    code.append('')
+    code.append(f'    end procedure {short_name}')
+    code.append('!*****************************************************************************************')
+    return '\n'.join(code) + '\n'
+
+
+def read_hand_written_steps():
+    """Read the hand-written step functions (for the methods that are not
+    generated from a tableau), indexed by the method name"""
+    with open(repo_path('scripts/low_storage_steps.f90'), 'r') as f:
+        text = f.read()
+    blocks = re.findall(r'^!\*+\n!>\n.*?^    end procedure \w+\n!\*+\n', text, re.M | re.S)
+    return {re.search(r'^    end procedure (\w+)$', b, re.M).group(1): b for b in blocks}
+
+def method_file(short_name : str):
+    """The submodule file of a method"""
+    return repo_path(f'src/methods/rklib_{short_name}.F90')
+
+def method_include_file(short_name : str):
+    """The include file with the procedures of a method (for all the real kinds)"""
+    return repo_path(f'src/methods/rklib_{short_name}.inc')
+
+def write_method_file(fixed_or_variable : str, method : tuple, hand_written : dict):
+    """Generates the submodules of a method, with its properties and step functions.
+    The step function is generated from the tableau, or copied from the hand-written ones.
+    The procedures are in an include file, and there is one submodule for each real kind."""
+    short_name, long_name, props, order, stages, registers, cfl, reference = method
+    if short_name in tableaus:
+        step = step_function(fixed_or_variable, method)
+    elif short_name in hand_written:
+        step = hand_written[short_name]
+    else:
+        raise ValueError(f'{short_name}: there is no tableau or hand-written step function')
+    with open(method_include_file(short_name), 'w') as f:
+        f.write('!*****************************************************************************************\n')
+        f.write('\n')
+        f.write(property_function(fixed_or_variable, method))
+        f.write('\n' + step)
+    with open(method_file(short_name), 'w') as f:
+        f.write('!*****************************************************************************************\n')
+        f.write('!>\n')
+        f.write(f'!  {long_name} ({fixed_or_variable}-step): the properties and step\n')
+        f.write(f'!  functions of [[{short_name}_class]], for each real kind (the procedures are in\n')
+        f.write(f'!  `{os.path.basename(method_include_file(short_name))}`).\n')
+        f.write('!\n')
+        f.write('!@note This file is generated by `scripts/generate_files.py`. Do not edit it by hand.\n')
+        for kind in real_kinds:
+            f.write('\n')
+            if kind != 'r64': f.write(f'#ifndef RKLIB_NO_REAL{kind[1:]}\n')
+            f.write(f'    submodule(rklib_module_{kind}) rklib_{short_name}\n')
+            f.write('    implicit none\n')
+            f.write('    contains\n')
+            f.write(f'#include "{os.path.basename(method_include_file(short_name))}"\n')
+            f.write(f'    end submodule rklib_{short_name}\n')
+            if kind != 'r64': f.write('#endif\n')
+        f.write('!*****************************************************************************************\n')
+
+def write_kind_classes_file(methods : list):
+    """Use statements for the integrator classes of each real kind, with the kind
+    as a suffix, for `rklib_kinds_module` (creates an include file)"""
+    with open(repo_path('src/rklib_kind_classes.inc'), 'w') as f:
+        for kind in real_kinds:
+            if kind != 'r64': f.write(f'#ifndef RKLIB_NO_REAL{kind[1:]}\n')
+            use = f'    use rklib_module_{kind}, only: '
+            renames = [f'{m[0]}_class_{kind} => {m[0]}_class' for m in methods]
+            f.write(use + (', &\n' + ' '*len(use)).join(renames) + '\n')
+            if kind != 'r64': f.write('#endif\n')
+
+def write_manifest(fixed : list, variable : list):
+    """Writes the list of the method submodules that are in the library, for
+    build systems that need the source files (creates `src/methods/manifest.txt`).
+    The submodule files of the other methods are deleted."""
+    methods = [('fixed', m) for m in fixed] + [('variable', m) for m in variable]
+    with open(repo_path('src/methods/manifest.txt'), 'w') as f:
+        f.write('# Method submodules of the library (generated by `scripts/generate_files.py`).\n')
+        f.write('# All the files are independent, and only depend on the kind modules (`src/rklib_module_r*.F90`).\n')
+        f.write('# Each one includes the `.inc` file with the same name.\n')
+        f.write('#\n')
+        f.write('# name      type      file\n')
+        for fixed_or_variable, m in methods:
+            f.write(f'{m[0]:10} {fixed_or_variable:9} {os.path.relpath(method_file(m[0]), root_dir)}\n')
+    files = {os.path.basename(f(m[0])) for _, m in methods for f in [method_file, method_include_file]}
+    for filename in glob.glob(repo_path('src/methods/rklib_*.*')):
+        if os.path.basename(filename) not in files:
+            os.remove(filename)
+
+################################################################################################
+def float_coefficient(s : str):
+    """The nearest double precision value of a coefficient string."""
+    r, q, k = parse_coefficient(s)
+    with localcontext() as ctx:
+        ctx.prec = 50
+        value = Decimal(r.numerator) / Decimal(r.denominator)
+        if q:
+            value += Decimal(q.numerator) / Decimal(q.denominator) * Decimal(k).sqrt()
+    return float(value)
+
+def write_python_tableaus(fixed : list, variable : list):
+    """Writes the tableaus of the methods for the NumPy reference integrator
+    (creates `python/rklib/tableaus.py`). The low-storage methods that are not
+    in the tableau registry are not included."""
+    def sparse(row : dict):
+        return '{' + ', '.join(f'{j-1}: {float_coefficient(v)!r}' for j, v in sorted(row.items())) + '}'
+    with open(repo_path('python/rklib/tableaus.py'), 'w') as f:
+        f.write('#\n')
+        f.write('# Butcher tableaus of the methods, for the NumPy reference integrator (`reference.py`).\n')
+        f.write('#\n')
+        f.write('# This file is generated by `scripts/generate_files.py` from `scripts/tableaus.py`.\n')
+        f.write('# Do not edit it by hand. The coefficients are rounded to double precision, and the\n')
+        f.write('# stage numbers are 0-based. For each method:\n')
+        f.write('#\n')
+        f.write('#   * `type` : `fixed` or `variable`.\n')
+        f.write('#   * `order` : the order of the method.\n')
+        f.write('#   * `fsal` : if the last stage is the first stage of the next step.\n')
+        f.write('#   * `nodes` : the nodes (one per stage).\n')
+        f.write('#   * `matrix` : the rows of the stage matrix, as `{j: a_ij}` dicts of the nonzero entries.\n')
+        f.write('#   * `weights` : the weights of the solution, as a `{j: b_j}` dict.\n')
+        f.write('#   * `embedded_weights` : the weights of the embedded solution (variable-step methods only).\n')
+        f.write('#\n')
+        f.write('\n')
+        f.write('methods = {}\n')
+        for fixed_or_variable, methods in [('fixed', fixed), ('variable', variable)]:
+            for m in methods:
+                short_name, props, order = m[0], m[2], m[3]
+                if short_name not in tableaus:
+                    continue
+                t = tableaus[short_name]
+                f.write('\n')
+                f.write(f"methods['{short_name}'] = {{\n")
+                f.write(f"    'type': '{fixed_or_variable}',\n")
+                f.write(f"    'order': {order},\n")
+                f.write(f"    'fsal': {'FSAL' in props},\n")
+                f.write(f"    'nodes': [{', '.join(repr(float_coefficient(a)) for a in t['a'])}],\n")
+                f.write("    'matrix': [" + ',\n               '.join(sparse(row) for row in t['b']) + '],\n')
+                f.write(f"    'weights': {sparse(t['c'])},\n")
+                if 'd' in t:
+                    f.write(f"    'embedded_weights': {sparse(t['d'])},\n")
+                f.write('    }\n')
+
 ################################################################################################
 def write_readme_tables(fixed_or_variable : str, methods : list):
     """generate the tables in the readme"""
@@ -364,46 +1128,119 @@ def write_readme_tables(fixed_or_variable : str, methods : list):
     s = s + f'---        | ---        | ---        | ---   | ---      | ---       | ---  | ---\n'
     for m in methods:
         short_name, long_name, props, order, stages, registers, cfl, reference = m
+        registers = number_of_registers(fixed_or_variable, m)
         s = s + f'`{short_name}` | {long_name} | {props.strip()} | {order} | {stages} | {registers} | {cfl} | {reference}\n'.replace('None','')
     s = s + '\n'
     return s
 
+def write_readme_efficiency_table(fixed_or_variable : str, methods : list):
+    """generate the tables of the predicted efficiency in the readme
+    (the cheapest variable-step method for each tolerance is in bold)"""
+
+    analysis = method_analysis()
+    methods = [m for m in methods if m[0] in analysis]
+    variable = fixed_or_variable == 'variable'
+    header = 'Name       | Order | Evaluations per step | Error coefficient | Real stability | Imaginary stability'
+    if variable:
+        header += ''.join(f' | Cost {tol:.0e}' for tol in readme_tolerances)
+        costs = [[predicted_cost(m, analysis[m[0]], tol) for tol in readme_tolerances] for m in methods]
+        cheapest = [min(c[k] for c in costs) for k in range(len(readme_tolerances))]
+    s = f'#### {fixed_or_variable.capitalize()}-step methods:\n\n'
+    s = s + header + '\n'
+    s = s + '---        ' + ' | ---' * (header.count('|')) + '\n'
+    for i, m in enumerate(methods):
+        a = analysis[m[0]]
+        order = str(a['order']) if a['order'] == m[3] else f'{a["order"]} (not {m[3]})'
+        s = s + (f'`{m[0]}` | {order} | {evaluations_per_step(m)} | {a["principal_error_coefficient"]:.3e} | '
+                 f'{a["real_stability_boundary"]} | {a["imaginary_stability_boundary"]}')
+        if variable:
+            s = s + ''.join(f' | **{c:.1f}**' if c == cheapest[k] else f' | {c:.1f}'
+                            for k, c in enumerate(costs[i]))
+        s = s + '\n'
+    s = s + '\n'
+    return s
+
 ################################################################################################
 def run_all(fixed_or_variable : str, methods : list):
     """Generate all the files"""
-    write_property_file(fixed_or_variable, methods)
+    hand_written = read_hand_written_steps()
     write_property_interface_file(fixed_or_variable, methods)
     write_class_file(fixed_or_variable, methods)
     write_step_interface_file(fixed_or_variable, methods)
+    for m in methods:
+        write_method_file(fixed_or_variable, m, hand_written)
 
 def generate_readme():
 
     FIXED_STEP_TABLE    = write_readme_tables('fixed',    fixed_methods)
     VARIABLE_STEP_TABLE = write_readme_tables('variable', variable_methods)
+    FIXED_STEP_EFFICIENCY_TABLE    = write_readme_efficiency_table('fixed',    fixed_methods)
+    VARIABLE_STEP_EFFICIENCY_TABLE = write_readme_efficiency_table('variable', variable_methods)
     FIXED_STEP_COUNT = str(len(fixed_methods))
     VARIABLE_STEP_COUNT = str(len(variable_methods))
     TOTAL_COUNT = str(len(fixed_methods) + len(variable_methods))
+    DENSE_METHODS = ', '.join(f'`{m[0]}` (order {tableaus[m[0]]["dense"]["order"]})'
+                              for m in variable_methods if 'dense' in tableaus.get(m[0], {}))
+
+    PARALLEL_METHODS = ', '.join(f'`{m[0]}` ({m[4]} stages on {max(stage_levels(m))} levels)'
+                                 for m in fixed_methods + variable_methods
+                                 if has_concurrent_stages(m))
 
-    with open('./example/rklib_example.f90', 'r') as f:
+    with open(repo_path('example/rklib_example.f90'), 'r') as f:
         EXAMPLE = f.read()
 
     readme_file = readme_template()
     readme_file = readme_file.replace('$FIXED_STEP_COUNT', FIXED_STEP_COUNT)
     readme_file = readme_file.replace('$VARIABLE_STEP_COUNT', VARIABLE_STEP_COUNT)
     readme_file = readme_file.replace('$TOTAL_COUNT', TOTAL_COUNT)
+    readme_file = readme_file.replace('$DENSE_METHODS', DENSE_METHODS)
+    readme_file = readme_file.replace('$PARALLEL_METHODS', PARALLEL_METHODS)
     readme_file = readme_file.replace('$FIXED_STEP_TABLE', FIXED_STEP_TABLE)
     readme_file = readme_file.replace('$VARIABLE_STEP_TABLE', VARIABLE_STEP_TABLE)
+    readme_file = readme_file.replace('$FIXED_STEP_EFFICIENCY_TABLE', FIXED_STEP_EFFICIENCY_TABLE)
+    readme_file = readme_file.replace('$VARIABLE_STEP_EFFICIENCY_TABLE', VARIABLE_STEP_EFFICIENCY_TABLE)
     readme_file = readme_file.replace('$EXAMPLE', EXAMPLE)
 
-    with open('./README.md', 'w') as f:
+    with open(repo_path('README.md'), 'w') as f:
         f.write(readme_file)
 
 ################################################################################################
 
-if __name__ == '__main__':
-    run_all('fixed',    fixed_methods)
-    run_all('variable', variable_methods)
+def select_methods(names : list):
+    """The fixed and variable-step methods to include in the library (all of them
+    if `names` is empty). Names can be separated by spaces or commas."""
+    if not names:
+        return fixed_methods, variable_methods
+    names = [n for name in names for n in name.split(',') if n]
+    unknown = set(names) - {m[0] for m in fixed_methods + variable_methods}
+    if unknown:
+        raise ValueError(f'unknown methods: {", ".join(sorted(unknown))}')
+    return ([m for m in fixed_methods if m[0] in names],
+            [m for m in variable_methods if m[0] in names])
+
+################################################################################################
 
-    generate_readme()
-    write_allocate_and_test_file(fixed_methods + variable_methods)
+if __name__ == '__main__':
 
+    parser = argparse.ArgumentParser(description='Generate the method files of rklib.')
+    parser.add_argument('--methods', nargs='+', metavar='NAME',
+                        help='only include these methods in the library (the include files, the manifest '
+                             'and the tests are trimmed to match, and the README is not updated). '
+                             'Run the script again without this option to restore all the methods.')
+    args = parser.parse_args()
+
+    try:
+        fixed, variable = select_methods(args.methods)
+    except ValueError as e:
+        parser.error(str(e))
+    os.makedirs(repo_path('src/methods'), exist_ok=True)
+    run_all('fixed',    fixed)
+    run_all('variable', variable)
+    write_manifest(fixed, variable)
+    write_allocate_method_file(fixed + variable)
+    write_kind_classes_file(fixed + variable)
+    write_python_tableaus(fixed_methods, variable_methods)
+
+    if not args.methods:
+        generate_readme()
+    write_allocate_and_test_file(fixed + variable)
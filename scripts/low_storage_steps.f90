@@ -0,0 +1,314 @@
+!*****************************************************************************************
+!
+!  Low-storage and SSP RK formulas.
+!
+!  These methods are written in their Shu-Osher or 2N low-storage form
+!  rather than as a Butcher tableau. This file is not compiled: each
+!  procedure is copied by `scripts/generate_files.py` into the submodule
+!  of its method (`src/methods/rklib_<name>.f90`), along with the
+!  generated properties function.
+!
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!  2-stage, 2nd order TVD Runge-Kutta method of Shu and Osher (1988). CFL=1.0.
+!
+!### Reference
+!  * C.-W. Shu, S. Osher, "Efficient implementation of essentially non-oscillatory
+!    shock-capturing schemes", Journal of Computational Physics, 77, 1988, 439-471.
+!    https://doi.org/10.1016/0021-9991(88)90177-5.
+
+    module procedure rkssp22
+
+    associate (fs => me%funcs(:,1))
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        xf = x + h*fs
+        call me%f(t + h, xf, fs)
+
+        xf = (x + xf + h*fs) / 2.0_wp
+
+    end associate
+
+    end procedure rkssp22
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!  3-stage, 3rd order TVD Runge-Kutta method of Shu and Osher (1988). CFL=1.0.
+!
+!### Reference
+!  * C.-W. Shu, S. Osher, "Efficient implementation of essentially non-oscillatory
+!    shock-capturing schemes", Journal of Computational Physics, 77, 1988, 439-471.
+!    https://doi.org/10.1016/0021-9991(88)90177-5.
+
+    module procedure rkssp33
+
+    associate (fs => me%funcs(:,1))
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        xf = x + h*fs
+        call me%f(t + h, xf, fs)
+        xf = (3.0_wp*x + xf + h*fs)/4.0_wp
+        call me%f(t + h/2.0_wp, xf, fs)
+        xf = (x + 2.0_wp*xf + 2.0_wp*h*fs)/3.0_wp
+
+    end associate
+
+    end procedure rkssp33
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!   5-stage, 3rd order SSP Runge-Kutta method of Spiteri and Ruuth (2005). CFL=2.65.
+!
+!### Reference
+!   * Ruuth, Steven. "Global optimization of explicit strong-stability-preserving Runge-Kutta
+!   methods." Mathematics of Computation 75.253 (2006): 183-207.
+!   https://www.ams.org/journals/mcom/2006-75-253/S0025-5718-05-01772-2/S0025-5718-05-01772-2.pdf
+!
+!@note the coefficients here are only 15 digits of precision.
+
+    module procedure rkssp53
+
+    real(wp), parameter :: a30 = 0.355909775063327_wp
+    real(wp), parameter :: a32 = 0.644090224936674_wp
+    real(wp), parameter :: a40 = 0.367933791638137_wp
+    real(wp), parameter :: a43 = 0.632066208361863_wp
+    real(wp), parameter :: a52 = 0.237593836598569_wp
+    real(wp), parameter :: a54 = 0.762406163401431_wp
+    real(wp), parameter :: b10 = 0.377268915331368_wp
+    real(wp), parameter :: b21 = 0.377268915331368_wp
+    real(wp), parameter :: b32 = 0.242995220537396_wp
+    real(wp), parameter :: b43 = 0.238458932846290_wp
+    real(wp), parameter :: b54 = 0.287632146308408_wp
+    real(wp), parameter :: c1  = 0.377268915331368_wp
+    real(wp), parameter :: c2  = 0.754537830662736_wp
+    real(wp), parameter :: c3  = 0.728985661612188_wp
+    real(wp), parameter :: c4  = 0.699226135931670_wp
+
+    associate (xs => me%funcs(:,1), &
+               fs => me%funcs(:,2))
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        ! x1 as xs
+        xs = x + b10*h*fs
+        call me%f(t + c1*h, xs, fs)
+        ! x2 as xf
+        xf = xs + b21*h*fs
+        call me%f(t + c2*h, xf, fs)
+        ! x3 as xs
+        xs = a30*x + a32*xf + b32*h*fs
+        call me%f(t + c3*h, xs, fs)
+        ! x4 as xs
+        xs = a40*x + a43*xs + b43*h*fs
+        call me%f(t + c4*h, xs, fs)
+
+        xf = a52*xf + a54*xs + b54*h*fs
+
+    end associate
+
+    end procedure rkssp53
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!  4-stage, 4th order low storage non-TVD Runge-Kutta method of Jiang and Shu (1988).
+!
+!### Reference
+!  * Method: Jiang, Guang-Shan, and Chi-Wang Shu. "Efficient implementation of weighted ENO
+!    schemes." Journal of computational physics 126.1 (1996): 202-228.
+!    https://ntrs.nasa.gov/api/citations/19960007052/downloads/19960007052.pdf
+!  * Implementation: J. M. F. Donnert et al 2019 ApJS 241 23.
+!    https://iopscience.iop.org/article/10.3847/1538-4365/ab09fb
+
+    module procedure rkls44
+
+    associate (xs => me%funcs(:,1), &
+               fs => me%funcs(:,2))
+
+        xf = x
+        xs = -4.0_wp*x/3.0_wp
+        call me%f(t, xf, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        xf = x + h*fs/2.0_wp
+        xs = xs + xf/3.0_wp
+        call me%f(t + h/2.0_wp, xf, fs)
+        xf = x + h*fs/2.0_wp
+        xs = xs + 2.0_wp*xf/3.0_wp
+        call me%f(t + h/2.0_wp, xf, fs)
+        xf = x + h*fs
+        xs = xs + xf/3.0_wp
+        call me%f(t + h, xf, fs)
+        xf = x + h*fs/6.0_wp
+        xf = xf + xs
+
+    end associate
+
+    end procedure rkls44
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!   5-stage, 4th order low storage Runge-Kutta method of Carpenter and Kennedy (1994).
+!    CFL<=0.32
+!
+!### Reference
+!   * Carpenter, Mark H., and Christopher A. Kennedy. Fourth-order 2N-storage Runge-Kutta
+!   schemes. No. NASA-TM-109112. 1994.
+!   https://ntrs.nasa.gov/api/citations/19940028444/downloads/19940028444.pdf
+
+    module procedure rkls54
+
+    real(wp), parameter :: a(2:5) = [ -567301805773.0_wp / 1357537059087.0_wp, &
+                                     -2404267990393.0_wp / 2016746695238.0_wp, &
+                                     -3550918686646.0_wp / 2091501179385.0_wp, &
+                                     -1275806237668.0_wp /  842570457699.0_wp]
+
+    real(wp), parameter :: b(1:5) = [1432997174477.0_wp /  9575080441755.0_wp, &
+                                     5161836677717.0_wp / 13612068292357.0_wp, &
+                                     1720146321549.0_wp /  2090206949498.0_wp, &
+                                     3134564353537.0_wp /  4481467310338.0_wp, &
+                                     2277821191437.0_wp / 14882151754819.0_wp]
+
+    real(wp), parameter :: c(2:5) = [1432997174477.0_wp / 9575080441755.0_wp, &
+                                     2526269341429.0_wp / 6820363962896.0_wp, &
+                                     2006345519317.0_wp / 3224310063776.0_wp, &
+                                     2802321613138.0_wp / 2924317926251.0_wp]
+
+    integer :: i !! counter
+
+    associate (ds => me%funcs(:,1), &
+               fs => me%funcs(:,2))
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        ds = h*fs
+        xf = x + b(1)*ds
+
+        do i = 2, 5
+            call me%f(t + c(i)*h, xf, fs)
+            ds = a(i)*ds + h*fs
+            xf = xf + b(i)*ds
+        end do
+
+    end associate
+
+    end procedure rkls54
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!   5-stage, 4th order SSP Runge-Kutta method of Spiteri and Ruuth (2005). CFL=1.508.
+!
+!### Reference
+!   * Ruuth, Steven. "Global optimization of explicit strong-stability-preserving Runge-Kutta
+!   methods." Mathematics of Computation 75.253 (2006): 183-207.
+!   https://www.ams.org/journals/mcom/2006-75-253/S0025-5718-05-01772-2/S0025-5718-05-01772-2.pdf
+
+    module procedure rkssp54
+
+    real(wp), parameter :: b10 = 0.391752226571890_wp
+    real(wp), parameter :: a20 = 0.444370493651235_wp
+    real(wp), parameter :: a21 = 0.555629506348765_wp
+    real(wp), parameter :: b21 = 0.368410593050371_wp
+    real(wp), parameter :: a30 = 0.620101851488403_wp
+    real(wp), parameter :: a32 = 0.379898148511597_wp
+    real(wp), parameter :: b32 = 0.251891774271694_wp
+    real(wp), parameter :: a40 = 0.178079954393132_wp
+    real(wp), parameter :: a43 = 0.821920045606868_wp
+    real(wp), parameter :: b43 = 0.544974750228521_wp
+    real(wp), parameter :: a52 = 0.517231671970585_wp
+    real(wp), parameter :: a53 = 0.096059710526147_wp
+    real(wp), parameter :: b53 = 0.063692468666290_wp
+    real(wp), parameter :: a54 = 0.386708617503269_wp
+    real(wp), parameter :: b54 = 0.226007483236906_wp
+    real(wp), parameter :: c1  = 0.391752226571890_wp
+    real(wp), parameter :: c2  = 0.586079689311540_wp
+    real(wp), parameter :: c3  = 0.474542363121400_wp
+    real(wp), parameter :: c4  = 0.935010630967653_wp
+
+    associate (x2 => me%funcs(:,1), &
+               x3 => me%funcs(:,2), &
+               f3 => me%funcs(:,3), &
+               fs => me%funcs(:,4))
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+
+        ! x2 as x1
+        x2 = x + b10*h*fs
+        call me%f(t + c1*h, x2, fs)
+
+        x2 = a20*x + a21*x2 + b21*h*fs
+        call me%f(t + c2*h, x2, fs)
+
+        x3 = a30*x + a32*x2 + b32*h*fs
+        call me%f(t + c3*h, x3, f3)
+
+        ! xf as x4
+        xf = a40*x + a43*x3 + b43*h*f3
+        call me%f(t + c4*h, xf, fs)
+
+        xf = a52*x2 + a53*x3 + b53*h*f3 + a54*xf + b54*h*fs
+
+    end associate
+
+    end procedure rkssp54
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!  4-stage, 3rd order SSP Runge-Kutta method.
+!
+! @note
+!    On the current performance tests, this method shows 3rd order convergence, but its
+! relative error is one order of magnitude higher than that obtained with other 3rd order
+! methods. An implementation error cannot be excluded.
+!
+!### References
+!
+!   * Main method: Kraaijevanger, Johannes Franciscus Bernardus Maria. "Contractivity of
+!   runge-kutta methods." BIT Numerical Mathematics 31.3 (1991): 482-528.
+!   [DOI: 10.1007/BF01933264](https://doi.org/10.1007/BF01933264).
+!
+!   * Embedded method: Conde, Sidafa, Imre Fekete, and John N. Shadid. "Embedded error
+!   estimation and adaptive step-size control for optimal explicit strong stability preserving
+!   Runge--Kutta methods." arXiv preprint arXiv:1806.08693 (2018).
+!   [arXiv: 1806.08693](https://arXiv.org/abs/1806.08693)
+!
+!   * Implementation:  Ranocha, Hendrik, et al. "Optimized Runge-Kutta methods with automatic
+!   step size control for compressible computational fluid dynamics." Communications on Applied
+!   Mathematics and Computation 4.4 (2022): 1191-1228.
+!   [arXiv:2104.06836](https://arxiv.org/abs/2104.06836)
+!
+    module procedure rkssp43
+
+    associate (xtilde => me%funcs(:,1), &
+               fs => me%funcs(:,2), &
+               half_h => h / 2.0_wp)
+
+        call me%f(t, x, fs)
+        if (me%interpolate_events) call me%save_first_stage(t, x, fs)
+        xf = x + half_h*fs
+        call me%f(t + half_h, xf, fs)
+        xf = xf + half_h*fs
+        call me%f(t + h, xf, fs)
+        xf = xf + half_h*fs
+        xtilde = (x + 2.0_wp*xf) / 3.0_wp
+        xf = (2.0_wp*x + xf) / 3.0_wp
+        call me%f(t + half_h, xf, fs)
+
+        xf = xf + half_h*fs
+
+        xerr = (xtilde - xf) / 2.0_wp
+
+    end associate
+
+    end procedure rkssp43
+!*****************************************************************************************
+
@@ -0,0 +1,5635 @@
+#
+# Butcher tableaus of the methods in `generate_files.py`.
+#
+# This is the registry that the step functions are generated from. Each entry is
+# keyed by the method short name. The coefficients are exact, written as strings
+# that are either integers, rationals (`p/q`), terminating decimals, or quadratic
+# surds (`r + s*sqrt(k)`), so they can be emitted at any precision:
+#
+#   * `a` : the nodes (one per stage).
+#   * `b` : the rows of the stage matrix, as `{j: b_ij}` dicts of the
+#           nonzero entries (1-based stage numbers).
+#   * `c` : the weights of the solution that is propagated (`xf`).
+#   * `d` : the weights of the embedded solution (variable-step methods only).
+#           The error estimate is `xerr = h*sum((c-d)*f)`.
+#   * `dense` : optional continuous extension (variable-step methods only), as
+#           `{'order': q, 'b': {j: [b_j1, ..., b_jq]}}`. The interpolant is
+#           `x(t+theta*h) = x + h*sum(b_j(theta)*f_j)`, with
+#           `b_j(theta) = sum(b_jk*theta**k)`. For methods that are not FSAL,
+#           stage `s+1` is `f(t+h,xf)`. See `dense_output.py`.
+#   * `doc`: the documentation for the step function.
+#
+# The low-storage and SSP methods that are written in Shu-Osher or 2N form are
+# not in this registry. Their step functions are in `scripts/low_storage_steps.f90`.
+#
+
+tableaus = {}
+
+#***************************************************************************************************
+# fixed-step methods
+#***************************************************************************************************
+
+tableaus['euler'] = {
+    'doc': '''\
+  Euler (1st order) integration method.''',
+    'a': ['0'],
+    'b': [{}],
+    'c': {1: '1'},
+    }
+
+tableaus['midpoint'] = {
+    'doc': '''\
+  Midpoint (2nd order) integration method.''',
+    'a': ['0', '1/2'],
+    'b': [{},
+          {1: '1/2'}],
+    'c': {2: '1'},
+    }
+
+tableaus['heun'] = {
+    'doc': '''\
+  Heun's (2nd order) integration method''',
+    'a': ['0', '1'],
+    'b': [{},
+          {1: '1'}],
+    'c': {1: '1/2',
+          2: '1/2'},
+    }
+
+tableaus['rk3'] = {
+    'doc': '''\
+  3rd order, 3 steps RK integration method''',
+    'a': ['0', '1/2', '1'],
+    'b': [{},
+          {1: '1/2'},
+          {1: '-1',
+           2: '2'}],
+    'c': {1: '1/6',
+          2: '2/3',
+          3: '1/6'},
+    }
+
+tableaus['rk4'] = {
+    'doc': '''\
+  Take one Runge Kutta 4 integration step: `t -> t+h (x -> xf)`''',
+    'a': ['0', '1/2', '1/2', '1'],
+    'b': [{},
+          {1: '1/2'},
+          {2: '1/2'},
+          {3: '1'}],
+    'c': {1: '1/6',
+          2: '1/3',
+          3: '1/3',
+          4: '1/6'},
+    }
+
+tableaus['rks4'] = {
+    'doc': '''\
+  4th order Runge Kutta Shanks (4 points)
+
+### Reference
+  * E. B. Shanks, "Solutions of Differential Equations by Evaluations of Functions"
+    Math. Comp. 20 (1966).''',
+    'a': ['0', '1/100', '3/5', '1'],
+    'b': [{},
+          {1: '1/100'},
+          {1: '-4278/245',
+           2: '885/49'},
+          {1: '8894/149',
+           2: '-532125/8791',
+           3: '16170/8791'}],
+    'c': {1: '-23/9',
+          2: '50000/17523',
+          3: '1225/2124',
+          4: '149/1188'},
+    }
+
+tableaus['rkr4'] = {
+    'doc': '''\
+  Ralston 4th order method with minimum truncation error.
+
+### Reference
+  * Ralston, Anthony (1962).
+    "[Runge-Kutta Methods with Minimum Error Bounds](https://www.ams.org/journals/mcom/1962-16-080/S0025-5718-1962-0150954-0/S0025-5718-1962-0150954-0.pdf)".
+    Math. Comput. 16 (80): 431-437.''',
+    'a': ['0', '2/5', '7/8 - 3/16*sqrt(5)', '1'],
+    'b': [{},
+          {1: '2/5'},
+          {1: '-2889/1024 + 357/256*sqrt(5)',
+           2: '3785/1024 - 405/256*sqrt(5)'},
+          {1: '-673/1208 + 1047/3020*sqrt(5)',
+           2: '-975/2552 - 1523/1276*sqrt(5)',
+           3: '93408/48169 + 203968/240845*sqrt(5)'}],
+    'c': {1: '263/1812 + 2/151*sqrt(5)',
+          2: '125/3828 - 250/957*sqrt(5)',
+          3: '3426304/5924787 + 553984/1974929*sqrt(5)',
+          4: '10/41 - 4/123*sqrt(5)'},
+    }
+
+tableaus['rks5'] = {
+    'doc': '''\
+  Runge Kutta Shanks (5th order)
+
+### Reference
+  * E. B. Shanks, "Solutions of Differential Equations by Evaluations of Functions"
+    Math. Comp. 20 (1966).''',
+    'a': ['0', '1/9000', '3/10', '3/4', '1'],
+    'b': [{},
+          {1: '1/9000'},
+          {1: '-4047/10',
+           2: '405'},
+          {1: '20241/8',
+           2: '-10125/4',
+           3: '15/8'},
+          {1: '-34483/3',
+           2: '11500',
+           3: '-490/81',
+           4: '112/81'}],
+    'c': {1: '5/54',
+          3: '250/567',
+          4: '32/81',
+          5: '1/14'},
+    }
+
+tableaus['rk5'] = {
+    'doc': '''\
+  Runge's 5th order method.''',
+    'a': ['0', '1/5', '2/5', '1', '3/5', '4/5'],
+    'b': [{},
+          {1: '1/5'},
+          {2: '2/5'},
+          {1: '9/4',
+           2: '-5',
+           3: '15/4'},
+          {1: '-63/100',
+           2: '9/5',
+           3: '-13/20',
+           4: '2/25'},
+          {1: '-6/25',
+           2: '4/5',
+           3: '2/15',
+           4: '8/75'}],
+    'c': {1: '17/144',
+          3: '25/36',
+          4: '1/72',
+          5: '-25/72',
+          6: '25/48'},
+    }
+
+tableaus['rkc5'] = {
+    'doc': '''\
+  Cassity's Order 5 method
+
+### Reference
+  * C.R. Cassity, Solutions of the fifth order Runge-Kutta equations,
+    SIAM J. Numer. Anal., 3, (1966), pp. 598-606
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK5/RKcoeff5a_3.pdf)''',
+    'a': ['0', '1/7', '5/14', '9/14', '6/7', '1'],
+    'b': [{},
+          {1: '1/7'},
+          {1: '-367/4088',
+           2: '261/584'},
+          {1: '41991/2044',
+           2: '-2493/73',
+           3: '57/4'},
+          {1: '-108413/196224',
+           2: '58865/65408',
+           3: '5/16',
+           4: '265/1344'},
+          {1: '-204419/58984',
+           2: '143829/58984',
+           3: '171/202',
+           4: '2205/404',
+           5: '-432/101'}],
+    'c': {1: '1/9',
+          2: '7/2700',
+          3: '413/810',
+          4: '7/450',
+          5: '28/75',
+          6: '-101/8100'},
+    }
+
+tableaus['rkl5'] = {
+    'doc': '''\
+  5th order Lawson
+
+### References
+  * An Order Five Runge Kutta Process with Extended Region of Stability,
+    J. Douglas Lawson, Siam Journal on Numerical Analysis,
+    Vol. 3, No. 4, (Dec., 1966) pages 593-597''',
+    'a': ['0', '1/12', '1/4', '1/2', '3/4', '1'],
+    'b': [{},
+          {1: '1/12'},
+          {1: '-1/8',
+           2: '3/8'},
+          {1: '3/5',
+           2: '-9/10',
+           3: '4/5'},
+          {1: '39/80',
+           2: '-9/20',
+           3: '3/20',
+           4: '9/16'},
+          {1: '-59/35',
+           2: '66/35',
+           3: '48/35',
+           4: '-12/7',
+           5: '8/7'}],
+    'c': {1: '7/90',
+          3: '16/45',
+          4: '2/15',
+          5: '16/45',
+          6: '7/90'},
+    }
+
+tableaus['rklk5a'] = {
+    'doc': '''\
+  Luther and Konen's 5th order method (1)
+
+### References
+  * H.A.Luther and H.P.Konen,
+    "Some Fifth-Order Classical Runge Kutta Formulas",
+    Siam Review, Vol. 3, No. 7, (Oct., 1965) pages 551-558.''',
+    'a': ['0', '1/2', '1/2 - 1/10*sqrt(5)', '1/2', '1/2 + 1/10*sqrt(5)', '1'],
+    'b': [{},
+          {1: '1/2'},
+          {1: '1/5',
+           2: '3/10 - 1/10*sqrt(5)'},
+          {1: '1/4',
+           2: '1/4'},
+          {1: '1/20 - 1/20*sqrt(5)',
+           2: '-1/5',
+           3: '1/4 + 3/20*sqrt(5)',
+           4: '2/5'},
+          {1: '-1/4 + 1/4*sqrt(5)',
+           2: '-1/2 + 1/2*sqrt(5)',
+           3: '5/4 - 1/4*sqrt(5)',
+           4: '-2',
+           5: '5/2 - 1/2*sqrt(5)'}],
+    'c': {1: '1/12',
+          3: '5/12',
+          5: '5/12',
+          6: '1/12'},
+    }
+
+tableaus['rklk5b'] = {
+    'doc': '''\
+  Luther and Konen's 5th order method (2)
+
+### References
+  * H.A.Luther and H.P.Konen,
+    "Some Fifth-Order Classical Runge Kutta Formulas",
+    Siam Review, Vol. 3, No. 7, (Oct., 1965) pages 551-558.''',
+    'a': ['0', '2/5', '1/2', '1', '1/2 - 1/10*sqrt(15)', '1/2 + 1/10*sqrt(15)'],
+    'b': [{},
+          {1: '2/5'},
+          {1: '3/16',
+           2: '5/16'},
+          {1: '1/4',
+           2: '-5/4',
+           3: '2'},
+          {1: '3/20 - 1/100*sqrt(15)',
+           2: '-1/4',
+           3: '3/5 - 2/25*sqrt(15)',
+           4: '-1/100*sqrt(15)'},
+          {1: '-3/20 - 1/20*sqrt(15)',
+           2: '-1/4',
+           3: '3/5',
+           4: '3/10 - 1/20*sqrt(15)',
+           5: '1/5*sqrt(15)'}],
+    'c': {3: '4/9',
+          5: '5/18',
+          6: '5/18'},
+    }
+
+tableaus['rkb6'] = {
+    'doc': '''\
+  Butcher's 6th order method. 7 function evaluations.
+
+### References
+  * Butcher, J. (1964). On Runge-Kutta processes of high order.
+    Journal of the Australian Mathematical Society, 4(2), 179-194.''',
+    'a': ['0', '1/3', '2/3', '1/3', '1/2', '1/2', '1'],
+    'b': [{},
+          {1: '1/3'},
+          {2: '2/3'},
+          {1: '1/12',
+           2: '1/3',
+           3: '-1/12'},
+          {1: '-1/16',
+           2: '9/8',
+           3: '-3/16',
+           4: '-3/8'},
+          {2: '9/8',
+           3: '-3/8',
+           4: '-3/4',
+           5: '1/2'},
+          {1: '9/44',
+           2: '-9/11',
+           3: '63/44',
+           4: '18/11',
+           6: '-16/11'}],
+    'c': {1: '11/120',
+          3: '27/40',
+          4: '27/40',
+          5: '-4/15',
+          6: '-4/15',
+          7: '11/120'},
+    }
+
+tableaus['rk7'] = {
+    'doc': '''\
+  Take one Runge Kutta 7 integration step: `t -> t+h (x -> xf)`
+
+### Reference
+  * E. B. Shanks, "Solutions of Differential Equations by Evaluations of Functions"
+    Math. Comp. 20 (1966).''',
+    'a': ['0', '2/9', '1/3', '1/2', '1/6', '8/9', '1/9', '5/6', '1'],
+    'b': [{},
+          {1: '2/9'},
+          {1: '1/12',
+           2: '1/4'},
+          {1: '1/8',
+           3: '3/8'},
+          {1: '23/216',
+           3: '7/72',
+           4: '-1/27'},
+          {1: '-4136/729',
+           3: '-4528/243',
+           4: '5264/729',
+           5: '1456/81'},
+          {1: '8087/11664',
+           3: '484/243',
+           4: '-518/729',
+           5: '-658/351',
+           6: '7/624'},
+          {1: '-1217/2160',
+           3: '-145/72',
+           4: '8342/6615',
+           5: '361/195',
+           6: '3033/50960',
+           7: '117/490'},
+          {1: '259/2768',
+           3: '-84/173',
+           4: '-14/173',
+           5: '6210/2249',
+           6: '-99873/251888',
+           7: '-29160/15743',
+           8: '2160/2249'}],
+    'c': {1: '173/3360',
+          4: '1846/5145',
+          5: '27/91',
+          6: '-19683/713440',
+          7: '-19683/713440',
+          8: '27/91',
+          9: '173/3360'},
+    }
+
+tableaus['rk8_10'] = {
+    'doc': '''\
+  Take one Runge Kutta 8 integration step: `t -> t+h (x -> xf)`
+  This is Formula (8-10) from Reference [1].
+
+# Reference
+  1. E. B. Shanks, "[Higher Order Approximations of Runge-Kutta Type](http://ntrs.nasa.gov/archive/nasa/casi.ntrs.nasa.gov/19650022581.pdf)",
+     NASA Technical Note, NASA TN D-2920, Sept. 1965.''',
+    'a': ['0', '4/27', '2/9', '1/3', '1/2', '2/3', '1/6', '1', '5/6', '1'],
+    'b': [{},
+          {1: '4/27'},
+          {1: '1/18',
+           2: '1/6'},
+          {1: '1/12',
+           3: '1/4'},
+          {1: '1/8',
+           4: '3/8'},
+          {1: '13/54',
+           3: '-1/2',
+           4: '7/9',
+           5: '4/27'},
+          {1: '389/4320',
+           3: '-1/80',
+           4: '161/720',
+           5: '-103/540',
+           6: '9/160'},
+          {1: '-231/20',
+           3: '81/20',
+           4: '-291/5',
+           5: '164/5',
+           6: '-61/10',
+           7: '40'},
+          {1: '-127/288',
+           3: '1/16',
+           4: '-113/48',
+           5: '19/12',
+           6: '-1/32',
+           7: '2',
+           8: '1/72'},
+          {1: '1481/820',
+           3: '-81/820',
+           4: '1776/205',
+           5: '-844/205',
+           6: '18/205',
+           7: '-252/41',
+           8: '-3/41',
+           9: '36/41'}],
+    'c': {1: '41/840',
+          4: '9/280',
+          5: '34/105',
+          6: '9/280',
+          7: '9/35',
+          9: '9/35',
+          10: '41/840'},
+    }
+
+tableaus['rkcv8'] = {
+    'doc': '''\
+  Cooper-Verner 11 stage, 8th order Runge-Kutta method.
+
+### Reference
+  * Some Explicit Runge-Kutta Methods of High Order, by G. J. Cooper and J. H. Verner,
+    SIAM Journal on Numerical Analysis, Vol. 9, No. 3, (September 1972), pages 389 to 405
+  * http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK8/RKcoeff8b_1.pdf''',
+    'a': ['0', '1/2', '1/2', '1/2 - 1/14*sqrt(21)', '1/2 - 1/14*sqrt(21)', '1/2',
+          '1/2 + 1/14*sqrt(21)', '1/2 + 1/14*sqrt(21)', '1/2', '1/2 - 1/14*sqrt(21)', '1'],
+    'b': [{},
+          {1: '1/2'},
+          {1: '1/4',
+           2: '1/4'},
+          {1: '1/7',
+           2: '-1/14 + 3/98*sqrt(21)',
+           3: '3/7 - 5/49*sqrt(21)'},
+          {1: '11/84 - 1/84*sqrt(21)',
+           3: '2/7 - 4/63*sqrt(21)',
+           4: '1/12 + 1/252*sqrt(21)'},
+          {1: '5/48 - 1/48*sqrt(21)',
+           3: '1/4 - 1/36*sqrt(21)',
+           4: '-77/120 - 7/180*sqrt(21)',
+           5: '63/80 + 7/80*sqrt(21)'},
+          {1: '5/21 + 1/42*sqrt(21)',
+           3: '-48/35 - 92/315*sqrt(21)',
+           4: '211/30 + 29/18*sqrt(21)',
+           5: '-36/5 - 23/14*sqrt(21)',
+           6: '9/5 + 13/35*sqrt(21)'},
+          {1: '1/14',
+           5: '1/9 + 1/42*sqrt(21)',
+           6: '13/63 + 1/21*sqrt(21)',
+           7: '1/9'},
+          {1: '1/32',
+           5: '91/576 + 7/192*sqrt(21)',
+           6: '11/72',
+           7: '-385/1152 + 25/384*sqrt(21)',
+           8: '63/128 - 13/128*sqrt(21)'},
+          {1: '1/14',
+           5: '1/9',
+           6: '-733/2205 + 1/15*sqrt(21)',
+           7: '515/504 - 37/168*sqrt(21)',
+           8: '-51/56 + 11/56*sqrt(21)',
+           9: '132/245 - 4/35*sqrt(21)'},
+          {5: '-7/3 - 7/18*sqrt(21)',
+           6: '-2/5 - 28/45*sqrt(21)',
+           7: '-91/24 + 53/72*sqrt(21)',
+           8: '301/72 - 53/72*sqrt(21)',
+           9: '28/45 + 28/45*sqrt(21)',
+           10: '49/18 + 7/18*sqrt(21)'}],
+    'c': {1: '1/20',
+          8: '49/180',
+          9: '16/45',
+          10: '49/180',
+          11: '1/20'},
+    }
+
+tableaus['rk8_12'] = {
+    'doc': '''\
+  8th order Shanks, 12 function evaluations.
+
+### Reference
+  * E. B. Shanks, "Solutions of Differential Equations by Evaluations of Functions"
+    Math. Comp. 20 (1966).''',
+    'a': ['0', '1/9', '1/6', '1/4', '1/10', '1/6', '1/2', '2/3', '1/3', '5/6', '5/6', '1'],
+    'b': [{},
+          {1: '1/9'},
+          {1: '1/24',
+           2: '1/8'},
+          {1: '1/16',
+           3: '3/16'},
+          {1: '29/500',
+           3: '33/500',
+           4: '-3/125'},
+          {1: '11/324',
+           4: '1/243',
+           5: '125/972'},
+          {1: '-7/12',
+           4: '19/9',
+           5: '125/36',
+           6: '-9/2'},
+          {1: '-10/81',
+           4: '-32/243',
+           5: '125/243',
+           7: '11/27'},
+          {1: '1175/324',
+           4: '-32/3',
+           5: '-3125/162',
+           6: '26',
+           7: '121/162',
+           8: '-1/12'},
+          {1: '293/324',
+           4: '-71/27',
+           5: '-1375/324',
+           6: '17/3',
+           7: '-59/162',
+           8: '1/2',
+           9: '1'},
+          {1: '1303/1620',
+           4: '-71/27',
+           5: '-1375/324',
+           6: '37/6',
+           7: '103/162',
+           10: '1/10'},
+          {1: '-955/492',
+           4: '2560/369',
+           5: '8125/738',
+           6: '-612/41',
+           7: '7/82',
+           8: '-27/164',
+           9: '-18/41',
+           10: '-12/41',
+           11: '30/41'}],
+    'c': {1: '41/840',
+          6: '9/35',
+          7: '34/105',
+          8: '9/280',
+          9: '9/280',
+          10: '3/70',
+          11: '3/14',
+          12: '41/840'},
+    }
+
+tableaus['rks10'] = {
+    'doc': '''\
+  Stepanov 10th order (15 stage) method.
+
+### References
+  * Misha Stepanov, "On Runge-Kutta methods of order 10"
+    arXiv:2504.17329, 24 Apr 2025''',
+    'a': ['0',
+          '1.33333333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-1',
+          '2.66666666666666666666666666666666666666666666666666666666666666666666666666666666666666667e-1',
+          '2/5',
+          '5.71428571428571428571428571428571428571428571428571428571428571428571428571428571428571429e-1',
+          '7.78740761536291800442363524550407562438954342313508170658506769545868148577329534757889703e-1',
+          '6.42615758240322548157075497020439535959501736363212695909875208263848965457099799090837864e-1',
+          '8.82527661964732346425501486979669075182867844268052119663791177918527658519413257061748635e-1',
+          '1.17472338035267653574498513020330924817132155731947880336208822081472341480586742938251365e-1',
+          '1.17472338035267653574498513020330924817132155731947880336208822081472341480586742938251365e-1',
+          '3.57384241759677451842924502979560464040498263636787304090124791736151034542900200909162136e-1',
+          '3.57384241759677451842924502979560464040498263636787304090124791736151034542900200909162136e-1',
+          '6.42615758240322548157075497020439535959501736363212695909875208263848965457099799090837864e-1',
+          '8.82527661964732346425501486979669075182867844268052119663791177918527658519413257061748635e-1',
+          '1'],
+    'b': [{},
+          {1: '1.33333333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-1'},
+          {2: '2.66666666666666666666666666666666666666666666666666666666666666666666666666666666666666667e-1'},
+          {1: '1/10',
+           3: '3/10'},
+          {1: '1.34110787172011661807580174927113702623906705539358600583090379008746355685131195335276968e-1',
+           3: '8.7463556851311953352769679300291545189504373177842565597667638483965014577259475218658892e-2',
+           4: '3.49854227405247813411078717201166180758017492711370262390670553935860058309037900874635569e-1'},
+          {1: '3.28658938997791240721282668696245180100949935428058492348520659513222104304668996831025694e-1',
+           3: '-8.43123044711636120617820434267319755889422538822419939805710279613810068291349217990455336e-1',
+           4: '1.230383064721160870667126440845906263177038685065274297872024392536130940503747853752249173e0',
+           5: '6.2821802528975809671774849275575875050388260642595320243671997110325172060261902165070172e-2'},
+          {1: '1.30186990844533481397415277676876710451288921648802895948985973227427327921848463186124942e-1',
+           4: '5.80738972917374107341609289970199905398640941037865280565410031214758908228344711848158528e-1',
+           5: '-1.32061017042928219570339015811796150446818327131853650470115559422384511796983327996330108e-1',
+           6: '6.3750811521343178988389945185159070556390200808398169865594763244047241103889952052884502e-2'},
+          {1: '1.16969144664032355608536137983019767284447494556651903864723553337776482921362147717802148e-1',
+           4: '8.04791321585223079797049560718389631085997501079130322088670870267840258541270110417387198e-1',
+           5: '-1.032442407303393452179074692383412947850773751656102435103865475343877801453723942152851429e0',
+           6: '1.41237507577425159424271186625123531674337461239364982255644624276392633209837338226267645e-1',
+           7: '8.51972095441445203774719294036549092988859139049007346558617605380396085300667602853143073e-1'},
+          {1: '7.2301376815318053808169355285248577196274719038173036516820302048727944927561329493507003e-2',
+           4: '2.7844935379385795073618755243334992787280952817420413972941256950598860019225410136467114e-1',
+           5: '-7.20355742529399485982635010432963793377590743017129914556141009831958711185177678815313348e-1',
+           6: '7.1478309723007569077180467110101963232268708471224068127334024952865428728115593534703972e-2',
+           7: '4.80546127100390254710165280839106235150089447220646221776588301884109281650681775624438024e-1',
+           8: '-6.4947086867906688774569132214511985256719504155169671257805366478260202832848378263755427e-2'},
+          {1: '-3.3604580075425596431640044865448312697754125457571033966446479388085421715398642048231498e-2',
+           4: '-8.5766938866867492403281273222956606899814498980798456274204327486924636730759940427543859e-1',
+           5: '2.054105395119576054328336908587945831582620175191578897288368999063154807831596816873316215e0',
+           6: '-2.09909042661849185066865444237374444876978972036734389443755323786107747791309251353961678e-1',
+           7: '-1.33397223595161140905112552467270450206815983114510371418725670262999230914415250963317693e0',
+           8: '1.80806348384581339693160596923480075192005804935788561945038863986674416934017278251008686e-1',
+           9: '3.17715841888671374135444753513998346683544094051974121442302739705074962673432455124735159e-1'},
+          {1: '3.781005386193372758387752686404632295230537376428675468887881613330293106578832193697553e-2',
+           4: '4.5591558641579644208161372472470642588279099631100286855624026273895766568226149784507397e-2',
+           5: '3.74858247294747357801811789348440678077393709386181864992340497763246020363342448831864027e-1',
+           6: '-1.8981904165238088665273073099056486944960468054380557714800392623159772511027805727133276e-2',
+           7: '-3.36038862637559379967733799098120208915305739878288300584069940705912757234040695695257751e-1',
+           8: '4.2207716375559153022580951807545725160812786625465879746013555646386854001549779891730475e-2',
+           9: '5.1900360983690832037790128319440699859433125187462257771821672390157423238366045436562647e-2',
+           10: '1.60037071404964205821709606364793091262540376974959118334316556858234569050695956449913087e-1'},
+          {1: '2.5378474265434522073341785109062596527860323276820540705890698859323818498838966304096456e-2',
+           4: '3.6230632754347408087035699053569267671448220794211898141693992894979172836712347332800412e-1',
+           5: '-2.130022066259949711216588139786172085385079053283141571779776466074951544604054464037893691e0',
+           6: '1.67271594859437715452103295041620121357577378494618057193516457140141705837480748503078071e-1',
+           7: '1.582750941864663213591839501273807297171503649177669091900056915258923612981224332245177665e0',
+           8: '-2.04720185139081567587174987631558173178320360472369067149216918644283831827088288528863705e-1',
+           9: '3.19265328144806137168538521838050367024648119039965645533219052127751799436983299054606914e-1',
+           10: '-1.99485256254696927298131093258193563570518501610697726802791703448058055735145490139989292e-1',
+           11: '4.34639082735589988788638629857251227378344501071803353072286827567511801587537624180945598e-1'},
+          {1: '2.1029555123492649231004219196592342935742304160151528452676708946550307466281435746860028e-2',
+           4: '-2.08531388344693562066394580214099278549298495126493308746134843353719483236004257692460587e-1',
+           5: '3.26863498654767652665730419629359718148991455519984894344217473947412982044929978522731887e-1',
+           6: '-4.0291595063466341977981502499810508092167265608412827254081246436545949894568768120086225e-2',
+           7: '-6.2168570110085104851127006245165266954000899589268210982639466796612080783267242335332813e-2',
+           8: '1.940151163563460747001599159488219379175289273178982841345785879777388504289471741431422e-2',
+           9: '3.3618934322149698701521634179531768990520248587976979368806692500394465464703080284812928e-2',
+           10: '1.84057539066668989188409585677311173226149887887488899665117691435303709700110659619387592e-1',
+           11: '1.26719042450063065291362679244566355420313628999369516069616211043815410052049067488162884e-1',
+           12: '2.41917230505790894504534056457271037041497978800625396578838128179475719599971128162447951e-1'},
+          {1: '5.9015439601144226763876106824299822651056803159364026683828389696455698859560833618210307e-2',
+           4: '3.46753529400439458709721774328857076918185484739163574624551262985723353031416083991491991e-1',
+           5: '-5.43520439250941361637466822737163641756559230304227658933756185028034640683436881957640271e-1',
+           6: '6.6998320513439386022349163118524383402374304344205128122905426297240312187142777357799209e-2',
+           7: '-2.0910592627389070532643303739196898590719884728718534406143819521419883801236544272392008e-1',
+           8: '3.419681921537739346821651430980392883034070188816770864692755688660908088078925868168271e-2',
+           9: '6.56808691640117064523673744875271638362693883629496564722278370329924383275858838375005043e-1',
+           10: '-5.30023086491271629685194176217211641242245756479495833589514996293186125976018346545708951e-1',
+           11: '6.82370713621575520444713157488350028626121649514411954149882119768342984225842629755650051e-1',
+           12: '-5.2431679464915420184127167210304917804736086848759833190910744595758863411342667109339574e-1',
+           13: '8.43350394637897194983316734483955643345459719551750331207234874447240084844050177602574367e-1'},
+          {1: '-4.0440866328662678612786513864723972854343311900228087268921187067545862661799086441064095e-2',
+           4: '-9.36174412160392166960880644803504126455580435000519336040696957832662353800600021951728948e-1',
+           5: '1.467410954959016212947954342116057777884286077126485056662059170859341898803083590224129382e0',
+           6: '-1.8088384977898705169969794224212402292232387065419889165445498481285033468844041179141779e-1',
+           7: '1.167589102274410575304328368479226265476383761610677844233764974596479007878520383510866872e0',
+           8: '-2.80113604810353377498686142206136702751291429624401159362004219851994095769258196924953998e-1',
+           9: '-1.871668376348516420302371567652811494220817967866998659532896736116592408041514651376908974e0',
+           10: '2.241588116125051681252015179294157675223848655884912766574651463604345999471163122136357746e0',
+           11: '-1.572572082691418559566908951416310106551328354276059431821310834756397117889598376197133068e0',
+           12: '2.151700399601058696148477230250852973515302452974155466886336399845840759500171462284652967e0',
+           13: '-1.813340450902764402851969633637645578401662879405552525500029323314042291416407578145425752e0',
+           14: '6.66905070061557491840526275682961312057527301131726956823502234846076798614679764672625658e-1'}],
+    'c': {1: '3.3333333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2',
+          9: '1.35169627249231064398790288647151661598687390677589878805138875485701561628210909193328656e-1',
+          10: '5.4067850899692425759516115458860664639474956271035951522055550194280624651284363677331462e-2',
+          11: '2.15778257736022470617613537547175598111058915336253983819589520767421262523355528508005093e-1',
+          12: '6.1650930781720705890746725013478742317445404381786852519882720219263217863815865288001455e-2',
+          13: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796006548e-1',
+          14: '1.89237478148923490158306404106012326238162346948625830327194425679982186279495272870660119e-1',
+          15: '3.3333333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2'},
+    }
+
+tableaus['rkz10'] = {
+    'doc': '''\
+  Zhang 10th order
+
+### Reference
+  * David K. Zhang, "Discovering New Runge-Kutta Methods Using Unstructured Numerical Search",
+    Thesis, April 16, 2019 [1911.00318.pdf](https://arxiv.org/pdf/1911.00318.pdf)
+  * [Coefficients](https://github.com/dzhang314/rktk/blob/master/methods/Zhang10.txt)''',
+    'a': ['0',
+          '6.888096612188652230677098661632935381315159322698285980682460033484176156636e-2',
+          '4.1558484518331227809737070056485372243108876367542428854988919130853403003456e-1',
+          '6.888096612188652230677098661632935381315159322698285980682460033484176156635e-2',
+          '7.1586871544502723286331674220009325303307546992540476213534656119646753667122e-1',
+          '8.8506225272484721608543268134339215101579226755203804959323597087309311688047e-1',
+          '1.1069155836774580151238817481880510754316607944811139791594399518232540363915e-1',
+          '3.0113422596409007031081748055618206049402716552407749842644887807782153512541e-1',
+          '6.5634506993258093106834386163684261711737257395459682270532529172654427257257e-1',
+          '4.1558484518331227809737070056485372243108876367542428854988919130853403003456e-1',
+          '4.1558484518331227809737070056485372243108876367542428854988919130853403003456e-1',
+          '6.8380263288949940889461708628199333243061535601536081101902649446063652514733e-1',
+          '8.8496513858099505215128217545754083167548764346868233674824300204034872020069e-1',
+          '4.1558484518331227809737070056485372243108876367542428854988919130853403003456e-1',
+          '4.1558484518331227809737070056485372243108876367542428854988919130853403003458e-1',
+          '1.00000000000000000000000000000000000000000000000000000000000000000000000000002e0'],
+    'b': [{},
+          {1: '6.888096612188652230677098661632935381315159322698285980682460033484176156636e-2'},
+          {1: '-8.3810520353364237535186366202804838694106968892100493081079119861616316483888e-1',
+           2: '1.25369004871695465344923436259290210937215845259642921936068038992469719487344e0'},
+          {1: '-4.90948675932680175369634467679043271190185159760893197940412354439119879747e-3',
+           2: '8.232173030768021571147603044143500716498050758632346872918243517328221749373e-2',
+           3: '-8.53127742646689165100869914831522063992706276173167694295371129404925712991e-3'},
+          {1: '1.04893195376435953811751460952804681519865641127045728585681123905425821150864e0',
+           2: '-7.5382817731759581241904280322911590179250916990960557195131331600659134298994e-1',
+           3: '8.0522815974064911780476652756884437914316713728791543021500322792680878839117e-1',
+           4: '-3.8446322074238561063992159166768203951623890872336238198515458977800812023865e-1'},
+          {1: '-2.39923834333299952700185010714876050203366145871277993098792813049815373139e-1',
+           2: '-6.364261163929229571107164643776483490956349179570579724023318438638668084701e-2',
+           3: '1.9967543135197895864283978317448663244372194705250026204952108330132418721869e-1',
+           4: '6.1035379509547002158981202467825146906358429601618359949777530100370262806814e-1',
+           5: '3.7859947224999048426403753064329493462141566215033797838496558400426835557965e-1'},
+          {1: '1.778833946316172550067667113299992644020408256145083580468064240809624146756e-2',
+           2: '-1.105021905501825472152093430479940021746699824126398377648788328289961044531e-2',
+           3: '-4.39342855052892929633342674635339618911779936473248023015437836908839819799e-3',
+           4: '1.0597527290509018731505658395393495306363828909501538659771103682791206047696e-1',
+           5: '4.05089069638330732472929903714130352675532845602736909932582009874330236167e-3',
+           6: '-1.67929709134223461022001825411827908084682305838572957913124250043819202374e-3'},
+          {1: '2.35660462254185379256926903568249731351275858291207497991761000813661327179e-1',
+           2: '8.89336268970155965611293086879433570148072406867365744055899691755601420662e-2',
+           3: '4.138834709876858545169518341465722051417932518424807026039922164100253591914e-2',
+           4: '-8.5290303603263069912309614093599359240031750375681439893926580845622126359984e-1',
+           5: '-2.308087548113625563008379864870135277272977633339373075859414529485111031087e-2',
+           6: '9.68592188591852514590807745954989979539211465004178878459403530669594442891e-3',
+           7: '8.0144977934196893864833794701047679699141990680205169668196460489197395944287e-1'},
+          {1: '9.048693760705330681795027653195090842362561521235737211709949607524998063814e-2',
+           2: '3.204427202479226242378001797390171191984804295279358947221505285617826137779e-2',
+           3: '1.2433768215891056280095053314827014992247446913700152962717366852615035330919e-1',
+           4: '-3.0731521755038158104946232011583084977900951861660916480042444618524837737411e-1',
+           5: '1.6447843681160268810163161551627427448581444120771873237010859382161886567365e-1',
+           6: '-4.100681167344768439646557295106150922485658224571650562701715147123044716022e-2',
+           7: '4.0661989930773198456977153545461924102851176247811339291440854490078881632775e-1',
+           8: '1.8669987124631939180018777607871869034096434382893787663176153320303681978038e-1'},
+          {1: '-1.2815849137721058028379122684114729957595452282110310092889040855742427673083e-1',
+           2: '-9.49429224253224554374888160619277034677176082796718500059750768044719372908e-2',
+           3: '-1.4450344511826259894917045729900439186304081642314445476990786282061867102157e-1',
+           4: '9.2134940704406912363606156819205798706915260363096464763106069459083167107327e-1',
+           5: '-1.3265301054949046320484467982507968172620145761107284691851092173475314294014e-1',
+           6: '1.661485872631464348319012586897860991564771318706900087871886151957318825574e-2',
+           7: '-6.4461773243991825568826538659502156175792556790721387489238296660149971176174e-1',
+           8: '4.7148463683422024098060807066053294761028203774917809473770514989820710158152e-1',
+           9: '1.5101154448891262356107150246546481622684638215041867281807172181868980886911e-1'},
+          {1: '-3.5394262889926481874318272132638227200275604000107564690424492655250744148526e-1',
+           2: '-1.2999250061102426001102206164524015480707041252098090235235458563228391897841e-1',
+           3: '7.296717474130959358123820183761890201581557542115580687780801792533382974931e-2',
+           4: '1.23409288203437673148811178545199717478084359792767549031487434785241641765067e0',
+           5: '2.4325479314414790350916184694938182359002523242070889454561579643424180130675e-1',
+           6: '-4.886415340347670065787549059652108014832442895629947389530738182689787996728e-2',
+           7: '-5.1442371407978914516038594645191171303742863244306956194414424856852330710239e-1',
+           8: '7.088500449199304304537010242765865457286791828303557337358385517356109210099e-2',
+           9: '-2.0555333994396552677698205301698855743095009068049025897065388713681681672772e-1',
+           10: '4.71613277090054578229370369352409448980660442247643675047122036400102534879e-2'},
+          {1: '-1.28883596401187309154174375754588391722337985378291577953064993833085325077145e0',
+           2: '-2.8020869761589692854933312826845810393637896090137224607343344880154309805585e-1',
+           3: '2.95502531060581466025398140893693575414694538631086569687435523799636000133369e0',
+           4: '2.68729452804277601048934070442766694554427130448420986662047690713132366345266e0',
+           5: '4.94062342991935573838476417426809163760371481941041460313006887242753416771859e0',
+           6: '-1.10669748003212502578007105340045335120159611347391447923604138591653946190627e0',
+           7: '-1.01499184284449721513261150169983810954496707583685170059698090784083909089787e0',
+           8: '2.53750982609373480524394613209930567128221625331336116097749979112883387569908e0',
+           9: '-3.0508543552530331258777833928407222878073712740686542859262567140544824307751e0',
+           10: '-4.48248369012964780236263511347668602256466957962418723733767273268597925464354e0',
+           11: '-1.21257843188510861623323738621796488386816954981559478788233918659317859600661e0'},
+          {1: '-2.6440344286774078027313975052115341819194404740705505988980388884472351746613e-1',
+           2: '-6.681118811399606825394685412417487195704333031683770523718698572711060614338e-2',
+           3: '2.2983178806827308655694675660046084355033982772309698316158066683955449428729e-1',
+           4: '6.4074149645736181719485655167408177784648088775776468738158085006283347730738e-1',
+           5: '4.2942911081576828545053652299580217770451868606900245607955202491949872419495e-1',
+           6: '-9.67078876662303036856558223558993132212111489612543886857914521712390529304e-3',
+           7: '1.613666672999681392501812041282804272240296713357286534780333216134004281864e-2',
+           8: '-3.596314318487727365094853269870982256844289210631058204493077377818835633949e-2',
+           9: '-4.902670091896965612083428201101205091198148478269054303875029017005640576667e-2',
+           10: '1.388537673498896790224810676002758506392838309962714417674884945696557987538e-2',
+           11: '-2.329475109524907760636494276820464664967810607545806961371703044079964798003e-2',
+           12: '4.11071472206196739547606137318514638902786727009559929394539277815884070579e-3'},
+          {1: '1.28995927881082034516023610876593719136951515200841564716720963602983766539309e0',
+           2: '1.3503265202676397192358271319486347590315093450300003507414087911915346743493e-1',
+           3: '-1.57533735338626298015011591165511659112640458688783385930436332029909777715227e0',
+           4: '-1.13614144125767380945133294734170682018114470434355261134291967031467884444496e0',
+           5: '-2.60629976327340284860734294234508518773200013764798796731373995419345584010989e0',
+           6: '-1.422551485722128292977686924595705712788245691193884512427632936325077447982e-1',
+           7: '-1.30050279397530175137190231972314623324238865480815606289913301764254981931424e0',
+           8: '2.70797163114645615543070920761013389431867941711011998785845670786144007733081e0',
+           9: '2.43554296946750176014394493560037156798756615586273835416220476865949138763199e0',
+           10: '-2.6458182516446999987007272710827096690076304619434648405874330108389046658365e-1',
+           11: '2.8431747275350668428305940521170347967298804085514279367418757904848425107603e-1',
+           12: '-1.567336501605444936187349334932741547111318613954509638698908027760861917463e-2',
+           13: '6.0355253162364202926624736416406789911182794847681800316234125803391629274555e-1'},
+          {1: '-8.2170145239485721248182614307298014363501501247665665859542963907661741852252e-1',
+           2: '1.25591221619821840505806060191670198289896021578755350597122093077684012752648e0',
+           3: '-1.61528411652582192169858936420113229814694831240320505932449451294946663882e-2',
+           4: '-2.297038987201048533939731478067813642773684981394747854111883904855646952919e-2',
+           5: '-2.796034376707111482574969609615809805957457730932703561247060660045527963337e-2',
+           6: '-7.509429872708069228856785296294584378472839219042646801373266261127412961103e-1',
+           7: '-8.31029089278008603544533798969572897337060350821384521268253868513966100453e-3',
+           8: '2.785523862077057819395231768788127899618354611871665730619924470585495216854e-2',
+           9: '4.021421539333651503730432703988977024358721548426886753518601253708363296062e-2',
+           10: '1.61713646360095425893804116572314412328254887955289755326352595104935489454125e0',
+           11: '-1.39628377741243214317623603663032161218084680028714877542197062209713837494256e0',
+           12: '-1.42443915906106420830484872694615503917980253911513028166554176375747238398e-2',
+           13: '7.5709054336643265169970374917936196757291644158102449813751290304179069353124e-1',
+           14: '-2.2405735763057330478532402187136037006601226103429496673285661641467238072308e-1'},
+          {1: '2.7726401853185531071095250844208662954769209843860654782270439586107555912462e-1',
+           2: '9.453818370728229619312145290868518019954577268055790438905422269619151226603e-2',
+           3: '8.417275429545428654198078897506589717982597224943613268427410367692287990859e-1',
+           4: '-9.0665259832844475943298457713954683980649043330939335614048943465366310987303e-1',
+           5: '-9.334858033923263720339222938292231543826754868386677793091178055855225779084e-2',
+           6: '4.088877589141140109655745387910541205517857658419761650616244837403991806274e0',
+           7: '7.953998649942899068707949254598231473949581278257343653554622082282627895365e-1',
+           8: '-4.859175145875636251218702854395529418032114353274620641007859711365783956136e-2',
+           9: '1.4819851457498430887143064575970769402240035004018486609649448109702272035773e-1',
+           10: '-1.77021148062189597056755123808303838576982978034562033343027660487016998355672e0',
+           11: '1.83821084492008174732030666893446362369060575712213328902105414298283276556307e0',
+           12: '4.909344463430916722179909282844531508454281205967923461622573420987424382584e-2',
+           13: '-3.80378823067007538071243467410680278604792596795503781745130930797860484235966e0',
+           14: '3.3157239872339854149205035234217673029656296754907585248267975563293121409049e-1',
+           15: '-8.4228976076347914332745917708032287630959039280343054587959508970676337698255e-1'}],
+    'c': {1: '3.181927458023409759419419944088926839595967458804889313841865851348230504492e-2',
+          3: '4.681369289018421954398607025172424191865836856120072277976273594277845007872e-2',
+          6: '1.3755353617054574901312633974759815109485248982304168872322054848629026929563e0',
+          7: '1.7506567143964248943590740397548086595186840317795589108615338820052040464001e-1',
+          8: '1.4924798653008455234489054168544610975862154045444166485218499565185924479229e-1',
+          9: '2.7180992312662372142355988162582830282467844949919584507610421296773792690656e-1',
+          10: '-1.7077940511361075387191294440611902706762757201779959741914461935949309724569e-1',
+          11: '3.0035519768848521819453255694344499143765502380409939822945376435190034136303e-1',
+          12: '-1.014254403202798636405231311418830930667910487160410011307114999518762983823e-2',
+          13: '-1.19177815782093190956613115811061881440838744821819017576359936663422556606341e0',
+          14: '3.639139354170713653095246097302347593652682408895579802073390992985525665017e-2',
+          15: '-4.683316086510645556720041443823709643011325850704077997225219431585033242635e-2',
+          16: '3.249476632925818017001031769734448004031420121031955285305017988372000314167e-2'},
+    }
+
+tableaus['rko10'] = {
+    'doc': '''\
+  Ono's 10th order method
+
+### References
+  * Hiroshi Ono, "A Runge-Kutta method of order 10 which minimizes truncation error",
+    The Japan Society for Industrial and Applied Mathematics,
+    Vol. 13, No. 1, 2003, pp 35 - 44.''',
+    'a': ['0',
+          '3.357505083417036184129939488963472892525539577157696170900805997207182929518116563365e-1',
+          '5.263563553500217821118595221339767434067222948292617539626688113669112965383197614021e-1',
+          '7.895345330250326731677892832009651151100834422438926309440032170503669448074796421031e-1',
+          '1.852155685265047076970656199437875208987680209449849941608024849050604421517806064228e-1',
+          '2.895345330250326731677892832009651151100834422438926309440032170503669448074796421031e-1',
+          '7.659879027055932401898717206953675811356898851157703878511505293452324618973555436361e-1',
+          '1.08073900957882449010024066175826671901459966598803481187081746587175195860580574108e-1',
+          '3.573842417596774518429245029795604640404982636367873040901247917361510345429002009092e-1',
+          '8.825276619647323464255014869796690751828678442680521196637911779185276585194132570617e-1',
+          '6.426157582403225481570754970204395359595017363632126959098752082638489654570997990908e-1',
+          '1.174723380352676535744985130203309248171321557319478803362088220814723414805867429383e-1',
+          '7.659879027055932401898717206953675811356898851157703878511505293452324618973555436361e-1',
+          '2.895345330250326731677892832009651151100834422438926309440032170503669448074796421031e-1',
+          '5.263563553500217821118595221339767434067222948292617539626688113669112965383197614021e-1',
+          '3.357505083417036184129939488963472892525539577157696170900805997207182929518116563365e-1',
+          '1'],
+    'b': [{},
+          {1: '3.357505083417036184129939488963472892525539577157696170900805997207182929518116563365e-1'},
+          {1: '1.137717040478783056449396184425018992536986324028992632761012508174661576282091865815e-1',
+           2: '4.125846513021434764669199036914748441530236624263624906865675605494451389101105748206e-1'},
+          {1: '1.973836332562581682919473208002412787775208605609731577360008042625917362018699105258e-1',
+           3: '5.921508997687745048758419624007238363325625816829194732080024127877752086056097315774e-1'},
+          {1: '1.360001717992528326665261557210531883399922632350163155393510462488093550801937826726e-1',
+           3: '8.247208052028112223790799775745048180379960003630910417779053602715946236310693542837e-2',
+           4: '-3.325668379302924720736853353471614924502384232634042555633909737090837529152011167815e-2'},
+          {1: '6.546785199481110579756630335868870724165088583024509548938434492848601278421108871818e-2',
+           4: '6.858715620423033993966826640550281985093888681236135859756994188871385539662876478859e-4',
+           5: '2.233808094681792639708262971782213796699231675455239218686431727029937934693022657371e-1'},
+          {1: '2.379439999135994223360182301765245366877534054337310606780367192080205084533052094979e-1',
+           4: '1.28579362649354610268747956030162906893343133315968085057721292458759763500552143393e-1',
+           5: '-7.303763776380165799305971651206183012312272113455920027358381669467410091843571268521e-1',
+           6: '1.129840917780655787515702699609298438785820557711663244851230684625193199127855317597e0'},
+          {1: '6.062780896441720418288517632894493561013839292138719356621888281245740094338544165775e-2',
+           5: '7.888222248692022386398029561573557081956734138939980123787302990185683517283562747179e-2',
+           6: '-3.213213504125939005101626782074483911778772517654658420946839341553511609992151857815e-2',
+           7: '6.960045478044110141748620518910045895419574645630705924582272883960758442810235566394e-4'},
+          {1: '3.10441586543872188908409753881999593035847986835220089359164492112482866700568653692e-2',
+           6: '1.571656120644442171909172634188670081467914525944196307657031602142991040495820182979e-1',
+           7: '1.117638541384084302989687338271505642661663918417037071041752801553969715970722155609e-4',
+           8: '1.690627071867076073308672954386663460258558459670039606814010070304482468516642450265e-1'},
+          {1: '1.430614201422677732943411456202705981582929884075538519224332811759391256045628709601e-2',
+           6: '-3.914725335338579386439799990026912235591541327277623987271673700062264924050571982953e-1',
+           7: '2.848400967322984698670378405298733357388045123736554424201702352859211869408079104816e-1',
+           8: '2.559426777170804941167590501634194225203620020234561863154326261989141389268124787652e-1',
+           9: '7.189112790349845437562504807270404806670261637579475044631123583223249124963937790142e-1'},
+          {1: '1.006668457426631788172270822620227260906121023931371723741841060852730989522549641648e-2',
+           6: '-3.683271809355001194608455001594963737510628435069995678571139196388186857259494651043e-1',
+           7: '8.575502624022299903546939609254513705068159712672738891650679949767497156363396523266e-2',
+           8: '2.633792404483482304677774849110341109669789276529274236259927084605103685123897043694e-1',
+           9: '6.78312074440182335256897830542523898162747260645378130842213441209027727613422289457e-1',
+           10: '-2.657008652719721502394642259236950907890441579413439685514223187307272640162219128045e-2'},
+          {1: '4.212573015701458022875431871453412827491044618882839077863171149554249469159410384126e-2',
+           6: '-1.14073025739498662832358741501332045332754077505475889494504614085885658522072079316e-2',
+           7: '-3.577323583881041642639854910390843838477094752248779125994771974507179107770816673622e-3',
+           8: '8.478085069047181595883795669333443274198965196004767054783136203447118275436721594692e-2',
+           9: '-8.236897403845190534516723638464155343698796681468739910260266595384301707513187151823e-5',
+           10: '7.920174936649160445251535005941104644271462692404428580786438040911208546142377592512e-4',
+           11: '4.840734825985701173601980408776943260994401783442431626214940796417131157064341867563e-3'},
+          {1: '1.866168584194642618748985099397434698267694490527249444362505121514680479505442836574e-1',
+           4: '1.28579362649354610268747956030162906893343133315968085057721292458759763500552143393e-1',
+           5: '-7.303763776380165799305971651206183012312272113455920027358381669467410091843571268521e-1',
+           6: '3.365620746651354218129539461265307620933082614096471567813938850533189571406833598679e-1',
+           7: '3.439152195696137654283681672732838006806635738118480999635325742827372086353048385257e-1',
+           8: '6.116809614283795957124860804122425718138169583157463948158033894717678649195939132136e-1',
+           9: '8.555642651045021202243366091904917631763787495189342130253621820535903092162656518481e-1',
+           10: '-8.913928524866960048456401557668818573165120479499861285407465844438950550960191679472e-2',
+           11: '-4.263317531098201582091498458499961586420389075833366648914840378325891404712881232497e-1',
+           12: '-4.510834231343501965076085217297850477436729165851712257475164429026900343003414799732e-1'},
+          {1: '8.132722174581177948072809791683141502457873136125978954741528825822682868334020231374e-2',
+           4: '6.858715620423033993966826640550281985093888681236135859756994188871385539662876478859e-4',
+           5: '2.233808094681792639708262971782213796699231675455239218686431727029937934693022657371e-1',
+           6: '-3.543152669595614715438074770044728248424634682417120916726014150358797064660842419218e-1',
+           7: '-1.614228337471357340842753214971350545154909424968569413717974406833347832344548170007e-1',
+           8: '-1.267989518319081979614362221100086229540210555088918164010191288219362963604567702803e0',
+           9: '2.482505660965057784745955362600844051763121832196360142449926255422280563592831868088e-1',
+           10: '1.894015072204329862304305088267495664543558350848310970103331708369628629196601961145e-3',
+           11: '-2.367108504250404697299275875477514623653536202773466252372015412173547424356865161882e-2',
+           12: '1.376373544047006195976245547649688122109906103559164922810806152088122419417100442009e0',
+           13: '1.650212091015662542191305948002865244010106371945579174943772453918520072439660689694e-1'},
+          {1: '1.137717040478783056449396184425018992536986324028992632761012508174661576282091865815e-1',
+           2: '4.125846513021434764669199036914748441530236624263624906865675605494451389101105748206e-1',
+           6: '-5.266141894222268880524004361760397955773267936583064281992495328485812564705031059898e-1',
+           7: '4.270299995350464166415042303891280056028480962227556089080302280248036279775533169729e-1',
+           13: '-4.270299995350464166415042303891280056028480962227556089080302280248036279775533169729e-1',
+           14: '5.266141894222268880524004361760397955773267936583064281992495328485812564705031059898e-1'},
+          {1: '3.357505083417036184129939488963472892525539577157696170900805997207182929518116563365e-1',
+           3: '-4.368367083891407610190158064846822677554138099678168504498524386288907219928146135373e-1',
+           15: '4.368367083891407610190158064846822677554138099678168504498524386288907219928146135373e-1'},
+          {1: '3.528400914539065757695374250020526983792042094778706633574048575138598395445375459964e-2',
+           2: '-4.368588562339554617519938616027395568153523718226810275461527253101515442644071737416e-1',
+           3: '-5.185253025751911700815354370658368214653404020923461413204927007907407344767758710502e-1',
+           6: '8.353882146318347708823979907871444293693024897533008980286851134950209556868285481998e-2',
+           7: '3.357324883823615793514438806416832609180686549969009829861766772233990660034579152038e-1',
+           8: '-1.18034685329019767814844084333871937845695241493575411083304379064000504997767805653e-1',
+           9: '-2.028121524999718341813208304021045923675061150408674489110338814798518734278169865166e-1',
+           10: '4.018734442526045674154192467995252408036818247069631361197899796078897150680466096292e-1',
+           11: '6.98280868123848751648159454225480555251054179427199763264092130735609340007512050548e-1',
+           12: '2.745953340127460413630142920026546525788337913278252157685398122819348957290706395825e-1',
+           13: '-8.071051158813288531951186779278104056732084407804403857002131168492985419909905100904e-1',
+           14: '2.98646988330185380748053177415523513559920676932876991417343780443429824085351477877e-1',
+           15: '5.185253025751911700815354370658368214653404020923461413204927007907407344767758710502e-1',
+           16: '4.368588562339554617519938616027395568153523718226810275461527253101515442644071737416e-1'}],
+    'c': {1: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2',
+          2: '-2.192242833052276559865092748735244519392917369308600337268128161888701517706576728499e-2',
+          3: '-5.671077504725897920604914933837429111531190926275992438563327032136105860113421550095e-2',
+          6: '-5.604719764011799410029498525073746312684365781710914454277286135693215339233038348083e-2',
+          7: '1.789297658862876254180602006688963210702341137123745819397993311036789297658862876254e-1',
+          9: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796e-1',
+          10: '1.892374781489234901583064041060123262381623469486258303271944256799821862794952728707e-1',
+          11: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796e-1',
+          12: '1.892374781489234901583064041060123262381623469486258303271944256799821862794952728707e-1',
+          13: '-1.789297658862876254180602006688963210702341137123745819397993311036789297658862876254e-1',
+          14: '5.604719764011799410029498525073746312684365781710914454277286135693215339233038348083e-2',
+          15: '5.671077504725897920604914933837429111531190926275992438563327032136105860113421550095e-2',
+          16: '2.192242833052276559865092748735244519392917369308600337268128161888701517706576728499e-2',
+          17: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2'},
+    }
+
+tableaus['rkh10'] = {
+    'doc': '''\
+  Hairer 10th order method.
+
+### References
+  * Ernst Hairer, "A Runge-Kutta Method of Order 10"
+    January 1978, IMA Journal of Applied Mathematics 21(1)''',
+    'a': ['0',
+          '5.233584004620047139632937023215170497515953383496781610502942213792083195573343614542e-1',
+          '5.265091001416125727329516734775408259523008085442588621240322448552569517961160776999e-1',
+          '7.897636502124188590994275102163112389284512128163882931860483672828854276941741165498e-1',
+          '3.939235701256720143227738119996521367488350094732736567444747389961242969755195414769e-1',
+          '7.666539862535505911932668693560686601417881683220066628197494388337786524595845606945e-1',
+          '2.897636502124188590994275102163112389284512128163882931860483672828854276941741165498e-1',
+          '1.084776892195672933536461100396272126536495082872530661076180009074872219675135232227e-1',
+          '3.573842417596774518429245029795604640404982636367873040901247917361510345429002009092e-1',
+          '8.825276619647323464255014869796690751828678442680521196637911779185276585194132570617e-1',
+          '6.426157582403225481570754970204395359595017363632126959098752082638489654570997990908e-1',
+          '1.174723380352676535744985130203309248171321557319478803362088220814723414805867429383e-1',
+          '7.666539862535505911932668693560686601417881683220066628197494388337786524595845606945e-1',
+          '2.897636502124188590994275102163112389284512128163882931860483672828854276941741165498e-1',
+          '5.265091001416125727329516734775408259523008085442588621240322448552569517961160776999e-1',
+          '5.233584004620047139632937023215170497515953383496781610502942213792083195573343614542e-1',
+          '1'],
+    'b': [{},
+          {1: '5.233584004620047139632937023215170497515953383496781610502942213792083195573343614542e-1'},
+          {1: '2.616697163778127283312402097548997641973627614039327706102102491953717704187699219879e-1',
+           2: '2.64839383763799844401711463722641061754938047140326091513821995659885181377346155712e-1'},
+          {1: '1.974409125531047147748568775540778097321128032040970732965120918207213569235435291375e-1',
+           3: '5.923227376593141443245706326622334291963384096122912198895362754621640707706305874124e-1'},
+          {1: '1.973205486287023067036649485978952117578825584337199991656132317825743833021058860612e-1',
+           3: '2.950833340926721918228255598274359230145509784596048092593866299668586683096812321792e-1',
+           4: '-9.848031259570248420371669642567899802359852742005115168052512275330875463626757676351e-2'},
+          {1: '1.313134173444616536130177999345909470542768366990469474228776563495603985387834598888e-1',
+           4: '1.101544395386396206773696967716892932905881833462590372574439152868807925960672597269e-1',
+           5: '5.251861293704493169028793726497884197969231482767006781394278671973374613247338410788e-1'},
+          {1: '1.342003418463226002727476951680931444018781918996634475042938727232827990267510411664e-1',
+           4: '6.960887032881160802299824047678314828416281106463280160258778625630871045892118300249e-1',
+           5: '2.50497721570339809712551809250980021800682347944567922677261157814518924782133414535e-1',
+           6: '-7.910231164923596311158543989705934101157374376741710930213845258180034007039221691766e-1'},
+          {1: '7.221827418966261942005081845517049770474117717860435538167259617193885317787239789517e-2',
+           5: '-5.833632293645610716380606138930651874161115931850840194371530896953184153028603826158e-2',
+           6: '3.047557668574525220174950070294036092519082552287015783049982467857131629284936232933e-3',
+           7: '9.154818029778625587722640290346919759800040787487009688661073123722307869064222735619e-2'},
+          {1: '3.12550081351661794705012052826347661215092881180084429562242445312997971185711894214e-2',
+           6: '1.091238215424128929294834955207716494619546474783251185719596191189550956073995218558e-4',
+           7: '1.567257586309938356246107465648794708917441337700138495832023584660674808897051732313e-1',
+           8: '1.692943511719750238548830676365254553777828871012866864321262291196648014390164387346e-1'},
+          {1: '1.190660441466861924216884258080925099509546061156163781761478570338134316043617322173e-2',
+           6: '2.83437082024602786025599226698218866542870225212527410159196247948926762009264460026e-1',
+           7: '-4.163121675706282353724276181356300212164192944619403444080980777942870933794472685216e-1',
+           8: '2.64646333949766366821090209108536102705356492632692481299439036677783427357627633931e-1',
+           9: '7.388498091463228097090708267277348761559649602732109347956391853827232193715322584046e-1'},
+          {1: '2.34065736913319789147083837798400784250394685775684541636233986599966237705791696029e-2',
+           6: '9.44931301894936540130025309560561432498251662377734609644880062513095401829593904774e-2',
+           7: '-2.728720559019952606363092580665963250433705067252372208829562550632597611313198545757e-1',
+           8: '2.240220461156057997944315522518131846261124699330640294272458923970695162204120486767e-1',
+           9: '6.043814410751657569719347222576085340011863610739072982875214128849988434755301302413e-1',
+           10: '-3.081537692927938090069243415828207929929122273386332605004724686626579706106108533173e-2'},
+          {1: '4.544377531017616315765389908153096498645890941991961177836633137902353666760633687088e-2',
+           6: '-1.187996671864028586765254219285356343376285990176386474891150929245660355742130860183e-3',
+           7: '1.203565499092261097966188217234362058515446695047694116231895919296441480090125575596e-2',
+           8: '7.512690298764966821627521371565572140275315500656240513504528112598150181393445048666e-2',
+           9: '-1.822092409888012403141186105974838892761579859192182074696828369088959767419077567178e-2',
+           10: '-2.571528540841043468806376221771396205460354181513400383106090430345956162981031278207e-4',
+           11: '4.53207837134746818596527095201150273430374435523846952064829404667274184437570948454e-3'},
+          {1: '1.767137782592772030958798765711993346076326211800572275450227165783753236705910865492e-1',
+           4: '1.101544395386396206773696967716892932905881833462590372574439152868807925960672597269e-1',
+           5: '5.251861293704493169028793726497884197969231482767006781394278671973374613247338410788e-1',
+           6: '-4.716207672801957948798217912152359376250630852495511063738116933651587031904328351457e-1',
+           7: '8.990310498491875266368990071875152922763468480002185650326986125011485318362907529907e-1',
+           8: '-7.467230306916289638599602008088168117750310724922743198498253813592425510843163068237e-1',
+           9: '-1.017101516756146040853186972006065972987027196800421553809421717321497529906933631477e0',
+           10: '1.263508715195988962951307827687648346421985369266969430473204298972536422365713122404e-1',
+           11: '5.660138272355064270682732249907470012763799581315503842554078250210353407723389384909e-1',
+           12: '5.986492052088624001098038724464832066388402270027708075754868643976463442046741430643e-1'},
+          {1: '1.277534947480869822694777006880571541639616513225826576695303067404023367054772185702e-1',
+           4: '6.960887032881160802299824047678314828416281106463280160258778625630871045892118300249e-1',
+           5: '2.50497721570339809712551809250980021800682347944567922677261157814518924782133414535e-1',
+           6: '-7.368246436028416867609246757454535374296880219263938462439002090823944915566264811824e-1',
+           7: '-2.778578777108241826773273374900723250222301109862216853553157201018147214465526588169e-1',
+           8: '-5.997526313598403501296884799197753021563938240370770948150479630779446286262003432092e-1',
+           9: '2.024692338910704693500237585621903123505161701229471467587157451308903694383321235511e-1',
+           10: '5.432036982363849780600684652634443601468189969678666775046718813224989883416104871445e-3',
+           11: '-1.07447247415504792010120691989438133712544466427220502431479893641873325892076956337e-2',
+           12: '6.95168848457023400470059185816414607235762822159711742643483974027319024505211367925e-1',
+           13: '-6.246651130952503394431547116755180508600167575701318270645551618021614799102076408562e-2'},
+          {1: '2.616697163778127283312402097548997641973627614039327706102102491953717704187699219879e-1',
+           2: '2.64839383763799844401711463722641061754938047140326091513821995659885181377346155712e-1',
+           6: '-1.998011270205324791079663580830885049848273745422651189682301346802905866051733476638e-1',
+           7: '-6.510499873052827124921914489683813643155863882516440645794556633240216912803403931627e-1',
+           13: '1.998011270205324791079663580830885049848273745422651189682301346802905866051733476638e-1',
+           14: '6.510499873052827124921914489683813643155863882516440645794556633240216912803403931627e-1'},
+          {1: '5.233584004620047139632937023215170497515953383496781610502942213792083195573343614542e-1',
+           3: '-5.558812136754302060726143105309293455559184141943321053532734480099926250948077261183e-1',
+           15: '5.558812136754302060726143105309293455559184141943321053532734480099926250948077261183e-1'},
+          {1: '5.732079543206559103114261705103983656495216504867462310285994428078568043160654439795e-2',
+           2: '-5.499710763899945608115841896290187887481592249811405834035066676393750158953834290913e-1',
+           3: '-6.499374174008749135116607420010890619711618624173024222960650740195874521599402439688e-1',
+           6: '-1.06166737040175620724001953902315707417252466630743702238977645647718323072329626994e0',
+           7: '-4.04015668980635829426968223421218330826256202391248636522064257787040249155571106248e-2',
+           8: '-1.828302366407607254710272774065261039379052622607190097473388370699414811305446343873e-1',
+           9: '-3.336592706492786845666575661828162687906558601961826440714525336287466822150370633233e-1',
+           10: '3.956485423760567568801345107166015519577734440834727480004748180136901286634710478955e-1',
+           11: '6.950570494599735891002099282005158129027126868215679095299345058137097320818106877162e-1',
+           12: '2.71487376457374858837726305853922094526382969180471461852905253029898214673975455295e-1',
+           13: '6.071810560414041202873774349794680164722661545496003750296400378855628528787164400954e-1',
+           14: '5.918636248229842840838104081530739675596239893196764223449596939309288102548549028752e-1',
+           15: '6.499374174008749135116607420010890619711618624173024222960650740195874521599402439688e-1',
+           16: '5.499710763899945608115841896290187887481592249811405834035066676393750158953834290913e-1'}],
+    'c': {1: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2',
+          2: '-3.846153846153846153846153846153846153846153846153846153846153846153846153846153846154e-2',
+          3: '-9.090909090909090909090909090909090909090909090909090909090909090909090909090909090909e-2',
+          6: '-1.348314606741573033707865168539325842696629213483146067415730337078651685393258426966e-1',
+          7: '-1.111111111111111111111111111111111111111111111111111111111111111111111111111111111111e-1',
+          9: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796e-1',
+          10: '1.892374781489234901583064041060123262381623469486258303271944256799821862794952728707e-1',
+          11: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796e-1',
+          12: '1.892374781489234901583064041060123262381623469486258303271944256799821862794952728707e-1',
+          13: '1.348314606741573033707865168539325842696629213483146067415730337078651685393258426966e-1',
+          14: '1.111111111111111111111111111111111111111111111111111111111111111111111111111111111111e-1',
+          15: '9.090909090909090909090909090909090909090909090909090909090909090909090909090909090909e-2',
+          16: '3.846153846153846153846153846153846153846153846153846153846153846153846153846153846154e-2',
+          17: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2'},
+    }
+
+#***************************************************************************************************
+# variable-step methods
+#***************************************************************************************************
+
+tableaus['rkbs32'] = {
+    'doc': '''\
+  Bogacki-Shampine 3(2) method
+
+### Reference
+  * Bogacki, P and Shampine, L. F. (1989),
+    "A 3(2) pair of Runge-Kutta formulas",
+    Applied Mathematics Letters, 2 (4): 321-325
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0', '1/2', '3/4', '1'],
+    'b': [{},
+          {1: '1/2'},
+          {2: '3/4'},
+          {1: '2/9',
+           2: '1/3',
+           3: '4/9'}],
+    'c': {1: '2/9',
+          2: '1/3',
+          3: '4/9'},
+    'd': {1: '7/24',
+          2: '1/4',
+          3: '1/3',
+          4: '1/8'},
+    }
+
+tableaus['rkf45'] = {
+    'doc': '''\
+  Fehlberg's 4(5) method.
+
+  This is Table III, RK4(5), Formula 2 in the reference.
+
+### References
+  * E. Fehlberg, "Low-order classical Runge-Kutta formulas with stepsize control and
+    their application to some heat transfer problems", NASA Technical Report R-315,
+    July 1, 1969.''',
+    'a': ['0', '1/4', '3/8', '12/13', '1', '1/2'],
+    'b': [{},
+          {1: '1/4'},
+          {1: '3/32',
+           2: '9/32'},
+          {1: '1932/2197',
+           2: '-7200/2197',
+           3: '7296/2197'},
+          {1: '439/216',
+           2: '-8',
+           3: '3680/513',
+           4: '-845/4104'},
+          {1: '-8/27',
+           2: '2',
+           3: '-3544/2565',
+           4: '1859/4104',
+           5: '-11/40'}],
+    'c': {1: '25/216',
+          3: '1408/2565',
+          4: '2197/4104',
+          5: '-1/5'},
+    'd': {1: '61/540',
+          3: '7424/12825',
+          4: '63713/112860',
+          5: '-11/50',
+          6: '-2/55'},
+    }
+
+tableaus['rkck54'] = {
+    'doc': '''\
+  Runge Kutta Cash-Karp.
+
+### Reference
+  * J. R. Cash, A. H. Karp. "A variable order Runge-Kutta method
+    for initial value problems with rapidly varying right-hand sides",
+    ACM Transactions on Mathematical Software 16: 201-222, 1990''',
+    'a': ['0', '1/5', '3/10', '3/5', '1', '7/8'],
+    'b': [{},
+          {1: '1/5'},
+          {1: '3/40',
+           2: '9/40'},
+          {1: '3/10',
+           2: '-9/10',
+           3: '6/5'},
+          {1: '-11/54',
+           2: '5/2',
+           3: '-70/27',
+           4: '35/27'},
+          {1: '1631/55296',
+           2: '175/512',
+           3: '575/13824',
+           4: '44275/110592',
+           5: '253/4096'}],
+    'c': {1: '37/378',
+          3: '250/621',
+          4: '125/594',
+          6: '512/1771'},
+    'd': {1: '2825/27648',
+          3: '18575/48384',
+          4: '13525/55296',
+          5: '277/14336',
+          6: '1/4'},
+    }
+
+tableaus['rkdp54'] = {
+    'doc': '''\
+   Dormand-Prince 5(4) method (RKDP or DOPRI)
+
+### Reference
+  * Dormand, J. R.; Prince, P. J. (1980), "A family of embedded Runge-Kutta formulae",
+    Journal of Computational and Applied Mathematics, 6 (1): 19-26
+  * https://en.wikipedia.org/wiki/Dormand-Prince_method
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0', '1/5', '3/10', '4/5', '8/9', '1', '1'],
+    'b': [{},
+          {1: '1/5'},
+          {1: '3/40',
+           2: '9/40'},
+          {1: '44/45',
+           2: '-56/15',
+           3: '32/9'},
+          {1: '19372/6561',
+           2: '-25360/2187',
+           3: '64448/6561',
+           4: '-212/729'},
+          {1: '9017/3168',
+           2: '-355/33',
+           3: '46732/5247',
+           4: '49/176',
+           5: '-5103/18656'},
+          {1: '35/384',
+           3: '500/1113',
+           4: '125/192',
+           5: '-2187/6784',
+           6: '11/84'}],
+    'c': {1: '35/384',
+          3: '500/1113',
+          4: '125/192',
+          5: '-2187/6784',
+          6: '11/84'},
+    'd': {1: '5179/57600',
+          3: '7571/16695',
+          4: '393/640',
+          5: '-92097/339200',
+          6: '187/2100',
+          7: '1/40'},
+    'dense': {'order': 4,
+              'b': {1: ['1', '-8048581381/2820520608', '8663915743/2820520608', '-12715105075/11282082432'],
+                    3: ['0', '131558114200/32700410799', '-68118460800/10900136933', '87487479700/32700410799'],
+                    4: ['0', '-1754552775/470086768', '14199869525/1410260304', '-10690763975/1880347072'],
+                    5: ['0', '127303824393/49829197408', '-318862633887/49829197408', '701980252875/199316789632'],
+                    6: ['0', '-282668133/205662961', '2019193451/616988883', '-1453857185/822651844'],
+                    7: ['0', '40617522/29380423', '-110615467/29380423', '69997945/29380423']}},
+    }
+
+tableaus['rkt54'] = {
+    'doc': '''\
+  Tsitouras 5(4) method
+
+### Reference
+  * Ch. Tsitouras, "Runge-Kutta pairs of order 5(4) satisfying only the
+    first column simplifying assumption", Computers & Mathematics with
+    Applications, Vol. 62, No. 2, pp. 770 - 775, 2011.
+  * [Higher-precision coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK5/RKcoeff5n_1.pdf)''',
+    'a': ['0', '161/1000', '327/1000', '9/10',
+          '9.800255409045096857298102862870245954942137979563024768854764293221195950761080302604e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '161/1000'},
+          {1: '-8.4806554923569885444268742502307746751211773934303915373692342452941929761641411569e-3',
+           2: '3.354806554923569885444268742502307746751211773934303915373692342452941929761641411569e-1'},
+          {1: '2.897153057105493432130432594192938764924887287701866490314866693455023795137503079289e0',
+           2: '-6.359448489975074843148159912383825625952700647415626703305928850207288721235210244366e0',
+           3: '4.362295432869581411017727318190886861027813359713760212991062156752264926097707165077e0'},
+          {1: '5.32586482843925660442887792084051131783647625309704010120236039772798164883560769179375e0',
+           2: '-1.174888356406282787774717033978577296188744178259862899288666928009020615663593781589e1',
+           3: '7.495539342889836208304604784564358155658679161518186721010132816213648793440552049753e0',
+           4: '-9.249506636175524925650207933207191611349983406029535244034750452930469056411389539635e-2'},
+          {1: '5.86145544294642002865925148698264789039433766616481443481815723905250733977071167974441e0',
+           2: '-1.292096931784710929170611868178335939541780751955743459166312250439928519268343184452e1',
+           3: '8.159367898576158643180400794539253485181918321135053305748355423955009222648673734986e0',
+           4: '-7.158497328140099722453054252582973869127213147363544882721139659546372402303777878835e-2',
+           5: '-2.826905039406838290900305721271224146717633626879770007617876201276764571291579142206e-2'},
+          {1: '9.646076681806522951816731316512876333711995238157997181903319145764851595234062815396e-2',
+           2: '1/100',
+           3: '4.798896504144995747752495322905965199130404621990332488332634944254542060153074523509e-1',
+           4: '1.379008574103741893192274821856872770756462643091360525934940067397245698027561293331e0',
+           5: '-3.290069515436080679901047585711363850115683290894936158531296799594813811049925401677e0',
+           6: '2.324710524099773982415355918398765796109060233222962411944060046314465391054716027841e0'}],
+    'c': {1: '9.646076681806522951816731316512876333711995238157997181903319145764851595234062815396e-2',
+          2: '1/100',
+          3: '4.798896504144995747752495322905965199130404621990332488332634944254542060153074523509e-1',
+          4: '1.379008574103741893192274821856872770756462643091360525934940067397245698027561293331e0',
+          5: '-3.290069515436080679901047585711363850115683290894936158531296799594813811049925401677e0',
+          6: '2.324710524099773982415355918398765796109060233222962411944060046314465391054716027841e0'},
+    'd': {1: '9.468075576583945807478876255758922856117527357724631226139574065785592789071067303271e-2',
+          2: '9.18356554034325309677636393664531375981374624098409523890593953292295524725360868727e-3',
+          3: '4.877705284247615707855642599631228241516691959761363774365216240304071651579571959813e-1',
+          4: '1.234297566930478985655109673884237654035539930748192848315425833500484878378061439761e0',
+          5: '-2.707712349983525454881109975059321670689605166938197378763992255714444407154902012702e0',
+          6: '1.866628418170587035753719399566211498666255505244122593996591602841258328965767580089e0',
+          7: '1/66'},
+    'dense': {'order': 4,
+              'b': {1: ['1', '-2.631775075534331200171921633794598887893', '2.649393218340923318416512520249712829134', '-0.9211573759885268887264235732899851779042'],
+                    2: ['0', '0.1922126097140925164739873681860180648328', '-0.3444252194281850329479747363720361296656', '0.1622126097140925164739873681860180648328'],
+                    3: ['0', '3.346180158012121042138119974053079580015', '-4.772801714366243785175241818943773080377', '1.906511206768622317812371377181290020276'],
+                    4: ['0', '-1.685365390766690365801200440338336526091', '8.886765077948348304371500168104164135208', '-5.822391113077916045378024905908954838361'],
+                    5: ['0', '-5.653920876724929799166944417810115701088', '-1.852436308294463121270301507225223998287', '4.216287669583312240536198339323975849259'],
+                    6: ['0', '6.055670810318418545467204778693285606146', '-2.812499524237741161272985883791508027856', '-0.9184607619809034017788629765030117821813'],
+                    7: ['0', '0.3769977649813192610607543710106678640785', '-1.753995529962638522121508742021335728157', '1.376997764981319261060754371010667864079']}},
+    }
+
+tableaus['rks54'] = {
+    'doc': '''\
+  Stepanov 5(4) method.
+
+### References
+  * Misha Stepanov, Calcolo volume 59, Article number: 41 (2022),
+    [Embedded (4,5) pairs of explicit 7-stage Runge-Kutta methods with FSAL property](https://link.springer.com/article/10.1007/s10092-022-00486-1).
+    [arxiv](https://arxiv.org/pdf/2108.12590.pdf) (see Table 4) Note that there is also
+    a 4th order continuously differential interpolant given.''',
+    'a': ['0', '1/5', '21/65', '9/10', '39/40', '1', '1'],
+    'b': [{},
+          {1: '1/5'},
+          {1: '21/338',
+           2: '441/1690'},
+          {1: '639/392',
+           2: '-729/140',
+           3: '1755/392'},
+          {1: '4878991/1693440',
+           2: '-16601/1792',
+           3: '210067/28224',
+           4: '-1469/17280'},
+          {1: '13759919/4230954',
+           2: '-2995/287',
+           3: '507312091/61294590',
+           4: '-22/405',
+           5: '-7040/180687'},
+          {1: '1441/14742',
+           3: '114244/234927',
+           4: '118/81',
+           5: '-12800/4407',
+           6: '41/22'}],
+    'c': {1: '1441/14742',
+          3: '114244/234927',
+          4: '118/81',
+          5: '-12800/4407',
+          6: '41/22'},
+    'd': {1: '115/1134',
+          3: '2225561/4698540',
+          4: '698/405',
+          5: '-1280/339',
+          6: '131979/52712',
+          7: '-127/4792'},
+    }
+
+tableaus['rkpp54'] = {
+    'doc': '''\
+  Papakostas-PapaGeorgiou 5(4) method (more stable, higher error)
+
+### Reference
+  * S.N. Papakostas and G. PapaGeorgiou, "A Family of Fifth-order Runge-Kutta Pairs",
+    Mathematics of Computation, Vol. 65, No. 215 (Jul., 1996), pp. 1165-1181
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0',
+          '2.03174603174603174603174603174603174603174603174603174603174603174603174603174603175e-1',
+          '3.01837270341207349081364829396325459317585301837270341207349081364829396325459317585e-1',
+          '8.1497326203208556149732620320855614973262032085561497326203208556149732620320855615e-1',
+          '8.92857142857142857142857142857142857142857142857142857142857142857142857142857142857e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '2.03174603174603174603174603174603174603174603174603174603174603174603174603174603175e-1'},
+          {1: '7.76317438051542769752206171079008824684316035298737264141194949056564779796226259119e-2',
+           2: '2.24205526536053072106144212288424576849153698307396614793229586459172918345836691673e-1'},
+          {1: '9.97054225910649851955403847106996156261144080556828071531226332913609633807524002826e-1',
+           2: '-3.9229583098359766207115693643000730264502583412156151006542354260709699970151262085e0',
+           3: '3.7408773459574123302534917204016330199217345815144020023850411787188576894108107618e0'},
+          {1: '2.41107195213820140711520163970784555943075679078314370129890823084996830515582884769e0',
+           2: '-9.6949301103878662103154820500485383234086722205716227648448127788897312407254087039e0',
+           3: '8.37096577602619810632388905477462929171641908259741309319801335095185921382851168188e0',
+           4: '-1.942504749193904459807515015767936705956465099517911725092516600549534211160746828e-1'},
+          {1: '2.7168057625061816856204273261884464561096956120345802906312192818356407160117670851e0',
+           2: '-1.054683603529310549314044778147157008430903760195597102588487606075745996500813719e1',
+           3: '8.82438454669452608734254952418112316791646628404483378649096846259826474086840654822e0',
+           4: '3.30231934937991900184188201559235426225444020547394478857972406538849522552348656011e-1',
+           5: '-3.245862088455941800067172704572349659425683146708375300952840902152950144243850993e-1'},
+          {1: '9.15102514359618091216858762219939898816995701624253490052873825554414393852942295257e-2',
+           3: '4.53088687963682563226735078441923499983686103419218207034508391590507417156754767246e-1',
+           4: '7.70212354683768742558003248195356972937967314339813992394948819785937766391608532599e-1',
+           5: '-4.6993115056469338687729550442725993708636301781314244468307254289871602785250570955e-1',
+           6: '1.55119856481280271970871301567985474283010029891684896248327948966829404918848180181e-1'}],
+    'c': {1: '9.15102514359618091216858762219939898816995701624253490052873825554414393852942295257e-2',
+          3: '4.53088687963682563226735078441923499983686103419218207034508391590507417156754767246e-1',
+          4: '7.70212354683768742558003248195356972937967314339813992394948819785937766391608532599e-1',
+          5: '-4.6993115056469338687729550442725993708636301781314244468307254289871602785250570955e-1',
+          6: '1.55119856481280271970871301567985474283010029891684896248327948966829404918848180181e-1'},
+    'd': {1: '9.00540754825040114941655607289341515504490822369589853929344566160995864634775952099e-2',
+          3: '4.5809304135508144229113593231712032224943530296667536352623564300761091021527039768e-1',
+          4: '7.17141736822002520962978129215068133609337518199443217706780208321061003994969882396e-1',
+          5: '-3.9730095904319871050513227050199810426175540655366523944169265633781699285936171784e-1',
+          6: '1.0820258157408692623304312443135168732872397934106386329193282458352168266183431874e-1',
+          7: '2.38095238095238095238095238095238095238095238095238095238095238095238095238095238095e-2'},
+    }
+
+tableaus['rkpp54b'] = {
+    'doc': '''\
+  Papakostas-PapaGeorgiou 5(4) method (less stable, lower error).
+
+### Reference
+  * S.N. Papakostas and G. PapaGeorgiou, "A Family of Fifth-order Runge-Kutta Pairs",
+    Mathematics of Computation, Vol. 65, No. 215 (Jul., 1996), pp. 1165-1181
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0',
+          '2.201257861635220125786163522012578616352201257861635220125786163522012578616352201257e-1',
+          '3.206106870229007633587786259541984732824427480916030534351145038167938931297709923664e-1',
+          '9.160839160839160839160839160839160839160839160839160839160839160839160839160839160839e-1',
+          '9.545454545454545454545454545454545454545454545454545454545454545454545454545454545454e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '2.201257861635220125786163522012578616352201257861635220125786163522012578616352201257e-1'},
+          {1: '8.712778975584173416467571819824019579278596818367228017015325447235009614824310937591e-2',
+           2: '2.334828972670590291941029077559582774896567799079307732649612493444437969815278829905e-1'},
+          {1: '1.229131120244552267075198689039393789189448076016053493121879281174531378872492304514e0',
+           2: '-5.174619722997219626464507457640199024688660926548912688647080129723360618339765067163e0',
+           3: '4.861572518836583443305392684684721319415296766616775279441284764632745323383356678732e0'},
+          {1: '1.635985585148686070813241441537203183216255340359063210526474302100593166648405715598e0',
+           2: '-6.911673476406501672554353133581688231701838702998878887272831441157207088140814883585e0',
+           3: '6.264598153851822604079697377077162805912462110097874626859336947971237445955455470077e0',
+           4: '-3.436480804855245688404023048722321197233329291260440465843435436916897900850084754553e-2'},
+          {1: '2.080199455181079060589945391266072650640389894799843423576531143602673095720452243744e0',
+           2: '-8.741042793278798222268721650787838365080091632936417117311519288907488660315135346032e0',
+           3: '7.705947570635899833548328481096646034173724896740120966754373004394344077008935321798e0',
+           4: '8.908088473605147947645976479787347297467362259887092033560387203210318720083482332807e-2',
+           5: '-1.341851172742321513460119863727537927086967812024181933549887311216316996150870428391e-1'},
+          {1: '9.66036881249531195005567960856946680283648658784972852584630120071777650839810054641e-2',
+           3: '4.847050840514515173851124515232483753229089551347247274647212546244695209679216658037e-1',
+           4: '2.985721504066570633782817413202582623066368759430782759246016403146502612390979295903e0',
+           5: '-3.882058366130615720106688908002536902372698760219285670845605164160172370352994326721e0',
+           6: '1.31502808988764044943820224719101123595505617977528089887640449438202247191011235955e0'}],
+    'c': {1: '9.66036881249531195005567960856946680283648658784972852584630120071777650839810054641e-2',
+          3: '4.847050840514515173851124515232483753229089551347247274647212546244695209679216658037e-1',
+          4: '2.985721504066570633782817413202582623066368759430782759246016403146502612390979295903e0',
+          5: '-3.882058366130615720106688908002536902372698760219285670845605164160172370352994326721e0',
+          6: '1.31502808988764044943820224719101123595505617977528089887640449438202247191011235955e0'},
+    'd': {1: '9.532926220038256951865552620720509864047974971891244940167035171716827175894410248606e-2',
+          3: '4.890503958633595206242721536021852509608016393506331933941960604717211861520491115111e-1',
+          4: '2.782787369422591128285131424607412688536477162495912788909265685055380447336451073683e0',
+          5: '-3.544320847545574336397313295146726421831558091536665262636276708453748484122524958198e0',
+          6: '1.168225248630669689397825619301351955122370968542635402359716039780907150303652099088e0',
+          7: '8.928571428571428571428571428571428571428571428571428571428571428571428571428571428571e-3'},
+    }
+
+tableaus['rkbs54'] = {
+    'doc': '''\
+  Bogacki & Shampine 5(4)
+
+### Reference
+  * P. Bogacki & L.F. Shampine, "An efficient Runge-Kutta (4,5) pair"
+    Computers & Mathematics with Applications,
+    Volume 32, Issue 6, September 1996, Pages 15-28
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK5/RKcoeff5p_1.pdf)
+  * This pair is in [rksuite](https://github.com/jacobwilliams/rksuite) (`METHD = 2`)''',
+    'a': ['0', '1/6', '2/9', '3/7', '2/3', '3/4', '1', '1'],
+    'b': [{},
+          {1: '1/6'},
+          {1: '2/27',
+           2: '4/27'},
+          {1: '183/1372',
+           2: '-162/343',
+           3: '1053/1372'},
+          {1: '68/297',
+           2: '-4/11',
+           3: '42/143',
+           4: '1960/3861'},
+          {1: '597/22528',
+           2: '81/352',
+           3: '63099/585728',
+           4: '58653/366080',
+           5: '4617/20480'},
+          {1: '174197/959244',
+           2: '-30942/79937',
+           3: '8152137/19744439',
+           4: '666106/1039181',
+           5: '-29421/29068',
+           6: '482048/414219'},
+          {1: '587/8064',
+           3: '4440339/15491840',
+           4: '24353/124800',
+           5: '387/44800',
+           6: '2152/5985',
+           7: '7267/94080'}],
+    'c': {1: '587/8064',
+          3: '4440339/15491840',
+          4: '24353/124800',
+          5: '387/44800',
+          6: '2152/5985',
+          7: '7267/94080'},
+    'd': {1: '2479/34992',
+          3: '123/416',
+          4: '612941/3411720',
+          5: '43/1440',
+          6: '2272/6561',
+          7: '79937/1113912',
+          8: '3293/556956'},
+    }
+
+tableaus['rkss54'] = {
+    'doc': '''\
+  Sharp & Smart 5(4) method.
+
+### Reference
+  * P.W. Sharp and E. Smart, "Explicit Runge-Kutta Pairs with One More Derivative Evaluation than the Minimum",
+    Siam Journal of Scientific Computing, Vol. 14, No. 2, pages. 338-348, March 1993.''',
+    'a': ['0', '16/105', '8/35', '9/20', '2/3', '7/9', '1'],
+    'b': [{},
+          {1: '16/105'},
+          {1: '2/35',
+           2: '6/35'},
+          {1: '8793/40960',
+           2: '-5103/8192',
+           3: '17577/20480'},
+          {1: '347/1458',
+           2: '-7/20',
+           3: '3395/10044',
+           4: '49792/112995'},
+          {1: '-1223224109959/9199771214400',
+           2: '1234787701/2523942720',
+           3: '568994101921/3168810084960',
+           4: '-105209683888/891227836395',
+           5: '9/25'},
+          {1: '2462504862877/8306031988800',
+           2: '-123991/287040',
+           3: '106522578491/408709510560',
+           4: '590616498832/804646848915',
+           5: '-319138726/534081275',
+           6: '52758/71449'}],
+    'c': {1: '1093/15120',
+          3: '60025/190992',
+          4: '3200/20709',
+          5: '1611/11960',
+          6: '712233/2857960',
+          7: '3/40'},
+    'd': {1: '84018211/991368000',
+          3: '92098979/357791680',
+          4: '17606944/67891005',
+          5: '3142101/235253200',
+          6: '22004596809/70270091500',
+          7: '9/125'},
+    }
+
+tableaus['rkdp65'] = {
+    'doc': '''\
+  Dormand-Prince 6(5) method.
+  This is `RK6(5)8M` from the reference.
+
+### Reference
+  * P.J. Prince, J.R. Dormand, "High order embedded Runge-Kutta formulae",
+    Journal of Computational and Applied Mathematics,
+    Volume 7, Issue 1, March 1981, Pages 67-75.''',
+    'a': ['0', '1/10', '2/9', '3/7', '3/5', '4/5', '1', '1'],
+    'b': [{},
+          {1: '1/10'},
+          {1: '-2/81',
+           2: '20/81'},
+          {1: '615/1372',
+           2: '-270/343',
+           3: '1053/1372'},
+          {1: '3243/5500',
+           2: '-54/55',
+           3: '50949/71500',
+           4: '4998/17875'},
+          {1: '-26492/37125',
+           2: '72/55',
+           3: '2808/23375',
+           4: '-24206/37125',
+           5: '338/459'},
+          {1: '5561/2376',
+           2: '-35/11',
+           3: '-24117/31603',
+           4: '899983/200772',
+           5: '-5225/1836',
+           6: '3925/4056'},
+          {1: '465467/266112',
+           2: '-2945/1232',
+           3: '-5610201/14158144',
+           4: '10513573/3212352',
+           5: '-424325/205632',
+           6: '376225/454272'}],
+    'c': {1: '61/864',
+          3: '98415/321776',
+          4: '16807/146016',
+          5: '1375/7344',
+          6: '1375/5408',
+          7: '-37/1120',
+          8: '1/10'},
+    'd': {1: '821/10800',
+          3: '19683/71825',
+          4: '175273/912600',
+          5: '395/3672',
+          6: '785/2704',
+          7: '3/50'},
+    }
+
+tableaus['rkc65'] = {
+    'doc': '''\
+  Calvo 6(5) method.
+
+### Reference
+  * M. Calvo, J.I. Montijano, L. Randez,
+    "A new embedded pair of Runge-Kutta formulas of orders 5 and 6",
+    Computers & Mathematics with Applications, Volume 20, Issue 1, 1990, Pages 15-24''',
+    'a': ['0', '2/15', '1/5', '3/10', '14/25', '19/25', '35226607/35688279', '1', '1'],
+    'b': [{},
+          {1: '2/15'},
+          {1: '1/20',
+           2: '3/20'},
+          {1: '3/40',
+           3: '9/40'},
+          {1: '86727015/196851553',
+           2: '-60129073/52624712',
+           3: '957436434/1378352377',
+           4: '83886832/147842441'},
+          {1: '-86860849/45628967',
+           2: '111022885/25716487',
+           3: '108046682/101167669',
+           4: '-141756746/36005461',
+           5: '73139862/60170633'},
+          {1: '77759591/16096467',
+           2: '-49252809/6452555',
+           3: '-381680111/51572984',
+           4: '879269579/66788831',
+           5: '-90453121/33722162',
+           6: '111179552/157155827'},
+          {1: '237564263/39280295',
+           2: '-100523239/10677940',
+           3: '-265574846/27330247',
+           4: '317978411/18988713',
+           5: '-124494385/35453627',
+           6: '86822444/100138635',
+           7: '-12873523/724232625'},
+          {1: '17572349/289262523',
+           3: '57513011/201864250',
+           4: '15587306/354501571',
+           5: '71783021/234982865',
+           6: '29672000/180480167',
+           7: '65567621/127060952',
+           8: '-79074570/210557597'}],
+    'c': {1: '17572349/289262523',
+          3: '57513011/201864250',
+          4: '15587306/354501571',
+          5: '71783021/234982865',
+          6: '29672000/180480167',
+          7: '65567621/127060952',
+          8: '-79074570/210557597'},
+    'd': {1: '15231665/510830334',
+          3: '59452991/116050448',
+          4: '-28398517/122437738',
+          5: '56673824/137010559',
+          6: '68003849/426673583',
+          7: '7097631/37564021',
+          8: '-71226429/583093742',
+          9: '1/20'},
+    }
+
+tableaus['rktp64'] = {
+    'doc': '''\
+  Tsitouras & Papakostas NEW6(4) Runge-Kutta method.
+
+### Reference
+  * C. Tsitouras and S. N. Papakostas, "Cheap Error Estimation for Runge-Kutta
+    methods", SIAM J. Sci. Comput. 20(1999) 2067-2088.
+  * [Rational coefficients](http://users.uoa.gr/~tsitourasc/publications.html)
+    (see [rktp64.m](http://users.uoa.gr/~tsitourasc/rktp64.m))''',
+    'a': ['0', '4/27', '2/9', '3/7', '11/16', '10/13', '1'],
+    'b': [{},
+          {1: '4/27'},
+          {1: '1/18',
+           2: '1/6'},
+          {1: '66/343',
+           2: '-729/1372',
+           3: '1053/1372'},
+          {1: '13339/49152',
+           2: '-4617/16384',
+           3: '5427/53248',
+           4: '95207/159744'},
+          {1: '-6935/57122',
+           2: '23085/48334',
+           3: '33363360/273642941',
+           4: '972160/118442467',
+           5: '172687360/610434253'},
+          {1: '611/1891',
+           2: '-4617/7564',
+           3: '6041007/13176488',
+           4: '12708836/22100117',
+           5: '-35840000/62461621',
+           6: '6597591/7972456'}],
+    'c': {1: '131/1800',
+          3: '1121931/3902080',
+          4: '319333/1682928',
+          5: '262144/2477325',
+          6: '4084223/15177600',
+          7: '1891/25200'},
+    'd': {1: '2694253/26100360',
+          3: '83647323/535804360',
+          4: '691202281/1789061040',
+          5: '-1275547648/10565208225',
+          6: '2/5',
+          7: '1891/25200'},
+    }
+
+tableaus['rkv65e'] = {
+    'doc': '''\
+  Verner's "most efficient" Runge-Kutta (9,6(5)) pair.
+
+### Reference
+  * J.H. Verner, "Strategies for deriving new explicit Runge-Kutta pairs",
+    Annals of Num. Math 1 1994, 225-244.
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Rational coefficients](https://www.sfu.ca/~jverner/RKV65.IIIXb.Efficient.00000144617.081204.RATOnWeb)
+  * [Floating point coefficients](https://www.sfu.ca/~jverner/RKV65.IIIXb.Efficient.00000144617.081204.CoeffsOnlyFLOAT)
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0', '3/50', '1439/15000', '1439/10000', '4973/10000', '389/400', '1999/2000',
+          '1', '1'],
+    'b': [{},
+          {1: '3/50'},
+          {1: '1.923996296296296296296296296296296296296e-2',
+           2: '7.669337037037037037037037037037037037037e-2'},
+          {1: '1439/40000',
+           3: '4317/40000'},
+          {1: '1.318683415233148260919747276431735612861e0',
+           3: '-5.042058063628562225427761634715637693344e0',
+           4: '4.220674648395413964508014358283902080483e0'},
+          {1: '-4.187259166432751461803757780644346812905e1',
+           3: '1.594325621631374917700365669070346830453e2',
+           4: '-1.221192135650100309202516203389242140663e2',
+           5: '5.531743066200053768252631238332999150076e0'},
+          {1: '-5.443015693531650433250642051294142461271e1',
+           3: '2.070672513650184644273657173866509835987e2',
+           4: '-1.586108137845899991828742424365058599469e2',
+           5: '6.991816585950242321992597280791793907096e0',
+           6: '-1.859723106220323397765171799549294623692e-2'},
+          {1: '-5.466374178728197680241215648050386959351e1',
+           3: '2.079528062553893734515824816699834244238e2',
+           4: '-1.592889574744995071508959805871426654216e2',
+           5: '7.018743740796944434698170760964252490817e0',
+           6: '-1.833878590504572306472782005141738268361e-2',
+           7: '-5.11948499788209907787543249724516839584e-4'},
+          {1: '3.43895786835703600927882012472832238652e-2',
+           4: '2.582624555633503404659558098586120858767e-1',
+           5: '4.209371189673537150642551514069801967032e-1',
+           6: '4.405396469669310170148836816197095664891e0',
+           7: '-1.764831190242986576151740942499002125029e2',
+           8: '1.723641334014150730294022582711902413315e2'}],
+    'c': {1: '3.43895786835703600927882012472832238652e-2',
+          4: '2.582624555633503404659558098586120858767e-1',
+          5: '4.209371189673537150642551514069801967032e-1',
+          6: '4.405396469669310170148836816197095664891e0',
+          7: '-1.764831190242986576151740942499002125029e2',
+          8: '1.723641334014150730294022582711902413315e2'},
+    'd': {1: '4.909967648382489730906854927971225836479e-2',
+          4: '2.251112229516524153401395320539875329485e-1',
+          5: '4.694682253029562039431948525047387412553e-1',
+          6: '8.065792249988867707634161808995217981443e-1',
+          8: '-6.071194891777959797672951465256217122488e-1',
+          9: '5.686113944047569241147603178766138153594e-2'},
+    'dense': {'order': 4,
+              'b': {1: ['1', '-4.929448794014445409103713007888782779058', '6.996455902763172258578578820766698453578', '-3.032617530065156489382077611630632450654'],
+                    4: ['0', '5.622405210818759022334819803751644672569', '-10.21176059938411668280581636806884100163', '4.847617844128708000936952374175808414939'],
+                    5: ['0', '-0.7746610518793633194915920733374925378823', '3.233070579628141499240204752302905948924', '-2.037472408781424464684357527558433192752'],
+                    6: ['0', '6.070313334524038923503436703606048316688', '5.480959209629162833588473857576286026187', '-7.145876074483891586943073744985238677985'],
+                    7: ['0', '-322.8076257742986392100948003708333528963', '-60.31722454859735204050677625793414421903', '206.6417312985973336354274823788672846124'],
+                    8: ['0', '316.800971432971306029525596250142291833', '55.85459073971768005855784058447638157397', '-200.291428771273913058681178563428432097'],
+                    9: ['0', '0.01804564187834396332625269455963503256195', '-1.036091283756687926652505389119270065124', '1.018045641878343963326252694559635032562']}},
+    }
+
+tableaus['rkv65r'] = {
+    'doc': '''\
+  Verner's "most robust" Runge-Kutta (9,6(5)) pair.
+
+### Reference
+  * J.H. Verner, "Strategies for deriving new explicit Runge-Kutta pairs",
+    Annals of Num. Math 1 1994, 225-244.
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Rational coefficients](https://www.sfu.ca/~jverner/RKV65.IIIXb.Robust.00010102836.081204.CoeffsOnlyRAT)
+  * [Floating point coefficients](https://www.sfu.ca/~jverner/RKV65.IIIXb.Robust.00010102836.081204.CoeffsOnlyFLOAT)
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0', '9/50', '1.666666666666666666666666666666666666667e-1', '1/4', '53/100',
+          '3/5', '4/5', '1', '1'],
+    'b': [{},
+          {1: '9/50'},
+          {1: '8.950617283950617283950617283950617283951e-2',
+           2: '7.716049382716049382716049382716049382716e-2'},
+          {1: '1/16',
+           3: '3/16'},
+          {1: '79129/250000',
+           3: '-261237/250000',
+           4: '19663/15625'},
+          {1: '2.723261273648562625722506556667430550251e-1',
+           3: '-8.251336032388663967611336032388663967611e-1',
+           4: '1.048091767881241565452091767881241565452e0',
+           5: '1.04715707992768568736791179690881776284e-1'},
+          {1: '-1.66994185997165143143296072789617973332e-1',
+           3: '6.317085020242914979757085020242914979757e-1',
+           4: '1.746104455277387608214675883848816179643e-1',
+           5: '-1.066535645908606612252519473401868067778e0',
+           6: '1.22721088435374149659863945578231292517e0'},
+          {1: '3.642375168690958164642375168690958164642e-1',
+           3: '-2.04048582995951417004048582995951417004e-1',
+           4: '-3.488373781606864313631230924464007170774e-1',
+           5: '3.261932303285686744333360874714258172905e0',
+           6: '-2.755102040816326530612244897959183673469e0',
+           7: '6.818181818181818181818181818181818181818e-1'},
+          {1: '7.638888888888888888888888888888888888889e-2',
+           4: '3.694083694083694083694083694083694083694e-1',
+           6: '2.48015873015873015873015873015873015873e-1',
+           7: '2.367424242424242424242424242424242424242e-1',
+           8: '6.944444444444444444444444444444444444444e-2'}],
+    'c': {1: '7.638888888888888888888888888888888888889e-2',
+          4: '3.694083694083694083694083694083694083694e-1',
+          6: '2.48015873015873015873015873015873015873e-1',
+          7: '2.367424242424242424242424242424242424242e-1',
+          8: '6.944444444444444444444444444444444444444e-2'},
+    'd': {1: '5.870020964360587002096436058700209643606e-2',
+          4: '4.807256235827664399092970521541950113379e-1',
+          5: '-8.534124207691908557883209486122831308356e-1',
+          6: '1.204648526077097505668934240362811791383e0',
+          8: '-5.924237307216030620285939434875605088371e-2',
+          9: '1.685804345378813463919846898570302825622e-1'},
+    'dense': {'order': 4,
+              'b': {1: ['1', '-3.073475491130393140767875755299829274304', '3.452506537816341837091307066155214104163', '-1.302642157797059807434542421966495940971'],
+                    4: ['0', '3.683257032574222866560010513507872671869', '-5.888880587514968099642387549382267710261', '2.575031924349114641451785405282764446761'],
+                    5: ['0', '0.3937860705488327376988455089743256373368', '-0.7875721410976654753976910179486512746735', '0.3937860705488327376988455089743256373368'],
+                    6: ['0', '-0.131682317314991178196090345887199764328', '1.255428126693474419884244183837891592148', '-0.875729936362610225815137964934818811947'],
+                    7: ['0', '-1.606869047661144622960766903470641867589', '4.160707792291986215618503503910980704874', '-2.317096320388417350233494176197914594861'],
+                    8: ['0', '0.6008498989565004643600770910045353128109', '-0.9239220201352231509423764042312928478441', '0.3925165656231671310267437576712019794776'],
+                    9: ['0', '0.1341338540269728733057998911709372840804', '-1.268267708053945746611599782341874568161', '1.13413385402697287330579989117093728408']}},
+    }
+
+tableaus['rkv65'] = {
+    'doc': '''\
+  Verner 6(5) method.
+
+### References
+  * A Contrast of a New RK56 pair with DP56, by Jim Verner,
+    Department of Mathematics. Simon Fraser University, Burnaby, Canada, 2006.
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK6/RKcoeff6e_3.pdf)''',
+    'a': ['0', '1/7', '2/9', '3/7', '2/3', '3/4', '1', '1'],
+    'b': [{},
+          {1: '1/7'},
+          {1: '4/81',
+           2: '14/81'},
+          {1: '291/1372',
+           2: '-27/49',
+           3: '1053/1372'},
+          {1: '86/297',
+           2: '-14/33',
+           3: '42/143',
+           4: '1960/3861'},
+          {1: '-267/22528',
+           2: '189/704',
+           3: '63099/585728',
+           4: '58653/366080',
+           5: '4617/20480'},
+          {1: '10949/6912',
+           2: '-69/32',
+           3: '-90891/68096',
+           4: '112931/25920',
+           5: '-69861/17920',
+           6: '26378/10773'},
+          {1: '1501/19008',
+           2: '-21/88',
+           3: '219519/347776',
+           4: '163807/926640',
+           5: '-417/640',
+           6: '1544/1539'}],
+    'c': {1: '79/1080',
+          3: '19683/69160',
+          4: '16807/84240',
+          6: '2816/7695',
+          7: '1/100',
+          8: '187/2800'},
+    'd': {1: '763/10800',
+          3: '59049/197600',
+          4: '88837/526500',
+          5: '243/4000',
+          6: '12352/38475',
+          8: '2/25'},
+    }
+
+tableaus['dverk65'] = {
+    'doc': '''\
+  Verner 6(5) 'DVERK' method.''',
+    'a': ['0', '1/6', '4/15', '2/3', '5/6', '1', '1/15', '1'],
+    'b': [{},
+          {1: '1/6'},
+          {1: '4/75',
+           2: '16/75'},
+          {1: '5/6',
+           2: '-8/3',
+           3: '5/2'},
+          {1: '-165/64',
+           2: '55/6',
+           3: '-425/64',
+           4: '85/96'},
+          {1: '12/5',
+           2: '-8',
+           3: '4015/612',
+           4: '-11/36',
+           5: '88/255'},
+          {1: '-8263/15000',
+           2: '124/75',
+           3: '-643/680',
+           4: '-81/250',
+           5: '2484/10625'},
+          {1: '3501/1720',
+           2: '-300/43',
+           3: '297275/52632',
+           4: '-319/2322',
+           5: '24068/84065',
+           7: '3850/26703'}],
+    'c': {1: '3/40',
+          3: '875/2244',
+          4: '23/72',
+          5: '264/1955',
+          7: '125/11592',
+          8: '43/616'},
+    'd': {1: '13/160',
+          3: '2375/5984',
+          4: '5/16',
+          5: '12/85',
+          6: '3/44'},
+    }
+
+tableaus['rktf65'] = {
+    'doc': '''\
+  Tsitouras & Famelis Runge-Kutta 6(5) method.
+
+### Reference
+  * Ch. Tsitouras and I. Th. Famelis,
+    [Phase-Fitted modified Runge-Kutta pairs of orders 6(5)](https://www.researchgate.net/publication/251740152_Phase-Fitted_modified_Runge-Kutta_pairs_of_orders_65),
+    ICNAAM 2006, Crete, 2006.
+  * [More precise rational coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK6/RKcoeff6g_5.pdf)
+
+@note The floating point coefficients here were generated from the rational ones from the 2nd reference.
+
+@note This is a first-same-as-last (FSAL) step.''',
+    'a': ['0',
+          '9.28961748633879781420765027322404371584699453551912568306010928961748633879781420765e-2',
+          '1.44578313253012048192771084337349397590361445783132530120481927710843373493975903614e-1',
+          '2.16867469879518072289156626506024096385542168674698795180722891566265060240963855422e-1',
+          '71/125',
+          '7.11864406779661016949152542372881355932203389830508474576271186440677966101694915254e-1',
+          '199/200', '1', '1'],
+    'b': [{},
+          {1: '9.28961748633879781420765027322404371584699453551912568306010928961748633879781420765e-2'},
+          {1: '3.20715889781663863106572284887245651635599805316233039884555941697335052470690700435e-2',
+           2: '1.12506724274845661882113855848624832426801465251509226132026333541109868246906833571e-1'},
+          {1: '5.42168674698795180722891566265060240963855421686746987951807228915662650602409638554e-2',
+           3: '1.62650602409638554216867469879518072289156626506024096385542168674698795180722891566e-1'},
+          {1: '6.56598126617283950617283950617283950617283950617283950617283950617283950617283950617e-1',
+           3: '-2.4972770465185185185185185185185185185185185185185185185185185185185185185185185185e0',
+           4: '2.4086789199012345679012345679012345679012345679012345679012345679012345679012345679e0'},
+          {1: '-1.7212338830272756350112289300338046256920059840520750991645177506321959252208613366e0',
+           3: '7.22310751192021126636920155870658124799459070542113115974697356535677039490201029989e0',
+           4: '-5.4959191727393518000813340726320306436524484390690989489777480799761402436788850115e0',
+           5: '7.05909950626077185672513986332135377282067107530551362971563451692243740099430963481e-1'},
+          {1: '4.1286718971616152746901807156615753875075696875042912424384212279484311366686019727e0',
+           3: '-1.6914025304289438220281346004343739703895247887189472122417356767305063273262951589e1',
+           4: '1.43289813217405868844323023574174855877382144987680899683823277400972814702596244738e1',
+           5: '-1.5533550903735309941352947451105003919180320410408681830389632181656533578398372284e0',
+           6: '1.00472717576076705529415767637517912056749574195795909463557101742500402417456237099e0'},
+          {1: '4.46860784284429599022330889710676757001193443328341367781153268526799285074027050787e0',
+           3: '-1.8345441869429650066499014099391358577583747335752433112108627235199546393109090809e1',
+           4: '1.55237707233543199854527260736987323920859616527670939779256214402670438227794675418e1',
+           5: '-1.7228800213316940986071454499455146268823602061289992205388429896934101951354882736e0',
+           6: '1.08151571740214517180934640319081789154027660669157008569533046194596896725782768317e0',
+           7: '-5.5723928394169823792218246594446491720651508606454087850143625880490525329866504633e-3'},
+          {1: '6.42309093721083246173486105540744934898802830008152394733186013531402447815498986849e-2',
+           4: '3.32861824699421109595374929094856793240150741775741341700388991831307262888094726546e-1',
+           5: '2.67859229165778080498089104036336501876704241846808785499560813816788199727204331902e-1',
+           6: '1.79863899670938711343662526258687438581919457377762276997401953795124106054682426881e-1',
+           7: '1.51075784805762160255845148219838318965956604578826959670696217369891977986727762107e0',
+           8: '-1.3555737109658678286129266521423384168482207697893972403776325344952795933188090051e0'}],
+    'c': {1: '6.42309093721083246173486105540744934898802830008152394733186013531402447815498986849e-2',
+          4: '3.32861824699421109595374929094856793240150741775741341700388991831307262888094726546e-1',
+          5: '2.67859229165778080498089104036336501876704241846808785499560813816788199727204331902e-1',
+          6: '1.79863899670938711343662526258687438581919457377762276997401953795124106054682426881e-1',
+          7: '1.51075784805762160255845148219838318965956604578826959670696217369891977986727762107e0',
+          8: '-1.3555737109658678286129266521423384168482207697893972403776325344952795933188090051e0'},
+    'd': {1: '6.22980954171238844288765383876964441563622264193747564518688416336360055072506207144e-2',
+          4: '3.40203519635783669970356076069438053031579043631460538976870898652474922063170157204e-1',
+          5: '2.35997541364108988248916956975923713134336326558729708330181566604979639253608698633e-1',
+          6: '2.20640276396042514942275961685396046511990069015617783025687162561106239011510198458e-1',
+          7: '1.15044133952868915480448599961883762022583301353216360785466101429534020477553812807e0',
+          8: '-1.0029141056750815457282448660706252103934340124906797279726028170808703439444111364e0',
+          9: '-6.6666666666666666666666666666666666666666666666666666666666666666666666666666666667e-3'},
+    }
+
+tableaus['rktp75'] = {
+    'doc': '''\
+  Tsitouras & Papakostas NEW7(5) Runge-Kutta method.
+
+### Reference
+  * C. Tsitouras and S. N. Papakostas, "Cheap Error Estimation for Runge-Kutta
+    methods", SIAM J. Sci. Comput. 20(1999) 2067-2088.
+  * [Rational coefficients](http://users.uoa.gr/~tsitourasc/publications.html)
+    (see [rktp75.m](http://users.uoa.gr/~tsitourasc/rktp75.m))''',
+    'a': ['0', '1/18', '1/9', '1/6', '89/200', '56482/115069', '74/95', '8/9', '1'],
+    'b': [{},
+          {1: '1/18'},
+          {2: '1/9'},
+          {1: '1/24',
+           3: '1/8'},
+          {1: '5.4599275e-1',
+           3: '-2.08520325e0',
+           4: '1.9842105e0'},
+          {1: '695768212/7463744411',
+           3: '-1803549175/7007942496',
+           4: '3474507053/6790877290',
+           5: '2188198899/15264927763'},
+          {1: '-11894934857/8390623634',
+           3: '53094780276/9800512003',
+           4: '-8415376229/2277049503',
+           5: '-18647567697/10138317907',
+           6: '27551494893/11905950217'},
+          {1: '30828057951/7654644085',
+           3: '-4511704/324729',
+           4: '16217851618/1651177175',
+           5: '282768186839/40694064384',
+           6: '-104400780537/15869257619',
+           7: '5409241639/9600177208'},
+          {1: '-133775720546/36753383835',
+           3: '49608695511/4066590848',
+           4: '-59896475201/7901259813',
+           5: '-48035527651/5727379426',
+           6: '86266718551/10188951048',
+           7: '-7751618114/23575802495',
+           8: '2289274942/8464405725'}],
+    'c': {1: '597988726/12374436915',
+          4: '3138312158/11968408119',
+          5: '480882843/7850665645',
+          6: '988558885/3512253271',
+          7: '5302636961/26425940286',
+          8: '1259489433/12163586030',
+          9: '1016647712/23899101975'},
+    'd': {1: '1421940313/46193547077',
+          4: '1943068601/5911217046',
+          5: '-3807140880/8205366359',
+          6: '9377220888/11577671635',
+          7: '586186883/5187186385',
+          8: '1114095023/8014791121',
+          9: '1016647712/23899101975'},
+    }
+
+tableaus['rktmy7'] = {
+    'doc': '''\
+  Tanaka/Muramatsu/Yamashita 7th order (a.k.a. Tanyam7)
+
+### Reference
+  * M. Tanaka, S. Muramatsu and S. Yamashita,
+    "On the Optimization of Some Nine-Stage Seventh-order Runge-Kutta Method",
+    Information Processing Society of Japan, Vol. 33, No. 12 (1992) pages 1512-1526.
+  * [Rational coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_4.pdf)
+  * [Tanyam7](https://github.com/SciML/OrdinaryDiffEq.jl/blob/f8f06c586c7a5616d7c251bce2d9e0fef0823eb4/src/tableaus/high_order_rk_tableaus.jl)
+
+@note The floating point coefficients here were generated from the rational ones from the 3rd reference.''',
+    'a': ['0',
+          '7.81664651011384679726388269101836941032920932418419855605785254026460056610810379655e-2',
+          '1.17249697651707701958958240365275541154938139862762978340867788103969008491621556948e-1',
+          '1.75874546477561552938437360547913311732407209794144467511301682155953512737432335422e-1',
+          '4.98740110191398804083870799279316917774238190981016789826879390030550695876961641904e-1',
+          '7.72121690184483890484305252570415231459539559725240465368497233385136757456140428136e-1',
+          '9.91185669604776798407733864088711970429343190218936593687802104065965311344896218368e-1',
+          '9.99501958209766146741222013447128336314037987005636927534919520974350847802956557173e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '7.81664651011384679726388269101836941032920932418419855605785254026460056610810379655e-2'},
+          {1: '2.9312424412926925489739560091318885288734534965690744585216947025992252122905389237e-2',
+           2: '8.79372732387807764692186802739566558662036048970722337556508410779767563687161677111e-2'},
+          {1: '4.39686366193903882346093401369783279331018024485361168778254205389883781843580838556e-2',
+           3: '1.31905909858171164703828020410934983799305407345608350633476261616965134553074251567e-1'},
+          {1: '7.36183483773838301137467440432293617773745769566559352064158169276511636772818047624e-1',
+           3: '-2.8337999624233305489833449285093928914333838008174765752291037107738552931533021862e0',
+           4: '2.5963565888408910519297482873564161914338762222319340129918249315278943522574457805e0'},
+          {1: '-1.2062819391370865506697620184830239019171754039710073663311602518203645149254198062e1',
+           3: '4.82083810017524271975659667922264091479441542231216831647946440093325968906031102739e1',
+           4: '-3.8058630464634340873444069083787729069064369254270820186967532356616235833794046365e1',
+           5: '2.68519054443726307306002772896197417175150863058445115085298809887242084990127458112e0'},
+          {1: '1.05219572763201983263505214763646609723666799568263028237820996736734142311884342584e2',
+           3: '-4.1792888626241254423220090632342880293119367792924845836746399438762371771451577296e2',
+           4: '3.32315550449933288661672145724565517116512854686499482568452142501473088581714784505e2',
+           5: '-1.982759118357293680333255601667730985248429276916293398808309214928107233814726788e1',
+           6: '1.21253990245498590876383571598269791392765963386781814296174940276352447040880996631e0'},
+          {1: '1.14677557186317412777743962690232735459737977190570736656211705995064581461317681933e2',
+           3: '-4.5556121698960972374080326255401158427067549223697915892004464775745251977067045545e2',
+           4: '3.62240955539231418592330010344238763220304805879492791461256324311641976192069398751e2',
+           5: '-2.167190442182808745198610853323263958730835818701676855333646196590541217807352699e1',
+           6: '1.31891320071378062521147328839749773179746572184191322809881380227032622170542838742e0',
+           7: '-4.8025566150346557548532221776442175423603809038769446508148646446010785455700778379e-3'},
+          {1: '1.15213348705537687993035352351751211261221390205532219553682499922866411003708635464e2',
+           3: '-4.5769356568613233007695763193867218928825178792989579576839091929408867970634224781e2',
+           4: '3.6393688218862734315661034842934577183287608644313226396452716662843262679970947732e2',
+           5: '-2.177668207890029292570487249950782355917297263311793089326046801011666330247687014e1',
+           6: '1.32506708878784683255232611830210096225232882939350575184015801179589744903384223122e0',
+           7: '-4.5181909867689836302434492066200005706653127046344820697054796285731244656302707584e-3',
+           8: '-5.3202693348599590527901201245120835437960233962812632873177926101911916720679884551e-4'},
+          {1: '1.15189282458001936117920705886017744028740693856879151180637835667882356288187386531e2',
+           3: '-4.5759802227164297152415973359923257831016657330505652256715384079434141772791111922e2',
+           4: '3.63861025631214796441099277168858079581214448605485290879259097757252663203289829524e2',
+           5: '-2.1772127540275557896757277605910244539671287153847928139832256704010642220109132278e1',
+           6: '1.3248804645074316071367653108186654820671540328678523819145553917668599680015070254e0',
+           7: '-4.5057252106918316437819055679743451410766257174024328014118092080515035470892820222e-3',
+           8: '-5.3301659494291359595525498369189704335941061044130202397950934176800791138229684609e-4'}],
+    'c': {1: '5.12601424974468664207334896467928192605824917480148880826975913119881823951586777925e-2',
+          4: '2.75216384562126285009146859937694605711798961533809877651595696709236573932734806466e-1',
+          5: '3.36966503407105433969810392957648333413899278562014739968412391495966278358775981408e-1',
+          6: '1.89860722449065759713312922673232536516903910783954769517234286153030491598156826344e-1',
+          7: '8.46109941851440210639662306074261643772685843568635085555647158979307742068711096848e0',
+          8: '-1.3015941672640542180639580507865346065998831988530342657791656834495604969014688205e2',
+          9: '1.21845013554975275354886178352695475927358276806989281447140156789492750743174944785e2'},
+    'd': {1: '5.15178674045165498935456331606040189732691117366780037018687102740608341377231004355e-2',
+          4: '2.74293474077587103115673357353694117460961625889987574554103649055617354062537694007e-1',
+          5: '3.40144404744524844384866753998836311948080055777461810976870625680298681141386116447e-1',
+          6: '1.77756133507317588948934456370457330369482065517695334295476170128299300917368978397e-1',
+          7: '1.11671233779869930925617663614972209726346754976205246098540815779039091073568637869e1',
+          8: '-1.74700862367671489888677143267771764606103021970520910227662714312027686763965769255e2',
+          9: '2.4369002710995055070977235670539095185471655361397856289428031357898550148634988957e2',
+          10: '-80'},
+    }
+
+tableaus['rktmy7s'] = {
+    'doc': '''\
+  Tanaka/Muramatsu/Yamashita 7th order (stable alternate)
+
+### Reference
+  * M. Tanaka, S. Muramatsu and S. Yamashita,
+    "On the Optimization of Some Nine-Stage Seventh-order Runge-Kutta Method",
+    Information Processing Society of Japan, Vol. 33, No. 12 (1992) pages 1512-1526.
+  * [Rational coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK7/RKcoeff7d_3.pdf)''',
+    'a': ['0',
+          '8.86136910904712762297901616787065703474372205022359821121431028551771585827313381493e-2',
+          '1.32920536635706914344685242518059855521155830753353973168214654282765737874097007224e-1',
+          '1.99380804953560371517027863777089783281733746130030959752321981424148606811145510836e-1',
+          '2.51937984496124031007751937984496124031007751937984496124031007751937984496124031008e-1',
+          '2.26466433020936656065704702091900664344459244867723201401086840088319283348150590416e-2',
+          '6.78260869565217391304347826086956521739130434782608695652173913043478260869565217391e-1',
+          '7.66129032258064516129032258064516129032258064516129032258064516129032258064516129032e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '8.86136910904712762297901616787065703474372205022359821121431028551771585827313381493e-2'},
+          {1: '3.3230134158926728586171310629514963880288957688338493292053663570691434468524251806e-2',
+           2: '9.9690402476780185758513931888544891640866873065015479876160990712074303405572755418e-2'},
+          {1: '4.9845201238390092879256965944272445820433436532507739938080495356037151702786377709e-2',
+           3: '1.49535603715170278637770897832817337461300309597523219814241486068111455108359133127e-1'},
+          {1: '5.51347401967803154774903010020881505852005989293761620647741487589886184464539035017e-2',
+           3: '1.12885720141989326660141409395828560302843986115057948865980980005720662021597769579e-1',
+           4: '8.39175241573543888701202275865794131429631668935503851932758789872287040280723579274e-2'},
+          {1: '1.53780353659624250311801512696108169293868598553255672534718580953857479599369970368e-2',
+           3: '3.20168833857685908914047299444587333329182280459513826892095134179082200072969961132e-2',
+           4: '-4.2539659878681657073856959205351592650720670439267341724969304281964049361468337347e-2',
+           5: '1.77913844290443067578425482004721088228615070247627119223966167775020097290494032391e-2'},
+          {1: '-1.525687339255491089288839540730449127100120223938713394418353305704707967711311341e1',
+           3: '-4.0883456759270366648261512467321799058186499039799239493858442836256593204975747971e-1',
+           4: '-1.3608204533866463335338410239697411205509650095546743972399822290598206098672910268e1',
+           5: '1.01149044236967810023853975406104197029605187561685172742777704473133250229308176604e1',
+           6: '1.98372689398825142836283710571516572858713290039459617328963432417380049457745287151e1'},
+          {1: '1.88486645187560529586357925865538054589099172763864914361630595960178420222946575411e0',
+           3: '7.38723400736316245047913111275147442586352189973516108074150970202563979482282113515e-2',
+           4: '8.0457207056650003980198380161466102309425619047376113302211151708806222954046260543e-1',
+           5: '4.6366464483142948228353176124942492069803882030195381387195390617390481561677843612e-3',
+           6: '-2.2571634399585372828168228383264979022555589706647864119944165313232196821070240573e0',
+           7: '2.55344963252550543952665407380963468836953509868134018667928934680410062297215831041e-1'},
+          {1: '-5.9346254587724754339983223484206523031910583834235199880213406063079393162409202809e0',
+           3: '-7.8254437924926937330746887342046970213268979627548332452496248647606158812656995539e-2',
+           4: '-7.819085069731140493902212303604071757973226578606944233859915440749802051998383003e0',
+           5: '6.62838952616537145950452382452961751768395831246709307616126651109617352143730615816e0',
+           6: '8.02308370728521564415778792242500347174153708508314015132305288664913153021463120273e0',
+           7: '-9.0428803055994289478315309000341323995405509411440606262203643609271327625942925961e-1',
+           8: '1.08477976353789865635212288241556328190611363822218538947146933405275575165945217817e0'},
+          {1: '1.62179253869109927468375569917595038904177242620112769247150828367984290149786137801e1',
+           3: '2.16664888484339819588806336947105292464689479004009761616228992822572035699934314119e-1',
+           4: '1.28224265684564880927217994602681081201929120394991496951845578168120816842817479071e1',
+           5: '-8.1089672876336983196919059983906105838229524182068262549575894100211346860455654545e0',
+           6: '-2.0667128454690444724018643663830140813737619941924668651212413900366570540033662448e1',
+           7: '-3.1833603946776751327638844301283960383913589487275171654091584194061718372090669796e-1',
+           8: '8.37414937940089897838775316258873698324382474489810241195049505895239674839838599165e-1'}],
+    'c': {1: '-7.0509607576408896307075679328876855284603613449588923698038237210603268019606544968e-1',
+          4: '-1.3042081566303485225649874598063839519475921490266396703180477516076867108693171832e0',
+          5: '1.48160311264599651661502935631784760949494268493436673049606673336731557372364280543e0',
+          6: '1.06895075363674788262512061362504155168134693772218655812810426772234205050708971472e0',
+          7: '6.13577483162844175682242729746843974632226625804493770700993518511008512922114250458e-2',
+          8: '3.2691254760494169227282210861249731645498062261693103396622573951918138838727290308e-1',
+          9: '7.0480070190466976554547901565081629699135375668595207637934031253779527155165784609e-2'},
+    'd': {1: '-3.6831507795991271832603276725031327096976142593866411295983627470495355912891936736e-1',
+          4: '-8.0950091191196753949937080390898589767029649084843059799077876945035271299089357243e-1',
+          5: '1.08173849169813311928266834059595139857072621270843946078873270438439274085083834379e0',
+          6: '6.13601703165021649508638707253091181092345706628708774027475501516795619531413661207e-1',
+          7: '1.38925487324489763175454783958272954686752997010110778095994410501506567737198901272e-1',
+          8: '2.68550307684235725858641739351983634290233000439835698038412427752611344000362033525e-1',
+          10: '3/40'},
+    }
+
+tableaus['rkv76e'] = {
+    'doc': '''\
+  Verner's "most efficient" Runge-Kutta (10:7(6)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV76.IIa.Efficient.00001675585.081206.OnWeb)''',
+    'a': ['0', '1/200', '1.088888888888888888888888888888888888889e-1',
+          '1.633333333333333333333333333333333333333e-1', '911/2000',
+          '6.095094489978381317087004421486024949638e-1', '221/250', '37/40', '1', '1'],
+    'b': [{},
+          {1: '1/200'},
+          {1: '-1.076790123456790123456790123456790123457e0',
+           2: '1.185679012345679012345679012345679012346e0'},
+          {1: '4.083333333333333333333333333333333333333e-2',
+           3: '49/400'},
+          {1: '6.389139236255726780508121615993336109954e-1',
+           3: '-2.455672638223656809662640566430653894211e0',
+           4: '2.272258714598084131611828404831320283215e0'},
+          {1: '-2.661577375018757131119259297861818119279e0',
+           3: '1.080451388645613769565396655365532838482e1',
+           4: '-8.353914657396199411968048547819291691541e0',
+           5: '8.204875949566569791420417341743839209619e-1'},
+          {1: '6.067741434696770992718360183877276714679e0',
+           3: '-2.471127363591108579734203485290746001803e1',
+           4: '2.042751793078889394045773111748346612697e1',
+           5: '-1.906157978816647150624096784352757010879e0',
+           6: '1.006172249242068014790040335899474187268e0'},
+          {1: '1.205467007625320299509109452892778311648e1',
+           3: '-4.975478495046898932807257615331444758322e1',
+           4: '4.114288863860467663259698416710157354209e1',
+           5: '-4.461760149974004185641911603484815375051e0',
+           6: '2.042334822239174959821717077708608543738e0',
+           7: '-9.834843665406107379530801693870224403537e-2'},
+          {1: '1.013814652288180787641845141981689030769e1',
+           3: '-4.264113603171750214622846006736635730625e1',
+           4: '3.576384003992257007135021178023160054034e1',
+           5: '-4.34802284039290765334037029690824594371e0',
+           6: '2.009862268377035895441943593011827554771e0',
+           7: '3.48749046033827240595382285305314587914e-1',
+           8: '-2.714390051048312842371587140910297407572e-1'},
+          {1: '-4.503007203429867712435322405073769635151e1',
+           3: '1.873272437654588840752418206154201997384e2',
+           4: '-1.540288236935018690596728621034510402582e2',
+           5: '1.856465306347536233859492332958439136765e1',
+           6: '-7.141809679295078854925420496823551192821e0',
+           7: '1.308808578161378625114762706007696696508e0'}],
+    'c': {1: '4.715561848627222170431765108838175679569e-2',
+          4: '2.575056429843415189596436101037687580986e-1',
+          5: '2.621665397741262047713863095764527711129e-1',
+          6: '1.521609265673855740323133199165117535523e-1',
+          7: '4.939969170032484246907175893227876844296e-1',
+          8: '-2.943031171403250441557244744092703429139e-1',
+          9: '8.131747232495109999734599440136761892478e-2'},
+    'd': {1: '4.460860660634117628731817597479197781432e-2',
+          4: '2.671640378571372680509102260943837899738e-1',
+          5: '2.201018300177293019979715776650753096323e-1',
+          6: '2.188431703143156830983120833512893824578e-1',
+          7: '2.289871705411202883378173889763552365362e-1',
+          10: '2.029518466335628222767054793810430358554e-2'},
+    }
+
+tableaus['rkv76r'] = {
+    'doc': '''\
+  Verner's "most robust" Runge-Kutta (10:7(6)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV76.IIa.Robust.000027015646.081206.CoeffsOnlyFLOAT)''',
+    'a': ['0', '1/200', '1.088888888888888888888888888888888888889e-1',
+          '1.633333333333333333333333333333333333333e-1', '91/200',
+          '6.059617471462913245758145021744683294809e-1', '167/200', '183/200', '1', '1'],
+    'b': [{},
+          {1: '1/200'},
+          {1: '-1.076790123456790123456790123456790123457e0',
+           2: '1.185679012345679012345679012345679012346e0'},
+          {1: '4.083333333333333333333333333333333333333e-2',
+           3: '49/400'},
+          {1: '6.360714285714285714285714285714285714286e-1',
+           3: '-2.444464285714285714285714285714285714286e0',
+           4: '2.263392857142857142857142857142857142857e0'},
+          {1: '-2.535121107934924522925638355466021548721e0',
+           3: '1.029937465444926792043851446075602491361e1',
+           4: '-7.951303288599057994949321745826687653648e0',
+           5: '7.93011489231005922012260142711152618238e-1'},
+          {1: '1.001876581252463296196919658309499980821e0',
+           3: '-4.166571282442379833131393800547097145319e0',
+           4: '3.83434329291286424125526652182513786652e0',
+           5: '-5.02333335607108475474643302286117656124e-1',
+           6: '6.676847438841607711538509226985769541026e-1'},
+          {1: '2.725501835463076713033396381917500571735e1',
+           3: '-4.200461727841063835531864544390929536961e1',
+           4: '-1.053571312661948991792108160054652610372e1',
+           5: '8.04955367114119371479836521589268266342e1',
+           6: '-6.734388227179051346854907596321297564093e1',
+           7: '1.304865761077793746347118702956696476271e1'},
+          {1: '-3.039737805711496514694365865875576322688e0',
+           3: '1.013816141032980111185794619070970015044e1',
+           4: '-6.429305674864721572146282562955529806444e0',
+           5: '-1.586437148340827658711531285379861057947e0',
+           6: '1.892178184196842441086430890913135336502e0',
+           7: '1.969933540760886906129236016333644283801e-2',
+           8: '5.44169898279332354651027242479525729779e-3'},
+          {1: '-1.444951891677773513735100317935571236052e0',
+           3: '8.031891385995591922411703322301956043504e0',
+           4: '-7.583174166340134682079888302367158860498e0',
+           5: '3.581616935319007421124768544245287869686e0',
+           6: '-2.436972263219952941118380906569375238373e0',
+           7: '8.515899999232617933968976603248614217339e-1'}],
+    'c': {1: '4.742583783370675608356917271757453469893e-2',
+          4: '2.562236165937056265996172745827462344816e-1',
+          5: '2.695137683307420661947381725807595288676e-1',
+          6: '1.268662240909278284598913836473917324788e-1',
+          7: '2.488722594206007162204644942764749276729e-1',
+          8: '3.074483740820063133530438847909918476864e-3',
+          9: '4.802380998949694330818906334714312332321e-2'},
+    'd': {1: '4.748524769929963103753127380572796155227e-2',
+          4: '2.55994125886906332971549182459053938705e-1',
+          5: '2.705847808106768872253089109926813573239e-1',
+          6: '1.250561868442599291363882232374691792045e-1',
+          7: '2.520446872374386050718404382019744256218e-1',
+          10: '4.883497152141861455738197130309313759259e-2'},
+    }
+
+tableaus['rkss76'] = {
+    'doc': '''\
+  Sharp & Smart 7(6)) method.
+
+### Reference
+  * P.W. Sharp and E. Smart, "Explicit Runge-Kutta Pairs with One More Derivative Evaluation than the Minimum",
+    Siam Journal of Scientific Computing, Vol. 14, No. 2, pages. 338-348, March 1993.''',
+    'a': ['0', '1/50', '27/125', '41/100', '57/100', '43/50',
+          '1.89734415567554714447412739459850829747319955773081476233291234325271903458210730096e-1',
+          '18/25',
+          '8.33333333333333333333333333333333333333333333333333333333333333333333333333333333333e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '1/50'},
+          {1: '-594/625',
+           2: '729/625'},
+          {1: '2.08796296296296296296296296296296296296296296296296296296296296296296296296296296296e-2',
+           3: '3.8912037037037037037037037037037037037037037037037037037037037037037037037037037037e-1'},
+          {1: '19/160',
+           3: '1.16301546391752577319587628865979381443298969072164948453608247422680412371134020619e-1',
+           4: '3.34948453608247422680412371134020618556701030927835051546391752577319587628865979381e-1'},
+          {1: '-31/200',
+           3: '1.26419952627798163356436989147106218572232900382472285320441881685984429300871726173e0',
+           4: '-1.4923539518900343642611683848797250859106529209621993127147766323024054982817869416e0',
+           5: '1.24315442561205273069679849340866290018832391713747645951035781544256120527306967985e0'},
+          {1: '5.32404818460847244880465705884559948010013316415508489398809027494008261005225044158e-2',
+           3: '2.63190905005944241395058267679896015089060637096436681624641838124193103498139523636e-1',
+           4: '-2.2992382584611251312628854152112504080421217996536744225053579460154724416916797118e-1',
+           5: '1.15020646834503298021503942059822317395934020502096307719511499416916110119759292822e-1',
+           6: '-1.1793792272865036330907499347198456734463853501634919800207211363690892091042619602e-2'},
+          {1: '1.01833250525779410925056563242748813162631092358712093910139906641055533787858600752e-1',
+           3: '3.67650402264021539690171893675768442020160413827130555257229267948121503927894530089e0',
+           4: '-1.3855064886371957262483408369918407532890732638371784299323099278110242610274153464e0',
+           5: '1.1058553654324280257400193743743202700327341248251627209026317277117200266618712691e0',
+           6: '-1.0442483660597752261508675907091877183025101004713070424083201191960255004658089509e-1',
+           7: '-2.6742613133552495847033672783119939782776450815708712332119223741033637886546789293e0'},
+          {1: '-7.0447278725441551253173322525085182085211898876535016082680181826378260058107213334e-2',
+           3: '2.57849022691031881978588351318784339446713208794819222430391001640703602812013523694e0',
+           4: '-1.735064874270553413736467544305100637314995326324086452786145732325615806040972405e0',
+           5: '1.42076925842656275743055431879937793726979032667289381452783078677285932226590451543e0',
+           6: '-2.9994002356151422690421464715731127083992859674624280646321971569589440552603013442e-2',
+           7: '-1.2738969184577295296576255258337856595600446902141816152083573928383427523639249936e0',
+           8: '-5.6523078193672326545416641274185392359344306198325340774902191286635758037098793739e-2'},
+          {1: '1.12188929566497595110309434330843411185625863434326301999225595935353619019786372693e-1',
+           3: '-9.4478179712463597825861610011719624575041188851623316508747159935931144002457572402e0',
+           4: '4.72928685969506458483541566908828462557623316160618665528745761537386487691574498692e0',
+           5: '-2.1535862973784519387089628138790863673524951190739517405566618338182156484450238408e0',
+           6: '-1.5003176034455324417891524003264793431625218068048301751161484381435733494665524146e0',
+           7: '7.32228493516381472239660644916433114018057892752031963313864026830512965942191992469e0',
+           8: '-1.0171881348813826762245691938848731969668479025856205360601503764094927919654990399e0',
+           9: '2.95514928252634993696651385667894218804354576106590151218235316235004803476538125126e0'},
+          {1: '1.26777165953424622263709262280041924195783046360695933368685779852909039382377368327e-2',
+           3: '-1.0069960582593041001624297555860950454903273549350063548770708526802347773053466643e1',
+           4: '4.62534242829213472690316528870584469183038900200033492988915271866480429986075212694e0',
+           5: '-2.1610283337552771303871477895705714199299596209426922872912146988024763221546690181e0',
+           6: '-1.67812185104514948971127411518435125655289709726895508499780462654928233478691485e0',
+           7: '8.10720558296219407284479196100506119564876298707858160850972380908658055161496706221e0',
+           8: '-9.9034046697481677826772383527914286511512256496144470729835169541686418859152250889e-1',
+           9: '3.15422550651861313801611511995610591660252253880816949662233444183429486317261609431e0'}],
+    'c': {1: '5.49699932022185175241442181883597507655769828815946565807124447154669050002194891238e-2',
+          5: '5.27017899545901255716693676497458451526562246965950291388111745594043275344112358966e-1',
+          6: '-5.7640010460253178146313005308307447324854309728047707823605247362054750175374841292e-1',
+          7: '2.99473766075857495911574410718252874676717226006797736321538429237884690787951256718e-1',
+          8: '-4.3511367243178106005606352407152054011086352330218025896985334826437712480556570901e-1',
+          9: '1.0697212009599420493587667703456495081274619429520696308484804269996726605610246447e0',
+          10: '6.03309172503935230080145014048744282630882217762450220670627753378570948660063724257e-2'},
+    'd': {1: '5.51948596604973952360558600324258025823235723557842084969195331387651217650789597054e-2',
+          5: '5.38771472959210564343392307526371633391618262286599376534904900758161647057057668278e-1',
+          6: '-7.2002415738222743602899270061101901552733320251540477745765896611188358469552535128e-1',
+          7: '2.98535385184885222079230265390696358266728601821898916299256942162002807672289159564e-1',
+          8: '-4.8443496217457505118337730236228616963449840154387472665426235404619128753787634184e-1',
+          9: '1.2461137803530323508211812819579677695219842128624867147149963226999683410064656175e0',
+          11: '6.58436213991769547325102880658436213991769547325102880658436213991769547325102880658e-2'},
+    }
+
+tableaus['rkf78'] = {
+    'doc': '''\
+  Fehlberg's 7(8) algorithm.
+
+### Reference
+  * E. Fehlberg, "Classical Fifth-, Sixth-, Seventh-, and Eighth-Order
+    Runge-Kutta Formulas with Stepsize Control",
+    [NASA TR R-2870](https://ntrs.nasa.gov/citations/19680027281).''',
+    'a': ['0', '2/27', '1/9', '1/6', '5/12', '1/2', '5/6', '1/6', '2/3', '1/3', '1', '0',
+          '1'],
+    'b': [{},
+          {1: '2/27'},
+          {1: '1/36',
+           2: '1/12'},
+          {1: '1/24',
+           3: '1/8'},
+          {1: '5/12',
+           3: '-25/16',
+           4: '25/16'},
+          {1: '1/20',
+           4: '1/4',
+           5: '1/5'},
+          {1: '-25/108',
+           4: '125/108',
+           5: '-65/27',
+           6: '125/54'},
+          {1: '31/300',
+           5: '61/225',
+           6: '-2/9',
+           7: '13/900'},
+          {1: '2',
+           4: '-53/6',
+           5: '704/45',
+           6: '-107/9',
+           7: '67/90',
+           8: '3'},
+          {1: '-91/108',
+           4: '23/108',
+           5: '-976/135',
+           6: '311/54',
+           7: '-19/60',
+           8: '17/6',
+           9: '-1/12'},
+          {1: '2383/4100',
+           4: '-341/164',
+           5: '4496/1025',
+           6: '-301/82',
+           7: '2133/4100',
+           8: '45/82',
+           9: '45/164',
+           10: '18/41'},
+          {1: '3/205',
+           6: '-6/41',
+           7: '-3/205',
+           8: '-3/41',
+           9: '3/41',
+           10: '6/41'},
+          {1: '-1777/4100',
+           4: '-341/164',
+           5: '4496/1025',
+           6: '-289/82',
+           7: '2193/4100',
+           8: '51/82',
+           9: '33/164',
+           10: '12/41',
+           12: '1'}],
+    'c': {6: '34/105',
+          7: '9/35',
+          8: '9/35',
+          9: '9/280',
+          10: '9/280',
+          12: '41/840',
+          13: '41/840'},
+    'd': {1: '-41/840',
+          6: '34/105',
+          7: '9/35',
+          8: '9/35',
+          9: '9/280',
+          10: '9/280',
+          11: '-41/840',
+          12: '41/420',
+          13: '41/420'},
+    }
+
+tableaus['rkv78'] = {
+    'doc': '''\
+  Verner's 7(8) algorithm.
+
+### Reference
+  * [Mathematics Source Library](http://www.mymathlib.com/diffeq/embedded_runge_kutta/embedded_verner_7_8.html)''',
+    'a': ['0', '1/4', '1/12', '1/8', '2/5', '1/2', '6/7', '1/7', '2/3', '2/7', '1', '1/3',
+          '1'],
+    'b': [{},
+          {1: '1/4'},
+          {1: '5/72',
+           2: '1/72'},
+          {1: '1/32',
+           3: '3/32'},
+          {1: '106/125',
+           3: '-408/125',
+           4: '352/125'},
+          {1: '1/48',
+           4: '8/33',
+           5: '125/528'},
+          {1: '-1263/2401',
+           4: '39936/26411',
+           5: '-64125/26411',
+           6: '5520/2401'},
+          {1: '37/392',
+           5: '1625/9408',
+           6: '-2/15',
+           7: '61/6720'},
+          {1: '17176/25515',
+           4: '-47104/25515',
+           5: '1325/504',
+           6: '-41792/25515',
+           7: '20237/145800',
+           8: '4312/6075'},
+          {1: '-23834/180075',
+           4: '-77824/1980825',
+           5: '-636635/633864',
+           6: '254048/300125',
+           7: '-183/7000',
+           8: '8/11',
+           9: '-324/3773'},
+          {1: '12733/7600',
+           4: '-20032/5225',
+           5: '456485/80256',
+           6: '-42599/7125',
+           7: '339227/912000',
+           8: '-1029/4180',
+           9: '1701/1408',
+           10: '5145/2432'},
+          {1: '-27061/204120',
+           4: '40448/280665',
+           5: '-1353775/1197504',
+           6: '17662/25515',
+           7: '-71687/1166400',
+           8: '98/225',
+           9: '1/16',
+           10: '3773/11664'},
+          {1: '11203/8680',
+           4: '-38144/11935',
+           5: '2354425/458304',
+           6: '-84046/16275',
+           7: '673309/1636800',
+           8: '4704/8525',
+           9: '9477/10912',
+           10: '-1029/992',
+           12: '729/341'}],
+    'c': {1: '13/288',
+          6: '32/125',
+          7: '31213/144000',
+          8: '2401/12375',
+          9: '1701/14080',
+          10: '2401/19200',
+          11: '19/450'},
+    'd': {1: '17/360',
+          6: '112/375',
+          7: '175273/792000',
+          8: '69629/396000',
+          9: '729/7040',
+          10: '2401/9600',
+          11: '19/225',
+          12: '-243/1760',
+          13: '-31/720'},
+    }
+
+tableaus['dverk78'] = {
+    'doc': '''\
+  Verner's "Maple" (dverk78).
+
+### Reference
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK8/RKcoeff8c_2.pdf)''',
+    'a': ['0', '1/16',
+          '1.05164319248826291079812206572769953051643192488262910798122065727699530516431924883e-1',
+          '1.57746478873239436619718309859154929577464788732394366197183098591549295774647887324e-1',
+          '39/100',
+          '4.66666666666666666666666666666666666666666666666666666666666666666666666666666666667e-1',
+          '39/250', '24/25',
+          '8.92267261582876569617601634626813346131102801365312428359450025561131899210951871087e-1',
+          '9.16666666666666666666666666666666666666666666666666666666666666666666666666666666667e-1',
+          '19/20', '1', '1'],
+    'b': [{},
+          {1: '1/16'},
+          {1: '1.6688046904273843373228415878683682690824131014569419647777116533315700147677929864e-2',
+           2: '8.84762723445524477065837906940862703608190614736934911503449491943838303687539950186e-2'},
+          {1: '3.9436619718309859154929577464788732394366197183098591549295774647887323943661971831e-2',
+           3: '1.18309859154929577464788732394366197183098591549295774647887323943661971830985915493e-1'},
+          {1: '3.76656086575255102040816326530612244897959183673469387755102040816326530612244897959e-1',
+           3: '-1.4062762954400510204081632653061224489795918367346938775510204081632653061224489796e0',
+           4: '1.41962020886479591836734693877551020408163265306122448979591836734693877551020408163e0'},
+          {1: '4.78355492244381133270022158911047799936688825577714466603355492244381133270022158911e-2',
+           4: '2.3446467743263781266611264589837462285410536876071543546781064468551834632287431964e-1',
+           5: '1.84366440009590740673551804877187263818892415348179784538520472756710207016790131136e-1'},
+          {1: '6.11454257142857142857142857142857142857142857142857142857142857142857142857142857143e-2',
+           4: '1.12966312083735007492797513828957773063162531957288289301243638495099728858422070298e-1',
+           5: '-3.6523126216152081630500698710681045165713080391277981385292799325019115669575763968e-2',
+           6: '1.84113884181313598519888991674375578168362627197039777983348751156336725254394079556e-2'},
+          {1: '-1.1290190344812819716873002143964435191540855755186649222833121580618541079059519076e0',
+           4: '-7/5',
+           5: '-8.8802928704648604017469555116668654703824580186941491818867912879961932084706688647e0',
+           6: '7.13094409677757261060034674920714023333661544255001489279410558828850531341195834447e0',
+           7: '5.2383678081685697628339089768561687561999281516627992113759978577695420029646624278e0'},
+          {1: '-6.1529353321310240531758577059630882789056716837277145620689461335329804789378294402e-1',
+           4: '-4.9518730627307206123980419770218646265183975456624504456109720877843836846893436386e0',
+           5: '-5.1425568821223535028317455499886772909974359615422348128021564911695375075220376057e0',
+           6: '4.40119257638430388133537282166699561228064232903290937377378080578921781089684014377e0',
+           7: '7.19135317060505642064565222344470796214151883455022732703393848995802890190295274383e0',
+           8: '9.44499265969278818394988712196051711534231335963244217175392212110442651632317187457e-3'},
+          {1: '-8.0487754950012651630611680571217899707181954913548370272898245110488470451176167195e-1',
+           4: '-4.59291319409483244444538935850779613413462233900102719811333759529145778119618896e0',
+           5: '-6.534479642987197634968584466456843368943752079442758756050283654909734819006825833e0',
+           6: '5.43653721645848061969301952101216405498569628561398967433445354186586889917076802846e0',
+           7: '7.41428376786239108774181233597389231941925460585428819853117348548056293090948270879e0',
+           8: '1.6296919876149290778085386765264656385911118914967657818595449515928671827136903802e-2',
+           9: '-1.8180850948197735826159946407835863974001376137309207124952108889616530525944509467e-2'},
+          {1: '-1.057858105660263049701012329924763567375548208380781605770758643060936612179474231e0',
+           4: '-2.4902747870066666124482517838284554072812073092990236244911099705917862954551978618e0',
+           5: '-8.3678653641187673586734269894057729098141483833620036736491918565911809345813949287e0',
+           6: '6.76706391372510233295677955943576702708643348087685990605145394724880397320088890883e0',
+           7: '6.10187575754750708348558966187981017887077884162790182554024225466956680755366458148e0',
+           8: '2.26346926591268273851441242963489920479522697011540597935824660244066631601010686288e-2',
+           9: '2.42115288970666032926841417691368020854458954458812827759456719481984746605406648566e-2',
+           10: '-4.9787636043105826297506384222071115619706586609988170250163869647072076359128202386e-2'},
+          {1: '-2.2141388211521594228089507244618610021434452510302869093059447809375117564415940198e0',
+           4: '4.56355804724646925572212018240182661579238223094527486516681347955670181620817635015e0',
+           5: '-1.6957036205517104297839745395366915857642603514682315438023365324576286639172315989e1',
+           6: '1.31105217928641421165649661367441373070008285256157591924114546268073486094645142906e1',
+           7: '2.65774224749870274100467824154490008698121216459786964112414318137911711432599035412e0',
+           8: '2.74592934104436868684638073474053713826464018949259425746847719273619536662550065244e0',
+           9: '-1.1506549223705344448192637136257715209341884980498719927919640966806759385051562199e0',
+           10: '2.42302296121448799919236503348925313670760208048083006656846347016299049952947649144e0',
+           11: '-4.1789444408283726338625504954661059040264279273698536826180777484478790720345919102e0'},
+          {1: '-1.5511316950026916120467765404925329008269305742185819600030671406615107733844590777e0',
+           4: '5.46092722623409081818657767842421731964760251560133825662023106815177868484348803926e0',
+           5: '-1.1979220224305761165813607594501926859816750798269770560276587319873047174682994374e1',
+           6: '9.35213287509985895980770600293832447863564422228774591854591472707049491657923415773e0',
+           7: '-2.6805151435786875122787398112144651989157843381870119309573397987877093382768663729e-1',
+           8: '-2.9111005885695086970119200745004024552717605363363761755145270197855298352241438457e-1',
+           9: '-5.7342608212997377743524954389733665898828809950550624616346021546025114366487668036e-1',
+           10: '8.49879473319296398230415986100741386767477221557113401924155562629859407659708957311e-1'}],
+    'c': {1: '4.46288489653070217415613140881920071523054807312072680684782090651440586079475760217e-2',
+          6: '3.53849672808056955006078714962021325996588002624194340841646462152138105292559006658e-1',
+          7: '2.49214137824034653157413522433245474576906451975957952284766070502834548257871008029e-1',
+          8: '-5.2283384709802500404740481515533751847798124016472832324227905218125681954020960889e0',
+          9: '5.15116549236861223325928760078465842871662817825128618469086436536651971244098141329e0',
+          10: '-9.5097928721643673005225329855637374707813853242252723834130793535769142379902016318e0',
+          11: '1.00596341373431488638526005247320813694813862000943570400067314269066845716409977948e1',
+          12: '-1.2036094616454238602036053988308595036261658780444717005661665860383856284805907814e-1'},
+    'd': {1: '4.46938336974745394582507450063655006984853368676139647920294768627190144403875012741e-2',
+          6: '3.54849078534857257151115499384161010948488673442599070019549247826104344436599329295e-1',
+          7: '2.48972827546254539183557734416986167348192069231072959065041272432884166102268412123e-1',
+          8: '2.66563173304884358413831674493708561666064947673721173917129352743937890031432599813e0',
+          9: '3.92326394871838972220877485800106547858756064671589732933492272245546934442704232603e0',
+          10: '-5.6804277609880002002190441358794913525295674525389817820177718907811376030065962976e0',
+          13: '-5.5698366055781944192097144586617242171380875045541328036506435623541816671402726928e-1'},
+    }
+
+tableaus['rkdp85'] = {
+    'doc': '''\
+  Dormand-Prince 8(5)
+
+### References
+  * E. Hairer, S.P. Norsett and G. Wanner, Solving Ordinary
+    Differential Equations I. Nonstiff Problems. 2nd edition.
+    springer series in computational mathematics,
+    springer-verlag (1993)
+  * [Original DOP853 by Hairer](https://www.unige.ch/~hairer/prog/nonstiff/dop853.f)
+  * [Modernized DOP853](https://github.com/jacobwilliams/dop853)
+  * [DP8ConstantCache](https://github.com/SciML/OrdinaryDiffEq.jl/blob/master/src/tableaus/high_order_rk_tableaus.jl)''',
+    'a': ['0', '4/45 - 2/135*sqrt(6)', '2/15 - 1/45*sqrt(6)', '1/5 - 1/30*sqrt(6)',
+          '1/5 + 1/30*sqrt(6)', '1/3', '1/4', '4/13', '127/195', '3/5', '6/7', '1'],
+    'b': [{},
+          {1: '5.26001519587677318785587544488e-2'},
+          {1: '1.97250569845378994544595329183e-2',
+           2: '5.91751709536136983633785987549e-2'},
+          {1: '2.95875854768068491816892993775e-2',
+           3: '8.87627564304205475450678981324e-2'},
+          {1: '2.41365134159266685502369798665e-1',
+           3: '-8.84549479328286085344864962717e-1',
+           4: '9.24834003261792003115737966543e-1'},
+          {1: '3.7037037037037037037037037037e-2',
+           4: '1.70828608729473871279604482173e-1',
+           5: '1.25467687566822425016691814123e-1'},
+          {1: '19/512',
+           4: '1.70252211019544039314978060272e-1',
+           5: '6.02165389804559606850219397283e-2',
+           6: '-9/512'},
+          {1: '3.70920001185047927108779319836e-2',
+           4: '1.70383925712239993810214054705e-1',
+           5: '1.07262030446373284651809199168e-1',
+           6: '-1.53194377486244017527936158236e-2',
+           7: '8.27378916381402288758473766002e-3'},
+          {1: '6.24110958716075717114429577812e-1',
+           4: '-3.36089262944694129406857109825e0',
+           5: '-8.68219346841726006818189891453e-1',
+           6: '2.75920996994467083049415600797e1',
+           7: '2.01540675504778934086186788979e1',
+           8: '-4.34898841810699588477366255144e1'},
+          {1: '4.77662536438264365890433908527e-1',
+           4: '-2.48811461997166764192642586468e0',
+           5: '-5.90290826836842996371446475743e-1',
+           6: '2.12300514481811942347288949897e1',
+           7: '1.52792336328824235832596922938e1',
+           8: '-3.32882109689848629194453265587e1',
+           9: '-2.03312017085086261358222928593e-2'},
+          {1: '-9.3714243008598732571704021658e-1',
+           4: '5.18637242884406370830023853209e0',
+           5: '1.09143734899672957818500254654e0',
+           6: '-8.14978701074692612513997267357e0',
+           7: '-1.85200656599969598641566180701e1',
+           8: '2.27394870993505042818970056734e1',
+           9: '2.49360555267965238987089396762e0',
+           10: '-3.0467644718982195003823669022e0'},
+          {1: '2.27331014751653820792359768449e0',
+           4: '-1.05344954667372501984066689879e1',
+           5: '-2.00087205822486249909675718444e0',
+           6: '-1.79589318631187989172765950534e1',
+           7: '2.79488845294199600508499808837e1',
+           8: '-2.85899827713502369474065508674e0',
+           9: '-8.87285693353062954433549289258e0',
+           10: '1.23605671757943030647266201528e1',
+           11: '6.43392746015763530355970484046e-1'}],
+    'c': {1: '5.42937341165687622380535766363e-2',
+          6: '4.45031289275240888144113950566e0',
+          7: '1.89151789931450038304281599044e0',
+          8: '-5.8012039600105847814672114227e0',
+          9: '3.1116436695781989440891606237e-1',
+          10: '-1.52160949662516078556178806805e-1',
+          11: '2.01365400804030348374776537501e-1',
+          12: '4.47106157277725905176885569043e-2'},
+    'd': {1: '4.11736891223738815055525466763e-2',
+          6: '5.67546933912861332216170925866e0',
+          7: '2.38727684897175057456422398564e0',
+          8: '-7.4655811424655713184287418377e0',
+          9: '6.6149321570779357609756479137e-1',
+          10: '-4.86340068375533557585910690905e-1',
+          11: '1.19442194318914635909069111371e-1',
+          12: '6.70659235916588857765328353543e-2'},
+    'dense': {'order': 6,
+              'b': {1: ['1', '-5.774907491308423941512959764970963240304', '16.49644626333281493448717831158698477354', '-24.54571949399562944091732721907238339798', '18.02749256792592241785328002308546543654', '-5.149018111838115207672117773992803571802'],
+                    6: ['0', '-18.23922941991843467127735254268508285247', '122.1045440775056407384213205153909612688', '-231.8409165214991521997697404857914908571', '197.0269958466695741580317666302112008223', '-64.60108109000521914396485461144879313076'],
+                    7: ['0', '37.18219910371234476883410315985135894324', '-173.9126249691618080480506753838777134361', '331.0954498424618621501918923894797549834', '-277.8327137964006769333112753240918054315', '85.35920771870277844537877114907840494096'],
+                    8: ['0', '-21.01303941098393274531745336294415241901', '83.03785796289760054373211846383908314383', '-179.7274499843094468873754395537543250482', '159.5862599637983144360210686315680103409', '-47.68483249141312012852750560140861601753'],
+                    9: ['0', '-25.32871770273569308363364761481498453167', '149.7049577648123148529446707699095285953', '-320.1481827346089882771858802334672808942', '294.3633491874707236965258349906859141291', '-98.28024214798053729424206184994317729857'],
+                    10: ['0', '31.79975067649928414267217770053633966581', '-190.4330731611144977647560714652260849976', '413.9891280957401879859390127512354067662', '-384.791005112109115719635594749767917203', '129.2830385513216252772242969564172557685'],
+                    11: ['0', '1.455380337690556329073188875578849616665', '-6.890318834976426013426899024543070764059', '8.800439201128689233698915120110979705951', '-1.543250843266143653161229443902145586384', '-1.620884459772645547809198989743612972173'],
+                    12: ['0', '1.251897240377632534495280054038948383869', '-5.663344658851194798907219747520695879341', '7.377251595082477435418616623370135436952', '-2.503794480755265068990562878908176771357', '-0.4172990801258775114984254940759111701227'],
+                    13: ['0', '-1.333333333333333333333333839430016915693', '5.555555555555555555555558334070863949511', '-5.000000000000000000000005179047457845389', '-2.333333333333333333333329286537979999605', '3.111111111111111111111109970921195560405']}},
+    }
+
+tableaus['rktp86'] = {
+    'doc': '''\
+  Tsitouras & Papakostas NEW8(6): 12-stage, 8th and 6th order Runge-Kutta method.
+
+### Reference
+  * C. Tsitouras and S. N. Papakostas, "Cheap Error Estimation for Runge-Kutta
+    methods", SIAM J. Sci. Comput. 20(1999) 2067-2088.
+  * [Matlab version](https://www.mathworks.com/matlabcentral/fileexchange/2911-ode86)
+  * [Rational coefficients](http://users.uoa.gr/~tsitourasc/publications.html)
+    (see [rktp86.m](http://users.uoa.gr/~tsitourasc/rktp86.m))''',
+    'a': ['0', '9/142', '24514/238491', '12257/79497', '50/129', '34/73', '23/148',
+          '142/141', '14183175345/16188232343', '83/91', '143/149', '1'],
+    'b': [{},
+          {1: '9/142'},
+          {1: '178422123/9178574137',
+           2: '685501333/8224473205'},
+          {1: '12257/317988',
+           3: '12257/105996'},
+          {1: '2584949729/6554704252',
+           3: '-9163901916/6184003973',
+           4: '26222057794/17776421907'},
+          {1: '4418011/96055225',
+           4: '2947922107/12687381736',
+           5: '3229973413/17234960414'},
+          {1: '2875139539/47877267651',
+           4: '2702377211/24084535832',
+           5: '-135707089/4042230341',
+           6: '299874140/17933325691'},
+          {1: '-7872176137/5003514694',
+           4: '-35136108789/26684798878',
+           5: '-114433184681/9760995895',
+           6: '299204996517/32851421233',
+           7: '254/39'},
+          {1: '-3559950777/7399971898',
+           4: '-29299291531/4405504148',
+           5: '-42434013379/9366905709',
+           6: '20642871700/5300635453',
+           7: '12951197050/1499985011',
+           8: '59527523/6331620793'},
+          {1: '-8196723582/10570795981',
+           4: '-46181454005/5775132776',
+           5: '-196277106011/29179424052',
+           6: '63575135343/11491868333',
+           7: '120535663067/11060780187',
+           8: '195434294/9727139945',
+           9: '-617468037/15757346105'},
+          {1: '-6373809055/5357779452',
+           4: '-150772749657/21151088080',
+           5: '-58076657383/6089469394',
+           6: '9252721190/1221566797',
+           7: '132381309631/11748965576',
+           8: '704633904/13813696331',
+           9: '656417033/8185349658',
+           10: '-1669806516/10555289849'},
+          {1: '-2726346953/6954959789',
+           4: '24906446731/6359105161',
+           5: '-65277767625/23298960463',
+           6: '39128152317/16028215273',
+           7: '-40638357893/16804059016',
+           8: '-7437361171/21911114743',
+           9: '1040125706/5334949109',
+           10: '-1129865134/5812907645',
+           11: '6253441118/10543852725'}],
+    'c': {1: '438853193/9881496838',
+          6: '11093525429/31342013414',
+          7: '481311443/1936695762',
+          8: '-3375294558/10145424253',
+          9: '9830993862/5116981057',
+          10: '-138630849943/50747474617',
+          11: '7152278206/5104393345',
+          12: '5118195927/53798651926'},
+    'd': {1: '289283091/6008696510',
+          6: '3034152487/7913336319',
+          7: '7170564158/30263027435',
+          8: '7206303747/16758195910',
+          9: '-1059739258/8472387467',
+          10: '16534129531/11550853505',
+          11: '-3/2',
+          12: '5118195927/53798651926'},
+    }
+
+tableaus['rkdp87'] = {
+    'doc': '''\
+  Dormand-Prince RK8(7)13M method.
+
+### Reference
+  * P.J. Prince and J.R. Dormand, J. Comp. Appl. Math.,7, pp. 67-75, 1981
+  * [rksuite_90](http://www.netlib.org/ode/rksuite/)''',
+    'a': ['0', '1/18', '1/12', '1/8', '5/16', '3/8', '59/400', '93/200',
+          '5490023248/9719169821', '13/20', '1201146811/1299019798', '1', '1'],
+    'b': [{},
+          {1: '1/18'},
+          {1: '1/48',
+           2: '1/16'},
+          {1: '1/32',
+           3: '3/32'},
+          {1: '5/16',
+           3: '-75/64',
+           4: '75/64'},
+          {1: '3/80',
+           4: '3/16',
+           5: '3/20'},
+          {1: '29443841/614563906',
+           4: '77736538/692538347',
+           5: '-28693883/1125000000',
+           6: '23124283/1800000000'},
+          {1: '16016141/946692911',
+           4: '61564180/158732637',
+           5: '22789713/633445777',
+           6: '545815736/2771057229',
+           7: '-180193667/1043307555'},
+          {1: '39632708/573591083',
+           4: '-433636366/683701615',
+           5: '-421739975/2616292301',
+           6: '100302831/723423059',
+           7: '790204164/839813087',
+           8: '800635310/3783071287'},
+          {1: '246121993/1340847787',
+           4: '-37695042795/15268766246',
+           5: '-309121744/1061227803',
+           6: '-12992083/490766935',
+           7: '6005943493/2108947869',
+           8: '393006217/1396673457',
+           9: '123872331/1001029789'},
+          {1: '-1028468189/846180014',
+           4: '8478235783/508512852',
+           5: '1311729495/1432422823',
+           6: '-10304129995/1701304382',
+           7: '-48777925059/3047939560',
+           8: '15336726248/1032824649',
+           9: '-45442868181/3398467696',
+           10: '3065993473/597172653'},
+          {1: '185892177/718116043',
+           4: '-3185094517/667107341',
+           5: '-477755414/1098053517',
+           6: '-703635378/230739211',
+           7: '5731566787/1027545527',
+           8: '5232866602/850066563',
+           9: '-4093664535/808688257',
+           10: '3962137247/1805957418',
+           11: '65686358/487910083'},
+          {1: '403863854/491063109',
+           4: '-5068492393/434740067',
+           5: '-411421997/543043805',
+           6: '652783627/914296604',
+           7: '11173962825/925320556',
+           8: '-13158990841/6184727034',
+           9: '3936647629/1978049680',
+           10: '-160528059/685178525',
+           11: '248638103/1413531060'}],
+    'c': {1: '14005451/335480064',
+          6: '-59238493/1068277825',
+          7: '181606767/758867731',
+          8: '561292985/797845732',
+          9: '-1041891430/1371343529',
+          10: '760417239/1151165299',
+          11: '118820643/751138087',
+          12: '-528747749/2220607170',
+          13: '1/4'},
+    'd': {1: '13451932/455176623',
+          6: '-808719846/976000145',
+          7: '1757004468/5645159321',
+          8: '656045339/265891186',
+          9: '-3867574721/1518517206',
+          10: '465885868/322736535',
+          11: '53011238/667516719',
+          12: '2/45'},
+    }
+
+tableaus['rkv87e'] = {
+    'doc': '''\
+  Verner's "most efficient" Runge-Kutta (13:8(7)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV87.IIa.Efficient.000000282866.081208.FLOAT40OnWeb)''',
+    'a': ['0', '1/20', '341/3200', '1023/6400', '39/100', '93/200', '31/200', '943/1000',
+          '9.01802041735856958259707940678372149956e-1', '909/1000', '47/50', '1', '1'],
+    'b': [{},
+          {1: '1/20'},
+          {1: '-6.9931640625e-3',
+           2: '1.135556640625e-1'},
+          {1: '1023/25600',
+           3: '3069/25600'},
+          {1: '3.613975628004575124052940721184028345129e-1',
+           3: '-1.341524066700492771819987788202715834917e0',
+           4: '1.370126503900035259414693716084313000404e0'},
+          {1: '4.90472027972027972027972027972027972028e-2',
+           4: '2.350972042214404739862988335493427143122e-1',
+           5: '1.80855592981356728810903963653454488485e-1'},
+          {1: '6.169289044289044289044289044289044289044e-2',
+           4: '1.123656831464027662262557035130015442303e-1',
+           5: '-3.885046071451366767049048108111244567456e-2',
+           6: '1.979188712522045855379188712522045855379e-2'},
+          {1: '-1.767630240222326875735597119572145586714e0',
+           4: '-125/2',
+           5: '-6.061889377376669100821361459659331999758e0',
+           6: '5.650823198222763138561298030600840174201e0',
+           7: '6.562169641937623283799566054863063741227e1'},
+          {1: '-1.180945066554970799825116282628297957882e0',
+           4: '-4.150473441114320841606641502701994225874e1',
+           5: '-4.434438319103725011225169229846100211776e0',
+           6: '4.260408188586133024812193710744693240761e0',
+           7: '4.375364022446171584987676829438379303004e1',
+           8: '7.87142548991231068744647504422630755086e-3'},
+          {1: '-1.281405999441488405459510291182054246266e0',
+           4: '-4.504713996013986630220754257136007322267e1',
+           5: '-4.731362069449576477311464265491282810943e0',
+           6: '4.514967016593807841185851584597240996214e0',
+           7: '4.744909557172985134869022392235929015114e1',
+           8: '1.059228297111661135687393955516542875228e-2',
+           9: '-5.746842263844616254432318478286296232021e-3'},
+          {1: '-1.724470134262485191756709817484481861731e0',
+           4: '-6.092349008483054016518434619253765246063e1',
+           5: '-5.95151837622239245520283276706185486829e0',
+           6: '5.556523730698456235979791650843592496839e0',
+           7: '6.398301198033305336837536378635995939281e1',
+           8: '1.464202825041496159275921391759452676003e-2',
+           9: '6.460408772358203603621865144977650714892e-2',
+           10: '-7.930323169008878984024452548693373291447e-2'},
+          {1: '-3.301622667747079016353994789790983625569e0',
+           4: '-1.18011272359752508566692330395789886851e2',
+           5: '-1.014142238845611248642783916034510897595e1',
+           6: '9.139311332232057923544012273556827000619e0',
+           7: '1.233759428284042683684847180986501894364e2',
+           8: '4.623244378874580474839807625067630924792e0',
+           9: '-3.383277738068201923652550971536811240814e0',
+           10: '4.527592100324618189451265339351129035325e0',
+           11: '-5.828495485811622963193088019162985703755e0'},
+          {1: '-3.039515033766309030040102851821200251056e0',
+           4: '-1.092608680894176254686444192322164623352e2',
+           5: '-9.290642497400293449717665542656897549158e0',
+           6: '8.430504981764911142134299253836167803454e0',
+           7: '1.142010010378331313557424041095523427476e2',
+           8: '-9.637271342145479358162375658987901652762e-1',
+           9: '-5.034884088802189791198680336183332323118e0',
+           10: '5.958130824002923177540402165388172072794e0'}],
+    'c': {1: '4.427989419007951074716746668098518862111e-2',
+          6: '3.541049391724448744815552028733568354121e-1',
+          7: '2.479692154956437828667629415370663023884e-1',
+          8: '-1.569420203883808405099207034271191213468e1',
+          9: '2.508406496555856261343930031237186278518e1',
+          10: '-3.173836778626027646833156112007297739997e1',
+          11: '2.293828327398878395231483560344797018313e1',
+          12: '-2.361324633071542145259900641263517600737e-1'},
+    'd': {1: '4.431261522908979212486436510209029764893e-2',
+          6: '3.546095642343226447863179350895055038855e-1',
+          7: '2.478480431366653069619986721504458660016e-1',
+          8: '4.448134732475784492725128317159648871312e0',
+          9: '1.984688636611873369930932399297687935291e1',
+          10: '-2.358162337746561841969517960870394965085e1',
+          13: '-3.60167943728977516212453673774620240911e-1'},
+    }
+
+tableaus['rkv87r'] = {
+    'doc': '''\
+  Verner's "most robust" Runge-Kutta (13:8(7)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV87.IIa.Robust.00000754677.081208.CoeffsOnlyFLOAT)''',
+    'a': ['0', '1/4', '1.128884514435695538057742782152230971129e-1',
+          '1.693326771653543307086614173228346456693e-1', '53/125', '509/1000', '867/1000',
+          '3/20', '7.09068036513868400806014001028247478675e-1', '8/25', '9/20', '1', '1'],
+    'b': [{},
+          {1: '1/4'},
+          {1: '8.740084650491523205268632759487741197705e-2',
+           2: '2.548760493865432175308795062034568513581e-2'},
+          {1: '4.233316929133858267716535433070866141732e-2',
+           3: '1.26999507874015748031496062992125984252e-1'},
+          {1: '4.260950588874226149488144523757227409094e-1',
+           3: '-1.598795284659152326542773323065718111709e0',
+           4: '1.596700225771729711593958870689995370799e0'},
+          {1: '5.071933729671392951509061813851363923933e-2',
+           4: '2.543337726460040758275471440887777803137e-1',
+           5: '2.03946890057281994657362237772708580447e-1'},
+          {1: '-2.900037471752311097038837928542589612409e-1',
+           4: '1.344187391026078988943868110941433700318e0',
+           5: '-2.864777943361442730961110382703656282947e0',
+           6: '2.67759429951059485172112606461648154387e0'},
+          {1: '9.853501133799354646974040298072701428476e-2',
+           5: '2.219268063075138484202403649819738790358e-1',
+           6: '-1.814062291180699431269033828807395245747e-1',
+           7: '1.094441147256254823692261491803863125415e-2'},
+          {1: '3.871105254573114467944461816516637340565e-1',
+           4: '-1.442445497485527757125674555307792776717e0',
+           5: '2.905398189069950931769134644923384844174e0',
+           6: '-1.853771069630105929084333267581197802518e0',
+           7: '1.400364809872815426949732510977124147922e-1',
+           8: '5.727394081149581657574677462444770648875e-1'},
+          {1: '-1.612440344443930810063001619791348059544e-1',
+           4: '-1.73396029573589840835784044739625678949e-1',
+           5: '-1.301289281406514740601681274517249252974e0',
+           6: '1.137950375173861730855879213143100347212e0',
+           7: '-3.174764966396688010692352113804302469898e-2',
+           8: '9.335129382493366643981106448605688485659e-1',
+           9: '-8.37863183347338527033008556296164332015e-2'},
+          {1: '-1.919944488158953328151080465148357607314e-2',
+           4: '2.733085726526428490794232625401612427562e-1',
+           5: '-6.753497320694437291969161121094238085624e-1',
+           6: '3.415184981384601607173848997472838271198e-1',
+           7: '-6.795006480337577247892051619852462939191e-2',
+           8: '9.659175224762387888426558649121637650975e-2',
+           9: '1.325308251118210118072103846654538995123e-1',
+           10: '3.685495936038611344690632995153166681295e-1'},
+          {1: '6.091877403645289867688841211158881778458e-1',
+           4: '-2.272569085898001676899980093141308839972e0',
+           5: '4.757898342694029006815525588191478549755e0',
+           6: '-5.516106706692758482429468966784424824484e0',
+           7: '2.900596369680119270909581856594617437818e-1',
+           8: '5.691423963359036822910985845480184914563e-1',
+           9: '7.926795760332167027133991620589332757995e-1',
+           10: '1.547372045328882289412619077184989823205e-1',
+           11: '1.614970895662181624708321510633454443497e0'},
+          {1: '8.873576220853471966321169405198102270488e-1',
+           4: '-2.975459782108536755851363280470930158198e0',
+           5: '5.600717009488163059799039254835009892383e0',
+           6: '-5.915607450536674468001493018994165735184e0',
+           7: '2.202968915613492701687914254080763833124e-1',
+           8: '1.015509782446221666614327134090299699755e-1',
+           9: '1.151434564738605590978039775212585055356e0',
+           10: '1.929710166527123939613436190080584365307e0'}],
+    'c': {1: '4.472956466669571420301584042904938246647e-2',
+          6: '1.569103352770819981336869801072664540918e-1',
+          7: '1.846097340815163774070245187352627789204e-1',
+          8: '2.251638060208699104247941940035072197092e-1',
+          9: '1.479461565197023468700517988544914175374e-1',
+          10: '7.605554244495582526979836191033649101273e-2',
+          11: '1.227729023501861961082434631592143738854e-1',
+          12: '4.181195863899163158338484280087188237679e-2'},
+    'd': {1: '4.584711140049592587866473012201028209588e-2',
+          6: '2.623189140415238743744335658484580339239e-1',
+          7: '1.916937233785261190448573863568842900803e-1',
+          8: '2.17091723279026183309784074229064485682e-1',
+          9: '1.27381896248337067968031694506567378679e-1',
+          10: '1.151053038536532625824051575004319214889e-1',
+          13: '4.056132779843756684182339143658360805005e-2'},
+    }
+
+tableaus['rkev87'] = {
+    'doc': '''\
+  Enright Verner 8(7)
+
+### Reference
+  * W. H. Enright, "The Relative Efficiency of Alternative Defect Control Schemes
+    for High-Order Continuous Runge-Kutta Formulas",
+    SIAM Journal on Numerical Analysis, Vol. 30, No. 5. (Oct., 1993), pp. 1419-1445.''',
+    'a': ['0', '139/2500',
+          '1.02577772963604852686308492201039861351819757365684575389948006932409012131715771231e-1',
+          '1.53866659445407279029462738301559792027729636048526863084922010398613518197573656846e-1',
+          '1923/5000', '923/2000', '769/5000', '8571/10000',
+          '9.50522279549898543264080746155892215372083974054663210568629277143998134232923935826e-1',
+          '3611/5000', '15/16', '1', '1'],
+    'b': [{},
+          {1: '139/2500'},
+          {1: '7.95367668507191489463769912616233707314310387997043291210079553116635514850736965522e-3',
+           2: '9.46240962785329377916707930748775242786766534857141424778472114012426569832084015753e-2'},
+          {1: '3.84666648613518197573656845753899480069324090121317157712305025996533795493934142114e-2',
+           3: '1.15399994584055459272097053726169844020797227036395147313691507798960138648180242634e-1'},
+          {1: '3.84391795249995742463414694148930014496173869183551650147262740706965192166135782038e-1',
+           3: '-1.4413754967533895577013957427459670216869972115118037596261793190397908645560378797e0',
+           4: '1.44158370150339381523798104859703700719082334232825210947891657833282567238990209761e0'},
+          {1: '4.61679927225245821615407392990543100173216372016370799947874024989156378037664283266e-2',
+           4: '2.30766671478580119613626743161835287145952544968066036170902600446677938235230248901e-1',
+           5: '1.84565335798895298224832517539110402836725817830296883834309997054406423961003322773e-1'},
+          {1: '5.98340656981684945502396474355291084616704020934744687941026109734450878397200860064e-2',
+           4: '1.11070988365806962422446377950496848082610655711386443707870631101667161815495770356e-1',
+           5: '-3.421431091519193158500700518598581235386143363430209832849164912546503727014620854e-2',
+           6: '1.71092568512164746123209797999598558095803758294411858265184070503527876149303521772e-2'},
+          {1: '-5.3795007752787302261474715462946928642562492201550692194017067742239449282090711696e-1',
+           4: '-6.9376482130983202468485892167839192961199723756828602894007094394246115740310891917e0',
+           5: '-4.662453820973334128700325885473702655237453619062658463388283415884433635650978074e0',
+           6: '3.9951521115995273981636622568870912377830509167610256747291635327314397025029743827e0',
+           7: '9'},
+          {1: '-1.6324274407986590789038658936937338307876068928047009736797164524613917396815405352e0',
+           4: '-1.0827155649128676300106788103992512405570868288293796026024992785621740125352159452e1',
+           5: '-1.2412770216529556426254179980877757507654516931216971035750731127725169216761599855e1',
+           6: '9.72736897958029723333620569705898647991679730938513196401603844136574931065998854059e0',
+           7: '1.61993509145171614713050347911446705109706857016123854149928694302903467232127746865e1',
+           8: '-1.0384430809066835611232576348376103150240692462738613298483822870379681784453944854e-1'},
+          {1: '4.3796950618238785899938395955075308647985790733672434221554718095812561143504953772e-1',
+           4: '3.93953188040780609055484179804938065477461949555863432014746148406805874085095872275e0',
+           5: '2.86077034685671490951716275075256969722509129259119025387241581075503457766785108234e0',
+           6: '-1.7743107088675159424540294493688191717730257147970606451633813362863675504027539094e0',
+           7: '-4.8953905177642011781075138200194429107217851579522239829952612873605231471994530162e0',
+           8: '2.13024858819919749451668262421798635017462468974251987239988291318720261714005089224e-1',
+           9: '-5.9395365635111487961513501386239991002220291711516275316770143453048494065657506474e-2'},
+          {1: '-1.4741971530084051096783684495220401762953156744718612221415953506898842409410764394e0',
+           4: '-1.0994004568773831856436455451565667915965033574293371252746458409074590501516335418e1',
+           5: '-1.1347103595550558407033481028962542986773842505250429938230098582640399568841966955e1',
+           6: '8.95698732805847648932199138433047040420587034365927857662263761085553916622223226594e0',
+           7: '1.58937788726768491199870127047315726092390614749240868516326055420934681415123903105e1',
+           8: '-9.8752574205231410895382886685088801840992767797867610760540167194860976207728613471e-2',
+           9: '4.88850458495220344526104177023129683434865807354905894219062956659502007705067202486e-3',
+           10: '-4.0968137822510287105773140969344294040959548433844633187412729158670403045658227312e-3'},
+          {1: '-2.6300593327636131335587362170718842216114396527353516008958114998659179172525086061e0',
+           4: '-9.1742180511635168771961994716051325461520269343576437631118099519514590372371556623e0',
+           5: '-1.918139262763558630960775091400259464454867350910231027230126760828409081794246123e1',
+           6: '1.46425586936966487212372354845143649157868001572824958943201356999170406197491766176e1',
+           7: '1.75293194641808432064264792329037561372134510518264860784855289743130207876560918202e1',
+           8: '-3.7191756017725564567993148040646183259986035050825855493662910931190949416983788302e-1',
+           9: '-7.009961538315145131112026180299584519469655253030098420015751241597110057751165714e-1',
+           10: '5.10160166123419814594373796567007747993680583372732066087135277690995003233586244844e-2',
+           11: '8.35689551081652570030668604041209869059346704560318853832715091573927364648452890489e-1'},
+          {1: '2.15760322561474994411124388359746470315016189993958868463227784863178137907983232935e-1',
+           4: '8.34514732667823366560737998962040201361659061600363822667194131727201870364735969189e0',
+           5: '2.18566238546511021703127210271410825362935054094744855941151130759498192966438607636e0',
+           6: '-1.6872364802758613307171751762566037387388156104034081739315755043398409544172643181e0',
+           7: '-8.7118979009844764699498732005474293440649791305528456441763927818947185541425600579e0',
+           8: '2.44414593429891254272241354773491646097520831036964631654327459178700700237090814351e-2',
+           9: '8.46378799450539085004935994965690483699123804486085782773911124365252659256135973281e-2',
+           10: '5.43485007267475889689554161135858132263172930458903122118464018149985401390772696043e-1'}],
+    'c': {1: '4.39177036443990264767390168245612938204165409329946310979955485867750206154532516854e-2',
+          6: '3.51024625301198059003711947067197522471081955372891881652834064609672316461737698276e-1',
+          7: '2.46142826354923978927496217611357561294520506174049687891933955470328003987048218576e-1',
+          8: '9.00324493052912782292485743663086167980166191074574843765667123724307486893548248673e-1',
+          9: '4.54941872725474687205992745995487359662269870465745627778562103310520198596208865435e0',
+          10: '4.80250151923706131251435406595354490562463095633152715752232119918349986859035476853e-3',
+          11: '-4.7410543521200460045854095885960988103202068879671787514735082136428459116707380269e0',
+          12: '-3.5457652500737177548746515059093087677430164120112009787806583305262240211772839944e-1'},
+    'd': {1: '4.33210538122143048906481448990561225500794142960488184912531716454290716526337909125e-2',
+          6: '3.38299786239324428483566710567298525845838208179552347378195505093356569277661366407e-1',
+          7: '2.48479842819169689968723882111796748697722834015831878169551896051150521744166052704e-1',
+          8: '2.23788296726381915717640915256391015765072451399129220461423268948426689142758885858e-1',
+          9: '-4.0201628625024655295655283841782384327701940439930130919929624261829397741432866016e-2',
+          10: '1.2329231693619830618596516523857376650085547539167095193286256396081735316235058814e-1',
+          13: '6.3020332091736010049110465768666204968133557157696914486643218562649192761862181994e-2'},
+    }
+
+tableaus['rkk87'] = {
+    'doc': '''\
+  Kovalnogov, Fedorov, Karpukhina, Simos, Tsitouras 8(7) method
+
+### References
+  * Kovalnogov, Fedorov, Karpukhina, Simos, Tsitouras,
+    [Runge-Kutta Embedded Methods of Orders 8(7) for Use in Quadruple Precision Computations](https://www.researchgate.net/publication/363396601_Runge-Kutta_Embedded_Methods_of_Orders_87_for_Use_in_Quadruple_Precision_Computations),
+    Mathematics, Volume 10, Issue 18, 2022.
+  * [Rational coefficients](http://users.uoa.gr/~tsitourasc/t87.m)
+
+@note The floating point coefficients here were generated from the rational ones from the 2nd reference.''',
+    'a': ['0',
+          '2.80032137795311131773988246233287895064681826798949202422973107165103409675642981593e-2',
+          '1.17211542455798199481153380377682961936340701290456762390962847695113281163272045568e-1',
+          '1.75817313683697299221730070566524442904511051935685143586444271542669921744908068353e-1',
+          '4.12418774972264624675725499028219180367525003545123161749372304663713787609586013029e-1',
+          '4.85788040125653655249646480463893555030416915791171976577551272195807115944917385569e-1',
+          '1.6194543688186485037346909523329210220365346739643996623648264841879502465904687077e-1',
+          '9.69999622636762726575177046252154115146102466697694310620259374331752600661643542686e-1',
+          '9.67212187169379825484211792872972399851315982484116576998481473839941803252105313177e-1',
+          '9.51733593009250954565256387258796094610870512261999333726263998154934269533352125669e-1',
+          '9.68202771170154148019728796247765727264175032590143665416817858054805198295905065247e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '2.80032137795311131773988246233287895064681826798949202422973107165103409675642981593e-2'},
+          {1: '-1.2809147513766000602840952300143562083196457175706189219831636475705535103141265693e-1',
+           2: '2.45303017593458205509562903379118613607705175036823097559603878184775233215504838718e-1'},
+          {1: '4.39543284209243248054325176416311107261277629839212858966110678856674804362270170882e-2',
+           3: '1.31862985262772974416297552924893332178383288951763857689833203657002441308681051264e-1'},
+          {1: '3.37793581678770282454466907421349755434169654489904742664883921124336709641723527478e-1',
+           3: '-1.2272549349642134972638116912742760383098006898941228119302659681159830923493358553e0',
+           4: '1.30188012825770783948507028288114558866194048988029573253542612869530190101485281039e0'},
+          {1: '5.55707180742854953774795421040398153698425834244408078243992150711110988336315378908e-2',
+           4: '2.51201707056335789089668842569664694678061738700922859182154307406956224053004373812e-1',
+           5: '1.79015614995032370782498095790188986963634606811801882820741709651062551409519978967e-1'},
+          {1: '6.68574347263499831237129311835436351646983012984884556347193166264996297617553477916e-2',
+           4: '1.18464279145447863166879557612335382759089586154167432866512942838128687075481264338e-1',
+           5: '-4.9625776043451759740292422000972633501142622216483112027320727273129396510418976777e-2',
+           6: '2.62494990535187638231690284383855963023506866196027758824536604264425581164307083575e-2'},
+          {1: '-2.8828852333227597022830828823050925772450620891223369172510088561729332090076138712e0',
+           4: '-6.2440208358504107644024024514118804244308557646280655968919670956442898657820780678e1',
+           5: '-1.8568693804204652514452785270528995249754499915069250253336433143578163151508120889e0',
+           6: '3.63680272715359047470913994410370911642713568016445118939856192986207517504148311731e0',
+           7: '6.45131598677305048496184230256252416917236861835199785338289493414147153759342124993e1'},
+          {1: '-2.8044177030062210609793681802747767950835025205736626228179150569096325843989251959e0',
+           4: '-6.0724923514423992066404703993882607779493861739697985128789442636875454172217394054e1',
+           5: '-1.843992544930825130766878887691184844247586243855475748407709804966868260250386026e0',
+           6: '3.58341131683436481398169260904220163311107056209428641899333714250541234007157548631e0',
+           7: '6.27562314336350305301529075880419713175762252340352806429712952136086493920793363741e1',
+           8: '9.0319906102273950056265763736944203104392059837960285913190880235936013769401198053e-4'},
+          {1: '-2.3867982748517262502656630171168908345533985055664349630981323816949508696589885131e0',
+           4: '-5.1627063109123959312754417147040225909854829131526049890819790306938208226330016825e1',
+           5: '-1.7536886231138950479955440820659955467185829948904221201507369859127252396249986529e0',
+           6: '3.28049564858832505325605350268523413528007142886883523265902376116967563208653997102e0',
+           7: '5.34320383180959473568498403628072891122624268061087757470806360734926014535143237753e1',
+           8: '-5.1871871749054814179692202838627648419279746926926280632135852213870053073114332763e-2',
+           9: '5.86215051636139696546789708280127234169485458303572483088290904612000509294669736233e-2'},
+          {1: '-2.8321844833678190185701414338307927128819672795892717761836464805524068227918002961e0',
+           4: '-6.1331782300299804156579640111028383230359362036389968935124318342451005168121921975e1',
+           5: '-1.8486956144396106169929005145135397640092170913037834243348598217810735996138171447e0',
+           6: '3.60245017376559155660368881029952545634233977218873589569763598469965203717427900757e0',
+           7: '6.33778491267616171592057963772550300254984410272010439289876706968447695603368885389e1',
+           8: '-1.4415990912159637680387758372857367088383577073617671128542010599339480760810185327e-2',
+           9: '1.79850128395124994545750132486994455015114960352855140561364324582618209513891071121e-2',
+           10: '-3.0031531771736374212615868099161882544231529622685172138561311528231108610020573246e-3'},
+          {1: '-4.0538618880188790999955490264156166727875270359794492495465581102083340028760864442e0',
+           4: '-8.957342462068871928246566717459550083825385469806444872344308239779797383467956063e1',
+           5: '-2.174160277997155927587404825690039171185069198907483070763699030181334201756712313e0',
+           6: '4.90277984566299792538628476237120023643679128602934227568174295156160923256501166825e0',
+           7: '9.21308811959261498386202635372829188598935945642923099199446915685906551410074148629e1',
+           8: '-1.0615798848368367252894309217989593007445778391108496729169226136688468696047739072e2',
+           9: '7.15244888413933960825621793700326950628446023762240029384782852503289700766263846501e2',
+           10: '-5.874164155345855219486680444844005231548526725787298594586658218072451066812579291e1',
+           11: '-5.5057747263167612955576982434494393109010422446397491970269616705184666943368933333e2'},
+          {1: '-1.5426576117927492437318562966731433591238073288653428133646285261236434041035073113e1',
+           4: '-4.0842463342275502766697135673815027343155742825350936594898511656878424252559774704e2',
+           5: '-1.3703330210475051981990819170722577088815078067066750833460437452985770323423290388e1',
+           6: '3.86861748380283839981840260187136546795985692447349074847554981151691738530542460349e1',
+           7: '4.1106448116236509863415155213827480484042391230168216047900828215708953919286111648e2',
+           8: '-5.262589642298483212559249328052605294339776017078932652593726402340337076939778859e3',
+           9: '3.59120401468351311263204092337603786279414890192167416431431463233495380766373955611e4',
+           10: '-2.9428565975170828789337889297586264433907248673913937095047691721267811559650558183e3',
+           11: '-2.7717790023268800945373425815230530802580454445165684044343605511598675223912861429e4'}],
+    'c': {1: '4.62710144559749507643438665696565266477463923324303941594264880671698479184226674443e-2',
+          6: '3.70024261130579576116287766947369066170603597694346848542347561458083670963945787412e-1',
+          7: '2.59046906438325331026392759493100306344056209570957698029069680004143772202534147226e-1',
+          8: '4.3952615194135065896470959749795071083916949081299016703836280834143904891587169169e2',
+          9: '2.54699783254442554735577328130608901983844079828777855737604201012040528247471881063e-3',
+          10: '3.71160265008765610052766362243075634874924739787417318444668226976710753590848050226e1',
+          11: '-4.6957326399687634573980555517438556136604535869046208947272277883667432727498150998e2',
+          12: '-6.8840856231271330609815727620309531232087818518011356960217496959521261426131545711e0',
+          13: '1.37281997918834547346514047866805411030176899063475546305931321540062434963579604579e-1'},
+    'd': {1: '4.626516149754783614405935291343401340931950268169050055759451352281718207632265855163849e-2',
+          6: '3.699303484429607166485496495501192579172873414002301803546939156507350865670884259184568e-1',
+          7: '2.5906876524654354764062870639725058223473892043691033358691364640278845365085138097931e-1',
+          8: '5.7378742345506215218571000996953839509789942750984120553767339670628254392825956627e1',
+          9: '-7.5759145925874260076458932547852083397486306382906476716330978204553180924595964854218937e2',
+          10: '4.21732513460119926451093225447437690446015589725575535315566671282288873849536678883e1',
+          11: '6.6449910817300380843623498122419144372671006560792568434153125098242474216456837702e2',
+          12: '-6.25846067909341872837107963930915051395230902886992059211720233133852488993048220301e0',
+          13: '1.235537981269510926118626430801248699271592091571279916753381893860561914672216441211e-1'},
+    }
+
+tableaus['rkf89'] = {
+    'doc': '''\
+  Fehlberg 8(9) method.
+
+### Reference
+  * E. Fehlberg, "Classical Fifth-, Sixth-, Seventh-, and Eighth-Order
+    Runge-Kutta Formulas with Stepsize Control",
+    [NASA TR R-2870](https://ntrs.nasa.gov/citations/19680027281).''',
+    'a': ['0', '4.436894037649818310959940428137e-1',
+          '6.6553410564747274664399106422055e-1', '9.9830115847120911996598659633083e-1',
+          '631/2000', '5.0544100948169068626516126737384e-1',
+          '1.7142857142857142857142857142857e-1', '8.2857142857142857142857142857143e-1',
+          '6.6543966121011562534953769255586e-1', '2.4878317968062652069722274560771e-1',
+          '109/1000', '891/1000', '799/2000', '1201/2000', '1', '0', '1'],
+    'b': [{},
+          {1: '4.436894037649818310959940428137e-1'},
+          {1: '1.6638352641186818666099776605514e-1',
+           2: '4.9915057923560455998299329816541e-1'},
+          {1: '2.4957528961780227999149664908271e-1',
+           3: '7.4872586885340683997448994724812e-1'},
+          {1: '2.0661891163400602426556710393185e-1',
+           3: '1.7707880377986347040380997288319e-1',
+           4: '-6.8197715413869494669377076815048e-2'},
+          {1: '1.0927823152666408227903890926157e-1',
+           4: '4.0215962642367995421990563690087e-3',
+           5: '3.9214118169078980444392330174325e-1'},
+          {1: '9.8899281409164665304844765434355e-2',
+           4: '3.5138370227963966951204487356703e-3',
+           5: '1.2476099983160016621520625872489e-1',
+           6: '-5.5745546834989799643742901466348e-2'},
+          {1: '-3.6806865286242203724153101080691e-1',
+           5: '-2.2273897469476007645024020944166e0',
+           6: '1.3742908256702910729565691245744e0',
+           7: '2.0497390027111603002159354092206e0'},
+          {1: '4.5467962641347150077351950603349e-2',
+           6: '3.2542131701589147114677469648853e-1',
+           7: '2.8476660138527908888182420573687e-1',
+           8: '9.7837801675979152435868397271099e-3'},
+          {1: '6.0842071062622057051094145205182e-2',
+           6: '-2.1184565744037007526325275251206e-2',
+           7: '1.9596557266170831957464490662983e-1',
+           8: '-4.2742640364817603675144835342899e-3',
+           9: '1.7434365736814911965323452558189e-2'},
+          {1: '5.4059783296931917365785724111182e-2',
+           7: '1.1029825597828926530283127648228e-1',
+           8: '-1.256500852007255641414776378225e-3',
+           9: '3.6790043477581460136384043566339e-3',
+           10: '-5.7780542770972073040840628571866e-2'},
+          {1: '1.273247706866711464664518179916e-1',
+           8: '1.1448805006396105323658875721817e-1',
+           9: '2.8773020709697992776202201849198e-1',
+           10: '5.0945379459611363153735885079465e-1',
+           11: '-1.479968224437257590024214444964e-1'},
+          {1: '-3.6526793876616740535848544394333e-3',
+           6: '8.162989601231891977781942124703e-2',
+           7: '-3.8607735635693506490517694343215e-1',
+           8: '3.0862242924605106450474166025206e-2',
+           9: '-5.8077254528320602815829374733518e-2',
+           10: '3.3598659328884971493143451362322e-1',
+           11: '4.1066880401949958613549622786417e-1',
+           12: '-1.1840245972355985520633156154536e-2'},
+          {1: '-1.2375357921245143254979096135669e0',
+           6: '-2.4430768551354785358734861366763e1',
+           7: '5.4779568932778656050436528991173e-1',
+           8: '-4.4413863533413246374959896569346e0',
+           9: '1.0013104813713266094792617851022e1',
+           10: '-1.4995773102051758447170985073142e1',
+           11: '5.8946948523217013620824539651427e0',
+           12: '1.7380377503428984877616857440542e0',
+           13: '2.7512330693166730263758622860276e1'},
+          {1: '-3.5260859388334522700502958875588e-1',
+           6: '-1.8396103144848270375044198988231e-1',
+           7: '-6.5570189449741645138006879985251e-1',
+           8: '-3.908614488043986343502552024131e-1',
+           9: '2.6794646712850022936584423271209e-1',
+           10: '-1.0383022991382490865769858507427e0',
+           11: '1.6672327324258671664727346168501e0',
+           12: '4.9551925855315977067732967071441e-1',
+           13: '1.1394001132397063228586738141784e0',
+           14: '5.1336696424658613688199097191534e-2'},
+          {1: '1.0464847340614810391873002406755e-3',
+           9: '-6.716388684499028223777844617802e-3',
+           10: '8.1828762189425021265330065248999e-3',
+           11: '-4.2640342864483347277142138087561e-3',
+           12: '2.8009029474168936545976331153703e-4',
+           13: '-8.7835333876238676639057813145633e-3',
+           14: '1.0254505110825558084217769664009e-2'},
+          {1: '-1.3536550786174067080442168889966e0',
+           6: '-1.8396103144848270375044198988231e-1',
+           7: '-6.5570189449741645138006879985251e-1',
+           8: '-3.908614488043986343502552024131e-1',
+           9: '2.7466285581299925758962207732989e-1',
+           10: '-1.0464851753571915887035188572676e0',
+           11: '1.6714967667123155012004488306588e0',
+           12: '4.9523916825841808131186990740287e-1',
+           13: '1.148183646627330190522579595493e0',
+           14: '4.1082191313833055603981327527525e-2',
+           16: '1'}],
+    'c': {1: '3.2256083500216249913612900960247e-2',
+          9: '2.5983725283715403018887023171963e-1',
+          10: '9.284780599657702778806371430219e-2',
+          11: '1.64523395147643428916477318428e-1',
+          12: '1.7665951637860074367084298397547e-1',
+          13: '2.3920102320352759374108933320941e-1',
+          14: '3.9484274604202853746752118829325e-3',
+          15: '3.0726495475860640406368305522124e-2'},
+    'd': {1: '1.529588024355609507244595438123e-3',
+          9: '2.5983725283715403018887023171963e-1',
+          10: '9.284780599657702778806371430219e-2',
+          11: '1.64523395147643428916477318428e-1',
+          12: '1.7665951637860074367084298397547e-1',
+          13: '2.3920102320352759374108933320941e-1',
+          14: '3.9484274604202853746752118829325e-3',
+          16: '3.0726495475860640406368305522124e-2',
+          17: '3.0726495475860640406368305522124e-2'},
+    }
+
+tableaus['rkv89'] = {
+    'doc': '''\
+  Runge Kutta Verner 8(9)
+
+### Reference
+  * J. H. Verner, "Explicit Runge-Kutta Methods with Estimates of the
+    Local Truncation Error", SIAM Journal on Numerical Analysis,
+   15(4), 772-790, 1978.''',
+    'a': ['0', '1/12', '1/9', '1/6', '2/15 + 2/15*sqrt(6)', '2/5 + 1/15*sqrt(6)',
+          '2/5 - 1/15*sqrt(6)', '2/3', '1/2', '1/3', '1/4', '4/3', '5/6', '1', '1/6', '1'],
+    'b': [{},
+          {1: '1/12'},
+          {1: '1/27',
+           2: '2/27'},
+          {1: '1/24',
+           3: '1/8'},
+          {1: '4/375 + 94/375*sqrt(6)',
+           3: '-94/125 - 84/125*sqrt(6)',
+           4: '328/375 + 208/375*sqrt(6)'},
+          {1: '3/50 - 1/150*sqrt(6)',
+           4: '104/475 + 32/1425*sqrt(6)',
+           5: '23/190 + 29/570*sqrt(6)'},
+          {1: '927/1250 - 347/1250*sqrt(6)',
+           4: '-5416/3125 + 7328/9375*sqrt(6)',
+           5: '-163/1250 + 179/3750*sqrt(6)',
+           6: '4756/3125 - 5798/9375*sqrt(6)'},
+          {1: '2/27',
+           6: '8/27 - 1/54*sqrt(6)',
+           7: '8/27 + 1/54*sqrt(6)'},
+          {1: '19/256',
+           6: '59/256 - 23/512*sqrt(6)',
+           7: '59/256 + 23/512*sqrt(6)',
+           8: '-9/256'},
+          {1: '11/144',
+           6: '133/432 - 1/864*sqrt(6)',
+           7: '133/432 + 1/864*sqrt(6)',
+           8: '-1/16',
+           9: '-8/27'},
+          {1: '839/10240 - 271/61440*sqrt(6)',
+           7: '7859/10240 - 813/5120*sqrt(6)',
+           8: '-279/2560 + 813/20480*sqrt(6)',
+           9: '-99/160 + 271/960*sqrt(6)',
+           10: '657/5120 - 813/5120*sqrt(6)'},
+          {1: '5996/405 - 3794/405*sqrt(6)',
+           6: '-4342/9 - 338/9*sqrt(6)',
+           7: '154922/135 - 13486/45*sqrt(6)',
+           8: '-464/5 + 3794/45*sqrt(6)',
+           9: '-340864/405 + 242816/405*sqrt(6)',
+           10: '8768/15 - 15176/45*sqrt(6)',
+           11: '-26624/81'},
+          {1: '3793/103680 + 271/12960*sqrt(6)',
+           6: '2021/6912 + 2263/13824*sqrt(6)',
+           7: '-115639/34560 + 40717/69120*sqrt(6)',
+           8: '883/1280 - 271/1440*sqrt(6)',
+           9: '1048/405 - 542/405*sqrt(6)',
+           10: '-461/240 + 271/360*sqrt(6)',
+           11: '2624/1053',
+           12: '3/1664'},
+          {1: '-137/1296',
+           6: '2821/432 - 337/864*sqrt(6)',
+           7: '2821/432 + 337/864*sqrt(6)',
+           8: '-299/48',
+           9: '184/81',
+           10: '-44/9',
+           11: '-5120/1053',
+           12: '-11/468',
+           13: '16/9'},
+          {1: '33617/518400 - 271/64800*sqrt(6)',
+           6: '-641/2304 + 31/13824*sqrt(6)',
+           7: '77669/172800 - 52807/345600*sqrt(6)',
+           8: '-1393/6400 + 271/7200*sqrt(6)',
+           9: '92/2025 + 542/2025*sqrt(6)',
+           10: '-599/1200 - 271/1800*sqrt(6)',
+           11: '320/567',
+           12: '-1/1920',
+           13: '4/105'},
+          {1: '-36487/279600 - 1897/17475*sqrt(6)',
+           6: '-14833/3728 - 4499/7456*sqrt(6)',
+           7: '1389591/93200 - 615973/186400*sqrt(6)',
+           8: '-94329/93200 + 5691/5825*sqrt(6)',
+           9: '-232192/17475 + 121408/17475*sqrt(6)',
+           10: '101226/5825 - 22764/5825*sqrt(6)',
+           11: '-169984/9087',
+           12: '-87/30290',
+           13: '492/1165',
+           15: '1260/233'}],
+    'c': {1: '103/1680',
+          8: '-27/140',
+          9: '76/105',
+          10: '-201/280',
+          11: '1024/1365',
+          12: '3/7280',
+          13: '12/35',
+          14: '9/280'},
+    'd': {1: '331/4200',
+          8: '-711/1400',
+          9: '674/525',
+          10: '-99/56',
+          11: '4096/2275',
+          12: '9/9100',
+          13: '81/175',
+          14: '9/140',
+          15: '-9/25',
+          16: '-233/4200'},
+    'dense': {'order': 6,
+              'b': {1: ['1', '-5.340344719034277057520180156605961165422', '13.14837749147880583627905814840113096574', '-16.19753220644721564442021410992430195459', '9.679167957452264867226831543926198530807', '-2.228358999640054192041685901987542567006'],
+                    8: ['0', '-0.1928091560220431882279434462006936069829', '-2.795296514601411936407436236842997163277', '8.105046383971632274701714040075139478674', '-8.210109457193713130126488441961370182442', '2.900311600988393122917296942072778616885'],
+                    9: ['0', '-3.523785763901498782485003655773001407777', '20.413798202322215438903936724561003866', '-32.5343350798153384543221022358185467414', '22.26527575112716857901526606390323037305', '-5.897143585923022971588287373063162280347'],
+                    10: ['0', '-2.215739806533410488205783550840062148035', '9.973890437075422933961970432657842616434', '-20.6972508759422178778287933780025127317', '16.02864680964895176373766680424888906337', '-3.80740370710588918880791745092129965722'],
+                    11: ['0', '3.280197295839766052503912871897446173215', '-7.116000767832304574334469339673192413154', '8.602360441398956096885113240960349784153', '-4.476408861561161581881371049392005922804', '0.4600350423378941899769974263905525617396'],
+                    12: ['0', '0.1664111072758262140138902045759452555931', '-0.9854917570028479820164423324668537043795', '2.154266630853038898619613644169287228982', '-2.01522989232831123471798858176926689467', '0.6804559991143820161888391534029760265624'],
+                    13: ['0', '3.767443004422831202510098694465157844184', '-19.12554744904271604728254310170097345485', '35.74599106973567702129982606328347924176', '-27.12796895289167356793527474218181235284', '7.082939470633024248550750228991291578894'],
+                    14: ['0', '-0.4774315545707187842769269030216411929781', '3.80747744350217528364731544809979435403', '-7.911188932425760587402490946706259428742', '6.502528895485013318113600304056843424451', '-1.889242994847852087224355045285880013903'],
+                    15: ['0', '6.1332989045875522022210373587729263819', '-25.05201217693119170593287957114770832526', '38.24380588392600290627114568791894902174', '-25.8647708554086395036278020974864785953', '6.539678243826276101068498621942311516917'],
+                    16: ['0', '-0.7674962105034196269237121994123193234511', '3.961603293156131681403372430018515875276', '-7.696390873945630730829349233334330540291', '6.577956710436544925143429974262390748559', '-2.075672919143626248793740971534256760093'],
+                    17: ['0', '-0.8297431015606077436093892178577968102466', '3.769201797875721071778117398093437383446', '-7.814772441309143902974462772621253358582', '6.640911895233555565052130222393381807813', '-1.76559815023952499024639563000776902243']}},
+    }
+
+tableaus['rkt98a'] = {
+    'doc': '''\
+  Tsitouras combined order 9(8) Runge-Kutta scheme A.
+
+### Reference
+  * Ch. Tsitouras, "Optimized explicit Runge-Kutta pairs of order 9(8)",
+    Applied Numerical Mathematics, 38 (2001) 123-134.
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK9/RKcoeff9b_1.pdf)''',
+    'a': ['0',
+          '2.040816326530612244897959183673469387755102040816326530612244897959183673469387755102e-2',
+          '8.81329391499810300863791593924151123085812117736908664603226557868277361675571063543e-2',
+          '1.321994087249715451295687390886226684628718176605362996904839836802416042513356595314e-1',
+          '4.285714285714285714285714285714285714285714285714285714285714285714285714285714285714e-1',
+          '5.364755392243287681395100999813264375851395225813758811703296868095847858703057159708e-1',
+          '2.25429222680433136622394661923435467176765239323386023591575075095177118891599045934e-1',
+          '6.349206349206349206349206349206349206349206349206349206349206349206349206349206349206e-1',
+          '4.761904761904761904761904761904761904761904761904761904761904761904761904761904761905e-1',
+          '1.055555555555555555555555555555555555555555555555555555555555555555555555555555555556e0',
+          '7.777777777777777777777777777777777777777777777777777777777777777777777777777777777778e-1',
+          '1.47416962426099476047840158710166095618042004264616180358505236755916144832421635821e-1',
+          '15/16', '39/40', '1', '1'],
+    'b': [{},
+          {1: '2.040816326530612244897959183673469387755102040816326530612244897959183673469387755102e-2'},
+          {1: '-1.021687274487683147769723606535303770211896504959152824720881616958241197178852529434e-1',
+           2: '1.903016665987493448633515200459454893297708622696061489324108174826518558854423592977e-1'},
+          {1: '3.304985218124288628239218477215566711571795441513407492262099592006040106283391488286e-2',
+           3: '9.914955654372865884717655431646700134715386324540222476786298776018120318850174464858e-2'},
+          {1: '9.439263832171291883556670672811977550046744677129090342789268623214132543830715838461e-1',
+           3: '-3.630115063093482037077114300073110289641773922761700400575782997067611129391489310214e0',
+           4: '3.114760108447781420150018661363341106065670883620219937725427563317626446436989154939e0'},
+          {1: '2.056923328616261711782848556408566522300362983753802984037858427390204762957826067614e-2',
+           4: '2.604824183197402987552340723087785980849282464799395547519553603229784733524946656053e-1',
+           5: '2.554238876184258522664475421084621742772076462638982965779957422127042648882327896893e-1'},
+          {1: '4.318483705109263028835194255758669000001323804220689783671769343298616516403726355252e-2',
+           4: '1.769284839807689645520842945002498666673573450203833044058383710943493957801668363127e-1',
+           5: '7.715414621876983794315795767271715967327448157389024021256382790156907385043923034755e-3',
+           6: '-2.39951297330544201235737090167280545793279189659320267223737222231534943764897696599e-3'},
+          {1: '7.05467372134038800705467372134038800705467372134038800705467372134038800705467372134e-2',
+           6: '2.389860715558522381270320269011306632810238539566724845073599194488366776462554669041e-1',
+           7: '3.253878261513788024373418708061003772833500437505585560570139782583943629181184308032e-1'},
+          {1: '7.068452380952380952380952380952380952380952380952380952380952380952380952380952380952e-2',
+           6: '1.146981694865827822571846471014964620252663838260725205469644176957364421846758824211e-1',
+           7: '3.24289925751512455838053448136598776069971711412022717548273677542358795910562212817e-1',
+           8: '-3.348214285714285714285714285714285714285714285714285714285714285714285714285714285714e-2'},
+          {1: '3.828039568865740740740740740740740740740740740740740740740740740740740740740740740741e-1',
+           6: '-2.628104570763124221540974003468081947028606261133704083478349807677632293296095495655e1',
+           7: '-1.748424643449004698170506878899427443294184302243206078796748836803923980619291957032e0',
+           8: '8.7107466796875e0',
+           9: '1.999147527006172839506172839506172839506172839506172839506172839506172839506172839506e1'},
+          {1: '5.775788905284689042365660435243263588459243112336590023001577005230527581251090920939e-2',
+           6: '19/25',
+           7: '4.018553287915560050245043972333732847203199147775749045996022855946715894896836169645e-1',
+           8: '6.626589626062798854099077293240416432854142660801015341291381713518812647417195998478e-2',
+           9: '-5.150696954976787388652658281684056884304318728657759205657506333922693112630203285629e-1',
+           10: '6.968359170425632653891831427973381274755878134602740100996538387882097264431620182023e-3'},
+          {1: '6.994103035906395715686489597582150022600838999784034656313893569317997374351308591645e-2',
+           6: '-1.206166060565470490794750098024428160239891793653556676806869026855595723414769418541e-1',
+           7: '1.32696301731445868301091105762183570963782891912854455492515937667446419188783413703e-1',
+           8: '2.031532538077627922059108299487811850373691592058111305356962697560067377203999264697e-1',
+           9: '-7.548640175023889467177231137902524280970115417595113975094208653922765875893450604889e-2',
+           10: '3.789103686439011295643140618205140110558445127918206929994555147217682251832650190596e-3',
+           11: '-6.605971935182620916042249241335724188598654843850115173121147228314743697169599255572e-2'},
+          {1: '6.878836016002817993752515099013030041019173079702440987327706356852301558017737433194e-1',
+           6: '-3.658808527366451517196946897056976218504208192589081007775064092270089158621094491595e0',
+           7: '5.845503378564669890314102776059891925747966958611333131112559317698644813283634646256e0',
+           8: '5.411412752004688858844863696709300082070631013287790747126942423884017249319289413984e0',
+           9: '-1.582095988269673568992894109712396974043574141076643374159775089066374202615336309544e0',
+           10: '9.945248865706299667788846635419585634800918858472131439118016352130452805983178532975e-2',
+           11: '-1.32959348710523440409877154930392292624448208834595661097065064448725970097729805995e0',
+           12: '-4.536254218085344054923493892951394749476260046442408298457962714965473684250800727799e0'},
+          {1: '8.07560295945926563700361746598699215675042424270981124526987817476158748998477007079e-1',
+           6: '-7.835750139557992772198249358151231578755580407654683121798887409512496231362858547948e0',
+           7: '6.174200025941229770123184423146954177664197990793732802584504944027199598185299195828e0',
+           8: '7.111311052783799148723822283846058963658585479679811643355604800924488305671070483858e0',
+           9: '1.126413982652184268358560776506518924191271296281999997786352511455840556312961264408e0',
+           10: '1.138838501589788637237573235699770016403876336825059128989257049544545698305937427348e-1',
+           11: '-1.434774678607913207528871735039082294103761283429995473644501054462770211806990144762e0',
+           12: '-5.06431474212289289846486380954520935195960747346453447408189070975548390788871656421e0',
+           13: '-2.352964719331973643770165093268505801053566015981841162709660510739142793983643698681e-2'},
+          {1: '8.101674645254722523232876762637530370910583262175105775933018316393086542069855754015e-1',
+           6: '-1.192841245677955898272791316012006359130670880301152754325896491950568584401093883276e1',
+           7: '5.364312898490360554625912421385267920693980736534035810795373384314434259846321616737e0',
+           8: '8.059954459759511795757228635532122933456240951117021423047033797467500489813129448587e0',
+           9: '4.618063439001721483758160286714057772615332315540952842312029459375380582946251202099e0',
+           10: '1.128601659181894505188796244218558774756228116520111404880300475877949274532116052613e-1',
+           11: '-1.315207706945002903017387913180865178001333874822374203640801449667142626811434784416e0',
+           12: '-4.689892399903609125554297739238443813841792924181292032608257980483530407060762654113e0',
+           13: '6.721374554329681653036240358001936392819624140428230276841754345869866338681915837036e-3',
+           14: '-3.856723862141420733690607213568689457521916318676624500458592507392990272144509263344e-2'},
+          {1: '7.08186700681096701934777239286565171237632147639673056885084759502408862200805835082e-1',
+           6: '-1.135112404359189673946143658241126665471485966274613155801176412146453899273199024599e1',
+           7: '4.439836852763619566651386303128039432194840880353792439043045399385549660055953598204e0',
+           8: '7.160528966855846780330688332694210230082237210593958603950542885510151860241609708315e0',
+           9: '4.944752289066181389539519911976094691889352151362799884071179481037363375554630307368e0',
+           10: '9.81953561086798742592703501940555170116801219719398366833846605007653188488342792932e-2',
+           11: '-1.023835739158951766446520340031695827655784562575140398451539531509310691718294156648e0',
+           12: '-3.935185699031579433419722235418354733643010565663948821548988100702690247383937415641e0',
+           13: '-2.186260374551646198917238469418771662941856089051019740795631241695933765898516172461e-2',
+           14: '-1.94920799474799113987905947234601097726691600464328452129891198427398074086267482594e-2'}],
+    'c': {1: '4.153556008805959168895898921867201921459132555672551671643920848892579905394945027033e-2',
+          8: '-4.252280874169805589327845543703559909471287347438636516704849004566228405918914211737e-1',
+          9: '4.911269629417608841870622286295630148000839362387724323042417629187646342598357379221e-1',
+          10: '4.54178241758847425437367681263804036534545085451231103798725730943431350315355399525e-1',
+          11: '1.006032649094428065183781872196896559026233580812897577690817173850511464781870422371e0',
+          12: '2.396980714287725918428584296767300637015778481901015943085981245718488414129283930348e-1',
+          13: '-4.455491297731407466229188603532881977410859597554953958343743900169006073451667494575e0',
+          14: '9.288978775706101824452250592593505318906312756833224753343846524732597445318251252011e0',
+          15: '-6.410061645100351588399537404906702274594586970014904598917670494111219851867862508616e0',
+          16: '7.692307692307692307692307692307692307692307692307692307692307692307692307692307692308e-1'},
+    'd': {1: '3.999250134104311539086473895855274325427452646000198100229842429713750574052674683348e-2',
+          8: '4.011325788584545964379727040448630014695811775770738360963521200500104385050340643944e-2',
+          9: '3.925127095625233142417946847596602750245079278580359243007567443309335209235627547386e-1',
+          10: '-1.051197094764485752167499211132792259622314942028765288915320450078532078636064340575e0',
+          11: '-2.505083298864024791053208779904093804217869849340728193482139880406203405457882973484e-1',
+          12: '2.465428288939690633785173766277520619424499467256191777438442341744800285916120244248e-1',
+          13: '6.839965112378725948727677787215511467384166222758213034610265848044786251996046243769e0',
+          14: '-1.602665175464198790087906253807353043847748558382750862377249679396395516268962930751e1',
+          15: '10',
+          16: '7.692307692307692307692307692307692307692307692307692307692307692307692307692307692308e-1'},
+    }
+
+tableaus['rkv98e'] = {
+    'doc': '''\
+  Verner's "most efficient" Runge-Kutta (16:9(8)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV98.IIa.Efficient.000000349.081209.FLOAT6040OnWeb)''',
+    'a': ['0', '1731/50000', '9.702435063878044594828361677100617517633e-2',
+          '1.455365259581706689224254251565092627645e-1', '561/1000',
+          '2.290079115904850126662751771814700052182e-1',
+          '5.449920884095149873337248228185299947818e-1', '129/200', '387/800',
+          '6757/100000', '1/4', '6.590650618730998549405331618649220295334e-1',
+          '4103/5000', '2253/2500', '1', '1'],
+    'b': [{},
+          {1: '1731/50000'},
+          {1: '-3.89335438857287327017042687229284478532e-2',
+           2: '1.359578945245091786499878854939346230295e-1'},
+          {1: '3.638413148954266723060635628912731569111e-2',
+           3: '1.091523944686280016918190688673819470733e-1'},
+          {1: '2.025763914393969636805657604282571047511e0',
+           3: '-7.638023836496292020387602153091964592952e0',
+           4: '6.173259922102322383581944548809393545442e0'},
+          {1: '5.112275589406060872792270881648288397197e-2',
+           4: '1.770823794555021537929910813839068684087e-1',
+           5: '8.0277624092225014536138698108025283759e-4'},
+          {1: '1.316006357975216279279871693164256985334e-1',
+           4: '-2.957276252669636417685183174672273730699e-1',
+           5: '8.78137803564295237421124704053886667082e-2',
+           6: '6.2130529752252747743214350056394300261e-1'},
+          {1: '7.166666666666666666666666666666666666667e-2',
+           6: '3.305533578915319409260346730051472207728e-1',
+           7: '2.427799754418013924072986603281861125606e-1'},
+          {1: '7353/102400',
+           6: '3.294380283228177160744825466257672816401e-1',
+           7: '1.165190029271822839255174533742327183599e-1',
+           8: '-3483/102400'},
+          {1: '4.836757646340646986611287718844085773549e-2',
+           6: '3.928989925676163974333190042057047002852e-2',
+           7: '1.054740945890344608263649267140088017604e-1',
+           8: '-2.143865284648312665982642293830533996214e-2',
+           9: '-1.041229174627194437759832813847147895623e-1'},
+          {1: '-2.664561487201478635337289243849737340534e-2',
+           6: '3.333333333333333333333333333333333333333e-2',
+           7: '-1.631072244872467239162704487554706387141e-1',
+           8: '3.396081684127761199487954930015522928244e-2',
+           9: '1.572319413814626097110769806810024118077e-1',
+           10: '2.15226747803187955230353477879477037696e-1'},
+          {1: '3.689009248708622334786359863227633989718e-2',
+           6: '-1.465181576725542928653609891758501156785e-1',
+           7: '2.242577768172024345345469822625833796001e-1',
+           8: '2.294405717066072637090897902753790803034e-2',
+           9: '-3.5850052905728761357394424889330334334e-3',
+           10: '8.669223316444385506869203619044453906053e-2',
+           11: '4.383840651968337846196219974168630120572e-1'},
+          {1: '-4.866012215113340846662212357570395295088e-1',
+           6: '-6.304602650282852990657772792012007122988e0',
+           7: '-2.81245618289472564778284183790118418111e-1',
+           8: '-2.679019236219849057687906597489223155566e0',
+           9: '5.18815663924157511565311164615012522024e-1',
+           10: '1.365353187603341710683633635235238678626e0',
+           11: '5.885091088503946585721274891680604830712e0',
+           12: '2.802808786272062889819965117517532194812e0'},
+          {1: '4.185367457753471441471025246471931649633e-1',
+           6: '6.724547581906459363100870806514855026676e0',
+           7: '-4.25444280164611790606983409697113064616e-1',
+           8: '3.343279153001265577811816947557982637749e0',
+           9: '6.17081663117537759528421117507709784737e-1',
+           10: '-9.29966123939932833937749523988800852013e-1',
+           11: '-6.099948804751010722472962837945508844846e0',
+           12: '-3.002206187889399044804158084895173690015e0',
+           13: '2.553202529443445472336424602988558373637e-1'},
+          {1: '-7.79374086122884664644623040843840506343e-1',
+           6: '-1.393734253810777678786523664804936051203e1',
+           7: '1.252048853379357320949735183924200895136e0',
+           8: '-1.469150040801686878191527989293072091588e1',
+           9: '-4.94705058533141685655191992136962873577e-1',
+           10: '2.242974909146236657906984549543692874755e0',
+           11: '1.336789380382864375813864978592679139881e1',
+           12: '1.439665048665068644512236935340272139005e1',
+           13: '-7.975813331776800379127866056663258667437e-1',
+           14: '4.409353709534277758753793068298041158235e-1'},
+          {1: '2.058051337466886442151242368989994043993e0',
+           6: '2.235793772796803295519317565842520212899e1',
+           7: '9.0949810997556332745009198137971890783e-1',
+           8: '3.589110098240264104710550686568482456493e1',
+           9: '-3.442515027624453437985000403608480262211e0',
+           10: '-4.865481358036368826566013387928704014496e0',
+           11: '-1.890980381354342625688427480879773032857e1',
+           12: '-3.426354448030451782929251177395134170515e1',
+           13: '1.264756521695642578827783499806516664686e0'}],
+    'c': {1: '1.461197685842315252051541915018784713459e-2',
+          8: '-3.91521186233133908941022826728824203081e-1',
+          9: '2.310932500289506415909675644868993669908e-1',
+          10: '1.274766769992852382560589467488989175618e-1',
+          11: '2.246434176204157731566981937082069688984e-1',
+          12: '5.684352689748512932705226972873692126743e-1',
+          13: '5.825871557215827200814768021863420902155e-2',
+          14: '1.364317403482215641609022744494239843327e-1',
+          15: '3.057013983082797397721005067920369646664e-2'},
+    'd': {1: '1.996996514886773085518508418098868756464e-2',
+          8: '2.191499304949330054530747099310837524864e0',
+          9: '8.857071848208438030833722031786358862953e-2',
+          10: '1.140560234865965622484956605091432032674e-1',
+          11: '2.533163805345107065564577734569651977347e-1',
+          12: '-2.056564386240941011158999594595981300493e0',
+          13: '3.40809679901311993516009489422454381283e-1',
+          16: '4.834231373823958314376726739772871714902e-2'},
+    'dense': {'order': 6,
+              'b': {1: ['1', '-9.294297684259170964419470415008214144017', '33.33019304474223208351911670131319982031', '-55.29390700001479756219779688064695107544', '42.86209746399012164663921783228828634884', '-12.58947384759996205102055181879613310255'],
+                    8: ['0', '1.463975254351409573827612242931709206232', '-13.9798391666554439758224813579248846535', '33.13750209232939212418676329141712828947', '-32.54051481949689406986266844115938466186', '11.52735545323840243872975143800660761657'],
+                    9: ['0', '-5.19164597267393477612301660930985495822', '29.37077808270272767012274883234832612429', '-54.65915321044746037789505095332892304404', '43.35911556365618069945972723377368375004', '-12.64800121320856257397344093899633250507'],
+                    10: ['0', '9.155548898707587637102104058712875724784', '-44.85798951487444740510904948451142295019', '83.95573436527913186664308228268940383708', '-69.19483571876956063683107866620264821735', '21.06901864665657377645100075606069052324'],
+                    11: ['0', '2.149574229837753413879428158508070567133', '2.925726822321066808605443129055364625059', '-19.94990740898311356404728326986679767487', '23.87219793737450768570071368078446101941', '-8.772948162929798570981603504772891567842'],
+                    12: ['0', '2.859065199728346707788582984291783052853', '-15.64746306478613725321435208163837674437', '37.31753407083610326457671709259648495224', '-35.71832813237807384104157369372075660672', '11.75762719557461241516114839575823455868'],
+                    13: ['0', '0.595994995615732567726801607328089586444', '-2.144868672764388592754508193798956138409', '0.03147819093359349938823948120130785157846', '4.337221947395998140628725270993699620424', '-2.761567745608777342981110485505506711015'],
+                    14: ['0', '-2.793442801887766395557734853376383633111', '18.44313777903336629197407208961445707654', '-43.53270842399800213046294664406801088258', '43.72836516053630035220003007949472897397', '-15.70891997333567655399251839721536755049'],
+                    15: ['0', '0.43892552272049430387385419989202088476', '-2.43439886309918474108235449717351836361', '6.33507939250642138053317274930991523239', '-6.93924344761229790945143850259213673419', '2.630207535315394940103976101242922677116'],
+                    16: ['0', '0.4061125593886674766274091735849513294637', '-2.4513782495438646909247299329563747066', '6.33102963484870901817535372574861233444', '-6.932374758620493870086154346967905866933', '2.64661081392698206620812138059071690963'],
+                    17: ['0', '0.2101897984708804552744294524449523911923', '-2.553898197075926195313905204327814144372', '6.327318296710022481099749124947830269452', '-6.833701196075788197355500446692027670559', '2.850091297970811456295227073627059154286']}},
+    }
+
+tableaus['rkv98r'] = {
+    'doc': '''\
+  Verner's "most robust" Runge-Kutta (16:9(8)) pair.
+
+### Reference
+  * J.H. Verner, "Explicit Runge-Kutta Methods with Estimates of the Local Truncation Error",
+    SIAM Journal on Numerical Analysis, Vol. 15, Issue 4 (1978)
+  * [Jim Verner's Refuge for Runge-Kutta Pairs](https://www.sfu.ca/~jverner/)
+  * [Coefficients](https://www.sfu.ca/~jverner/RKV98.IIa.Robust.000000351.081209.CoeffsOnlyFLOAT6040)''',
+    'a': ['0', '1/25', '9.648736013787361245235039379666356743708e-2',
+          '1.447310402068104186785255906949953511556e-1', '72/125',
+          '2.272326564618766017153738192188229509142e-1',
+          '5.407673435381233982846261807811770490858e-1', '16/25', '12/25', '3377/50000',
+          '1/4', '6.770920153543242682384311058159603931192e-1', '1623/2000', '453/500',
+          '1', '1'],
+    'b': [{},
+          {1: '1/25'},
+          {1: '-1.98852731918229097650241511466089129345e-2',
+           2: '1.163726333296965222173745449432724803716e-1'},
+          {1: '3.61827600517026046696313976737488377889e-2',
+           3: '1.085482801551078140088941930212465133667e-1'},
+          {1: '2.272114264290177409193144938921415409241e0',
+           3: '-8.526886447976398578316416192982602292786e0',
+           4: '6.830772183686221169123271254061186883545e0'},
+          {1: '5.094385535389374394512668566783434123978e-2',
+           4: '1.75586504980907111020369332874956164699e-1',
+           5: '7.0229612707574674987780067603244497535e-4'},
+          {1: '1.424783668683284782770955365543878809824e-1',
+           4: '-3.541799434668684104094753917518523845155e-1',
+           5: '7.595315450295100889001534202778550159932e-2',
+           6: '6.765157656337123215269906939508560510196e-1'},
+          {1: '7.111111111111111111111111111111111111111e-2',
+           6: '3.279909287605898328568406057725491803016e-1',
+           7: '2.408979601282990560320482831163397085872e-1'},
+          {1: '57/800',
+           6: '3.268842451575245554847578757216915662785e-1',
+           7: '1.156157548424754445152421242783084337215e-1',
+           8: '-27/800'},
+          {1: '4.822677322465810178387112087673611111111e-2',
+           6: '3.948559980495400110769549704186108167677e-2',
+           7: '1.058851161934658144373823566907778072121e-1',
+           8: '-2.1520063204743093466644287109375e-2',
+           9: '-1.045374260183348238623046875e-1'},
+          {1: '-2.609113435754923412210928689962011065179e-2',
+           6: '3.333333333333333333333333333333333333333e-2',
+           7: '-1.65250400663810508672468159819526724141e-1',
+           8: '3.434664118368616658319419895678838776647e-2',
+           9: '1.595758283215209043195814910843067811951e-1',
+           10: '2.140857321828193385584684233447183324979e-1'},
+          {1: '-3.62842339625565859076509979091267105528e-2',
+           6: '-1.096167597427208807028761474420297770752e0',
+           7: '1.826035504321331052308236240517254331348e-1',
+           8: '7.08225444417068325613028685455625123741e-2',
+           9: '-2.31364701848243126999929738482630407146e-2',
+           10: '2.711204726320932916455631550463654973432e-1',
+           11: '1.308133749422980744437146904349994472286e0'},
+          {1: '-5.074635056416974879347823927726392374259e-1',
+           6: '-6.631342198657237090355284142048733580937e0',
+           7: '-2.52748010090880105270020973014860316405e-1',
+           8: '-4.952612380036095562991116175550167835424e-1',
+           9: '2.93252554525388690285739720360003594753e-1',
+           10: '1.440108693768280908474851998204423941413e0',
+           11: '6.237934498647055877243623886838802127716e0',
+           12: '7.270192054526987638549835199880202544289e-1'},
+          {1: '6.130118256955931701496387847232542148725e-1',
+           6: '9.088803891640463313341034206647776279557e0',
+           7: '-4.07378815629344868103315381138325162923e-1',
+           8: '1.790733389490374687043894756399015035977e0',
+           9: '7.14927166761755073724875250629602731782e-1',
+           10: '-1.438580857841722850237810322456327208949e0',
+           11: '-8.263329312064740580595954649844133476994e0',
+           12: '-1.537570570808865115231450725068826856201e0',
+           13: '3.453832827564871699090880801079644428793e-1'},
+          {1: '-1.211697910343873872490625222495537087293e0',
+           6: '-1.9055818715595952777533346765752344935e1',
+           7: '1.26306067538987510135943101851905310045e0',
+           8: '-6.913916969178458046793476128409110926069e0',
+           9: '-6.76462266509498065300115641383621209887e-1',
+           10: '3.36786044502660788709035278568406424256e0',
+           11: '1.800675164312590810020103216906571965203e1',
+           12: '6.838828926794279896350389904990814350968e0',
+           13: '-1.031516451921950498420447675652291096155e0',
+           14: '4.129106232130622755368055554332539084021e-1'},
+          {1: '2.157389007494053627033175177985666660692e0',
+           6: '2.38071221980958052317231217981527971275e1',
+           7: '8.8627792492165554903036801415266308369e-1',
+           8: '1.313913039759876381480201677314222971522e1',
+           9: '-2.604415709287714883747369630937415176632e0',
+           10: '-5.193859949783872300189266203049579105962e0',
+           11: '-2.041234071154150778768154893536134356354e1',
+           12: '-1.230085625250572261314889445241581039623e1',
+           13: '1.521553095008539362178397458330791655267e0'}],
+    'c': {1: '1.458885278405539719101539582255752917034e-2',
+          8: '2.024197887889332650566666683195656097825e-3',
+          9: '2.178047084569716646796256135839225745895e-1',
+          10: '1.274895340854389692868677968654808668201e-1',
+          11: '2.244617745463131861258531547137348031621e-1',
+          12: '1.787254491259903095100090833796054447157e-1',
+          13: '7.594344758096557172908303416513173076283e-2',
+          14: '1.294845879197561516869001434704642286297e-1',
+          15: '2.947744761261941714007911131590716605202e-2'},
+    'd': {1: '2.034666655224434599707885098832906986649e-2',
+          8: '1.069617650982700109541321983413338230042e0',
+          9: '7.680834711303187278673130261850350530338e-2',
+          10: '1.130778186885240437498706751119241126785e-1',
+          11: '2.552587357981962194892445789565762186511e-1',
+          12: '-9.825898086919164036191607912120918904022e-1',
+          13: '3.981545824421514217762002137442675068982e-1',
+          16: '4.932600711506839027871318637915324696208e-2'},
+    }
+
+tableaus['rks98'] = {
+    'doc': '''\
+  Sharp 9(8)
+
+### Reference
+  * Philip W. Sharp, "High order explicit Runge-Kutta pairs for ephemerides of the Solar System and the Moon",
+    Journal of Applied Mathematics & Decision Sciences, 4(2), 183-192 (2000),
+  * https://github.com/SciML/DiffEqDevTools.jl/blob/master/src/ode_tableaus.jl
+
+@note The floating point coefficients here were generated from the rational ones from the 2nd reference.''',
+    'a': ['0', '1/50',
+          '9.66220283800537781651565568869531890039129854640901213159807057025513165826690659288e-2',
+          '1.44933042570080667247734835330429783505869478196135181973971058553826974874003598893e-1',
+          '3.11111111111111111111111111111111111111111111111111111111111111111111111111111111111e-1',
+          '3.51498773299780208885007017507765081905783415195317477342800010797639951702224305104e-1',
+          '1.47701226700219791114992982492234918094216584804682522657199989202360048297775694896e-1',
+          '52/125', '39/125', '21/200',
+          '5.87002096436058700209643605870020964360587002096436058700209643605870020964360587002e-1',
+          '6.838184959735590571970098837913569226343131475385671787888536693257464832339250793e-1',
+          '8.79003558718861209964412811387900355871886120996441281138790035587188612099644128114e-1',
+          '229/250', '1', '1'],
+    'b': [{},
+          {1: '1/50'},
+          {1: '-1.3677338082684416521484257374903677512719677066274978006646616817250635870287502595e-1',
+           2: '2.33395409206897943379999130635989964131109756126839901382446873875057675285544091877e-1'},
+          {1: '3.62332606425201668119337088326074458764673695490337954934927646384567437185008997233e-2',
+           3: '1.0869978192756050043580112649782233762940210864710138648047829391537023115550269917e-1'},
+          {1: '1.93101200330205381129632393375249728863798118161035750556803447904498441444456645259e-1',
+           3: '-6.477099856031238858956915295121609784973213094512817520786940822584145136714730382e-1',
+           4: '7.65719896384029615877170247248022360744634302401357112633001745465027183338127504049e-1'},
+          {1: '4.77439440833806232500188714529354943400951843563751259289256424427344686758530074484e-2',
+           4: '1.96932175795354826650179476488669790168656892603887237546677770684075728220363810345e-1',
+           5: '1.06822653421044758984808669566159797397031338235055113867196597670829754806007487311e-1'},
+          {1: '5.35653520740100302121103332775188587103176832181869303040831220432325640950516524391e-2',
+           4: '1.20625588947728919056244246899316675798038285391744744331826391017415590396850177402e-1',
+           5: '-6.7750756225149701080673518583857606163917837693866673698932599085495183512419090449e-2',
+           6: '4.12610419036305429273119208992569897497784538886175217202230752272070773182929555031e-2'},
+          {1: '4.62222222222222222222222222222222222222222222222222222222222222222222222222222222222e-2',
+           6: '1.56583674083394386420831384025620810581726829112411811849222219222877791193826581916e-1',
+           7: '2.13194103694383391356946393752156967196050948665365965928555558554899986583951195862e-1'},
+          {1: '741/16000',
+           6: '7.51502406476090389349073807809004819189545346828427154623710864742465169193996381623e-2',
+           7: '2.12474759352390961065092619219099518081045465317157284537628913525753483080600361838e-1',
+           8: '-351/16000'},
+          {1: '4.7137080516757085574515948321137215083505479500017506389832288785406673435804068485e-2',
+           6: '2.09088767177245700619002712371830037495557938247264604576291946948488435273048771651e-1',
+           7: '1.00170199845336072001441249674316806102355300084726572203232579503666601315305977833e-1',
+           8: '-4.1746535935132619792943174258604390602569938027379993697699660376037253597563110535e-2',
+           9: '-2.0964951160420623840201673610867966807884877980462868947165715486152445642659570743e-1'},
+          {1: '9.6250625480495430850179197845618401329533753029113574890463906141258487974102752302e-2',
+           6: '-3.2889823940483436676586225555059183413399004899899513082733172247062419719368801086e0',
+           7: '1.58120592819482939980472941802825082360990331356773185743485106618875616830910113284e-1',
+           8: '1.38472174110756949611966846419084262312633249684929784010383708600379765979254809143e0',
+           9: '2.38689153107685450091794555753665319888363091085120276623574076954818022830367973855e0',
+           10: '-3/20'},
+          {1: '-4.1407181780829333826951338677923830282957788550316015757490123469403067795923041646e-1',
+           6: '2.79362329285576366638884698134000509392713675687003189893845038096478481618920557795e0',
+           7: '-3.9420148894844370214218382106635188284591903158605020970611433089765204398968285433e0',
+           8: '-1.8050833493703232778218655623536664178736717202844850014226094729833601601906484738e0',
+           9: '-8.2411175299103457871280197945625000732690195817565658068273621079502124203745163579e-2',
+           10: '3.76724363839931467375143823390080271058360595326428259518770377058250406454692000855e0',
+           11: '3.66532796680637812441222026292597668018700554869965598789627155511871004748252089945e-1'},
+          {1: '2.57118803244482153847626462807856681730780184786345438393372906485058163365316011894e-1',
+           6: '3.22367498544415690028414563287198307551779583958713835991093894064695605463707833852e0',
+           7: '3.95644809715768343577645732188103093651324923567481376817610794743631132119165042871e0',
+           8: '1.90269610866406552179805731106267938194469931412329236667880503143330311252532589886e0',
+           9: '-5.2391055401717914982701824261828721839527015786103641427597273886467794920713496236e0',
+           10: '-2.689948131327298704120797334842045766357444468476740301955899039037397552857497375e0',
+           11: '-1.6326510182468950685438619936368781848861272140333241607130497353632849427158674841e0',
+           12: '1.10077025395445846919296783742614641536163480794527995340824137263302194802498793285e0'},
+          {1: '4.08583369788787674770196821641246834353608695949114599877074475305978651235285469124e0',
+           6: '-2.2271040812705511368267126642675337195508778742206509440033684681620630123740836983e1',
+           7: '2.14948200377041255968873743962135304520531006690258805591495319234107676337073934764e1',
+           8: '-1.2574667847036709064117981533059871307009863478980024060295805266513615915043138735e1',
+           9: '2.5402565104986927758981385177013504570086179777434132937458424261533357606226911778e1',
+           10: '-2.4865730830721493170953431486117421078941351149011810402690627604263543458446989032e1',
+           11: '1.82479073749516085147180202069097519978378918397970543443181892233252604987304701845e1',
+           12: '-9.4291787815393124480125158715016538695138573450523345127986553789149287859337960255e0',
+           13: '8.25492056472487433062307536805028087460591469502464576121882769983546032147130645121e-1'},
+          {1: '-2.0602212042704652199244807912284589395147988173289204904243925620741467390453149503e0',
+           6: '-2.3055564596876178326198929677498175792624263330011017577312032231421737767030559692e0',
+           7: '-1.8379647671170325920306936223300488315443940076512542750939032591666020672221106554e1',
+           8: '9.80063543421329918398827905876150569685353384114341904048681595591515045410441012888e-1',
+           9: '6.44589158658994320826489839207649833491520903216082715269469597755156737618623074351e0',
+           10: '1.69192749452203241565519919050371391213914448119219462829620457478758678378197682618e1',
+           11: '-2.0988423575394962681126735718162381051185885412147351718156202906941587529583151802e0',
+           12: '1.32027878990329475096946854788916481157084451169381843791872814006897180501111028426e0',
+           13: '1.29768753187020321933985725604863066333871547241993002451338834678114639100987388885e-1',
+           14: '4.89900743459928848448110776111870354430304809243733908347583718104632373992549620659e-2'},
+          {1: '-1.2158274587431439669291103556715073078571331121887250332403319959071088711190342783e-1',
+           6: '-1.3009191687212087953937489554001604506419126739405937395616109697496506450739882872e1',
+           7: '-1.0172115280165551555631444224047088737887421449467885159610413901710577571727155577e1',
+           8: '-9.137604059768455320850072839729326992033837734500900754998877294941723879220810499e0',
+           9: '2.20271190656799492286306009834337099718633750373570345566819174880669811072575443296e1',
+           10: '6.06122452890837591335001768945892462299766158185132002339883804559430763723850436801e0',
+           11: '9.49756499938619826937987552815088909338119306846899551533354213035888156520270940573e0',
+           12: '-4.7967103151651448708172582989203880579450635055043503690520505457817795045514591312e0',
+           13: '6.51295494211030686568681751222035336828933052420596087187186975501127983652453403424e-1'}],
+    'c': {1: '2.96275053023277765257147159271391983963018401625397769109581065606146193195367573656e-2',
+          8: '7.80838132003046860057542718319735163112389396834314055277737601781852412778315993413e-2',
+          9: '2.07620199958252939386280504658544994598465755307530373969021587633956273026455132933e-1',
+          10: '1.69689395533794848088161847963068489566652421567777796351282799972583366756393555465e-1',
+          11: '1.51705614234815145844037646207281350814128482549399473556449026004053183774844489538e-1',
+          12: '1.44245948285115701641251053349684808091393327368972824014235232832191510849137389325e-1',
+          13: '1.6676153021890558048407663445081122711009057570479204533514887165125623313477996644e-1',
+          14: '1.9253428562124359476213019756939969464461001236529820847554398310239020067981136988e-2',
+          15: '3.30125647043589625485103058545564456472676564190264834875762168569205517930399726031e-2'},
+    'd': {1: '2.98603077327271866543455374899994274225585056921637520652930266673233165901602953218e-2',
+          8: '6.57755975911182224511842125160987804765191941684313617933281553333569953681029565846e-2',
+          9: '2.13956779658119140898029891022265645728716698807857092033794693592749028494691587115e-1',
+          10: '1.68721578796992869389907340999574096253253203866862151079585793545930377244267574219e-1',
+          11: '1.71768360736786458177293485795001832452979570477507671772344473084105210367066149609e-1',
+          12: '1.25492680790662476798676554483056276508051861757938232565244001424475853044387070116e-1',
+          13: '1.89263652417235144013217502395309419983557239873730317305944966458721798394126740078e-1',
+          16: '3.51610422763585016173454752986945211743637253555094213844648898933374204971976269572e-2'},
+    }
+
+tableaus['rkf108'] = {
+    'doc': '''\
+  Feagin's RK8(10) method -- a 10th-order method with an embedded 8th-order method.
+
+### Reference
+  * T. Feagin, "[A Tenth-Order Runge-Kutta Method with Error Estimate](http://sce.uhcl.edu/feagin/courses/rk10.pdf)",
+    [coefficient file](http://sce.uhcl.edu/rungekutta/rk108.txt)''',
+    'a': ['0', '1/10', '5.393578408029817875324851978813024368572734497010090155055e-1',
+          '8.0903676120447268129872779682195365528591017455151352325825e-1',
+          '3.0903676120447268129872779682195365528591017455151352325825e-1',
+          '9.81074190219795268254879548310562080489056746118724882027805e-1',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '3.54017365856802376329264185948796742115824053807373968324184e-1',
+          '8.82527661964732346425501486979669075182867844268052119663791e-1',
+          '6.42615758240322548157075497020439535959501736363212695909875e-1',
+          '3.57384241759677451842924502979560464040498263636787304090125e-1',
+          '1.17472338035267653574498513020330924817132155731947880336209e-1',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '3.0903676120447268129872779682195365528591017455151352325825e-1',
+          '5.393578408029817875324851978813024368572734497010090155055e-1', '1/10', '1'],
+    'b': [{},
+          {1: '1/10'},
+          {1: '-9.1517656137529144052001501927534215431895138766436972056466e-1',
+           2: '1.45453440217827322805250021715664459117622483736537873607016e0'},
+          {1: '2.02259190301118170324681949205488413821477543637878380814562e-1',
+           3: '6.06777570903354510974045847616465241464432630913635142443687e-1'},
+          {1: '1.84024714708643575149100693471120664216774047979591417844635e-1',
+           3: '1.97966831227192369068141770510388793370637287463360401555746e-1',
+           4: '-7.29547847313632629185146671595558023015011608914382961421311e-2'},
+          {1: '8.79007340206681337319777094132125475918886824944548534041378e-2',
+           4: '4.10459702520260645318174895920453426088035325902848695210406e-1',
+           5: '4.82713753678866489204726942976896106809132737721421333413261e-1'},
+          {1: '8.5970050490246030218848022594580840141113261563660022259388e-2',
+           4: '3.30885963040722183948884057658753173648240154838402033448632e-1',
+           5: '4.8966295730945019284450701113589820117801547843379009721079e-1',
+           6: '-7.31856375070850736789057580558988816340355615025188195854775e-2'},
+          {1: '1.20930449125333720660378854927668953958938996999703678812621e-1',
+           5: '2.60124675758295622809007617838335174368108756484693361887839e-1',
+           6: '3.25402621549091330158899334391231259332716675992700000776101e-2',
+           7: '-5.95780211817361001560122202563305121444953672762930724538856e-2'},
+          {1: '1.10854379580391483508936171010218441909425780168656559807038e-1',
+           6: '-6.05761488255005587620924953655516875526344415354339234619466e-2',
+           7: '3.2176370560177839010089879904987890408140436860307712925111e-1',
+           8: '5.1048572560806303157775901228512341674467213703175235406759e-1'},
+          {1: '1.12054414752879004829715002761802363003717611158172229329393e-1',
+           6: '-1.44942775902865915672349828340980777181668499748506838876185e-1',
+           7: '-3.33269719096256706589705211415746871709467423992115497968724e-1',
+           8: '4.99269229556880061353316843969978567860276816592673201240332e-1',
+           9: '5.0950460892968610423609869004538625398664323235298960218506e-1'},
+          {1: '1.13976783964185986138004186736901163890724752541486831640341e-1',
+           6: '-7.68813364203356938586214289120895270821349023390922987406384e-2',
+           7: '2.39527360324390649107711455271882373019741311201004119339563e-1',
+           8: '3.97774662368094639047830462488952104564716416343454639902613e-1',
+           9: '1.07558956873607455550609147441477450257136782823280838547024e-2',
+           10: '-3.27769124164018874147061087350233395378262992392394071906457e-1'},
+          {1: '7.98314528280196046351426864486400322758737630423413945356284e-2',
+           6: '-5.20329686800603076514949887612959068721311443881683526937298e-2',
+           7: '-5.76954146168548881732784355283433509066159287152968723021864e-2',
+           8: '1.9478191571210416497630626214738287115614292135440936473809e-1',
+           9: '1.45384923188325069727524825977071194859203467568236523866582e-1',
+           10: '-7.82942710351670777553986729725692447252077047239160551335016e-2',
+           11: '-1.14503299361098912184303164290554670970133218405658122674674e-1'},
+          {1: '9.85115610164857280120041500306517278413646677314195559520529e-1',
+           4: '3.30885963040722183948884057658753173648240154838402033448632e-1',
+           5: '4.8966295730945019284450701113589820117801547843379009721079e-1',
+           6: '-1.37896486574843567582112720930751902353904327148559471526397e0',
+           7: '-8.61164195027635666673916999665534573351026060987427093314412e-1',
+           8: '5.78428813637537220022999785486578436006872789689499172601856e0',
+           9: '3.28807761985103566890460615937314805477268252903342356581925e0',
+           10: '-2.38633905093136384013422325215527866148401465975954104585807e0',
+           11: '-3.25479342483643918654589367587788726747711504674780680269911e0',
+           12: '-2.16343541686422982353954211300054820889678036420109999154887e0'},
+          {1: '8.9508029577163289104961313233658513814815627924156134599171e-1',
+           3: '1.97966831227192369068141770510388793370637287463360401555746e-1',
+           4: '-7.29547847313632629185146671595558023015011608914382961421311e-2',
+           6: '-8.51236239662007619739049371445966793289359722875702227166105e-1',
+           7: '3.98320112318533301719718614174373643336480918103773904231856e-1',
+           8: '3.63937263181035606029412920047090044132027387893977804176229e0',
+           9: '1.54822877039830322365301663075174564919981736348973496313065e0',
+           10: '-2.12221714704053716026062427460427261025318461146260124401561e0',
+           11: '-1.58350398545326172713384349625753212757269188934434237975291e0',
+           12: '-1.71561608285936264922031819751349098912615880827551992973034e0',
+           13: '-2.44036405750127452135415444412216875465593598370910566069132e-2'},
+          {1: '-9.1517656137529144052001501927534215431895138766436972056466e-1',
+           2: '1.45453440217827322805250021715664459117622483736537873607016e0',
+           5: '-7.77333643644968233538931228575302137803351053629547286334469e-1',
+           7: '-9.10895662155176069593203555807484200111889091770101799647985e-2',
+           13: '9.10895662155176069593203555807484200111889091770101799647985e-2',
+           14: '7.77333643644968233538931228575302137803351053629547286334469e-1'},
+          {1: '1/10',
+           3: '-1.57178665799771163367058998273128921867183754126709419409654e-1',
+           15: '1.57178665799771163367058998273128921867183754126709419409654e-1'},
+          {1: '1.81781300700095283888472062582262379650443831463199521664945e-1',
+           2: '27/40',
+           3: '3.4275815984718983994222055341385087174233873470395891993726e-1',
+           5: '2.59111214548322744512977076191767379267783684543182428778156e-1',
+           6: '-3.58278966717952089048961276721979397739750634673268802484271e-1',
+           7: '-1.0459489594088330609505006875640990513158812317237848928608e0',
+           8: '9.30327845415626983292300564432428777137601651182965794680397e-1',
+           9: '1.77950959431708102446142106794824453926275743243327790536e0',
+           10: '1/10',
+           11: '-2.82547569539044081612477785222287276408489375976211189952877e-1',
+           12: '-1.59327350119972549169261984373485859278031542127551931461821e-1',
+           13: '-1.45515894647001510860991961081084111308650130578626404945571e-1',
+           14: '-2.59111214548322744512977076191767379267783684543182428778156e-1',
+           15: '-3.4275815984718983994222055341385087174233873470395891993726e-1',
+           16: '-27/40'}],
+    'c': {1: '3.33333333333333333333333333333333333333333333333333333333333e-2',
+          2: '1/40',
+          3: '3.33333333333333333333333333333333333333333333333333333333333e-2',
+          5: '1/20',
+          7: '1/25',
+          9: '1.89237478148923490158306404106012326238162346948625830327194e-1',
+          10: '2.77429188517743176508360262560654340428504319718040836339472e-1',
+          11: '2.77429188517743176508360262560654340428504319718040836339472e-1',
+          12: '1.89237478148923490158306404106012326238162346948625830327194e-1',
+          13: '-1/25',
+          14: '-1/20',
+          15: '-3.33333333333333333333333333333333333333333333333333333333333e-2',
+          16: '-1/40',
+          17: '3.33333333333333333333333333333333333333333333333333333333333e-2'},
+    'd': {1: '3.33333333333333333333333333333333333333333333333333333333333e-2',
+          2: '1/45',
+          3: '3.33333333333333333333333333333333333333333333333333333333333e-2',
+          5: '1/20',
+          7: '1/25',
+          9: '1.89237478148923490158306404106012326238162346948625830327194e-1',
+          10: '2.77429188517743176508360262560654340428504319718040836339472e-1',
+          11: '2.77429188517743176508360262560654340428504319718040836339472e-1',
+          12: '1.89237478148923490158306404106012326238162346948625830327194e-1',
+          13: '-1/25',
+          14: '-1/20',
+          15: '-3.33333333333333333333333333333333333333333333333333333333333e-2',
+          16: '-1/45',
+          17: '3.33333333333333333333333333333333333333333333333333333333333e-2'},
+    }
+
+tableaus['rkc108'] = {
+    'doc': '''\
+  A modification of Curtis' order 10 Runge-Kutta scheme with an order 8 embedded scheme
+
+### Reference
+  * A.R.Curtis, "High-order Explicit Runge-Kutta Formulae, Their uses, and Limitations",
+    J. Inst. Maths Applics (1975) 16, 35-55.
+  * [Rational coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10a(8)_2.pdf)''',
+    'a': ['0',
+          '1.452518960316150517617548528770033320314511251329947060838468741983976455607179673401e-1',
+          '1.452518960316150517617548528770033320314511251329947060838468741983976455607179673401e-1',
+          '2.178778440474225776426322793155049980471766876994920591257703112975964683410769510101e-1',
+          '5.446946101185564441065806982887624951179417192487301478144257782439911708526923775252e-1',
+          '6.536335321422677329278968379465149941415300630984761773773109338927894050232308530303e-1',
+          '2.746594919905254008808021630247618520892150865127407293922085868737635475402543533498e-1',
+          '7.735775201106609448405825008093973718589542913426807556412662673054607938029043386501e-1',
+          '5.801831400829957086304368756070480288942157185070105667309497004790955953521782539876e-1',
+          '1.174723380352676535744985130203309248171321557319478803362088220814723414805867429383e-1',
+          '3.573842417596774518429245029795604640404982636367873040901247917361510345429002009092e-1',
+          '6.426157582403225481570754970204395359595017363632126959098752082638489654570997990908e-1',
+          '1.174723380352676535744985130203309248171321557319478803362088220814723414805867429383e-1',
+          '8.825276619647323464255014869796690751828678442680521196637911779185276585194132570617e-1',
+          '3.573842417596774518429245029795604640404982636367873040901247917361510345429002009092e-1',
+          '6.426157582403225481570754970204395359595017363632126959098752082638489654570997990908e-1',
+          '8.825276619647323464255014869796690751828678442680521196637911779185276585194132570617e-1',
+          '1',
+          '3.510848126232741617357001972386587771203155818540433925049309664694280078895463510848e-1',
+          '6.157407407407407407407407407407407407407407407407407407407407407407407407407407407407e-1',
+          '1'],
+    'b': [{},
+          {1: '1.452518960316150517617548528770033320314511251329947060838468741983976455607179673401e-1'},
+          {1: '7.262594801580752588087742643850166601572556256649735304192343709919882278035898367003e-2',
+           2: '7.262594801580752588087742643850166601572556256649735304192343709919882278035898367003e-2'},
+          {1: '5.446946101185564441065806982887624951179417192487301478144257782439911708526923775252e-2',
+           3: '1.634083830355669332319742094866287485353825157746190443443277334731973512558077132576e-1'},
+          {1: '5.446946101185564441065806982887624951179417192487301478144257782439911708526923775252e-1',
+           3: '-2.04260478794458666539967761858285935669228144718273805430409666841496689069759641572e0',
+           4: '2.04260478794458666539967761858285935669228144718273805430409666841496689069759641572e0'},
+          {1: '6.536335321422677329278968379465149941415300630984761773773109338927894050232308530303e-2',
+           4: '3.268167660711338664639484189732574970707650315492380886886554669463947025116154265151e-1',
+           5: '2.614534128569070931711587351786059976566120252393904709509243735571157620092923412121e-1'},
+          {1: '8.233707757482716585173454344310125296066814318521742241762319051772963627695955263034e-2',
+           4: '2.119171963202803561687843468555305553175658807629274312902985594840086570224567152664e-1',
+           5: '-3.997343508054218311577932550061320162379840049816347807630118786107674477850206579628e-2',
+           6: '2.037865317596006197606259822674324543477946306275935376058802473310199901934015124941e-2'},
+          {1: '8.595305779007343831562027786771081909543936570474230618236291858949564375587825985001e-2',
+           6: '2.9117694780588509603371796217615533998560260495983930139818745949422898370643297e-1',
+           7: '3.964475145147024104912442607655312127779123206780991480607158892217361663405931088001e-1'},
+          {1: '8.612093485606967549983047372292119178898514571588438099912534616486575243508895957628e-2',
+           6: '1.39746482682444208903631389100118980107442531458232673771628856352118359545509026848e-1',
+           7: '3.951098495815674599900526056001284215294125840404176924334653987770478924197803010468e-1',
+           8: '-4.07941270370856357630775928161205645316245427075241804732699008149364090482000334835e-2'},
+          {1: '7.233144422337948077616348229119326315582930871089020733092900891206129381937795204778e-2',
+           6: '2.200276284689998102140972735735070061373242800181187459951219347361114857342828430157e-1',
+           7: '8.789533425436734013369780264792573637952226487753296416823846876217040795688489371334e-2',
+           8: '-4.44538399626035086399067488061110898683286064819603000058000469000226810898423864173e-2',
+           9: '-2.183282289488754689095532966861839909872150913926337371522805434288481649401165594213e-1'},
+          {1: '8.947100936731114228785441966773836169071038390882857211057269158522704971585365845223e-2',
+           6: '3.946008170285561860741397654755022300929434262701385530048127140223687993778661654316e-1',
+           7: '3.443011367963333487713764986067104675654371857504670290688086760696354596195596354011e-1',
+           8: '-7.94668266429266129069493811311943099705381514086377232876415086658249242589223139578e-2',
+           9: '-3.91521894789596612383496799639196285338054580884009126806427781275255349911456944418e-1'},
+          {1: '3.210006877963209212945282736072241886741425314298532400216927262619488479186214523312e-2',
+           8: '-1.846375997512050141835163881753227910996323204749769226655464078048769505209525299752e-4',
+           9: '1.560894025313219860759149162557283383430181475726228517203663063649626288079337909898e-1',
+           10: '1.934496857654560252749984220385188727138526287670744309970093278715606577140084022992e-1',
+           11: '2.611612387636636496908928477536452288263163392010050661129958478089356710938164130987e-1'},
+          {1: '4.423749328524996327035388417792688154433173133294892285295756457561276315648477233732e-2',
+           8: '4.640774434539039636406222168781981616534115643208114455689698789119941732444857047798e-3',
+           9: '4.704660282615136532130927218172390570903230981414159347904277946537920001824903276586e-2',
+           10: '8.620749948011488160369445167416002799205317397013619044391270706339561700281526529703e-2',
+           11: '-2.607983024682138093233254079066687623148682426317395111719299641390118652802949600035e-2',
+           12: '-3.85802017439662153249327763915949958133323507653129897782009313981339939013776885094e-2'},
+          {1: '2.318046717429411567006043539613275607940758021709332569729352990777336390158311630529e-2',
+           8: '3.197856784116367067302124322582100058864027838197120089129330601737324659881765852593e-1',
+           9: '5.933233331841898686063939886797828376866051205773280426848164018120869674204443797948e-1',
+           10: '-1.937519548878479314706815782408229952008442222624773168771865465659822020582450444783e0',
+           11: '1.803950557030502357344063195737827904476240180662764468232042537858892203518134072359e-1',
+           12: '-4.554014298857220726863505256926549022316460712353658688873150702827663762861750674926e-1',
+           13: '2.158764106255762807077594619172645539322916635447781333204724468181634037726021280742e0'},
+          {1: '2.624364325798105891527733985858552391723553030719144065844544880498188553839263944447e-2',
+           8: '4.86313942386726610652684391360922599625307372738196154441526323943157158604362233276e-2',
+           9: '4.274382538346478867636942429421724367591866585774144180215122660980822123988151132213e-2',
+           10: '-4.862259869465547771298976981868643277396586803130813159599600102115609499827986711663e-1',
+           11: '1.326047194917652331781527125743684254490968718259563958293167893998110899691451568372e-1',
+           12: '-9.402962152946515651634831658142934852383791641671387741034606371378082209616938685225e-2',
+           13: '6.993864679941022534190304512277131176659196396138275832136258135631963192299339871223e-1',
+           14: '-1.197020013028860976492784934312243036670658451195397948726104511062042521592125912599e-2'},
+          {1: '5.56806664153621646109082306891780343606636580436190353212534947455147612081355812583e-2',
+           8: '-4.324853319508358432896036654421685136736530810118924113940744870078036705505610668088e-1',
+           9: '-9.979726994172038714656907882931844552238093285811791155499130927685987422432191170216e-1',
+           10: '2.707893755718926115778725270396739994070337972517006747100005607751792006959604868323e0',
+           11: '-1.02482302351213292931356715657696995485523227274903834767181819593558509529512783915e0',
+           12: '1.334565206642246959252239602313589265188981560552694580059808406200559397799055652161e0',
+           13: '-2.587748998830690939658228913150922979184368065866213469477796089200252812362701917187e0',
+           14: '8.992773696348355846430438306111181223414632598285854300924423251352733205187087732678e-2',
+           15: '1.497578446211167333777988534023066333042434967475357134513165331964695787890042760189e0'},
+          {1: '-8.434891199686377639125188391985671318383858641413517143104162188088468627447515172982e-4',
+           8: '7.602144218856081893754106886111596435015500427480120290148318740899211421773423234728e-1',
+           9: '1.769083927820959377467464871522349066447068428702073590698445112684989184432409492025e0',
+           10: '-4.499239797622297101452915424261016593995695456495268863455643396071539024609271033574e0',
+           11: '1.490558190212043468817221563278239942209691100326719140478588601720867838040211450448e0',
+           12: '-2.552203480132132516997563217309689292804518121743365818482497611667126218719069737195e0',
+           13: '4.795167551528575994217413424533259845001657006088189480440731104737960266616292993321e0',
+           14: '-9.161854401769482236671414092387917470686251714192236693920061138984202381209109248553e-2',
+           15: '-1.525735678746850818217653470352135651821164556169070505816135230784807058389577753184e0',
+           16: '7.371445601564892133467497107205798584829803038168267854389817508169123996459113657504e-1'},
+          {1: '1.0173669741115766387668096563698289719440800182203328092593987406747388070233710827e-1',
+           8: '-1.696217553209432810711666838709742166182992092906177246174096517233561845662947862824e0',
+           9: '-3.825235846211624254528740857512255693551264719132875740261231165548583482101116676418e0',
+           10: '9.754768979885866648856431516333641627109105703674164986615824197909762854575668793816e0',
+           11: '-2.520767789227152291196336314591227486393143379933686189126240710041836742414125694941e0',
+           12: '5.472417145227780046950992000565734793413395536531652419585004300790370984185945495978e0',
+           13: '-9.781098113458736121002383874108051372067873053264954833376114258940736444388841687929e0',
+           14: '3.189152692455334369024560213486753019540464785641163242047782111839399471147176681561e-1',
+           15: '3.447227036527756718156475010324322155277035924051392880570525223655410460762027138915e0',
+           16: '-6.051983612219277832241707671295607127814820499715293613761402732652780120810041653591e-1',
+           17: '3.334525350307787459202631378414806560287636505658634784117511174230383993073398823363e-1'},
+          {1: '-1.012987737478284424676828232882617689682012456457322189102956361570156443805900941944e-1',
+           6: '-2.409389328948775401304659380663043147167897928467308244359962659633933617326533285822e-2',
+           7: '-6.679880790275182076676283582867036095782150170801495251932447614617249253864579543857e-1',
+           8: '1.600262798493100648047998296908183265688507618079976446601985464092263571149154964705e0',
+           9: '3.706958893826695766827011000213884379914407774639901049574259778345288538246990591819e0',
+           10: '-8.581755560147929325446798534254342948628755672447282004336563881429983605741487870996e0',
+           11: '5.607314974300953986559644699099897253584501767603091982484141468619493221310582281877e-2',
+           12: '-4.547761497422899514520768375507009011918601407646237921467449197008085790456674001879e0',
+           13: '9.255775439941294621826928846245618922061242300726600002589630404152665447900428712156e0',
+           14: '-3.450876657451631707159097079770789925142348071643902737346329921538351794816584861003e-1'},
+          {1: '3.826909723812638609001259641818040193828105314579492422836388985468479567237561247336e-2',
+           6: '7.786978965202527814624406274393101840018332461648638653990700950184871893714491273096e-1',
+           7: '4.859454140913448249612202172501868752761599132465501266008866131088163955018926230543e-1',
+           8: '1.814925350154666364151014269029611427420766367555858499108920245656959783343309816408e0',
+           9: '4.551165245704657956889158854062833952834232753889932986749613143631480116805870313264e0',
+           10: '-7.173770670344544101351160462586215092596352548535380880420409450623251883641801862305e0',
+           11: '-3.943009017000923237232456850787591816773705728833192412204243696911216045268772747196e-1',
+           12: '-6.036544185898100312430357626685382432626027303329497026597513524312479466987506315664e0',
+           13: '7.338904299721887701527380004651998686389416058019429466200740313593568240326087171554e0',
+           14: '-4.143158595971836110248598960027762194900538872022960061452263646470675916118824501965e-1',
+           19: '-3.732349451502749258108621577582478607301443393311959731632798508493352335121760204375e-1'},
+          {1: '2.16233904602204586687862878555058802678057855249460809793119888227679196291224467484e-2',
+           6: '4.611834700744369218866370212060318930941322187829670117414118166503940620998117275429e-1',
+           7: '1.940797759547798743610542713744618433967649025379792966207862125676964319674160574624e-1',
+           8: '7.041001229739959807963554405302474570280838416767002383409508232534658577705201658489e-1',
+           9: '2.877431096792763528910415905652149398266490601780194388811216042455337979365709745445e0',
+           11: '-4.332742088749107411735902392606181444105337491234912425673655059805456011404518143074e-1',
+           12: '-2.234178753588834452567105459024473991729105867012210449973082203886376638514123583334e0',
+           13: '2.235678086885984010238782832657956960650576194069632574873732156942360146780276407657e-1',
+           14: '1.293532338308457711442786069651741293532338308457711442786069651741293532338308457711e-1',
+           19: '1.418136968194278394808045812385429206355105705182818920178205766092934777719870449624e-1',
+           20: '-1.085699633131323582531514699802817081967439754938101617737029931360398856861850276906e0'}],
+    'c': {1: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2',
+          12: '1.38714594258871588254180131280327170214252159859020418169736120493342240193585696898e-1',
+          13: '1.892374781489234901583064041060123262381623469486258303271944256799821862794952728707e-1',
+          14: '9.461873907446174507915320205300616311908117347431291516359721283999109313974763643533e-2',
+          15: '2.77429188517743176508360262560654340428504319718040836339472240986684480387171393796e-1',
+          16: '1.38714594258871588254180131280327170214252159859020418169736120493342240193585696898e-1',
+          17: '9.461873907446174507915320205300616311908117347431291516359721283999109313974763643533e-2',
+          18: '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-2'},
+    'd': {1: '3.339829895931337572271945815422988633728883413227543303554098429202731077409488318421e-2',
+          9: '5.024509803921568627450980392156862745098039215686274509803921568627450980392156862745e-2',
+          10: '-1.423859191318858946753152353981644782061337055184060977838998119673893661279423564924e-1',
+          11: '2.126013199429258434998789109063801828540550730541648287733608913970804891935883227446e-1',
+          12: '3.254854965632843133622967470840062095221514741629108993207015882688341071771214986692e-1',
+          13: '3.312629399585921325051759834368530020703933747412008281573498964803312629399585921325e-1',
+          14: '1.887845809230650005639203350759631573314744764356665687950807917985316096487827551997e-1',
+          19: '6.15981109428714460440450884767920076156915483969870153340677975367599950638846296207e-2',
+          20: '-9.440109660594088037957791636147830082275023098021053120999763935859315478744850552959e-2',
+          21: '3.341117040855897708234682470384970584684876341854831047975628586614323631403861184369e-2'},
+    }
+
+tableaus['rkb109'] = {
+    'doc': '''\
+  Baker 10(9) method.
+
+### Reference
+  * Tom Baker, University of Teeside, "RK-Aid software: RK10921M".
+    [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK10/RKcoeff10c_1.pdf)''',
+    'a': ['0',
+          '2.232129192123735665527132860096509572180113541116006004801774831897914255866976731834e-1',
+          '3.348193788185603498290699290144764358270170311674009007202662247846871383800465097751e-1',
+          '5.022290682278405247436048935217146537405255467511013510803993371770307075700697646627e-1',
+          '1.176948756548443596524604744040430749724814058786280779261159420482531581524139111558e-1',
+          '6.42592367760446208621905710521970519348071310926243186451770334640204073764980200525e-1',
+          '1.81826565311210497e-1',
+          '4.341610334077954337462856744299909865481150413847250582144329859884319977831972426112e-1',
+          '7.122335424182418496009012272374473135415214567547251841147975874613222331084545787886e-1',
+          '1.894400309592476109308204841234726559856268372193596062465558450034952083309882121192e-1',
+          '4.943921538691045853333333333333333333333333333333333333333333333333333333333333333333e-1',
+          '6.403413702953303301268868454436798781085931758963391614454137298592697657577711636312e-1',
+          '7.41588230803656878e-1', '3.82911329862520855e-1', '1.07157755822487322e-1',
+          '8.75691376241245711e-1', '9.64069299370187816e-1', '2.81729610523717922e-1',
+          '6.31145492177176748e-1', '9.73803039377034607e-1', '1'],
+    'b': [{},
+          {1: '2.232129192123735665527132860096509572180113541116006004801774831897914255866976731834e-1'},
+          {1: '8.370484470464008745726748225361910895675425779185022518006655619617178459501162744378e-2',
+           2: '2.511145341139202623718024467608573268702627733755506755401996685885153537850348823314e-1'},
+          {1: '1.255572670569601311859012233804286634351313866877753377700998342942576768925174411657e-1',
+           3: '3.76671801170880393557703670141285990305394160063326013310299502882773030677552323497e-1'},
+          {1: '8.64501263186028304309582758844308034258998816820951820303015617265404005372645736304e-2',
+           3: '5.236243791730284147504959465381950604441622286481307774905930763200738501679225239292e-2',
+           4: '-2.111768858106131225354739613420723449783469866828018185324492731029462740164291486751e-2'},
+          {1: '-2.639257721366917655020719039008537814312675653905044467083967854693494521584367325145e-2',
+           4: '3.321586951309942525210016931443520748342752809336835485070926725007327816351124496012e-1',
+           5: '3.368262498431211326511112077677038226569227865316100826155173406864062373457114241753e-1'},
+          {1: '4.214481430128891924590207161639307925193144098983055869572587559196013842334308634337e-2',
+           5: '1.395091008993089985837339976891755843541033762656629420011519949721775047502000865276e-1',
+           6: '1.726501106125791703639306944313363939651827445064993031221294358623568264568271289984e-4'},
+          {1: '1.913223517063317850561878098464623128757461736096094048517648270556161690028960671678e-1',
+           5: '-6.549476653170516368338607340883454058106339891146285998978549868910881698171713079544e-1',
+           6: '1.755876323742502725238471568246235150972597859217101866902108545773998108136024750683e-2',
+           7: '8.80227583781090258271573882989411727973276878297573234591502060366164017516112235891e-1'},
+          {1: '5.819519506251173970176101222224200992345451475572200041442763494089781743712740682029e-2',
+           6: '1.647908558976784212367930935320516004070340774715814512653291320117464889726338996259e-1',
+           7: '2.562758618556534830885936612274458691344630164445656645146446091037555911278059725788e-1',
+           8: '2.329716296023982055737534602557078340765698480828560679203962114049223355708872997637e-1'},
+          {1: '6.609808969751805186432114363691927852621669632797821827493854746683225501745446560252e-2',
+           6: '4.993798303607936315852000088060192246997357096577012552548527217200430403080630524414e-2',
+           7: '1.536216094454890707317822140262379594167730891287251273659790090180235843883503581847e-1',
+           8: '-5.414130381994316899529893137177555939937633423733000345305400547297139497578508331128e-2',
+           9: '-2.607634739989570582850394304851094502796018496578386146679297818039354012983783360089e-2'},
+          {1: '5.977281413067455622264838600535046960155059547948827360548395666199015131925709118733e-2',
+           8: '1.656649460691327819663527933964608353435263909407310250007028968559622442637053740488e-1',
+           9: '-1.270467077219322361480177163110966635379558631317440513037999854071349138024611223099e-3',
+           10: '2.702248607465165695058123310946329950236359055444314752401844796694522868883954793203e-1'},
+          {1: '5.714646346927726543617292683289117330020257083064077657640682066128476784510949443172e-2',
+           9: '1.706647333279140031893907789070497592665517669717541507696626200796144815409471923569e-2',
+           10: '2.853767151165243146804641383356191775396044057521502467001987179873305495674085297549e-1',
+           11: '2.807517183767373496913107023844645513421310226163727230918419292026930001911584202089e-1'},
+          {1: '5.71369077066741124588875490466570144861997949456488820236659968850857120123548360966e-2',
+           9: '8.662146075905090149738288126241361791710263955784173047391548833627524888649185757901e-2',
+           10: '2.854329582389984323634810972884390808440109342965556282630983683305184760043391707767e-1',
+           11: '2.797633923959254653770985744082321055561046971559230633717557229339774187704436927395e-1',
+           12: '3.263351170300796630314989799425818119658193404403069586756442351414314432637044280815e-2'},
+          {1: '5.792154217958510846632846508298421800727675597066414244319766319648769731268367294802e-2',
+           9: '-1.168598764394854203108670771355968386139754171212251879659829443523204385801129100146e-1',
+           10: '2.79127002447720706638185160361017050812929253473165746503837336782194728720095347281e-1',
+           11: '5.523482312158897030618178268050450731680950103624425704577340542168627357243106364454e-2',
+           12: '3.313821420230448163586175200236513161592367149984143944502756986720155621978125806284e-2',
+           13: '7.434962435080700826430991700872593086103623514130960252814696908475018275512156807813e-2'},
+          {1: '5.424349131266048906033564077410202025889503282676783408313456162421294081865905389248e-2',
+           9: '2.555744036484019017045493997261865838594175905367142496400185786785191604031397243218e-2',
+           10: '1.065318948685044129706483445621162791089602467505369099004177225283624953902959013228e-1',
+           11: '1.494739176822617600298548318084537294306548147599349812604239821749187453609545343658e-1',
+           12: '-7.541418150821686840498891896239704084250667222662001839556328840119093341810397465136e-2',
+           13: '1.18366271697470617369516184510635365805481883570886818758516420584483580788051263815e-3',
+           14: '-1.54418469614537368e-1'},
+          {1: '-3.130073355625165399871063999971367682939799979170688711523373232868473829204122305445e-2',
+           9: '-4.393041016682237597697452523147415408933247130414835042917723489831082747083637622576e-1',
+           10: '-2.971894957150042139937620479069507765251785957115322181603409909075380714667735160813e-1',
+           11: '1.262980195755398451585609791771777378208362550125140868265029793320289593624402155837e-1',
+           12: '-1.352235663389501393036813956309918309028161801076417057198393439731017100387729485379e-2',
+           13: '6.695605432945227295340251006073274395173466715429726933128280272846122961086155806635e-1',
+           14: '3.98926850454282556e-1',
+           15: '4.62222650490275222e-1'},
+          {1: '4.254608456033344945622257854593736284131499735662276010271273463216872625702497770866e-2',
+           9: '-1.821182296512653493976221650402057582117417514147759470622260585285199838506585092559e-1',
+           10: '1.693488568788993457692776359468516487310835997985566768493328170663073221084671579068e-1',
+           11: '-2.812932311380423097505532359005039285971305910469541561543126052387690343228512975388e-3',
+           12: '4.36735950043569259248094778483503511208129195337130078583804534697434361708101159525e-1',
+           13: '9.649623253501190961728232014648167901724237884864786722867265364689659268793239634042e-3',
+           14: '1.827541189026459104590716992261562936435133038172843022420870171219768684076842803782e-1',
+           15: '8.16399262978844696334164508237280127139345441636110872140941628245625872014353934424e-2',
+           16: '2.263259013959999629673163223583858004580131789671757969088706528737681492423808136362e-1'},
+          {1: '-6.16278619970676395505256880874324775116572954244464654496172250162895228899656717728e-2',
+           9: '2.630819816424975496840706912577088603030984130761613342651746722632362416592729338065e-2',
+           10: '-6.563819353303824389148917307603424726525093364227772615481314402265589817962663323807e-1',
+           11: '-4.996969738639946601661934398570589720521936732243676171454742217015940903119194293034e-1',
+           12: '-7.123015625596798250364056005999154454586809433543859495632863935368185749281956104361e-2',
+           13: '1.945887064918253295880838290230513152388881501421435771759995471289411971821731631008e-1',
+           14: '7.502438829684451516052952921664213906375154664124515160998662893556068266252405773932e-1',
+           15: '6.778525665536439867432200838066450041417881571145524785032579156045245492715999778952e-1',
+           16: '-1.046057647455310786652080097009039359249473747848876107492887123406055065619567484248e-1',
+           17: '2.627894853849749889545315434384080663867415921515384464319901932333376180798673115539e-2'},
+          {1: '3.796521632874261201186203436841209430559695655768644122346210733272382403437031805294e-2',
+           9: '-2.594056416058702079475722192315214454017994671360402614116801042085357278273610676615e-1',
+           10: '6.023088303591701879982724849459819049819908747310071139535368513067871259409896536125e-1',
+           11: '6.119387226913542078978281038711879095845432514371708320113689988639552031445275756169e-1',
+           12: '-8.557593281472216275173535332798856826091404689475696899046474643882545069592793853088e-1',
+           13: '1.016014044479150879819181655935044451622873646716581194764492422092270586935018600847e0',
+           14: '4.174635465318728144170599907012271233953357864579855698710555478932012900105054820193e-1',
+           15: '-3.142068748294011550388298801522627398568106507178091710884531834553635025761917127745e-3',
+           16: '-3.113859536805386540643212859648902182769708893494791481799285293081168071417215791223e-1',
+           17: '7.475323182002611486490630088842356498085791607202230555314272159767158496743797941577e-2',
+           18: '-6.996051078512155679294752334324570751847195000321862661699180193471489380787256603442e-1'},
+          {1: '6.354247858004162057833209973904648790423789887640110847597201944718467473335513915457e-2',
+           9: '1.335709427214855386564319367816597150656631989678512452281616080142611136536750546091e-1',
+           10: '3.491939710685402856556370077059343902437022368395394555525545826876029022896488736825e-1',
+           11: '-1.284299219085288104043584513269729325317465049017238832115899338924554224999281557779e-1',
+           12: '5.820143454609020234416665664957204705761540086346612646427774305741185500271652747165e-1',
+           13: '-7.032295749061967719609757517752619736970110102217160910226632819061710474763494562046e-2',
+           14: '4.108572358925710179476579003323188290642373757595878674150744283920916547885055706399e-1',
+           15: '-2.510654779239962466269627907503763505655390551209676232633905831376503530736867220512e-2',
+           16: '1.22316625470600778580746057547293072908849606094548963490994433425886946574614312869e-1',
+           17: '4.712374572639742166850752217533416565767093458666637954607896698933218387654817641078e-2',
+           18: '-2.035773172368828280351383367281992122282011746329188150975183458730713499142844139626e-1',
+           19: '-3.073795611150731392306884484695711542343125736903452146138998032605691134742962145162e-1'},
+          {1: '1.189924137880676460852663367282125023346761041034714988771622602337896848257576311721e-1',
+           9: '1.567065389218647018255284948985537561396036403483411695550932448674279128530361565244e0',
+           10: '1.062742213102872753657741254837796588064400661866785937264672961506012193460062190291e0',
+           11: '-7.051696022721412819771965938099389611228930171636494130149946862206926743626267591091e-1',
+           12: '9.907825344767892999287937933800084396119601938859814415204705439463102044422773242413e-1',
+           13: '2.507980962931107922266871779870423357231706420300879746540980799200371363012966217081e-1',
+           14: '1.972591757153629542226038011120263810650524345125694323573613060238829589123920677616e0',
+           15: '-3.262628387941532893880299499584174546880007304318604226454131079685364715701264155684e-1',
+           16: '-7.195961905900189101450624277119790470362703727002334732811111315403329989928142118605e-1',
+           17: '5.802031535291661528133435810283051023192180079596550160030993013203826047471987749923e-1',
+           18: '-1.503104563178041688806298917914932279967077722444117887454135595533548208509663052219e0',
+           19: '-2.082917406986733532241895178393857460921252779279252368270349439324592549474879051363e0',
+           20: '-2.061249557411945026346720362780411363644917364359743227780446952519376385207652951444e-1'}],
+    'c': {1: '3.074440935793207675883517938984149786411995438646211366049687901929864736726360396701e-2',
+          12: '4.447886124335158463373029422601699728444313324875120673928896655863659883998986985001e-1',
+          13: '-7.714472898672551027236427412075689933241937304249667830486089002567926592070578328099e-2',
+          14: '1.895969236666960081782143661904924178003392273539755384045555627359634132139704039829e-1',
+          15: '1.696794742660741325357704245298007854728500376148224262050684467711119689665579207267e-1',
+          16: '3.1077253276234899881550727492069691385016102755909991888550160921835290505255218717e-1',
+          17: '-1.052173416444910172223599400939351222118848154980691993896969290833000795415995203779e0',
+          18: '1.09835316959631060934850660386286981822661822574319104064007152154252895305995434955e-1',
+          19: '-1.334572232187388442842841059278351057902328711498735111118805829160094435254500793407e-1',
+          20: '1.154026328574134208065260150796827370454610532524502151460002781580501491609214462821e0',
+          21: '-1.466682293699578048454932174861727128676735353276311367588113332911578050533016457222e-1'},
+    'd': {1: '3.06993588915105633978419848815291723759470195906443111383956636605349614374098980658e-2',
+          12: '4.50103737076513486300040041681239155223156306056673370657160667766639016450132240786e-1',
+          13: '-6.514757933632400121177566572810133388907129562810217527103583351082868427677317818171e-2',
+          14: '1.916476309177840038043731680068457542540807928558914659725060136615214781805707317846e-1',
+          15: '1.699093037015861786030207592719576231809404332930270025745281206261397945871067257969e-1',
+          16: '2.831822563446878149008449047225439184357774091336334653238641676396106848038134341285e-1',
+          17: '-7.938273328067640993878535581971311480056976834520424653124835645605083935506842817243e-1',
+          18: '1.085805168491408111596918257428235537727685528809234551377846603272747280143198404809e-1',
+          19: '-1.442902422009048623094173280045594665841429401482516755746485620108546739010869727583e-1',
+          20: '8.718101111217405681350791198631736702436128801469513492598526664004710882551915616216e-1',
+          21: '-1.02667760558970463391845252240320899007371474729348103905924e-1'},
+    }
+
+tableaus['rks1110a'] = {
+    'doc': '''\
+  Stone's 26 stage combined order 10 and 11 Runge-Kutta scheme
+
+### Reference
+  * [Coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK11/RKcoeff11_a.pdf)''',
+    'a': ['0',
+          '2.49451043687738934426405343963652121801183546729842636814536698333999371871537308376e-1',
+          '3.74176565531608401639608015945478182701775320094763955221805047500999057807305962564e-1',
+          '5.61264848297412602459412023918217274052662980142145932832707571251498586710958943846e-1',
+          '8.546995299174592915742289900418092935366740866720183954100852188058051166442961011609e-2',
+          '7.310788517640473762691237698106576677338584467168049416410984572334277402413648068397e-1',
+          '1.304049416609471516815374056280027453671928620452985586822237474262182566918325326012e-1',
+          '4.71263635720284726755893314945148290565949917847386950454571797043665666738206917543e-1',
+          '7.730997092193940758126470461455964941402897392485301085000777589597371419303943343132e-1',
+          '2.05629227109756916089466333827969380139163631075011601908931057038758626702918060498e-1',
+          '5.366419968074299811348135248875344652445218400812654186620229284574082136119576258888e-1',
+          '6.950637644720240807995723705690567056506824408065743296638976932495337928615038239116e-1',
+          '8.049629952111449717022202873313016978667827601218981279930343926861123204179364388333e-1',
+          '1.913760139217099199372138166733346224093015957152232805822661231536077778241788913071e-1',
+          '8.894442715562032655697860690613313211578199121477983480401175761840408067430713807992e-1',
+          '4.680151547126001101041424878175828807838998612363955308441536427569141462651129332201e-1',
+          '9.90838618745595489781536293164200140944326990838618745595489781536293164200140944327e-1',
+          '9.000188288457917529655432122010920730559216720015063076633402372434569760873658444737e-2',
+          '4.031478884213807074957145083372292348449431198379304971170328814087579865980988000623e-1',
+          '2.426620464737056665307786384019567876070118222584590297594781899714635140644109253975e-1',
+          '7.208245981830887491264849755415793151642208245981830887491264849755415793151642208246e-1',
+          '1.999681579366342939022448654672822798917369845565992676325425887597516319057474924375e-1',
+          '9.639977912755383765875207067918277194919933738266151297625621203754831584759801214798e-1',
+          '7.436137801734239512538082962268572767752519334426997890789782048277478322006093273963e-1',
+          '1', '1'],
+    'b': [{},
+          {1: '2.49451043687738934426405343963652121801183546729842636814536698333999371871537308376e-1'},
+          {1: '9.3544141382902100409902003986369545675443830023690988805451261875249764451826490641e-2',
+           2: '2.80632424148706301229706011959108637026331490071072966416353785625749293355479471923e-1'},
+          {1: '1.403162120743531506148530059795543185131657450355364832081768928128746466777397359615e-1',
+           3: '4.209486362230594518445590179386629555394972351066094496245306784386239400332192078845e-1'},
+          {1: '7.01916467045438208744378660640537427490873918345465227659802518393598213663073072187e-2',
+           3: '2.631174841924423444834727510216642181614053183934029855724529099908799066900681707156e-2',
+           4: '-1.103344213204212616536224216203923521156051500668498178221702095786730037088451417417e-2'},
+          {1: '-1.566211240781183642488518551453027928209011808429926742075994450765608166883593055436e-1',
+           4: '4.022037025415642768212777334976723807953788960750969348079276345083207687523340439985e-1',
+           5: '4.854962733006014636966978914582880797593807314847006810407702678016677881773900683848e-1'},
+          {1: '3.112249065189454540975938749103688775640860268015765517875901819636788841622883514715e-2',
+           5: '9.925602946470755730976861333746552578010113543371556501156532289522223083686039750464e-2',
+           6: '2.642154434504896200940479950033183068312393142533849189940633462813743874329994944194e-5'},
+          {1: '7.09722115858591977980290497034026777369199007473928089677028676672124121719631873733e-1',
+           5: '-2.878599621086994245472819276760640913301855954929611359904818127369971660983418731969e0',
+           6: '2.129446575803202495593011450000675123146819436283352905644086375052608273806710598083e-2',
+           7: '2.618846675190654969292491980171755675267138670940236691625920383990987123263926669799e0'},
+          {1: '1.971162769751622653374279030890901895102271260934752560073298666516820598947694065245e-2',
+           6: '1.314769583961512153957380944910102917010453313237904532896703042317759437588108172284e-1',
+           7: '2.651026426320722003136425762899652531974839391071893983013696279981183473287139122567e-1',
+           8: '3.568084804936544335695235850557119302907377562082027313083048400646746448533926641757e-1'},
+          {1: '4.52000198123696303466615899715814558178752759216811801443752162006850816548332785001e-2',
+           6: '4.002799368963269424453448726036172129707286035255084033530848251945047638855433381069e-3',
+           7: '1.601500636916154116141648988130496051518236572818790559811874215346710453554656819808e-1',
+           8: '-6.94830896113558766055076810880379832567315616309439231397834893941418976920688252096e-4',
+           9: '-3.028824867077836529758526871817473127675272547494279018764594054601128969315645111849e-3'},
+          {1: '6.488088874156601542550101009631282425235066317670643554509232342293350370832201888741e-2',
+           8: '1.798223672519538764980931982771653336226267689019203140039759418977874942481337275737e-1',
+           9: '-1.379038853795374658459375939872891452260918957641627984236926962149885290906676389842e-3',
+           10: '2.933177796677054638696786924539291988218053269602802970971915900988371009464085558176e-1'},
+          {1: '6.203009498964512152733682602483252800544465468027723696513649660598713938403105468563e-2',
+           9: '1.852494271216683106566732412801252654028709112506185661813162013190347158018146409385e-2',
+           10: '3.097644836067189024326911104871249008925595428403487952252886015862314098920345337684e-1',
+           11: '3.047442431634932257738771099290867502123911521608864408553409749254117720052567713637e-1'},
+          {1: '6.201972260916893080711420739558975045994481991404016270942831042621296675332534575866e-2',
+           9: '9.402397126314593976910409432600376284640745739392856006491693414739377176752496830254e-2',
+           10: '3.098255331628556417346604747446843311853795538255778076358109181983411673182996479068e-1',
+           11: '3.036714566645797050698936883147468540428250347499812111630779317183972047785244555068e-1',
+           12: '3.542231151139475432144782255027699933222589423837038641980029819576720980026202135845e-2'},
+          {1: '6.96908934482578755465020457698766652266123986652693124386595687256626658587557438909e-2',
+           9: '-1.026068398848221434143517600646828432765332980244057389200313887686341269100904144289e0',
+           10: '1.707111685325415936794748807994057363691702390665289122715815578989450621608097471178e-1',
+           11: '-2.276426317828345244640899307352560724213609963668371269120350778897604268488707131379e-1',
+           12: '6.469733264162559693641327687577763359541689058709531537823573009011020286605375682754e-1',
+           13: '5.577116561557104399547116527283603900460440287233664182020166612039997170938506894503e-1'},
+          {1: '5.62712237629357194913230965344514394930168752026278865175040823274026618061657084551e-2',
+           11: '3.678983222850209699517524982831781294240536196092600812178960084767342167600554097921e-1',
+           12: '-5.19558720880348329935654723427838356118784732660198614667815838883522387738021381423e-2',
+           13: '2.204300024722190946507889136186101583051939445678464072502258435712922894837870998433e-1',
+           14: '2.96800595124062314469487032967875429547433946034083834521273225696963877466865300851e-1'},
+          {1: '5.634846497340329026169333310752166966844307632715132381117641490389593628519826878531e-2',
+           11: '2.154493134975348678816921094538633047666156318059356569827382889198219015749935439823e-1',
+           12: '-1.828038597798339032767249818891038294211236603774749922977117870744959009671532402296e-1',
+           13: '1.11503556596438531451282074551085000425282080659729290336972311112246924681107238155e-1',
+           14: '2.961573176911709124764789850722285989373150621850530267865487559044685065325051431373e-1',
+           15: '-2.863963826611358869027903247801186359263232936399877477557034100902322184153802061016e-2'},
+          {1: '5.768994198724289036171882589079551200329053317074015736866935607317368058263947892388e-2',
+           11: '-3.33959415357374613877965725423968746194051846428608976081589395203455257443421103754e-2',
+           12: '4.007337036063909756966778946251460958783204419363211999098235920936595305217080757252e-1',
+           13: '-2.804910522268063380484013221059916164179105523752052409880171087961359378301286147028e-1',
+           14: '2.860659865450288214940338791467983472419468134474127404785360793939950768656398860364e-1',
+           15: '3.300830129889967277869093004777042822760017064369869377090469066296160876867312632942e-1',
+           16: '2.301529673804798738783942876721443945820832328652238487255898956623302521178929654255e-1'},
+          {1: '4.628349579719024427317175399131733273511297084139209516535128748975595102348466963346e-2',
+           11: '1.630450107397975249685538886816283747362802271995334921665631466207136001357816066251e0',
+           12: '-1.519389027110125818833104438792078888366805294218517984315935323689939634346785541266e0',
+           13: '1.451177905612818398158204503782829478002025896171620079182131464615748573245045066933e0',
+           14: '1.115858300886827251108540309774994639792980968086331408518485993004009147049002886661e-1',
+           15: '-6.927910549842217223999151167283689307038087310272710650839151778360002928231938996564e-1',
+           16: '-1.033967300639154935442351963388333197850853637180263551013370838161871418837432150763e0',
+           17: '9.66519267214150347441566645609602021478205938092229943145925457991156032849020846494e-2'},
+          {1: '-2.030459770939010457179865043457543159890686836908949375313125798640212974640722247139e-2',
+           11: '5.403684273875123798630962329849980016426640735397844799635504992740247972317943415738e0',
+           12: '-6.547667878535769638577053800139325829335808492655639368966216657633158529493394018748e0',
+           13: '7.013821350363578373165272471360941682153886129098573011050120208706394847104611280659e0',
+           14: '1.870129209851220070917089872488052512865730910524666003812699685036249110639968876355e-1',
+           15: '-3.586221630318466310345416445340680667399109825679889726092108094877121092019568725906e0',
+           16: '-2.796807192734124892412016302005787005622243784243008121795193206999340165569504484433e0',
+           17: '5.350966429298067141403865717192268565615462868769074262461851475076297049847405900305e-1',
+           18: '2.145339995655007603736693460786443623723658483597653704106017814468824679556810775581e-1'},
+          {1: '-1.742485918290044205614554854196710455479504553190752005798475964042862615568249931979e-2',
+           11: '1.624681387971290566033459737855869526767754661771120924184664522930252560057487715917e0',
+           12: '-2.354176134519334554629765394537690359953484690980299665915399924759933249024433201062e0',
+           13: '2.681464673816256355689049206851920401601461184001531947851310974409875440156813229521e0',
+           14: '-3.769156802887539884394023979903229235497658274041343397278286356588457999273698837568e-2',
+           15: '-1.416558131026522083720211494413873707821785422770559705231460034487688457012423059506e0',
+           16: '-6.949353599391523142082433283060914200352029386004581317085753581959007030993120101233e-1',
+           17: '2.176483372495038460388837827561689520877604442565239353657200502175872181787882826377e-1',
+           18: '2.697602441781337550421531890140860774876933975825845928799740196946913466182988994464e-1',
+           19: '-3.010654404469406281446127247743328561741318472966391363598843663110743566238944373807e-2'},
+          {1: '-5.403069633602259108646269644934256957551404599412561453767268074870783669925498016457e-3',
+           11: '4.139045320778312241379049484992085439613081939853923740529945110841130228938567470608e-1',
+           12: '-6.225569512435124987325753043472442306739960604338314680453027342793707050930404307846e-1',
+           13: '8.734771329093316867790902545034150641322140869164058836843523721471009826005087793734e-1',
+           14: '-4.460631186034505809671866759278699513326438900110859254673757293843834232949457511945e-1',
+           15: '-4.770024428429503264261245457799687730095056727976098627656199278228457764648229288301e-1',
+           16: '3.350194037993700956622540574882038342150917200081189888351569726131444997493018243069e-1',
+           17: '7.504248468668828335131027827336082864172905052946156155171125652518370192017019285897e-2',
+           18: '2.868602398412017179778096520767496699075337622961506198525486757858393614463244192166e-1',
+           19: '-3.105278876109550093409796945938508430591700006793679865817465482241195091701064106306e-1',
+           20: '5.980742748031364157936282749945094293392110393839614650861749046057502083978432774641e-1'},
+          {1: '-8.040637783629852670386253408427477129839038039895222958327102384382347854387228140586e-2',
+           11: '1.409003825209192451104055534327205557907144506304998967309786817952326707840468519855e1',
+           12: '-1.651095452142836096439418777253125778161824307435047496403861839615632359732680906324e1',
+           13: '1.713478919889388959512706015258229430254357775856472236246578628732774154201548556949e1',
+           14: '5.162416754963992955466349330401373481541758099272782749146402071285515617224748797349e-1',
+           15: '-8.738239054447235555769280431947112005536670926201592356606646679961357074323383907433e0',
+           16: '-7.92876329121720476299798138277054206358034455264322390702240236236168868716103377695e0',
+           17: '1.299607095883618341404631332785395816146491714221581325131902479964394904680531866743e0',
+           18: '2.985974887158637819626343538772133330364013942516888589723607063393086453938726507764e-1',
+           19: '2.306899737777788621463004228318904282554044640133218561071121312583287783148540854557e-1',
+           20: '-4.162475612748372571090619229550372319146077330570330975546626972398912191287912992344e-1',
+           21: '3.046152792810969736488023713665193266324974471792934717484737567812431778577335699415e-1'},
+          {1: '5.188944067774664913134965881842338637465167538426812594601866401917453125373780443288e-2',
+           11: '-1.283277980375441090269741488559725341590001661469261097548681503281119502510781510671e0',
+           12: '3.197031115178587180279278821590157014124289302868827178494105498343258944734856975984e0',
+           13: '-4.925730995528770332329418001427019544036228452951763539493235207541539355193215629707e0',
+           14: '4.556842843249686735202095835169824346358162044635023939110786683727545600555997662146e-1',
+           15: '2.672937738349530686900845106745665406421870114003531687061025215633257210063413548721e0',
+           16: '-1.545486350471516022666399706441233218275810264466541860777249858172892030485892221263e0',
+           17: '-3.721987962685219677888284678662933875128991354125828036313277053504464873414697307303e-1',
+           18: '1.275610106742831413187042273550361954603324559021122028077942983877428065036205767992e-1',
+           19: '1.955690675673468524392185835321028843337157689840864927642297223731192314442172030656e0',
+           20: '3.191081222387442241092001119049884652557628641382080948098270187047261996513219724153e-1',
+           21: '1.121546003224352473639037341460033868464982074905347279402236597305066991912121393629e0',
+           22: '-8.107564764218937636489023156262164031679294933798974588613267897756930246095048550015e-1'},
+          {1: '-7.011708297168838093320073271824231811555516376839339889768780533772204046098056778645e-3',
+           11: '1.191430397515656948185785084406871641958062497543742234300725797836945018037271858084e0',
+           12: '-1.828224802245176636695187739870698589078178771180859212263094110856159464053843046402e0',
+           13: '2.587660024998591526533741070898054580235728551249558749988014852858819613806922059203e0',
+           14: '-4.609429033777800137012176300671539646289103914701490781289612317160305665226273519358e-1',
+           15: '-1.325931501693639442980805419646217538577342867896123447497177267595031990967256304102e0',
+           16: '5.048216427266366058315103764214691413381451411460686651485736358879672359427752204445e-1',
+           17: '2.194255008759965600775266235750828151587685421380286198819468613425068758315070811985e-1',
+           18: '2.580087037350744276193737624019399564007443016182003098695556923721330317034140914297e-1',
+           19: '-7.820644366919761953621998768725631028114098091524728093576852041863328545044120664888e-1',
+           20: '4.981236112353889237817573857026156554544669576903254922783923277260844155420240361688e-1',
+           21: '-2.818659230370184110487250730841700637198882434735413160224991411608463306147813033701e-1',
+           22: '1.975630649870201406787729762339550948339749510061280462627577046361617264269398213974e-1',
+           23: '-2.737789055818164357320317060050411797735340939936712549180293178469667438122671145178e-2'},
+          {1: '6.971223157985491441889543463058968335832800922315696226973214263599946413187133757441e-2',
+           11: '8.485072933915981598683071881067011723176540155630964375777672731824955304237165117739e-1',
+           12: '-1.504790599380062029550479292004278750516583328735111485609300227641118522265117453228e0',
+           13: '2.971661962491066226601618850699945230551598000336030549022007199066569229936095601265e0',
+           14: '2.189212281135321618639152301919425667361998064642432899287016486436734890226912997813e-1',
+           15: '-1.363504916136495083863504916136495083863504916136495083863504916136495083863504916136e0',
+           16: '1.535256651208129648912110087693939955244136470648889182343875125782209378315005545886e0',
+           17: '2.255130922481182477299374148203865138344993252214597927624562120740486384043245934395e-1',
+           18: '-1.252487725356194666272520523138563196763786809348751670013078003838735310461344402659e-1',
+           19: '-1.433947471579772638181105448843590748725989807918463347706781654253234025872206977656e0',
+           20: '-2.653692486145121794045624436138677664647506121922928212398504961979636551101946127078e-1',
+           21: '-1.057083353895191276322695714066286715782319071838176809244435034528746563196511305239e0',
+           22: '5.958992342288874679818860848371024166473432615899828093938621236679595663138268737944e-1',
+           23: '5.640763974002360165840684759509622393779174110889642877127279949714649497561235682228e-2',
+           24: '2.28065029140442244914522728402671622401975787599659262595505604591329589830525584896e-1'},
+          {1: '5.847724407501707800509964027663995519804001870472850379216053933603321448937320382873e-2',
+           11: '8.482433234853130399472226781516394610296267520150369993929425712656780053034142790857e-1',
+           12: '-1.818778337229596341437999685014432821665031881560984595319320029619105771387827231293e0',
+           13: '3.360950949051261986329911895518526801628857587757616068272635548399517354842337530945e0',
+           14: '1.508779656009112841743785043192199515750215073024373320382690391467484988490972888214e-1',
+           15: '-1.535625970104296058211732653128688607443092018291498032244748403611478465692632705036e0',
+           16: '1.689710648596447426456373308903510510459502815029443327222583037297243278873766013804e0',
+           17: '2.753763916359371389555315070580325732352897337628204267122697551960198539312003364345e-1',
+           18: '-8.663993203603434555880694559625317699151588603507943515655135799742692170332074641456e-2',
+           19: '-1.514109179619982965788582168222695819982704233094238060182049846398573819503074487947e0',
+           20: '-2.731051919432418524342072455220752640028637692479133311886846927223922900302148881433e-1',
+           21: '-7.386383863141516263346011834004149434481207761507984915319537912098408949133636097415e-1',
+           22: '6.34357867507252269668867941450570925326988395897840494702537617628693500234072464984e-1',
+           23: '2.219915268009860510634252213682523269888255016876797090075141605397073674221546364928e-2',
+           24: '-7.329654538493563887779811693040477761888079625817917741084140276508628003504291297654e-2'}],
+    'c': {1: '2.560300422448818640056973733027381517733824076443136953634798402199579680290993667785e-2',
+          15: '4.518777011767389121126592910724741440985372571238852320538195476794258345326944681173e-1',
+          16: '1.57164483505041034252589221878591402394590678116612911340086190869454148554617146598e-1',
+          17: '1.587056574024945279877130621604901273153398820663935100541595105228850005414302839405e0',
+          18: '1.457164101207840798598697293357824068221719394674815441268910066025070033320249231167e-1',
+          19: '6.756690992874993365704777906957166121534838869284524431811474400358351375791575269125e-2',
+          20: '2.263702829370636470261171189724674060331565741885612750461048803721449531302274282834e-1',
+          21: '9.585657493693419066100150421626762898713313017234629340723230525017707321578125838875e-1',
+          22: '-5.737510952253720251243392241397701824182886145229967660377157325379672132470673999182e-2',
+          23: '-8.207294363127299380342111455087248111504033000422844250308430626629630466499721876523e-1',
+          24: '-8.19994679581049673375798069017292857612934037207202549509437419890504510666357762282e-1',
+          25: '-9.218218898708361658735554044867437117607070020394289598912304554724677090414683888511e-1'},
+    'd': {1: '2.611453567558047174327245053028336466626806615883961914681281336363189972915245544873e-2',
+          15: '6.130789590044024420375347235457514503322168389154611016924109584567258667669428084328e-2',
+          16: '2.225176387207912085954871898906978473895949131807976650805573845853338932568562016822e-1',
+          17: '-6.452541374509687528609607022885324791758461431623241957335732784511248267767614258399e-1',
+          18: '1.42881343232677523731652225953864167230822229763939517021116011366572064103322497523e-1',
+          19: '1.998503703511764116053495106126866164319741023221332167221899831502033833897226507607e-2',
+          20: '2.271215662186804051109071916317932366756181626009529050272447503184463361820614170681e-1',
+          21: '3.555653412963184679461951194576569724124866534036012519458466746801575903667969215385e-1',
+          22: '-5.084144204984584161908312330177564954877067154001079429559777704302946848644928736984e-2',
+          23: '3.451056668568212037936618506732414889276840710489545476476791628380007277211978725437e-1',
+          24: '-1.182965488838884338743861432044520655991039617854064994056837668531638997325328536863e-1',
+          26: '4.137931034482758620689655172413793103448275862068965517241379310344827586206896551724e-1'},
+    }
+
+tableaus['rkf1210'] = {
+    'doc': '''\
+  Feagin's RK12(10) method -- a 12th-order method with an embedded 10th-order method.
+
+### Reference
+  * [coefficient file](http://sce.uhcl.edu/rungekutta/rk1210.txt)''',
+    'a': ['0', '1/5', '5.55555555555555555555555555555555555555555555555555555555556e-1',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '3.33333333333333333333333333333333333333333333333333333333333e-1', '1',
+          '6.71835709170513812712245661002797570438953420568682550710222e-1',
+          '2.88724941110620201935458488967024976908118598341806976469674e-1', '9/16',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '9.47695431179199287562380162101836721649589325892740646458322e-1',
+          '5.48112876863802643887753674810754475842153612931128785028369e-2',
+          '8.48880518607165350639838930162674302064148175640019542045934e-2',
+          '2.65575603264642893098114059045616835297201264164077621448665e-1', '1/2',
+          '7.34424396735357106901885940954383164702798735835922378551335e-1',
+          '9.15111948139283464936016106983732569793585182435998045795407e-1',
+          '9.47695431179199287562380162101836721649589325892740646458322e-1',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '2.88724941110620201935458488967024976908118598341806976469674e-1',
+          '6.71835709170513812712245661002797570438953420568682550710222e-1',
+          '3.33333333333333333333333333333333333333333333333333333333333e-1',
+          '5.55555555555555555555555555555555555555555555555555555555556e-1', '1/5', '1'],
+    'b': [{},
+          {1: '1/5'},
+          {1: '-2.16049382716049382716049382716049382716049382716049382716049e-1',
+           2: '7.71604938271604938271604938271604938271604938271604938271605e-1'},
+          {1: '2.08333333333333333333333333333333333333333333333333333333333e-1',
+           3: '5/8'},
+          {1: '1.93333333333333333333333333333333333333333333333333333333333e-1',
+           3: '11/50',
+           4: '-2/25'},
+          {1: '1/10',
+           4: '2/5',
+           5: '1/2'},
+          {1: '1.03364471650010477570395435690481791543342708330349879244197e-1',
+           4: '1.24053094528946761061581889237115328211074784955180298044074e-1',
+           5: '4.8317116756103289928883648045196250872410925751728917730238e-1',
+           6: '-3.8753024569476325208568144376762058039573330234136803880429e-2'},
+          {1: '1.2403826143183332408190458598017516814002467069863361229248e-1',
+           5: '2.17050632197958486317846256953159942875916353757734167684657e-1',
+           6: '1.37455792075966759812907801835048190594443990939408530842918e-2',
+           7: '-6.61095317267682844455831341498149531672668252085016565917546e-2'},
+          {1: '9.14774894856882983144991846980432197088832099976660100090486e-2',
+           6: '-5.44348523717469689965754944144838611346156873847009178068318e-3',
+           7: '6.80716801688453518578515120895103863112751730758794372203952e-2',
+           8: '4.08394315582641046727306852653894780093303185664924644551239e-1'},
+          {1: '8.90013652502551018954509355423841780143232697403434118692699e-2',
+           6: '4.9952822664553236019779340842069280040589114940681409195581e-3',
+           7: '3.97918238819828997341739603001347156083435060931424970826304e-1',
+           8: '4.27930210752576611068192608300897981558240730580396406312359e-1',
+           9: '-8.65117637557827005740277475955029103267246394128995965941585e-2'},
+          {1: '6.95087624134907543112693906409809822706021061685544615255758e-2',
+           6: '1.29146941900176461970759579482746551122871751501482634045487e-1',
+           7: '1.53073638102311295076342566143214939031177504112433874313011e0',
+           8: '5.77874761129140052546751349454576715334892100418571882718036e-1',
+           9: '-9.51294772321088980532340837388859453930924498799228648050949e-1',
+           10: '-4.08276642965631951497484981519757463459627174520978426909934e-1'},
+          {1: '4.44861403295135866269453507092463581620165501018684152933313e-2',
+           6: '-3.80476867056961731984232686574547203016331563626856065717964e-3',
+           7: '1.06955064029624200721262602809059154469206077644957399593972e-2',
+           8: '2.09616244499904333296674205928919920806734650660039898074652e-2',
+           9: '-2.33146023259321786648561431551978077665337818756053603898847e-2',
+           10: '2.63265981064536974369934736325334761174975280887405725010964e-3',
+           11: '3.15472768977025060103545855572111407955208306374459723959783e-3'},
+          {1: '1.94588815119755475588801096525317761242073762016273186231215e-2',
+           9: '6.78512949171812509306121653452367476194364781259165332321534e-5',
+           10: '-4.2979585904927362327100533023016234356886338772488360367555e-5',
+           11: '1.76358982260285155407485928953302139937553442829975734148981e-5',
+           12: '6.53866627415027051009595231385181033549511358787382098351924e-2'},
+          {1: '2.06836835664277105916828174798272361078909196043446411598231e-1',
+           9: '1.66796067104156472828045866664696450306326505094792505215514e-2',
+           10: '-8.79501563200710214457024178249986591130234990219959208704979e-3',
+           11: '3.46675455362463910824462315246379209427513654098596403637231e-3',
+           12: '-8.61264460105717678161432562258351242030270498966891201799225e-1',
+           13: '9.08651882074050281096239478469262145034957129939256789178785e-1'},
+          {1: '2.03926084654484010091511314676925686038504449562413004562382e-2',
+           9: '8.69469392016685948675400555583947505833954460930940959577347e-2',
+           10: '-1.91649630410149842286436611791405053287170076602337673587681e-2',
+           11: '6.55629159493663287364871573244244516034828755253746024098838e-3',
+           12: '9.87476128127434780903798528674033899738924968006632201445462e-2',
+           13: '5.35364695524996055083260173615567408717110247274021056118319e-3',
+           14: '3.01167864010967916837091303817051676920059229784957479998077e-1'},
+          {1: '2.28410433917778099547115412893004398779136994596948545722283e-1',
+           9: '-4.98707400793025250635016567442511512138603770959682292383042e-1',
+           10: '1.34841168335724478552596703792570104791700727205981058201689e-1',
+           11: '-3.8745824405583415843990422692402923093516105914280680567436e-2',
+           12: '-1.27473257473474844240388430824908952380979292713250350199641e0',
+           13: '1.43916364462877165201184452437038081875299303577911839630524e0',
+           14: '-2.14007467967990254219503540827349569639028092344812795499026e-1',
+           15: '9.58202417754430239892724139109781371059908874605153648768037e-1'},
+          {1: '2.00222477655974203614249646012506747121440306225711721209798e0',
+           9: '2.06701809961524912091954656438138595825411859673341600679555e0',
+           10: '6.2397813608613954195747127983149446615529231616702108066314e-1',
+           11: '-4.62283685500311430283203554129062069391947101880112723185773e-2',
+           12: '-8.8497328836264961486007524672711894928660483545709270109463e0',
+           13: '7.74257707850855976227437225791835589560188590785037197433615e0',
+           14: '-5.88358519250869210993353314127711745644125882130941202896436e-1',
+           15: '-1.10683733362380649395704708016953056176195769617014899442903e0',
+           16: '-9.29529037579203999778397238291233214220788057511899747507074e-1'},
+          {1: '3.1378953341207344293445160898988879680816125933032210026831e0',
+           6: '1.29146941900176461970759579482746551122871751501482634045487e-1',
+           7: '1.53073638102311295076342566143214939031177504112433874313011e0',
+           8: '5.77874761129140052546751349454576715334892100418571882718036e-1',
+           9: '5.42088263055126683050056840891857421941300558851862156403363e0',
+           10: '2.31546926034829304872663800877643660904880180835945693836936e-1',
+           11: '7.59292995578913560162301311785251873561801342333194895292058e-2',
+           12: '-1.23729973380186513287414553402595806591349822617535905976253e1',
+           13: '9.85455883464769543935957209317369202080367765721777101906955e0',
+           14: '8.5911143137043652957935770905236777288998049512232960115954e-2',
+           15: '-5.65242752862643921117182090081762761180392602644189218673969e0',
+           16: '-1.94300935242819610883833776782364287728724899124166920477873e0',
+           17: '-1.28352601849404542018428714319344620742146491335612353559923e-1'},
+          {1: '1.38360054432196014878538118298167716825163268489922519995564e0',
+           6: '4.9952822664553236019779340842069280040589114940681409195581e-3',
+           7: '3.97918238819828997341739603001347156083435060931424970826304e-1',
+           8: '4.27930210752576611068192608300897981558240730580396406312359e-1',
+           9: '-1.30299107424475770916551439123047573342071475998399645982146e0',
+           10: '6.61292278669377029097112528107513072734573412294008071500699e-1',
+           11: '-1.44559774306954349765969393688703463900585822441545655530145e-1',
+           12: '-6.96576034731798203467853867461083919356792248105919255460819e0',
+           13: '6.65808543235991748353408295542210450632193197576935120716437e0',
+           14: '-1.66997375108841486404695805725510845049807969199236227575796e0',
+           15: '2.06413702318035263832289040301832647130604651223986452170089e0',
+           16: '-6.74743962644306471862958129570837723192079875998405058648892e-1',
+           17: '-1.15618834794939500490703608435907610059605754935305582045729e-3',
+           18: '-5.44057908677007389319819914241631024660726585015012485938593e-3'},
+          {1: '9.51236297048287669474637975894973552166903378983475425758226e-1',
+           5: '2.17050632197958486317846256953159942875916353757734167684657e-1',
+           6: '1.37455792075966759812907801835048190594443990939408530842918e-2',
+           7: '-6.61095317267682844455831341498149531672668252085016565917546e-2',
+           9: '1.52281696736414447136604697040747131921486432699422112099617e-1',
+           10: '-3.3774101835759984080230079313399800435464342445753966767008e-1',
+           11: '-1.92825981633995781534949199286824400469353110630787982121133e-2',
+           12: '-3.68259269696866809932409015535499603576312120746888880201882e0',
+           13: '3.16197870406982063541533528419683854018352080342887002331312e0',
+           14: '-3.70462522106885290716991856022051125477943482284080569177386e-1',
+           15: '-5.14974200365440434996434456698127984941168616474316871020314e-2',
+           16: '-8.29625532120152946787043541792848416659382675202720677536554e-4',
+           17: '2.79801041419278598986586589070027583961355402640879503213503e-6',
+           18: '4.18603916412360287969841020776788461794119440689356178942252e-2',
+           19: '2.79084255090877355915660874555379649966282167560126269290222e-1'},
+          {1: '1.03364471650010477570395435690481791543342708330349879244197e-1',
+           4: '1.24053094528946761061581889237115328211074784955180298044074e-1',
+           5: '4.8317116756103289928883648045196250872410925751728917730238e-1',
+           6: '-3.8753024569476325208568144376762058039573330234136803880429e-2',
+           8: '-4.38313820361122420391059788940960176420682836652600698580091e-1',
+           10: '-2.18636633721676647685111485017151199362509373698288330593486e-1',
+           11: '-3.12334764394719229981634995206440349766174759626578122323015e-2',
+           18: '3.12334764394719229981634995206440349766174759626578122323015e-2',
+           19: '2.18636633721676647685111485017151199362509373698288330593486e-1',
+           20: '4.38313820361122420391059788940960176420682836652600698580091e-1'},
+          {1: '1.93333333333333333333333333333333333333333333333333333333333e-1',
+           3: '11/50',
+           4: '-2/25',
+           7: '9.84256130499315928152900286856048243348202521491288575952143e-2',
+           8: '-1.96410889223054653446526504390100417677539095340135532418849e-1',
+           10: '4.36457930493068729391826122587949137609670676712525034763317e-1',
+           11: '6.5261372167572109856037093980555569835054381070841471673027e-2',
+           18: '-6.5261372167572109856037093980555569835054381070841471673027e-2',
+           19: '-4.36457930493068729391826122587949137609670676712525034763317e-1',
+           20: '1.96410889223054653446526504390100417677539095340135532418849e-1',
+           21: '-9.84256130499315928152900286856048243348202521491288575952143e-2'},
+          {1: '-2.16049382716049382716049382716049382716049382716049382716049e-1',
+           2: '7.71604938271604938271604938271604938271604938271604938271605e-1',
+           5: '-6.66666666666666666666666666666666666666666666666666666666667e-1',
+           7: '-3.90696469295978451446999802258495981249099665294395945559163e-1',
+           21: '3.90696469295978451446999802258495981249099665294395945559163e-1',
+           22: '6.66666666666666666666666666666666666666666666666666666666667e-1'},
+          {1: '1/5',
+           3: '-1.64609053497942386831275720164609053497942386831275720164609e-1',
+           23: '1.64609053497942386831275720164609053497942386831275720164609e-1'},
+          {1: '1.47178724881110408452949550989023611293535315518571691939396e0',
+           2: '63/80',
+           3: '4.21296296296296296296296296296296296296296296296296296296296e-1',
+           5: '2.91666666666666666666666666666666666666666666666666666666667e-1',
+           7: '3.48600717628329563206854421629657569274689947367847465753757e-1',
+           8: '2.2949954476899484958289023371055544707382356966650670066251e-1',
+           9: '5.79046485790481979159831978177003471098279506036722411333192e0',
+           10: '4.18587511856506868874073759426596207226461447604248151080016e-1',
+           11: '3.07039880222474002649653817490106690389251482313213999386651e-1',
+           12: '-4.68700905350603332214256344683853248065574415794742040470287e0',
+           13: '3.13571665593802262152038152399873856554395436199962915429076e0',
+           14: '1.40134829710965720817510506275620441055845017313930508348898e0',
+           15: '-5.5293110143949902362901030600576433642127605577765815640091e0',
+           16: '-8.53138235508063349309546894974784906188927508039552519557498e-1',
+           17: '1.03575780373610140411804607167772795518293914458500175573749e-1',
+           18: '-1.40474416950600941142546901202132534870665923700034957196546e-1',
+           19: '-4.18587511856506868874073759426596207226461447604248151080016e-1',
+           20: '-2.2949954476899484958289023371055544707382356966650670066251e-1',
+           21: '-3.48600717628329563206854421629657569274689947367847465753757e-1',
+           22: '-2.91666666666666666666666666666666666666666666666666666666667e-1',
+           23: '-4.21296296296296296296296296296296296296296296296296296296296e-1',
+           24: '-63/80'}],
+    'c': {1: '2.38095238095238095238095238095238095238095238095238095238095e-2',
+          2: '3/128',
+          3: '1/32',
+          5: '4.16666666666666666666666666666666666666666666666666666666667e-2',
+          7: '1/20',
+          8: '1/20',
+          10: '1/10',
+          11: '7.14285714285714285714285714285714285714285714285714285714286e-2',
+          13: '1.38413023680782974005350203145033146748813640089941234591267e-1',
+          14: '2.15872690604931311708935511140681138965472074195773051123019e-1',
+          15: '2.4380952380952380952380952380952380952380952380952380952381e-1',
+          16: '2.15872690604931311708935511140681138965472074195773051123019e-1',
+          17: '1.38413023680782974005350203145033146748813640089941234591267e-1',
+          18: '-7.14285714285714285714285714285714285714285714285714285714286e-2',
+          19: '-1/10',
+          20: '-1/20',
+          21: '-1/20',
+          22: '-4.16666666666666666666666666666666666666666666666666666666667e-2',
+          23: '-1/32',
+          24: '-3/128',
+          25: '2.38095238095238095238095238095238095238095238095238095238095e-2'},
+    'd': {1: '2.38095238095238095238095238095238095238095238095238095238095e-2',
+          2: '-17/320',
+          3: '1/32',
+          5: '4.16666666666666666666666666666666666666666666666666666666667e-2',
+          7: '1/20',
+          8: '1/20',
+          10: '1/10',
+          11: '7.14285714285714285714285714285714285714285714285714285714286e-2',
+          13: '1.38413023680782974005350203145033146748813640089941234591267e-1',
+          14: '2.15872690604931311708935511140681138965472074195773051123019e-1',
+          15: '2.4380952380952380952380952380952380952380952380952380952381e-1',
+          16: '2.15872690604931311708935511140681138965472074195773051123019e-1',
+          17: '1.38413023680782974005350203145033146748813640089941234591267e-1',
+          18: '-7.14285714285714285714285714285714285714285714285714285714286e-2',
+          19: '-1/10',
+          20: '-1/20',
+          21: '-1/20',
+          22: '-4.16666666666666666666666666666666666666666666666666666666667e-2',
+          23: '-1/32',
+          24: '17/320',
+          25: '2.38095238095238095238095238095238095238095238095238095238095e-2'},
+    }
+
+tableaus['rko129'] = {
+    'doc': '''\
+  A modification of Hiroshi Ono's order 12 Runge-Kutta scheme with an order 9 embedded scheme.
+
+### Reference
+  * Hiroshi Ono, On the 25 stage 12th order explicit Runge-Kutta method,
+    Transactions of the Japan Society for Industrial and applied Mathematics,
+    Vol. 6, No. 3, (2006) pages 177 to 186.
+  * [Rational coefficients](http://www.peterstone.name/Maplepgs/Maple/nmthds/RKcoeff/Runge_Kutta_schemes/RK12/RKcoeff12h(9)_1.pdf)''',
+    'a': ['0',
+          '4.351851851851851851851851851851851851851851851851851851851851851851851851851851851852e-1',
+          '4.429824561403508771929824561403508771929824561403508771929824561403508771929824561404e-1',
+          '6.644736842105263157894736842105263157894736842105263157894736842105263157894736842105e-1',
+          '1.069403994175161223216143124609943831911795298522987310172664863740378614520490950697e-1',
+          '1.644736842105263157894736842105263157894736842105263157894736842105263157894736842105e-1',
+          '5.843251088534107402031930333817126269956458635703918722786647314949201741654571843251e-1',
+          '6.382358235823582358235823582358235823582358235823582358235823582358235823582358235824e-2',
+          '1/5',
+          '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-1',
+          '9.446116054065563496847375720237340591364440847545279548637407620203329280139199114088e-1',
+          '5.179584680428461035835615460185207449756996828425551866437683588600807071775316523299e-2',
+          '8.488805186071653506398389301626743020641481756400195420459339398355773991365476236893e-2',
+          '2.655756032646428930981140590456168352972012641640776214486652703185222349414361456016e-1',
+          '1/2',
+          '7.344243967353571069018859409543831647027987358359223785513347296814777650585638543984e-1',
+          '9.151119481392834649360161069837325697935851824359980457954066060164422600863452376311e-1',
+          '9.446116054065563496847375720237340591364440847545279548637407620203329280139199114088e-1',
+          '3.333333333333333333333333333333333333333333333333333333333333333333333333333333333333e-1',
+          '1/5',
+          '5.843251088534107402031930333817126269956458635703918722786647314949201741654571843251e-1',
+          '1.644736842105263157894736842105263157894736842105263157894736842105263157894736842105e-1',
+          '4.429824561403508771929824561403508771929824561403508771929824561403508771929824561404e-1',
+          '4.351851851851851851851851851851851851851851851851851851851851851851851851851851851852e-1',
+          '1',
+          '4.970267001007476028032930885363848318550815967070143979104342007017543082576391973337e-1',
+          '8.043478260869565217391304347826086956521739130434782608695652173913043478260869565217e-1',
+          '8.717948717948717948717948717948717948717948717948717948717948717948717948717948717949e-1',
+          '1'],
+    'b': [{},
+          {1: '4.351851851851851851851851851851851851851851851851851851851851851851851851851851851852e-1'},
+          {1: '2.175227402212137286104398734798923400326123258875071216675507357419304139407870179368e-1',
+           2: '2.254597159191371485825425826604585371603701302528437555254317203984204632521954382036e-1'},
+          {1: '1.661184210526315789473684210526315789473684210526315789473684210526315789473684210526e-1',
+           3: '4.983552631578947368421052631578947368421052631578947368421052631578947368421052631579e-1'},
+          {1: '8.68116319391850886508062971348367434861757015968588067387847640565978467242743420384e-2',
+           3: '3.456981948164897000739691452644149026866903085576649936607708344667115529230058847943e-2',
+           4: '-1.444105200331793633658889920028385056366520260032657508759536112923114056452583544813e-2'},
+          {1: '3.85095150452495257524472652032440486089882384495048449013834354160100060557967490878e-2',
+           4: '9.889604363651382462812798900870548282288802143553903392828423536490053424426345577709e-5',
+           5: '1.258652731216402762123982910182735616976625577395859318541619645591514091994326716669e-1'},
+          {1: '5.247404461891304721708365639844356354386624470737997647397329116437616959059854701778e-1',
+           4: '7.610651429965941990931946190296373660533922130208900643092560661920652146268815424885e-2',
+           5: '-2.135538596825204678401302463372339475781988628449683891486081018353295131152366999963e0',
+           6: '2.119016745189825526524339470866652730733632823644186992594087231585247087949150559862e0'},
+          {1: '3.572122856624484555412656871410309454657254402954350529356994466234212462699695879099e-2',
+           5: '4.596205641509305161863483311675360886293026632692961086374314175410528945129931429031e-2',
+           6: '-1.800016957713219812376781513215261066354472582005125759344515744644655947135707070493e-2',
+           7: '1.404669540301245333646491248782654898654978218139650184903068535815036288843799818693e-4'},
+          {1: '1.888176809184108413680419706237505704281864015973418413153299364663524364341955734913e-2',
+           6: '8.381198329740939383758467268684128106638290469173528975872944409244863365387981657651e-2',
+           7: '9.031585241436450659339626877786556727134244569192456020771509670971435444573825121328e-6',
+           8: '9.729721702550808557495179062390587533407132090396133365371679075124515126725605224924e-2'},
+          {1: '-4.08006770346984638700159900758509441664528517965669688200664569678127494169619133857e-2',
+           6: '-6.005539308646711394173617417282635784603029781694346062080009050806164919590318269156e-1',
+           7: '1.585222658367901823092810289995660365558277114283363946284113044047141269675809741481e-3',
+           8: '3.026658851734428583799288358366834830670493200050903757742452562250879940584583879948e-1',
+           9: '6.704368334008921764176894190107687125274815661799611686408713261126274393811928758984e-1'},
+          {1: '6.344326927733666873696263058980778771328558370914152084380122688263116113189631874466e0',
+           7: '1.975263319684766813850955500728188106557880392559127720135666889111189136253813975729e0',
+           8: '-1.382822337504897849061527131653164721900473695395858210726164571154383357718661916508e1',
+           9: '1.48242392699106634729210394450401429305544771209087756610542176978370555182752947093e1',
+           10: '-8.370994536873562320168249116193728530299734845668945403444620801647194262518201483006e0'},
+          {1: '-9.91078378147037573501842470699034248447825996342712119061634343225949328690350107075e-2',
+           6: '-1.046319958132641377892211373672215159710875883372049858922517534871447317958500644882e0',
+           7: '-4.662578801256029967826301701912208605727776822301916928051722653634090636623902615221e-4',
+           8: '4.243518408197806737520879584209906999975132950474577957967837636354467847566731274758e-1',
+           9: '8.350767448298191909277817680995907515365477233544915021061336714983604939879298121048e-1',
+           10: '-6.204379562043795620437956204379562043795620437956204379562043795620437956204379562044e-2',
+           11: '3.051106025934401220442410373760488176964149504195270785659801678108314263920671243326e-4'},
+          {1: '1.731635805893703684448829089734942070445562382116745420114094326722705203174775140332e-2',
+           9: '8.690027159880925811795093256330430220184719404902985010762237927304116502630885425916e-4',
+           10: '-9.198044746158460357290146202828770811642343120551843217420771155968903404182588708338e-5',
+           11: '1.833594777349928706130754092439075395240645268074916590065144720493485758190652981058e-7',
+           12: '6.67944881737752552490183811799040102805176211690229124428914281206879159171099292448e-2'},
+          {1: '1.497702285787817250603134142375551527881374815295532946701659971640303704469333256722e-2',
+           9: '1.299053198125687130806056561360945267563487713700848629960379786258472215118648828622e-1',
+           10: '4.444252090193421415880477613428889941728587016143899156135432416265141679149665438354e-3',
+           11: '-2.185380330434085597487818850115824768660155325792369439283645364044817815712239904765e-6',
+           12: '6.235770138025566019351747531432668514647398310437277172705875380249580436468314885283e-2',
+           13: '5.389349250407735998767659637686133399860483467584655047185578940287507515886082812093e-2'},
+          {1: '1.956886038861791180930007029621719896471785620210633245797118818081004119873004962774e-1',
+           9: '1.132878041352190960246053936692850204846641933665191609652843227265803479941175715645e0',
+           10: '9.754686357770750130309903534180324613492470735016258589778436907188769670738143543989e-1',
+           11: '4.607633555393391875625052489818876130584589587566695260680043303699764560744838206512e-4',
+           12: '-4.833419929869440350491944569648386990066349467457051943375195864364996227787596872297e-1',
+           13: '2.837255261146423361717978265203569959020643630988946562818139270625464117810614651744e-1',
+           14: '-1.604879577498682731680210867877554840351555444499826924680761144749197624460666828087e0'},
+          {1: '-6.628581660952109109950216641584960475848453023977418371554567406302394052049642993363e-1',
+           9: '-5.301219753823165631138506283750981613687493380976143446419698251739201243786272433269e0',
+           10: '-5.49374453000515177195083278043848966835280115820783196266705586043041689366476158933e0',
+           11: '6.448107716343851659685115053410322161204197332247306929859781244843876115320017653542e-3',
+           12: '2.226911096857986220827171118161838780361655511952909244621862410327793805385281866476e0',
+           13: '-8.260094546883369994121948528168152647220748853112540011094140493170779782006783468229e-1',
+           14: '9.736973734199539440165209948098457305642565726332220268712929325968631361580234056276e0',
+           15: '1.047923362573352907746375340805459350884588027111516805638308114257144242834404582751e0'},
+          {1: '9.451896878619703179615895147719645120861585484250220485534769741441232402797149004402e0',
+           9: '7.407837676951819392708315469048815926453257791083353986411194358002277837032529121349e1',
+           10: '8.008971633421252928663933464653279322909492698803384552922422585968931770071180510457e1',
+           11: '-1.241702484260160323471778040612055855620194337087768444994146945534716737633295008233e-1',
+           12: '-3.204108125365225923900659816438329678215226279318337501510105142207810131441066638158e1',
+           13: '1.551919421000708125838831543558938623465692911684926717234376165413330242668122537342e1',
+           14: '-1.364444237346563024309541869705527862321862115141467999073204884062451779712319267938e2',
+           15: '-1.13610989685829816844463369562213664287871731664530902529427749892699734414669625153e1',
+           16: '1.746701961099335199963616081872403749335232589961167014444435282876535760443759733215e0'},
+          {1: '1.059086740089530572084686602455620391446019980075022020682291957643879144548290466243e0',
+           7: '1.975263319684766813850955500728188106557880392559127720135666889111189136253813975729e0',
+           8: '-1.382822337504897849061527131653164721900473695395858210726164571154383357718661916508e1',
+           9: '-2.672676722061492102175215840759265382960786498230207636418025793583833107088763635551e1',
+           10: '-5.349798986553787152824955918158085193982743760760492627590775850823540448031315562431e1',
+           11: '7.179812487812968675250181644918743516316099586081748670146732996043783143974128607587e-2',
+           12: '1.805559723664965139501142471462605880255358278669785143935434349294122071206578011157e1',
+           13: '-8.76516381923298211379232439238318512585843291534823420851291646703777699468724846421e0',
+           14: '7.687522358555575651988028075659565616302805855797883225625477685501643635288672453023e1',
+           15: '6.541007260506904941709851688460080123863085658071943624909334991972860537373864701434e0',
+           16: '-8.461837296739539683436767973109554382501241857205608248520628152174372445350689400749e-1',
+           17: '3.096334815052354314802658810823658907325235844531318754050068324709258105543338930304e-2'},
+          {1: '-9.776673260040047976710026469624134014469714141641816253185153958371390334954366206102e-2',
+           6: '-6.005539308646711394173617417282635784603029781694346062080009050806164919590318269156e-1',
+           7: '1.585222658367901823092810289995660365558277114283363946284113044047141269675809741481e-3',
+           8: '3.026658851734428583799288358366834830670493200050903757742452562250879940584583879948e-1',
+           9: '4.285248952296136656501504776128834912424841890282487604085652387338305228046948965999e-1',
+           10: '-2.494936049956423479331713062821820760626388763661853215936426940474748269791918051828e-2',
+           11: '2.011342149874705950638155217740310555133571768677965217932407885434178872356469888792e-2',
+           12: '1.265809640150575117740069284741749647793461966567090378701137188708013785394651655531e-1',
+           13: '-7.625505511021937468044360160133448561674800889340550320120549846220783051800508863794e-3',
+           14: '2.257683215130023640661938534278959810874704491725768321513002364066193853427895981087e-1',
+           15: '-2.745492489167708483879226183906024865124767290578864277433486220883760763766017543321e-2',
+           16: '7.78376126062793733870554495237063730343726544219823124634854020279442244198684449501e-3',
+           17: '1.680830476266175444138000910160343423421707378563384687234091879582812751321589095322e-5',
+           18: '-2.135549195295375067495229039525877007339581782873806009604806379884885927885993014667e-2'},
+          {1: '4.918722777774214635454694806095471334564471116346374258920200467475606642975663633169e-2',
+           6: '8.381198329740939383758467268684128106638290469173528975872944409244863365387981657651e-2',
+           7: '9.031585241436450659339626877786556727134244569192456020771509670971435444573825121328e-6',
+           8: '9.729721702550808557495179062390587533407132090396133365371679075124515126725605224924e-2',
+           9: '-7.780700010332922911083090560520956762627768671838912755501179322945892692289272010345e-2',
+           10: '2.322816011687352870985186646759446719321113455516507860765563208248738749278233611786e-1',
+           11: '-1.06971352297168569854032832985203844594754477080796496451908806986137557552489055223e-2',
+           12: '-1.273357855008010164642613326804825893357151796749893640146110897003842493364412495521e-1',
+           13: '1.1955963060457703357984080979881993156568490891544043331831115293607832903896465949e-1',
+           14: '1.268882175226586102719033232628398791540785498489425981873111782477341389728096676737e-1',
+           15: '2.044989775051124744376278118609406952965235173824130879345603271983640081799591002045e-2',
+           16: '-3.909856506984242164691157929655038995858933888334921275260056794557284704385445582377e-3',
+           17: '-9.117410119332842109125953032188840693633119317454401715027062207348542639139803659651e-6',
+           18: '1.126093151077456154585623418197514536662349793737574398626301058923382946852045056475e-2',
+           19: '-3.209868434922071245903287586373535845929558438862699119277778588606558307508436673461e-1'},
+          {1: '5.247404461891304721708365639844356354386624470737997647397329116437616959059854701778e-1',
+           4: '7.610651429965941990931946190296373660533922130208900643092560661920652146268815424885e-2',
+           5: '-2.135538596825204678401302463372339475781988628449683891486081018353295131152366999963e0',
+           6: '2.119016745189825526524339470866652730733632823644186992594087231585247087949150559862e0',
+           9: '-6.068669292751351984511141135476525247489731841233590933089036540462466843434512014723e-1',
+           10: '-6.975023816048118989159659127206041759560640169551283418432821453966450135301718130674e-1',
+           11: '-2.539552135383387231958801508125376392283214913791972115937570999107334296436460657368e-2',
+           18: '2.539552135383387231958801508125376392283214913791972115937570999107334296436460657368e-2',
+           19: '6.975023816048118989159659127206041759560640169551283418432821453966450135301718130674e-1',
+           20: '6.068669292751351984511141135476525247489731841233590933089036540462466843434512014723e-1'},
+          {1: '3.85095150452495257524472652032440486089882384495048449013834354160100060557967490878e-2',
+           4: '9.889604363651382462812798900870548282288802143553903392828423536490053424426345577709e-5',
+           5: '1.258652731216402762123982910182735616976625577395859318541619645591514091994326716669e-1',
+           7: '1.148546657824708136802241649776446744025406100582655444423341878411637297467351936831e-1',
+           9: '-1.299246462925958527077352114079744607750386324042347411360003531859939834460301561195e-1',
+           10: '-3.664591598580916638621456622089859363144583004356560608229075984337239720284817960193e-1',
+           19: '3.664591598580916638621456622089859363144583004356560608229075984337239720284817960193e-1',
+           20: '1.299246462925958527077352114079744607750386324042347411360003531859939834460301561195e-1',
+           21: '-1.148546657824708136802241649776446744025406100582655444423341878411637297467351936831e-1'},
+          {1: '2.175227402212137286104398734798923400326123258875071216675507357419304139407870179368e-1',
+           2: '2.254597159191371485825425826604585371603701302528437555254317203984204632521954382036e-1',
+           6: '-7.003676470588235294117647058823529411764705882352941176470588235294117647058823529412e-1',
+           7: '-3.841432262252079340469853296205751191707035527677198880717241749265840367609120672261e-1',
+           21: '3.841432262252079340469853296205751191707035527677198880717241749265840367609120672261e-1',
+           22: '7.003676470588235294117647058823529411764705882352941176470588235294117647058823529412e-1'},
+          {1: '4.351851851851851851851851851851851851851851851851851851851851851851851851851851851852e-1',
+           3: '-4.244806610219170956648818689597945762515945523075081224120777274585003570971510665439e-1',
+           23: '4.244806610219170956648818689597945762515945523075081224120777274585003570971510665439e-1'},
+          {1: '1.454990971513478580914495526598245283940024810265087163382498896386800769812364397026e1',
+           2: '-2.609444444444444444444444444444444444444444444444444444444444444444444444444444444444e0',
+           3: '-2.016004609236637754870351028563643794559738431497207211298306162299623087053267335725e0',
+           6: '-2667/1600',
+           7: '-1.84001013760904971548055102860399278075185418481258273031989327821148060476670231985e0',
+           9: '1.128850026879393650927243496060343039004107661597559344830054269802155904451112935844e2',
+           10: '1.233942086822776167534198661922997568027612066045886506351026838994566451157760161079e2',
+           11: '-7.912126656078716671206667350992937018785263673658058027818457299775466324638082312137e-1',
+           12: '-5.005149873558555185701853277950418028083920384013973228797374663569746882026502756132e1',
+           13: '2.488778291494286023489265916235844707524170235927746532159915897878512972222657954044e1',
+           14: '-2.121164197057320847511194729602871445996396409264694299135694995667783941778631290781e2',
+           15: '-1.789082255740024165397920079197116480379826062999613139163493416384514698556677051724e1',
+           16: '2.509716434086569985363077956674238286724267256774032757480361264001771307725305753519e0',
+           17: '1.162475886937088360535666476065014131326443901611275096836079807311057386735832665899e-1',
+           18: '5.840328281597421751021178306186155103094570763962374837158281176580253234011237044692e-1',
+           19: '1.584417806712708397483834073813399023446091584920600008797782958694409008929749703075e0',
+           20: '1.338635006378392645053446531474068534729248229446179562750186952887872256191439757181e0',
+           21: '1.84001013760904971548055102860399278075185418481258273031989327821148060476670231985e0',
+           22: '2667/1600',
+           23: '2.016004609236637754870351028563643794559738431497207211298306162299623087053267335725e0',
+           24: '2.609444444444444444444444444444444444444444444444444444444444444444444444444444444444e0'},
+          {1: '4.213659219087082450668941175898637044576077571412870755532166081975824639155816025423e-1',
+           6: '2.360375290413766425107807321597798068298832670876354152068674897991709951684675057597e0',
+           7: '7.88792681183690214427082447723136543744296285638349185134971336108654256114493596476e-2',
+           8: '-1.881850641776530466652474803895333308262409829541779704822719782535259533895036456964e0',
+           9: '-1.304700734906095391371228323883517431348033016096248869612640797091741378769699510853e0',
+           10: '1.146971532060496506611311517441641422873299688900135018999537656144573134542692746612e-1',
+           11: '-5.223613182942077907170609676910338480915071906000186351215047373740452623507436746018e-3',
+           12: '7.134840563194221964556259902880063405282394887795535106616674222878805188799073074497e-1'},
+          {1: '-1.016867684065179179311540011641152067739527559831057381007428484343486238202737995538e0',
+           6: '-7.712044352285817603610736737545203003182107799250377304475316992902646516184627861475e0',
+           7: '-4.03400840937485875341064328003977931165002307626629621003033787297632709208171745486e-1',
+           8: '6.739165476490825275476530741799137001781411805688541615342712456896969009075069743117e0',
+           9: '6.014994643407224294180918860565568523540180411761624603152605084567461778121724411633e0',
+           10: '-1.138427387973993086846707441740657423236451007119331997503516596250482644801941463866e0',
+           11: '5.009271973181599563449431362188397685579770251743883251930235916805543539186803311245e-2',
+           12: '-3.113250932564715585587456369457050044282973515833171733791753110672694235302567710668e0',
+           26: '1.384086184284282287144691407184059663080846182736441247635994288225760468937471545692e0'},
+          {1: '1.131093475949031458408970675798323789793651098141584053672723684523337489654810813567e0',
+           6: '-1.130475611955440577592346561419842170756276153921836803995513790246783417109406727002e1',
+           7: '8.673508908529372037894544277195364499375277491231106383198729858086287127092489733738e-2',
+           8: '4.971317844154333915807514558966554931901059536397301577948574837963960265600948244094e0',
+           9: '1.486493772010299652718002500847699984298963300991290479767277341466986550270499895786e1',
+           10: '-5.526130551905351405702373768620234518347747212552226033118137855980983127699224086148e0',
+           11: '1.017790491986200061558195486579246543940163889995857946318495764475820398967567810759e-1',
+           12: '-5.412708567655345677389304794550103449135846140313886894023804835964789906470796078495e0',
+           26: '2.11990590321612439733775670699822674248916753380437462629339915546322728794839885233e0',
+           27: '-1.60378970796425371382092892506352136643130578288709152082432501440356456940956239807e-1'},
+          {1: '4.612864603958015905056850990838704062569763496465412763519385202873225169326091596022e1',
+           6: '2.791300163119399908845158457840426795358131126287389180101909720743727165524743997096e1',
+           7: '1.611362689862451240990975288339484000039234961533373225370151713993919933068137837655e1',
+           8: '-1.254696763444318726329250646477825268481685879278990572088898486327607587168793188547e2',
+           9: '7.657182020120529497684089567511627659347626021577320126137924234653281598557298427556e1',
+           10: '-4.897805558723490361747755876313897556229903489002597907918723603724236906416246304792e1',
+           11: '-1.242830487244052672528847080627776989497284066852925470069357906835696725179561610962e0',
+           12: '1.885807213383620068645464308722546866214730809725606975205204214283143331463602851729e1',
+           26: '-8.871982194511738170929283011936752038683182063824370821380217475185779921363890310462e0',
+           27: '-2.069534982695615656321598541301254038890059866116256078922522295738656144906973495868e0',
+           28: '2.046912691678016537956965912259391642243284658827565955103431482290288593093460219351e0'}],
+    'c': {1: '2.380952380952380952380952380952380952380952380952380952380952380952380952380952380952e-2',
+          2: '-11/100',
+          3: '-17/100',
+          6: '-19/100',
+          7: '-21/100',
+          9: '-23/100',
+          10: '-27/100',
+          11: '-29/100',
+          13: '1.384130236807829740053502031450331467488136400899412345912671194817223119377730668077e-1',
+          14: '2.158726906049313117089355111406811389654720741957730511230185948039919737765126474781e-1',
+          15: '2.438095238095238095238095238095238095238095238095238095238095238095238095238095238095e-1',
+          16: '2.158726906049313117089355111406811389654720741957730511230185948039919737765126474781e-1',
+          17: '1.384130236807829740053502031450331467488136400899412345912671194817223119377730668077e-1',
+          18: '29/100',
+          19: '27/100',
+          20: '23/100',
+          21: '21/100',
+          22: '19/100',
+          23: '17/100',
+          24: '11/100',
+          25: '2.380952380952380952380952380952380952380952380952380952380952380952380952380952380952e-2'},
+    'd': {1: '1.357267366422036691624508570375039921213961405197383540990729271585608575744367221422e-2',
+          9: '1.957242608025905233613155193355413222756712243739956539857744660017249157522413539338e-1',
+          10: '6.18886634743560866161606023838034532174057918569826292507244103081046113011822462665e-2',
+          11: '2.356461254963383884566009189531765712282459575681722654363888116993755654359289982043e-1',
+          12: '9.356981277656948171659125355126822887878370575133833270918675400840988929847712528189e-2',
+          26: '2.788382624223597882496809755901865993371492355322230983832374605891024297949723722505e-1',
+          27: '4.265887719284871852244002213010235951116369449606049493109912099005098392090245967637e-1',
+          28: '-2.87802516647450196299947724123386148715120154208475122551185143779853808819230330843e-1',
+          29: '-1.802605391747162424104685269536402054591231988681564193502526144322952773004003407203e-2'},
+    }
+
+tableaus['rkf1412'] = {
+    'doc': '''\
+  Feagin's RK14(12) - a 14th-order method with an embedded 12th-order method.
+
+### Reference
+  * [coefficient file](http://sce.uhcl.edu/rungekutta/rk1412.txt)''',
+    'a': ['0', '1.11111111111111111111111111111111111111111111111111111111111e-1',
+          '5.55555555555555555555555555555555555555555555555555555555556e-1',
+          '8.33333333333333333333333333333333333333333333333333333333333e-1',
+          '3.33333333333333333333333333333333333333333333333333333333333e-1', '1',
+          '6.69986979272772921764683785505998513938845229638460353285142e-1',
+          '2.97068384213818357389584716808219413223332094698915687379168e-1',
+          '7.27272727272727272727272727272727272727272727272727272727273e-1',
+          '1.40152799042188765276187487966946717629806463082532936287323e-1',
+          '7.00701039770150737151099854830749337941407049265546408969222e-1',
+          '3.63636363636363636363636363636363636363636363636363636363636e-1',
+          '2.63157894736842105263157894736842105263157894736842105263158e-1',
+          '3.92172246650270859125196642501208648863714315266128052078483e-2',
+          '8.12917502928376762983393159278036506189612372617238550774312e-1',
+          '1.66666666666666666666666666666666666666666666666666666666667e-1', '9/10',
+          '6.41299257451966923312771193896682809481096651615083225402924e-2',
+          '2.0414990928342884892774463430102340502714950524133375162887e-1',
+          '3.95350391048760565615671369827324372352227297456659450554577e-1',
+          '6.04649608951239434384328630172675627647772702543340549445423e-1',
+          '7.9585009071657115107225536569897659497285049475866624837113e-1',
+          '9.35870074254803307668722880610331719051890334838491677459708e-1',
+          '1.66666666666666666666666666666666666666666666666666666666667e-1',
+          '8.12917502928376762983393159278036506189612372617238550774312e-1',
+          '3.92172246650270859125196642501208648863714315266128052078483e-2',
+          '3.63636363636363636363636363636363636363636363636363636363636e-1',
+          '7.00701039770150737151099854830749337941407049265546408969222e-1',
+          '1.40152799042188765276187487966946717629806463082532936287323e-1',
+          '2.97068384213818357389584716808219413223332094698915687379168e-1',
+          '6.69986979272772921764683785505998513938845229638460353285142e-1',
+          '3.33333333333333333333333333333333333333333333333333333333333e-1',
+          '5.55555555555555555555555555555555555555555555555555555555556e-1',
+          '1.11111111111111111111111111111111111111111111111111111111111e-1', '1'],
+    'b': [{},
+          {1: '1.11111111111111111111111111111111111111111111111111111111111e-1'},
+          {1: '-8.33333333333333333333333333333333333333333333333333333333333e-1',
+           2: '1.38888888888888888888888888888888888888888888888888888888889e0'},
+          {1: '2.08333333333333333333333333333333333333333333333333333333333e-1',
+           3: '5/8'},
+          {1: '1.93333333333333333333333333333333333333333333333333333333333e-1',
+           3: '11/50',
+           4: '-2/25'},
+          {1: '1/10',
+           4: '2/5',
+           5: '1/2'},
+          {1: '1.03484561636679776672993546511910344499744798201971316606663e-1',
+           4: '1.22068887306407222589644082868962077139592714834162134741275e-1',
+           5: '4.82574490331246622475134780125688112865919023850168049679402e-1',
+           6: '-3.8140960001560699973088624000562020566411307247841147742197e-2'},
+          {1: '1.24380526654094412881516420868799316268491466359671423163289e-1',
+           5: '2.26120282197584301422238662979202901196752320742633143965145e-1',
+           6: '1.37885887618080880607695837016477814530969417491493385363543e-2',
+           7: '-6.722101339966844497493995074143058569500863415253821828562e-2'},
+          {1: '9.36919065659673815530885456083005933866349695217750085655603e-2',
+           6: '-6.13406843450510987229498995641664735620914507128858871007099e-3',
+           7: '2.16019825625503063708860097659866573490979433278117320188668e-1',
+           8: '4.23695063515761937337619073960976753205867469544123532683116e-1'},
+          {1: '8.38479812409052664616968791372814085980533139224911131069335e-2',
+           6: '-1.17949367100973814319755056031295775367961960590736150777613e-2',
+           7: '-2.47299020568812652339473838743194598325992840353340132697498e-1',
+           8: '9.78080858367729012259313014081291665503740655476733940756599e-2',
+           9: '2.17590689243420631360008651767860318344168120024782176879989e-1'},
+          {1: '6.1525535976942822795456238961431471433342396906482110745394e-2',
+           6: '5.9223278032450330804299000579804652473838956044425713683499e-3',
+           7: '4.70326159963841112217224303205894113455362530746108825010848e-1',
+           8: '2.99688863848679000853981837096192399136831121671781279184194e-1',
+           9: '-2.47656877593994914689992276329810825853958069263947095548189e-1',
+           10: '1.10895029771437682893999851839061714522445173600678718208625e-1'},
+          {1: '4.19700073362782579861792864787277787213483656543104611245994e-2',
+           6: '-3.17987696266205093901912847692712407988609169703103952205634e-3',
+           7: '8.06397714906192077260821711520379506393543111567419750119748e-1',
+           8: '9.75983126412388979093522850684288851314672048003054550357187e-2',
+           9: '7.78575578158398909027512446452927238999763460594181964958853e-1',
+           10: '2.04890423831599428189499202098105603312029235081420653574829e-1',
+           11: '-1.56261579627468188307070943950527825211462892236424360892806e0'},
+          {1: '4.37726782233730163574465242495339811688214967071614123256973e-2',
+           9: '6.2436502752019520879435862858093362528163121690309591720125e-3',
+           10: '2.00043097109577314994435165469647856829066232218264969608768e-1',
+           11: '-8.05328367804983036823857162048902911923392887337029314844206e-3',
+           12: '2.11517528067396521915711903523399601316877825157550573051221e-2'},
+          {1: '2.83499250363514563095023591920717312247137654896477097768495e-2',
+           9: '2.49163204855817407538949148805995149459884653585417680098222e-3',
+           10: '2.30138787854593149638399846373742768772087122638142234223658e-2',
+           11: '-3.22155956692977098724476092467120878189463604760620461043308e-3',
+           12: '9.88442549447664668946335414487885256040819982786014648129297e-3',
+           13: '-2.13010771328887351384307642875927384886634565429572466632092e-2'},
+          {1: '3.43511894290243001049432234735147943083353174980701426268122e-1',
+           9: '2.10451912023627385609097011999010655788807405225626700040882e-1',
+           10: '1.03427452057230411936482926828825709938667999698324740166559e0',
+           11: '6.00303645864422487051240448206640574939078092406156945568306e-3',
+           12: '8.55938125099619537578012106002407728915062652616416005816477e-1',
+           13: '-9.77235005036766810872264852372525633013107656892839677696022e-1',
+           14: '-6.60026980479294694616225013856327693720573981219974874776419e-1'},
+          {1: '-1.43574001672168069538206399935076366657755954378399880691949e-2',
+           9: '-3.66253270049039970293685796848974791733119081733552207318285e-2',
+           10: '3.50254975636213681976849406979846524346789082471103574920148e-2',
+           11: '3.60946016362113508931786658758335239823689929864237671348749e-2',
+           12: '-2.65219967553681106351595946834601923649627012457464284442911e-2',
+           13: '4.45699011305698119638911537508839908104336323082226770910408e-2',
+           14: '1.24343093331358243286225595741786448038973408895106741855721e-1',
+           15: '4.13829693239480694403512496204335960426192908674476033832967e-3'},
+          {1: '3.56032404425120290975609116398089176264106222379748802654822e-1',
+           9: '-4.50192758947562595966821779075956175110645100214763601190349e-1',
+           10: '4.30527907083710898626656292808782917793030154094709462877146e-1',
+           11: '5.11973029011022237668556960394071692077125787030651386389972e-1',
+           12: '9.08303638886404260390159124638110213997496214819904630546596e-1',
+           13: '-1.2392109337193393175737246915153402885441388924860572618652e0',
+           14: '-6.49048661671761465141672348879062553905402831967191097656668e-1',
+           15: '2.51708904586819292210480529948970541404887852931447491219418e-1',
+           16: '7.79906470345586398810756795282334476023540593411550187024263e-1'},
+          {1: '1.30935687406513066406881206418834980127470438213192487844956e-2',
+           13: '-9.32053067985113945908461962767108237858631509684667142124826e-5',
+           14: '5.05374334262299359640090443138590726770942344716122381702746e-2',
+           15: '8.04470341944487979109579109610197797641311868930865361048975e-7',
+           16: '5.91726029494171190528755742777717259844340971924321528178248e-4',
+           17: '-4.01614722154557337064691684906375587732264247950093804676867e-7'},
+          {1: '2.07926484466053012541944544000765652167255206144373407979758e-2',
+           13: '5.82695918800085915101902697837284108951406103029871570103075e-4',
+           14: '-8.01700732358815939083342186525852746640558465919633524655451e-3',
+           15: '4.03847643847136940375170821743560570484117290330895506618968e-6',
+           16: '8.54609998055506144225056114567535602510114622033622491802597e-2',
+           17: '-2.04486480935804242706707569691004307904442837552677456232848e-6',
+           18: '1.05328578824431893399799402979093997354240904235172843146582e-1'},
+          {1: '1.40153449795736021415446247355771306718486452917597731683689e0',
+           13: '-2.30252000984221261616272410367415621261130298274455611733277e-1',
+           14: '-7.21106840466912905659582237106874247165856493509961561958267e0',
+           15: '3.72901560694836335236995327852132340217759566678662385552634e-3',
+           16: '-4.71415495727125020678778179392224757011323373221820091641216e0',
+           17: '-1.76367657545349242053841995032797673574903886695600132759652e-3',
+           18: '7.64130548038698765563029310880237651185173367813936997648198e0',
+           19: '3.50602043659751834989896082949744710968212949893375368243588e0'},
+          {1: '1.19514650694120686799372385830716401674473610826553517297976e1',
+           13: '7.79480932108175968783516700231764388220284279598980948538579e0',
+           14: '-5.64501393867325792523560991120904281440468100061340556540132e1',
+           15: '9.12376306930644901344530449290276645709607450403673704844997e-2',
+           16: '-1.27336279925434886201945524309199275038162717529918963305155e1',
+           17: '-3.96895921904719712313542810939736674712383070433147873009352e-2',
+           18: '5.44392141883570886996225765155307791861438378423305337073797e1',
+           19: '-3.64411637921569236846406990361350645806721478409266709351203e0',
+           20: '-8.04503249910509910899030787958579499315694913210787878260459e-1'},
+          {1: '-1.4880942650710048842783886826864762556193061208214859707669e2',
+           13: '-9.17295278291256484357935662402321623495228729036354276506427e1',
+           14: '7.07656144971598359834575719286335716154821128966649565194286e2',
+           15: '-1.1056361185748244090529696131159093080133830894263776955554e0',
+           16: '1.76134591883811372587859898076055660406999516762301689616841e2',
+           17: '4.91384824214880662268898345164454557416884631402764792538746e-1',
+           18: '-6.84278000449814944358237535610895081956077167893600278300805e2',
+           19: '2.79910604998398258984224332124380407446002518400668657974589e1',
+           20: '1.31939710030282333443670964371153238435064159623744975073252e1',
+           21: '1.25128781283980445450114974148056006317268830077396406361417e0'},
+          {1: '-9.67307946948196763644126118433219395839951408571877262880482e0',
+           13: '-4.46990150858505531443846227701960360497830681408751431146712e0',
+           14: '4.55127128690952681968241950400052751178905907817398483534845e1',
+           15: '-7.13085086183826912791492024438246129930559805352394367050813e-2',
+           16: '1.1227361406841274158259062447993938420782680077679448505154e1',
+           17: '1.26244376717622724516237912909138809361786889819105426371393e-1',
+           18: '-4.35439339549483313605810624907242107623814304467621407753424e1',
+           19: '7.87174307543058978398792994996550902064546091443233850464377e-1',
+           20: '5.32264696744684215669300708603886690785395776821503851830821e-1',
+           21: '4.22422733996325326010225127471388772575086538809603346825334e-1',
+           22: '8.59131249503067107308438031499859443441115056294154956487671e-2'},
+          {1: '-1.00664032447054702403396606900426891472202824757968765569183e1',
+           9: '-3.66253270049039970293685796848974791733119081733552207318285e-2',
+           10: '3.50254975636213681976849406979846524346789082471103574920148e-2',
+           11: '3.60946016362113508931786658758335239823689929864237671348749e-2',
+           12: '-2.65219967553681106351595946834601923649627012457464284442911e-2',
+           13: '-6.27088972181464143590553149478871603839356122957396018530209e0',
+           14: '4.82079237442562989090702103008195063923492593141636117832993e1',
+           15: '-6.94471689136165640882395180583732834557754169149088630301342e-2',
+           16: '1.26810690204850295698341370913609807066108483811412127009785e1',
+           17: '1.19671168968323754838161435501011294100927813964199613229864e-2',
+           18: '-4.67249764992482408003358268242662695593201321659795608950429e1',
+           19: '1.33029613326626711314710039298216591399033511191227101321435e0',
+           20: '1.0076678750339829835343890361992665777116271779366171970837e0',
+           21: '2.09512051933665091664122388475480702892770753864487241177616e-2',
+           22: '2.10134706331264177317735424331396407424412188443757490871603e-2',
+           23: '9.52196014417121794175101542454575907376360233658356240547761e-3'},
+          {1: '-4.09478081677743708772589097409370357624424341606752069725341e2',
+           9: '2.10451912023627385609097011999010655788807405225626700040882e-1',
+           10: '1.03427452057230411936482926828825709938667999698324740166559e0',
+           11: '6.00303645864422487051240448206640574939078092406156945568306e-3',
+           12: '8.55938125099619537578012106002407728915062652616416005816477e-1',
+           13: '-2.5051699854744786049277765772931613038658405042078207596699e2',
+           14: '1.94642466652388427766053750328264758595829850895761428240231e3',
+           15: '-3.04503882102310365506105809086860882786950544097602101685174e0',
+           16: '4.9062637952828171352120826529916808384159854227406167157623e2',
+           17: '1.56647589531270907115484067013597445739595615245966775329993e0',
+           18: '-1.88197428994011173362217267377035870619215906638453056643641e3',
+           19: '7.52592224724847175278837713643303149821620618914245864351135e1',
+           20: '3.45734356980331067622434344736554689696728644793551014989002e1',
+           21: '3.21147679440968961435417361847073755169022966748891627882572e0',
+           22: '-4.60408041738414391307201404237058848867245095265382820823055e-1',
+           23: '-8.70718339841810522431884137957986245724252047388936572215438e-2',
+           24: '-7.39351814158303067567016952195521063999185773249132944724553e0'},
+          {1: '3.43347475853550878921093496257596781120623891072008459930197e0',
+           9: '2.49163204855817407538949148805995149459884653585417680098222e-3',
+           10: '2.30138787854593149638399846373742768772087122638142234223658e-2',
+           11: '-3.22155956692977098724476092467120878189463604760620461043308e-3',
+           12: '9.88442549447664668946335414487885256040819982786014648129297e-3',
+           13: '2.1625279937792250778830784190475735404575922533573270791653e0',
+           14: '-1.62699864546457421328065640660139489006987552040228852402716e1',
+           15: '-1.28534502120524552843583417470935010538029037542654506231743e-1',
+           16: '-8.98915042666504253089307820833379330486511746063552853023189e0',
+           17: '-3.48595363232025333387080201851013650192401767250513765000963e-3',
+           18: '1.57936194113339807536235187388695574135853387025139738341334e1',
+           19: '-5.74403330914095065628165482017335820148383663195675408024658e-1',
+           20: '-3.45602039021393296692722496608124982535237228827655306030152e-1',
+           21: '-6.62241490206585091731619991383757781133067992707418687587487e-3',
+           22: '-7.7778812924220416403254645860736430975934720962675911194615e-3',
+           23: '-3.56084192402274913338827232697437364675240818791706587952939e-3',
+           24: '4.79282506449930799649797749629840189457296934139359048988332e0',
+           25: '1.53725464873068577844576387402512082757034273069877432944621e-1'},
+          {1: '3.23038520871985442326994734440031535091364975047784630088983e1',
+           6: '-3.17987696266205093901912847692712407988609169703103952205634e-3',
+           7: '8.06397714906192077260821711520379506393543111567419750119748e-1',
+           8: '9.75983126412388979093522850684288851314672048003054550357187e-2',
+           9: '7.78575578158398909027512446452927238999763460594181964958853e-1',
+           10: '2.04890423831599428189499202098105603312029235081420653574829e-1',
+           11: '-1.56261579627468188307070943950527825211462892236424360892806e0',
+           13: '1.63429891882310570648504243973927174708753353504154550405647e1',
+           14: '-1.54544555293543621230730189631471036399316683669609116705323e2',
+           15: '1.56971088703334872692034283417621761466263593582497085955201e0',
+           16: '3.27685545087248131321429817269900731165522404974733504794135e0',
+           17: '-5.03489245193653176348040727199783626534081095691632396802451e-2',
+           18: '1.53321151858041665070593767885914694011224363102594556731397e2',
+           19: '7.17568186327720495846766484814784143567826308034865369443637e0',
+           20: '-2.94036748675300481945917659896930989215320594380777597403592e0',
+           21: '-6.65845946076803144470749676022628870281920493197256887985612e-2',
+           22: '-4.62346054990843661229248668562217261176966514016859284197145e-2',
+           23: '-2.04198733585679401539388228617269778848579774821581777675337e-2',
+           24: '-5.33523106438735850515953441165998107974045090495791591218714e1',
+           25: '-1.35548714715078654978732186705996404017554501614191325114947e0',
+           26: '-1.57196275801232751882901735171459249177687219114442583461866e0'},
+          {1: '-1.66451467486341512872031294403931758764560371130818978459405e1',
+           6: '5.9223278032450330804299000579804652473838956044425713683499e-3',
+           7: '4.70326159963841112217224303205894113455362530746108825010848e-1',
+           8: '2.99688863848679000853981837096192399136831121671781279184194e-1',
+           9: '-2.47656877593994914689992276329810825853958069263947095548189e-1',
+           10: '1.10895029771437682893999851839061714522445173600678718208625e-1',
+           12: '-4.91719043846229147070666628704194097678081907210673044988866e-1',
+           13: '-1.14743154427289496968389492564352536350842454130853175250727e1',
+           14: '8.02593166576230272541702485886484400152793366623589989106256e1',
+           15: '-3.84132303980042847625312526759029103746926841342088219165648e-1',
+           16: '7.28147667468107583471326950926136115767612581862877764249646e0',
+           17: '-1.32699384612248379510571708176035274836827341616751884314074e-1',
+           18: '-8.10799832525730726674679289752255240006070716633632990308935e1',
+           19: '-1.25037492835620639521768185656179119962253747492403205797494e0',
+           20: '2.59263594969543681023776379504377324994226447359296887778718e0',
+           21: '-3.01440298346404539830163997260526875264431537275641495291993e-1',
+           22: '2.2138446078983233745170645157277379169524683905731841430102e-1',
+           23: '8.2757727477189293195598987097469315299627643542980989055121e-2',
+           24: '1.89960662040611520464672450037243263998175161412237156872211e1',
+           25: '2.69231946409639685623468015128334167460051910348912845121977e-1',
+           26: '1.6267482744706653746298936492962893398812502928418368027902e0',
+           27: '4.91719043846229147070666628704194097678081907210673044988866e-1'},
+          {1: '8.38479812409052664616968791372814085980533139224911131069335e-2',
+           6: '-1.17949367100973814319755056031295775367961960590736150777613e-2',
+           7: '-2.47299020568812652339473838743194598325992840353340132697498e-1',
+           8: '9.78080858367729012259313014081291665503740655476733940756599e-2',
+           9: '2.17590689243420631360008651767860318344168120024782176879989e-1',
+           11: '1.3758560676332522486565963219678774664744722297508486597544e-1',
+           12: '4.39870229715046685058790092341545026046103890294261359042581e-2',
+           14: '-5.13700813768193341957004456618630303738757363641964030086972e-1',
+           15: '8.26355691151315508644211308399153458701423158616168576922372e-1',
+           16: '2.57018139719811832625873882972519939511136556341960074626615e1',
+           24: '-2.57018139719811832625873882972519939511136556341960074626615e1',
+           25: '-8.26355691151315508644211308399153458701423158616168576922372e-1',
+           26: '5.13700813768193341957004456618630303738757363641964030086972e-1',
+           27: '-4.39870229715046685058790092341545026046103890294261359042581e-2',
+           28: '-1.3758560676332522486565963219678774664744722297508486597544e-1'},
+          {1: '1.24380526654094412881516420868799316268491466359671423163289e-1',
+           5: '2.26120282197584301422238662979202901196752320742633143965145e-1',
+           6: '1.37885887618080880607695837016477814530969417491493385363543e-2',
+           7: '-6.722101339966844497493995074143058569500863415253821828562e-2',
+           10: '-8.56238975085428354755349769879501772112121597411563802855067e-1',
+           11: '-1.96337522866858908928262850028093813988180440518267404553576e0',
+           12: '-2.32332822724119401237246257308921847250108199230419994978218e-1',
+           14: '4.30660719086453349461668936876562947772432562053478092626764e0',
+           15: '-2.92722963249465482659787911202390446687687394950633612630592e0',
+           16: '-8.23131666397858944454492334105458707735761966428138676971041e1',
+           24: '8.23131666397858944454492334105458707735761966428138676971041e1',
+           25: '2.92722963249465482659787911202390446687687394950633612630592e0',
+           26: '-4.30660719086453349461668936876562947772432562053478092626764e0',
+           27: '2.32332822724119401237246257308921847250108199230419994978218e-1',
+           28: '1.96337522866858908928262850028093813988180440518267404553576e0',
+           29: '8.56238975085428354755349769879501772112121597411563802855067e-1'},
+          {1: '1.03484561636679776672993546511910344499744798201971316606663e-1',
+           4: '1.22068887306407222589644082868962077139592714834162134741275e-1',
+           5: '4.82574490331246622475134780125688112865919023850168049679402e-1',
+           6: '-3.8140960001560699973088624000562020566411307247841147742197e-2',
+           8: '-5.50499525310802324138388507020508177411414311000037561712836e-1',
+           10: '-7.11915811585189227887648262043794387578291882406745570495765e-1',
+           11: '-5.84129605671551340432988730158480872095335329645227595707052e-1',
+           14: '2.11046308125864932128717300046622750300375054278936987850718e0',
+           15: '-8.37494736739572135525742023001037992695260175335123517729291e-2',
+           16: '5.10021499072320914075295969043344113107545060862804249161191e0',
+           24: '-5.10021499072320914075295969043344113107545060862804249161191e0',
+           25: '8.37494736739572135525742023001037992695260175335123517729291e-2',
+           26: '-2.11046308125864932128717300046622750300375054278936987850718e0',
+           28: '5.84129605671551340432988730158480872095335329645227595707052e-1',
+           29: '7.11915811585189227887648262043794387578291882406745570495765e-1',
+           30: '5.50499525310802324138388507020508177411414311000037561712836e-1'},
+          {1: '1.93333333333333333333333333333333333333333333333333333333333e-1',
+           3: '11/50',
+           4: '-2/25',
+           7: '1.09993425580724703919462404865068340845119058295846426463652e-1',
+           8: '-2.54297048076270161384068506997153122141835626976703920846242e-1',
+           10: '8.65570777116694254343770343821098281832847401233011859346737e-1',
+           11: '3.324164491140930831067995527865720183368600929369864071602e0',
+           14: '-1.20102223315977933882352385148661841260301942633996815127277e1',
+           15: '4.76601466242493239430442776862061899602963782003580209476163e-1',
+           16: '-2.90243011221036390525802623213654099596251221332470910692353e1',
+           24: '2.90243011221036390525802623213654099596251221332470910692353e1',
+           25: '-4.76601466242493239430442776862061899602963782003580209476163e-1',
+           26: '1.20102223315977933882352385148661841260301942633996815127277e1',
+           28: '-3.324164491140930831067995527865720183368600929369864071602e0',
+           29: '-8.65570777116694254343770343821098281832847401233011859346737e-1',
+           30: '2.54297048076270161384068506997153122141835626976703920846242e-1',
+           31: '-1.09993425580724703919462404865068340845119058295846426463652e-1'},
+          {1: '-8.33333333333333333333333333333333333333333333333333333333333e-1',
+           2: '1.38888888888888888888888888888888888888888888888888888888889e0',
+           5: '-3/4',
+           7: '-4.92529543718026304422682049114021320200214681580657784719074e-1',
+           31: '4.92529543718026304422682049114021320200214681580657784719074e-1',
+           32: '3/4'},
+          {1: '1.11111111111111111111111111111111111111111111111111111111111e-1',
+           3: '-2.22222222222222222222222222222222222222222222222222222222222e-1',
+           33: '2.22222222222222222222222222222222222222222222222222222222222e-1'},
+          {1: '2.85835140388971558796088842163836414852927537894596466840753e-1',
+           2: '2.91666666666666666666666666666666666666666666666666666666667e-1',
+           3: '7/32',
+           5: '21/128',
+           7: '2.18194354945556658327188241581352107093288824322187941141516e-1',
+           8: '1.80392898478697766863635221946775437719620053641849228562435e-1',
+           10: '2.05713839404845018859120755122929542277570094982808905393991e-1',
+           11: '2.42715791581770239970282927959446515762745971386670541948576e-1',
+           12: '2.46465780813629305833609291181891407799228103869305705137021e-1',
+           13: '-3.44991940790890824979834154601622662060370460614931644223924e0',
+           14: '2.28875562160036081760729060738458584294220372552740218459295e-1',
+           15: '2.83290599702151415321527419056733335978436595493855789831434e-1',
+           16: '3.21085125837766640960131490544236787005557320332238705967955e0',
+           17: '-2.23538777364845699920233756214162507964125230083674032084065e-1',
+           18: '-7.07121157204419073518727286207487212130091231955206160635271e-1',
+           19: '3.21123345150287080408174729202856500893260034443022374267639e0',
+           20: '1.40954348309669766030414474301123175769045945573548986335553e0',
+           21: '-1.51362053443742613121602276742518111090963026203676055891793e-1',
+           22: '3.72350574527014276454724080214619984397121028202148298716575e-1',
+           23: '2.52978746406361336722199907762141285915775728129414319261111e-1',
+           24: '-3.21085125837766640960131490544236787005557320332238705967955e0',
+           25: '-2.83290599702151415321527419056733335978436595493855789831434e-1',
+           26: '-2.28875562160036081760729060738458584294220372552740218459295e-1',
+           27: '-2.46465780813629305833609291181891407799228103869305705137021e-1',
+           28: '-2.42715791581770239970282927959446515762745971386670541948576e-1',
+           29: '-2.05713839404845018859120755122929542277570094982808905393991e-1',
+           30: '-1.80392898478697766863635221946775437719620053641849228562435e-1',
+           31: '-2.18194354945556658327188241581352107093288824322187941141516e-1',
+           32: '-21/128',
+           33: '-7/32',
+           34: '-2.91666666666666666666666666666666666666666666666666666666667e-1'}],
+    'c': {1: '1.78571428571428571428571428571428571428571428571428571428571e-2',
+          2: '3/512',
+          3: '3/256',
+          5: '9/512',
+          7: '3/128',
+          8: '15/512',
+          10: '9/256',
+          11: '21/512',
+          12: '3/64',
+          14: '27/512',
+          15: '15/256',
+          16: '33/512',
+          18: '1.0535211357175301969149603288787816222767308308052388404167e-1',
+          19: '1.70561346241752182382120338553874085887555487802790804737501e-1',
+          20: '2.06229397329351940783526485701104894741914286259542454077972e-1',
+          21: '2.06229397329351940783526485701104894741914286259542454077972e-1',
+          22: '1.70561346241752182382120338553874085887555487802790804737501e-1',
+          23: '1.0535211357175301969149603288787816222767308308052388404167e-1',
+          24: '-33/512',
+          25: '-15/256',
+          26: '-27/512',
+          27: '-3/64',
+          28: '-21/512',
+          29: '-9/256',
+          30: '-15/512',
+          31: '-3/128',
+          32: '-9/512',
+          33: '-3/256',
+          34: '-3/512',
+          35: '1.78571428571428571428571428571428571428571428571428571428571e-2'},
+    'd': {1: '1.78571428571428571428571428571428571428571428571428571428571e-2',
+          2: '311/64000',
+          3: '3/256',
+          5: '9/512',
+          7: '3/128',
+          8: '15/512',
+          10: '9/256',
+          11: '21/512',
+          12: '3/64',
+          14: '27/512',
+          15: '15/256',
+          16: '33/512',
+          18: '1.0535211357175301969149603288787816222767308308052388404167e-1',
+          19: '1.70561346241752182382120338553874085887555487802790804737501e-1',
+          20: '2.06229397329351940783526485701104894741914286259542454077972e-1',
+          21: '2.06229397329351940783526485701104894741914286259542454077972e-1',
+          22: '1.70561346241752182382120338553874085887555487802790804737501e-1',
+          23: '1.0535211357175301969149603288787816222767308308052388404167e-1',
+          24: '-33/512',
+          25: '-15/256',
+          26: '-27/512',
+          27: '-3/64',
+          28: '-21/512',
+          29: '-9/256',
+          30: '-15/512',
+          31: '-3/128',
+          32: '-9/512',
+          33: '-3/256',
+          34: '-311/64000',
+          35: '1.78571428571428571428571428571428571428571428571428571428571e-2'},
+    }
@@ -0,0 +1,152 @@
+!*****************************************************************************************
+!>
+!  Derivative function with a C interface, for [[rk_test_c_interface]].
+
+    module rk_test_c_interface_module
+
+    use iso_c_binding
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    contains
+
+        subroutine oscillator(n,t,x,xdot,data) bind(c)
+            !! harmonic oscillator, with the frequency in `data`
+            integer(c_int),value :: n
+            real(c_double),value :: t
+            real(c_double),dimension(n),intent(in) :: x
+            real(c_double),dimension(n),intent(out) :: xdot
+            type(c_ptr),value :: data
+            real(wp),pointer :: omega
+            call c_f_pointer(data, omega)
+            xdot = [x(2), -omega**2*x(1)]
+        end subroutine oscillator
+
+    end module rk_test_c_interface_module
+!*****************************************************************************************
+
+!*****************************************************************************************
+!>
+!  Unit test for the C interface ([[rklib_c_module]]).
+
+    program rk_test_c_interface
+
+    use iso_c_binding
+    use rklib_module, wp => rk_module_rk
+    use rklib_c_module
+    use rk_test_c_interface_module
+
+    implicit none
+
+    integer,parameter :: n = 2 !! number of state variables
+    integer,parameter :: m = 5 !! number of initial states in the batch
+    integer,parameter :: nt = 11 !! number of output times
+    real(wp),parameter :: tol = 1.0e-12_wp
+    real(wp),parameter :: max_err = 1.0e-9_wp
+
+    real(wp),target :: omega
+    type(c_ptr) :: s
+    character(kind=c_char,len=32) :: name
+    character(kind=c_char,len=64) :: message
+    integer :: i, j, num_methods
+    integer(c_int) :: istatus
+    integer(c_int),dimension(m) :: istatus_batch
+    real(wp),dimension(n) :: x0, xf
+    real(wp),dimension(n,m) :: x0_batch, xf_batch
+    real(wp),dimension(m) :: t0_batch, tf_batch
+    real(wp),dimension(nt) :: tout
+    real(wp),dimension(n,nt) :: xout
+
+    write(*,*) ''
+    write(*,*) '---------------------'
+    write(*,*) ' rk_test_c_interface'
+    write(*,*) '---------------------'
+    write(*,*) ''
+
+    if (rklib_c_real_size() /= storage_size(1.0_wp)/8) error stop 'wrong real size'
+
+    ! list of the methods:
+    num_methods = 0
+    do i = 1, 1000
+        if (rklib_c_method_name(int(i,c_int), name, len(name,c_int)) == 0) exit
+        num_methods = num_methods + 1
+    end do
+    if (num_methods == 0) error stop 'no methods'
+    if (rklib_c_method_name(1_c_int, name, len(name,c_int)) /= 5 .or. name(1:6) /= 'euler'//c_null_char) &
+        error stop 'wrong name of the first method'
+    write(*,'(A,I0,A)') 'methods: ', num_methods, ', first: '//name(1:5)
+
+    ! unknown method:
+    s = rklib_c_create('unknown'//c_null_char, int(n,c_int), c_funloc(oscillator), c_null_ptr, tol, tol)
+    if (c_associated(s)) error stop 'an unknown method was created'
+
+    omega = 2.0_wp
+    x0 = [1.0_wp, 0.0_wp]
+
+    ! single integration:
+    s = rklib_c_create('rkdp54'//c_null_char, int(n,c_int), c_funloc(oscillator), c_loc(omega), tol, tol)
+    if (.not. c_associated(s)) error stop 'rkdp54 was not created'
+    istatus = rklib_c_integrate(s, 0.0_wp, x0, 0.0_wp, 10.0_wp, xf)
+    if (istatus /= RKLIB_ERROR_NONE) error stop 'integration failed'
+    if (rklib_c_evaluations(s) <= 0) error stop 'wrong number of evaluations'
+    if (rklib_c_status_message(s, message, len(message,c_int)) /= 7) error stop 'wrong status message'
+    write(*,'(A,ES12.4)') 'rkdp54 single error: ', maxval(abs(xf - solution(10.0_wp)))
+    if (maxval(abs(xf - solution(10.0_wp))) > max_err) error stop 'inaccurate integration'
+
+    ! batch (the initial states are points of the same solution):
+    do j = 1, m
+        t0_batch(j) = real(j,wp)
+        tf_batch(j) = 10.0_wp + real(j,wp)
+        x0_batch(:,j) = solution(t0_batch(j))
+    end do
+    if (rklib_c_integrate_batch(s, int(m,c_int), t0_batch, x0_batch, 0.0_wp, tf_batch, &
+                                xf_batch, istatus_batch) /= 0) error stop 'batch integration failed'
+    do j = 1, m
+        if (istatus_batch(j) /= RKLIB_ERROR_NONE) error stop 'wrong batch status'
+        if (maxval(abs(xf_batch(:,j) - solution(tf_batch(j)))) > max_err) error stop 'inaccurate batch integration'
+    end do
+
+    ! dense output:
+    tout = [(real(i,wp), i = 0, nt-1)]
+    istatus = rklib_c_integrate_dense(s, 0.0_wp, x0, 0.0_wp, int(nt,c_int), tout, xout)
+    if (istatus /= RKLIB_ERROR_NONE) error stop 'dense integration failed'
+    do i = 1, nt
+        if (maxval(abs(xout(:,i) - solution(tout(i)))) > max_err) error stop 'inaccurate dense output'
+    end do
+    call rklib_c_destroy(s)
+
+    ! fixed-step method (without dense output):
+    s = rklib_c_create('rk4'//c_null_char, int(n,c_int), c_funloc(oscillator), c_loc(omega), tol, tol)
+    istatus = rklib_c_integrate(s, 0.0_wp, x0, 0.001_wp, 10.0_wp, xf)
+    write(*,'(A,ES12.4)') 'rk4 single error: ', maxval(abs(xf - solution(10.0_wp)))
+    if (istatus /= RKLIB_ERROR_NONE .or. maxval(abs(xf - solution(10.0_wp))) > max_err) &
+        error stop 'rk4 integration failed'
+    istatus = rklib_c_integrate_dense(s, 0.0_wp, x0, 0.001_wp, int(nt,c_int), tout, xout)
+    if (istatus /= RKLIB_ERROR_NO_DENSE_OUTPUT) error stop 'expecting no dense output'
+    call rklib_c_destroy(s)
+
+    ! a NULL handle is an error:
+    s = c_null_ptr
+    if (rklib_c_integrate(s, 0.0_wp, x0, 0.0_wp, 10.0_wp, xf) /= RKLIB_ERROR_INVALID_HANDLE) &
+        error stop 'expecting an invalid handle (single)'
+    i = rklib_c_integrate_batch(s, int(m,c_int), t0_batch, x0_batch, 0.0_wp, tf_batch, xf_batch, istatus_batch)
+    if (i /= m .or. any(istatus_batch /= RKLIB_ERROR_INVALID_HANDLE)) &
+        error stop 'expecting an invalid handle (batch)'
+    if (rklib_c_integrate_dense(s, 0.0_wp, x0, 0.0_wp, int(nt,c_int), tout, xout) /= &
+        RKLIB_ERROR_INVALID_HANDLE) error stop 'expecting an invalid handle (dense)'
+    if (rklib_c_evaluations(s) /= 0) error stop 'expecting no evaluations'
+    i = rklib_c_status_message(s, message, len(message,c_int))
+    if (i /= 0 .or. message(1:1) /= c_null_char) error stop 'expecting an empty status message'
+    call rklib_c_destroy(s)
+
+    contains
+
+        pure function solution(t) result(x)
+            real(wp),intent(in) :: t
+            real(wp),dimension(n) :: x
+            x = [cos(omega*t), -omega*sin(omega*t)]
+        end function solution
+
+    end program rk_test_c_interface
+!*****************************************************************************************
@@ -0,0 +1,129 @@
+!*****************************************************************************************
+!>
+!  Unit test for saving and restoring the state of an integration
+!  ([[save_state]], [[restore_state]] and [[resume]]).
+!
+!  An integration of the two-body problem is interrupted (by stopping it in the
+!  derivative function), and resumed from its last checkpoint with another integrator.
+!  The result must be the same as the one of the uninterrupted integration, bit for bit.
+
+    program rk_test_checkpoint
+
+    use rklib_module, wp => rk_module_rk
+    use iso_fortran_env, only: int8
+
+    implicit none
+
+    integer,parameter :: n = 4  !! number of state variables
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 50.0_wp
+    real(wp),parameter :: t_stop = 23.0_wp !! time when the first integration is stopped
+    real(wp),parameter :: tol = 1.0e-10_wp
+    character(len=*),parameter :: file = 'rk_test_checkpoint.bin'
+
+    type(rkdp54_class) :: s1, s2 !! a FSAL method
+    type(rk4_class) :: f1, f2
+    type(stepsize_class) :: sz
+    type(rklib_stats) :: stats1, stats2
+    real(wp),dimension(n) :: x0, xf_ref, xf
+    integer(int8),dimension(:),allocatable :: state, state2
+    integer :: istatus
+    integer :: iunit
+
+    write(*,*) ''
+    write(*,*) '--------------------'
+    write(*,*) ' rk_test_checkpoint'
+    write(*,*) '--------------------'
+    write(*,*) ''
+
+    x0 = [1.0_wp, 0.0_wp, 0.0_wp, 1.2_wp] ! an elliptic orbit
+    call sz%initialize(controller=RKLIB_CONTROLLER_PI, hmin=1.0e-10_wp)
+
+    ! variable step, uninterrupted:
+    call s1%initialize(n=n,f=twobody,rtol=[tol],atol=[tol],stepsize_method=sz)
+    call s1%integrate(t0,x0,0.0_wp,tf,xf_ref)
+    if (s1%failed()) error stop 'integration failed'
+    stats1 = s1%statistics()
+
+    ! interrupted, with a checkpoint every 10 steps:
+    call s1%initialize(n=n,f=twobody_stop,rtol=[tol],atol=[tol],stepsize_method=sz,&
+                       checkpoint_file=file,checkpoint_rate=10)
+    call s1%integrate(t0,x0,0.0_wp,tf,xf)
+
+    ! resumed from the checkpoint file, with another integrator:
+    call s2%initialize(n=n,f=twobody,rtol=[tol],atol=[tol],stepsize_method=sz)
+    call s2%read_state(file)
+    if (s2%failed()) error stop 'could not read the state'
+
+    ! the restored state is saved again exactly (including the step size method):
+    call s2%save_state(state)
+    call s1%initialize(n=n,f=twobody,rtol=[tol],atol=[tol])
+    call s1%restore_state(state)
+    if (s1%failed()) error stop 'could not restore the state'
+    call s1%save_state(state2)
+    if (size(state2) /= size(state)) error stop 'the state does not round-trip'
+    if (any(state2 /= state)) error stop 'the state does not round-trip'
+
+    call s2%resume(xf)
+    if (s2%failed()) error stop 'resumed integration failed'
+    stats2 = s2%statistics()
+    write(*,*) 'variable step: steps = ', stats2%num_steps, ' evaluations = ', stats2%num_f_evals
+    if (any(xf /= xf_ref)) error stop 'the resumed integration is different (variable step)'
+    if (stats2%num_steps /= stats1%num_steps .or. &
+        stats2%num_rejected_steps /= stats1%num_rejected_steps .or. &
+        stats2%num_f_evals /= stats1%num_f_evals) error stop 'wrong counters after resuming'
+
+    ! the state can't be restored in another method:
+    call f2%initialize(n=n,f=twobody)
+    call f2%read_state(file)
+    call f2%status(istatus)
+    if (istatus /= RKLIB_ERROR_INVALID_STATE) error stop 'invalid state not detected'
+
+    ! fixed step, with the state saved in memory after the interruption:
+    call f1%initialize(n=n,f=twobody)
+    call f1%integrate(t0,x0,1.0e-3_wp,tf,xf_ref)
+    call f1%initialize(n=n,f=twobody_stop)
+    call f1%integrate(t0,x0,1.0e-3_wp,tf,xf)
+    call f1%save_state(state)
+    if (f1%failed()) error stop 'could not save the state'
+    call f2%initialize(n=n,f=twobody)
+    call f2%restore_state(state)
+    call f2%resume(xf)
+    if (f2%failed()) error stop 'resumed integration failed'
+    if (any(xf /= xf_ref)) error stop 'the resumed integration is different (fixed step)'
+    write(*,*) 'fixed step: OK'
+
+    ! a truncated state:
+    call f2%restore_state(state(1:size(state)-1))
+    call f2%status(istatus)
+    if (istatus /= RKLIB_ERROR_INVALID_STATE) error stop 'truncated state not detected'
+
+    open(newunit=iunit, file=file)
+    close(iunit, status='delete')
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        subroutine twobody(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            real(wp) :: r3
+            r3 = norm2(x(1:2))**3
+            xdot = [x(3), x(4), -x(1)/r3, -x(2)/r3]
+        end subroutine twobody
+
+        subroutine twobody_stop(me,t,x,xdot)
+            !! the same, but the integration is stopped at `t_stop` (as if the program was killed)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            call twobody(me,t,x,xdot)
+            if (t > t_stop) call me%stop()
+        end subroutine twobody_stop
+
+    end program rk_test_checkpoint
+!*****************************************************************************************
@@ -0,0 +1,114 @@
+!*****************************************************************************************
+!>
+!  Unit test for the continuation of an integration in segments
+!  ([[continue_integration]] and the `continuation` option).
+!
+!  An orbit of the two-body problem is propagated as 1000 short segments, with and
+!  without the continuation, and the total number of function evaluations are compared.
+
+    program rk_test_continuation
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 4  !! number of state variables
+    integer,parameter :: num_segments = 1000
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 50.0_wp
+    real(wp),parameter :: tol = 1.0e-10_wp
+
+    type(rkdp54_class) :: s
+    type(stepsize_class) :: sz
+    type(rklib_stats) :: stats
+    real(wp),dimension(n) :: x0, xf_ref, x_cold, x_warm, x_api
+    integer :: evals_cold, evals_warm, evals_api, fsal_misses
+    integer :: istatus
+    integer :: i
+
+    write(*,*) ''
+    write(*,*) '----------------------'
+    write(*,*) ' rk_test_continuation'
+    write(*,*) '----------------------'
+    write(*,*) ''
+
+    x0 = [1.0_wp, 0.0_wp, 0.0_wp, 1.2_wp] ! an elliptic orbit
+    call sz%initialize(controller=RKLIB_CONTROLLER_PI)
+
+    ! in one integration:
+    call s%initialize(n=n,f=twobody,rtol=[tol],atol=[tol],stepsize_method=sz)
+    call s%integrate(t0,x0,0.0_wp,tf,xf_ref)
+    call s%evaluations(num_f_evals=i)
+    write(*,*) 'one integration:       evaluations = ', i
+
+    ! each segment is a new integration:
+    evals_cold = 0
+    x_cold = x0
+    do i = 1, num_segments
+        call s%integrate(segment_time(i-1),x_cold,0.0_wp,segment_time(i),x_cold)
+        stats = s%statistics()
+        evals_cold = evals_cold + stats%num_f_evals
+    end do
+    write(*,*) 'segments:              evaluations = ', evals_cold
+
+    ! with the continuation option:
+    call s%initialize(n=n,f=twobody,rtol=[tol],atol=[tol],stepsize_method=sz,continuation=.true.)
+    evals_warm = 0
+    fsal_misses = 0
+    x_warm = x0
+    do i = 1, num_segments
+        call s%integrate(segment_time(i-1),x_warm,0.0_wp,segment_time(i),x_warm)
+        stats = s%statistics()
+        evals_warm = evals_warm + stats%num_f_evals
+        ! (the cache is only missed after a rejected step):
+        if (i > 1) fsal_misses = fsal_misses + stats%num_fsal_misses - stats%num_rejected_steps
+    end do
+    write(*,*) 'continued segments:    evaluations = ', evals_warm
+    if (s%failed()) error stop 'continued integration failed'
+    if (fsal_misses /= 0) error stop 'the FSAL cache was not used across the segments'
+    if (evals_warm > 2*evals_cold/3) error stop 'not enough evaluations saved'
+    if (maxval(abs(x_warm - xf_ref)) > 1.0e-7_wp) error stop 'inaccurate continued integration'
+    if (maxval(abs(x_cold - xf_ref)) > 1.0e-7_wp) error stop 'inaccurate segments'
+    write(*,*) 'errors: ', maxval(abs(x_cold - xf_ref)), maxval(abs(x_warm - xf_ref))
+
+    ! the same with continue_integration:
+    call s%initialize(n=n,f=twobody,rtol=[tol],atol=[tol],stepsize_method=sz)
+    call s%integrate(t0,x0,0.0_wp,segment_time(1),x_api)
+    stats = s%statistics()
+    evals_api = stats%num_f_evals
+    do i = 2, num_segments
+        call s%continue_integration(segment_time(i),x_api)
+        stats = s%statistics()
+        evals_api = evals_api + stats%num_f_evals
+    end do
+    if (evals_api /= evals_warm .or. any(x_api /= x_warm)) error stop 'continue_integration is different'
+
+    ! after a discontinuity, the state is invalidated:
+    call s%invalidate_continuation()
+    call s%continue_integration(tf+1.0_wp,x_api)
+    call s%status(istatus)
+    if (istatus /= RKLIB_ERROR_INVALID_STATE) error stop 'invalidated state not detected'
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        pure function segment_time(i) result(t)
+            !! the final time of segment `i`
+            integer,intent(in) :: i
+            real(wp) :: t
+            t = t0 + (tf-t0)*i/num_segments
+        end function segment_time
+
+        subroutine twobody(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            real(wp) :: r3
+            r3 = norm2(x(1:2))**3
+            xdot = [x(3), x(4), -x(1)/r3, -x(2)/r3]
+        end subroutine twobody
+
+    end program rk_test_continuation
+!*****************************************************************************************
@@ -0,0 +1,115 @@
+!*****************************************************************************************
+!>
+!  Unit test for the dense output.
+!
+!  Integrates the harmonic oscillator \( \ddot{x} = -x \) with [[integrate_dense]]
+!  and compares the interpolated states with the exact solution. The output times
+!  must not change the steps that are taken, so the number of steps is compared
+!  with a plain `integrate` call.
+
+    program rk_test_dense
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 2  !! number of state variables
+    integer,parameter :: m = 201 !! number of output times
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 10.0_wp
+    real(wp),parameter :: tol = 1.0e-10_wp !! integration tolerance
+    real(wp),parameter :: max_err = 1.0e-7_wp !! required accuracy of the interpolated states
+
+    class(rk_variable_step_class),allocatable :: s
+    real(wp),dimension(n) :: x0, xf
+    real(wp),dimension(m) :: tout
+    real(wp),dimension(n,m) :: xout
+    integer :: i
+
+    write(*,*) ''
+    write(*,*) '---------------'
+    write(*,*) ' rk_test_dense'
+    write(*,*) '---------------'
+    write(*,*) ''
+
+    x0 = [1.0_wp, 0.0_wp]
+    tout = [(t0 + (tf-t0)*real(i-1,wp)/real(m-1,wp), i = 1, m)]
+
+    allocate(rkdp54_class :: s); call run_test()
+    allocate(rkt54_class  :: s); call run_test()
+    allocate(rkv65e_class :: s); call run_test()
+    allocate(rkv65r_class :: s); call run_test()
+    allocate(rkdp85_class :: s); call run_test()
+    allocate(rkv89_class  :: s); call run_test()
+    allocate(rkv98e_class :: s); call run_test()
+
+    ! backwards:
+    allocate(rkdp54_class :: s)
+    call s%initialize(n=n,f=fun,rtol=[tol],atol=[tol])
+    call s%integrate_dense(tf,solution(tf),0.0_wp,tout(m:1:-1),xout)
+    if (s%failed()) error stop 'backward dense integration failed'
+    call check('rkdp54 (backward)', xout(:,m:1:-1))
+    deallocate(s)
+
+    ! output times in the wrong order:
+    allocate(rkdp54_class :: s)
+    call s%initialize(n=n,f=fun,rtol=[tol],atol=[tol])
+    call s%integrate_dense(t0,x0,0.0_wp,[1.0_wp, 0.5_wp, 2.0_wp],xout(:,1:3))
+    if (.not. s%failed()) error stop 'unordered output times not detected'
+    deallocate(s)
+
+    ! a method without dense output:
+    allocate(rkf45_class :: s)
+    call s%initialize(n=n,f=fun,rtol=[tol],atol=[tol])
+    call s%integrate_dense(t0,x0,0.0_wp,tout,xout)
+    if (.not. s%failed()) error stop 'missing dense output not detected'
+    deallocate(s)
+
+    contains
+
+        subroutine run_test()
+            type(rklib_properties) :: p
+            integer :: num_steps, num_steps_dense
+            p = s%properties()
+            if (p%dense_output_order <= 0) error stop 'method does not have dense output'
+            call s%initialize(n=n,f=fun,rtol=[tol],atol=[tol])
+            call s%integrate(t0,x0,0.0_wp,tf,xf)
+            call s%info(num_steps=num_steps)
+            call s%integrate_dense(t0,x0,0.0_wp,tout,xout)
+            if (s%failed()) error stop 'dense integration failed'
+            call s%info(num_steps=num_steps_dense)
+            if (num_steps /= num_steps_dense) error stop 'dense output changed the steps'
+            if (any(xout(:,m) /= xf)) error stop 'dense output changed the final state'
+            call check(p%short_name, xout)
+            deallocate(s)
+        end subroutine run_test
+
+        subroutine check(method, xout)
+            character(len=*),intent(in)        :: method
+            real(wp),dimension(n,m),intent(in) :: xout
+            real(wp) :: err
+            integer :: i
+            err = 0.0_wp
+            do i = 1, m
+                err = max(err, maxval(abs(xout(:,i) - solution(tout(i)))))
+            end do
+            write(*,'(A20,A,ES12.4)') method, ' : max error = ', err
+            if (err > max_err) error stop 'dense output is not accurate'
+        end subroutine check
+
+        pure function solution(t) result(x)
+            real(wp),intent(in) :: t
+            real(wp),dimension(n) :: x
+            x = [cos(t), -sin(t)]
+        end function solution
+
+        subroutine fun(me,t,x,xdot)
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),dimension(:),intent(out) :: xdot
+            xdot = [x(2), -x(1)]
+        end subroutine fun
+
+    end program rk_test_dense
+!*****************************************************************************************
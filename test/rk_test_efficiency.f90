@@ -0,0 +1,85 @@
+!*****************************************************************************************
+!>
+!  Unit test for the static analysis of the methods (the `principal_error_coefficient`
+!  and `imaginary_stability_boundary` properties, and [[rklib_recommended_method]]).
+!
+!  The recommended method for a tight tolerance must need fewer function evaluations
+!  on the two-body problem than a low order method.
+
+    program rk_test_efficiency
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 4  !! number of state variables
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 50.0_wp
+    real(wp),parameter :: tol = 1.0e-12_wp
+
+    type(rk4_class) :: s4
+    type(rkf45_class) :: s45
+    class(rk_class),allocatable :: s
+    type(rklib_properties) :: p, p_loose
+    character(len=:),allocatable :: name
+    real(wp),dimension(n) :: x0, xf
+    real(wp) :: cost
+    integer :: evals, evals_45
+
+    write(*,*) ''
+    write(*,*) '---------------------'
+    write(*,*) ' rk_test_efficiency'
+    write(*,*) '---------------------'
+    write(*,*) ''
+
+    ! the known values for the classical RK4 method:
+    p = s4%properties()
+    write(*,*) 'rk4: error coefficient = ', p%principal_error_coefficient, &
+               ' imaginary stability boundary = ', p%imaginary_stability_boundary
+    if (abs(p%principal_error_coefficient - 1.4505e-2_wp) > 1.0e-5_wp) error stop 'wrong error coefficient'
+    if (abs(p%imaginary_stability_boundary - sqrt(8.0_wp)) > 1.0e-3_wp) error stop 'wrong stability boundary'
+
+    ! the recommended methods:
+    call rklib_allocate(s, rklib_recommended_method(1.0e-3_wp))
+    if (.not. allocated(s)) error stop 'no method recommended'
+    p_loose = s%properties()
+    name = rklib_recommended_method(tol, cost)
+    call rklib_allocate(s, name)
+    if (.not. allocated(s)) error stop 'no method recommended'
+    p = s%properties()
+    write(*,*) 'recommended: ', p_loose%short_name, ' (1e-3), ', name, ' (1e-12), cost = ', cost
+    if (p%order < p_loose%order) error stop 'lower order method recommended for a tighter tolerance'
+    if (cost <= 0.0_wp) error stop 'wrong cost'
+
+    x0 = [1.0_wp, 0.0_wp, 0.0_wp, 1.2_wp] ! an elliptic orbit
+    select type (s)
+    class is (rk_variable_step_class)
+        call s%initialize(n=n,f=twobody,rtol=[tol],atol=[tol])
+        call s%integrate(t0,x0,0.0_wp,tf,xf)
+        if (s%failed()) error stop 'integration failed'
+        call s%evaluations(num_f_evals=evals)
+    class default
+        error stop 'not a variable-step method'
+    end select
+    call s45%initialize(n=n,f=twobody,rtol=[tol],atol=[tol])
+    call s45%integrate(t0,x0,0.0_wp,tf,xf)
+    call s45%evaluations(num_f_evals=evals_45)
+    write(*,*) 'evaluations: ', name, evals, ' rkf45', evals_45
+    if (evals >= evals_45) error stop 'the recommended method is not efficient'
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        subroutine twobody(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            real(wp) :: r3
+            r3 = norm2(x(1:2))**3
+            xdot = [x(3), x(4), -x(1)/r3, -x(2)/r3]
+        end subroutine twobody
+
+    end program rk_test_efficiency
+!*****************************************************************************************
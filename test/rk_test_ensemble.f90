@@ -0,0 +1,89 @@
+!*****************************************************************************************
+!>
+!  Unit test for the ensemble integration.
+!
+!  Integrates an ensemble of initial conditions of \( \dot{x} = -x \) and compares
+!  the results with the same cases integrated one at a time with `integrate`.
+!  The last member is stopped by the user function, to check the per-member status.
+
+    program rk_test_ensemble
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 2  !! number of state variables
+    integer,parameter :: m = 50 !! number of ensemble members
+    real(wp),parameter :: t_stop = 100.0_wp !! the user function stops the integration after this time
+
+    type(rk4_class)   :: s_fixed
+    type(rkdp54_class) :: s_variable
+    real(wp),dimension(m) :: t0, tf
+    real(wp),dimension(n,m) :: x0, xf, xf_serial
+    integer,dimension(m) :: istatus
+    integer :: j
+
+    write(*,*) ''
+    write(*,*) '------------------'
+    write(*,*) ' rk_test_ensemble'
+    write(*,*) '------------------'
+    write(*,*) ''
+
+    do j = 1, m
+        t0(j) = real(j-1,wp) / 10.0_wp
+        tf(j) = t0(j) + 1.0_wp + real(j,wp) / real(m,wp)
+        x0(:,j) = [real(j,wp), -1.0_wp / real(j,wp)]
+    end do
+    tf(m) = 2*t_stop
+
+    ! fixed-step:
+    call s_fixed%initialize(n=n,f=fun)
+    call s_fixed%integrate_ensemble(t0,x0,0.01_wp,tf,xf,istatus)
+    if (s_fixed%failed()) error stop 'ensemble integration failed'
+    do j = 1, m
+        call s_fixed%integrate(t0(j),x0(:,j),0.01_wp,tf(j),xf_serial(:,j))
+    end do
+    call check('rk4', xf, xf_serial, istatus)
+
+    ! variable-step:
+    call s_variable%initialize(n=n,f=fun,rtol=[1.0e-10_wp],atol=[1.0e-10_wp])
+    call s_variable%integrate_ensemble(t0,x0,0.0_wp,tf,xf,istatus)
+    if (s_variable%failed()) error stop 'ensemble integration failed'
+    do j = 1, m
+        call s_variable%integrate(t0(j),x0(:,j),0.0_wp,tf(j),xf_serial(:,j))
+    end do
+    call check('rkdp54', xf, xf_serial, istatus)
+
+    ! inconsistent sizes:
+    call s_variable%integrate_ensemble(t0(1:m-1),x0,0.0_wp,tf,xf,istatus)
+    if (.not. s_variable%failed()) error stop 'invalid ensemble sizes not detected'
+
+    contains
+
+        subroutine fun(me,t,x,xdot)
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),dimension(:),intent(out) :: xdot
+            if (t > t_stop) call me%stop()
+            xdot = -x
+        end subroutine fun
+
+        subroutine check(method, xf, xf_serial, istatus)
+            character(len=*),intent(in)         :: method
+            real(wp),dimension(n,m),intent(in)  :: xf, xf_serial
+            integer,dimension(m),intent(in)     :: istatus
+            real(wp) :: err
+            integer :: j
+            if (any(istatus(1:m-1) /= RKLIB_ERROR_NONE)) error stop 'ensemble member failed'
+            if (istatus(m) /= RKLIB_ERROR_USER_STOPPED) error stop 'ensemble member not stopped'
+            do j = 1, m-1
+                if (any(xf(:,j) /= xf_serial(:,j))) error stop 'ensemble result differs from serial result'
+            end do
+            err = maxval(abs(xf(:,1:m-1) - x0(:,1:m-1)*spread(exp(-(tf(1:m-1)-t0(1:m-1))),1,n)))
+            write(*,'(A10,A,ES12.4)') method, ' : max error = ', err
+            if (err > 1.0e-6_wp) error stop 'ensemble result is not accurate'
+        end subroutine check
+
+    end program rk_test_ensemble
+!*****************************************************************************************
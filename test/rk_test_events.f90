@@ -0,0 +1,170 @@
+!*****************************************************************************************
+!>
+!  Unit test for [[integrate_to_events]].
+!
+!  Integrates the harmonic oscillator \( \ddot{x} = -x \), with \( x(0) = 1 \), and
+!  tracks three event functions:
+!
+!  1. \( x \) (all crossings, at \( t = \pi/2 + k \pi \)),
+!  2. \( \dot{x} \) (only rising crossings, at \( t = (2k-1) \pi \)),
+!  3. \( t - t_{stop} \) (terminal).
+!
+!  The logged crossings are compared with the exact times and states. Also checks
+!  the number of function evaluations of the Hermite interpolant of a step.
+
+    program rk_test_events
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 2  !! number of state variables
+    integer,parameter :: m = 3  !! number of event functions
+    real(wp),parameter :: pi = acos(-1.0_wp)
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tmax = 100.0_wp
+    real(wp),parameter :: tstop = 20.0_wp   !! time of the terminal event
+    real(wp),parameter :: tol = 1.0e-12_wp  !! integration and root finding tolerance
+    real(wp),parameter :: max_err = 1.0e-7_wp !! required accuracy of the events
+    integer,dimension(m),parameter :: direction = [RKLIB_EVENT_BOTH, RKLIB_EVENT_RISING, RKLIB_EVENT_BOTH]
+    logical,dimension(m),parameter :: terminal = [.false., .false., .true.]
+
+    class(rk_class),allocatable :: s
+    real(wp),dimension(n) :: x0, xf
+    real(wp) :: tf
+    type(rklib_event),dimension(:),allocatable :: events
+
+    write(*,*) ''
+    write(*,*) '----------------'
+    write(*,*) ' rk_test_events'
+    write(*,*) '----------------'
+    write(*,*) ''
+
+    x0 = [1.0_wp, 0.0_wp]
+
+    allocate(rk8_10_class :: s); call run_test(.false.)
+    allocate(rk8_10_class :: s); call run_test(.true.)
+    allocate(rkdp54_class :: s); call run_test(.false.)
+    allocate(rkdp54_class :: s); call run_test(.true.)
+    allocate(rkv89_class  :: s); call run_test(.true.)
+    allocate(rk4_class    :: s); call hermite_test()
+
+    ! inconsistent sizes:
+    allocate(rkdp54_class :: s)
+    call initialize(.false.)
+    call s%integrate_to_events(t0,x0,0.1_wp,tmax,tol,g,direction,terminal(1:2),tf,xf,events)
+    if (.not. s%failed()) error stop 'invalid event arrays not detected'
+    deallocate(s)
+
+    contains
+
+        subroutine initialize(interpolate_events)
+            logical,intent(in) :: interpolate_events
+            select type (s)
+            class is (rk_fixed_step_class)
+                call s%initialize(n=n,f=fun,interpolate_events=interpolate_events)
+            class is (rk_variable_step_class)
+                call s%initialize(n=n,f=fun,rtol=[tol],atol=[tol],interpolate_events=interpolate_events)
+            end select
+        end subroutine initialize
+
+        subroutine run_test(interpolate_events)
+            logical,intent(in) :: interpolate_events
+            type(rklib_properties) :: p
+            integer :: i, k, num_f_evals, num_g_evals
+            real(wp) :: err, t_exact
+
+            p = s%properties()
+            call initialize(interpolate_events)
+            call s%integrate_to_events(t0,x0,0.1_wp,tmax,tol,g,direction,terminal,tf,xf,events)
+            if (s%failed()) error stop 'event integration failed'
+            call s%evaluations(num_f_evals,num_g_evals)
+
+            ! the crossings of x (6 before tstop), the rising ones of xdot (3),
+            ! and the terminal event:
+            if (size(events) /= 10) error stop 'wrong number of events'
+            if (count(events%index == 1) /= 6) error stop 'wrong number of x crossings'
+            if (any(events(2:)%t < events(:size(events)-1)%t)) error stop 'events are not in time order'
+            if (events(size(events))%index /= 3 .or. .not. events(size(events))%terminal) &
+                error stop 'the last event is not the terminal one'
+            if (tf /= events(size(events))%t) error stop 'final time is not the terminal event'
+
+            err = abs(tf - tstop)
+            err = max(err, maxval(abs(xf - solution(tf))))
+            k = 0
+            do i = 1, size(events)
+                select case (events(i)%index)
+                case (1)
+                    t_exact = pi/2.0_wp + pi*count(events(:i-1)%index == 1)
+                    if (events(i)%direction /= merge(RKLIB_EVENT_FALLING, RKLIB_EVENT_RISING, &
+                                                    mod(count(events(:i-1)%index == 1),2)==0)) &
+                        error stop 'wrong direction for x'
+                case (2)
+                    k = k + 1
+                    t_exact = real(2*k-1,wp)*pi
+                    if (events(i)%direction /= RKLIB_EVENT_RISING) error stop 'wrong direction for xdot'
+                case default
+                    t_exact = tstop
+                end select
+                err = max(err, abs(events(i)%t - t_exact))
+                err = max(err, maxval(abs(events(i)%x - solution(events(i)%t))))
+            end do
+
+            write(*,'(A20,L2,A,I6,A,I6,A,ES12.4)') p%short_name, interpolate_events, &
+                ' : f evals = ', num_f_evals, ', g evals = ', num_g_evals, ', max error = ', err
+            if (err > max_err) error stop 'events are not accurate'
+            deallocate(s)
+        end subroutine run_test
+
+        subroutine hermite_test()
+            !! the Hermite interpolant of the step that brackets the event reuses
+            !! its first stage, so it only evaluates the derivative at its end.
+            integer :: num_f_evals, num_steps
+            real(wp) :: gf
+            select type (s)
+            class is (rk_fixed_step_class)
+                call s%initialize(n=n,f=fun,g=gx,interpolate_events=.true.)
+                call s%integrate_to_event(t0,x0,0.01_wp,tmax,tol,tf,xf,gf)
+                if (s%failed()) error stop 'event integration failed'
+                call s%info(num_steps)
+                call s%evaluations(num_f_evals)
+                write(*,'(A20,A,I6,A,I6)') 'rk4', ' : f evals = ', num_f_evals, ', steps = ', num_steps
+                ! the steps, the end of the interpolant, and the step to the root:
+                if (num_f_evals /= 4*num_steps + 1 + 4) error stop 'the interpolant does not reuse the first stage'
+                if (abs(tf - pi/2) > max_err) error stop 'event is not accurate'
+            end select
+            deallocate(s)
+        end subroutine hermite_test
+
+        pure function solution(t) result(x)
+            real(wp),intent(in) :: t
+            real(wp),dimension(n) :: x
+            x = [cos(t), -sin(t)]
+        end function solution
+
+        subroutine fun(me,t,x,xdot)
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),dimension(:),intent(out) :: xdot
+            xdot = [x(2), -x(1)]
+        end subroutine fun
+
+        subroutine g(me,t,x,gv)
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),dimension(:),intent(out) :: gv
+            gv = [x(1), x(2), t - tstop]
+        end subroutine g
+
+        subroutine gx(me,t,x,g)
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),intent(out)              :: g
+            g = x(1)
+        end subroutine gx
+
+    end program rk_test_events
+!*****************************************************************************************
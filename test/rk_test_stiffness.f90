@@ -0,0 +1,124 @@
+!*****************************************************************************************
+!>
+!  Unit test for the stiffness detection (the `stiffness_test_rate` option).
+!
+!  The stiff problem is \( \dot{x} = -\lambda (x - \cos t) - \sin t \), with a large
+!  \( \lambda \), where the solution is \( x = \cos t \) (after a fast transient).
+!  The integration must be stopped with `RKLIB_ERROR_STIFF`. The harmonic oscillator is
+!  not stiff, and it must not be stopped.
+
+    program rk_test_stiffness
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    real(wp),parameter :: lambda = 1.0e4_wp !! the eigenvalue of the stiff problem
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 100.0_wp
+    real(wp),parameter :: tol = 1.0e-8_wp
+
+    type(rkdp54_class) :: s54 !! a FSAL method
+    type(rkdp87_class) :: s87 !! a method with an extra function evaluation for the test
+    type(rkf45_class) :: s45
+    type(rklib_stats) :: stats
+    type(rklib_properties) :: props
+    real(wp),dimension(1) :: xf
+    real(wp),dimension(2) :: xf2
+    real(wp) :: t_stop !! the time of the last reported point
+    real(wp) :: gf
+    integer :: istatus
+    integer :: num_steps_unstopped
+
+    write(*,*) ''
+    write(*,*) '--------------------'
+    write(*,*) ' rk_test_stiffness'
+    write(*,*) '--------------------'
+    write(*,*) ''
+
+    props = s54%properties()
+    write(*,*) 'rkdp54 real stability boundary: ', props%real_stability_boundary
+    if (.not. props%stiffness_detection) error stop 'rkdp54 should detect stiffness'
+
+    ! without the detection, the integration takes a lot of steps:
+    call s54%initialize(n=1,f=stiff,rtol=[tol],atol=[tol])
+    call s54%integrate(t0,[2.0_wp],0.0_wp,tf,xf)
+    if (s54%failed()) error stop 'integration failed'
+    call s54%info(num_steps=num_steps_unstopped)
+    write(*,*) 'rkdp54, no detection: steps = ', num_steps_unstopped
+
+    ! with the detection (the last point is reported):
+    call s54%initialize(n=1,f=stiff,rtol=[tol],atol=[tol],report=report,stiffness_test_rate=10)
+    call s54%integrate(t0,[2.0_wp],0.0_wp,tf,xf)
+    call s54%status(istatus)
+    stats = s54%statistics()
+    write(*,*) 'rkdp54: stopped at t = ', t_stop, ' steps = ', stats%num_steps, &
+               ' h*lambda = ', stats%stiffness_estimate
+    if (istatus /= RKLIB_ERROR_STIFF) error stop 'stiffness not detected (rkdp54)'
+    if (stats%num_stiff_steps < 15) error stop 'stopped too early'
+    if (stats%num_steps > num_steps_unstopped/10) error stop 'stopped too late'
+    if (t_stop >= tf .or. abs(xf(1) - cos(t_stop)) > 1.0e-6_wp) error stop 'wrong last point'
+
+    ! a method without a FSAL stage, and the number of stiff steps:
+    call s87%initialize(n=1,f=stiff,rtol=[tol],atol=[tol],stiffness_test_rate=1,max_stiff_steps=5)
+    call s87%integrate(t0,[2.0_wp],0.0_wp,tf,xf)
+    call s87%status(istatus)
+    stats = s87%statistics()
+    write(*,*) 'rkdp87: steps = ', stats%num_steps, ' h*lambda = ', stats%stiffness_estimate
+    if (istatus /= RKLIB_ERROR_STIFF) error stop 'stiffness not detected (rkdp87)'
+    if (stats%num_stiff_steps < 5) error stop 'stopped too early'
+
+    ! with an event that is not reached:
+    call s45%initialize(n=1,f=stiff,g=never,rtol=[tol],atol=[tol],stiffness_test_rate=1)
+    call s45%integrate_to_event(t0,[2.0_wp],0.0_wp,tf,tol,t_stop,xf,gf)
+    call s45%status(istatus)
+    write(*,*) 'rkf45, event: stopped at t = ', t_stop
+    if (istatus /= RKLIB_ERROR_STIFF) error stop 'stiffness not detected (rkf45, event)'
+    if (t_stop >= tf) error stop 'wrong final time (rkf45, event)'
+
+    ! a problem that is not stiff:
+    call s54%initialize(n=2,f=oscillator,rtol=[tol],atol=[tol],stiffness_test_rate=1)
+    call s54%integrate(t0,[1.0_wp,0.0_wp],0.0_wp,tf,xf2)
+    if (s54%failed()) error stop 'non-stiff problem stopped'
+    stats = s54%statistics()
+    write(*,*) 'oscillator: tests = ', stats%num_stiffness_tests, ' stiff steps = ', stats%num_stiff_steps
+    if (stats%num_stiffness_tests /= stats%num_steps - 1) error stop 'wrong number of tests'
+    if (stats%num_stiff_steps /= 0) error stop 'non-stiff steps found stiff'
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        subroutine stiff(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            xdot = -lambda*(x - cos(t)) - sin(t)
+        end subroutine stiff
+
+        subroutine oscillator(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            xdot = [x(2), -x(1)]
+        end subroutine oscillator
+
+        subroutine never(me,t,x,g)
+            class(rk_class),intent(inout)        :: me
+            real(wp),intent(in)                  :: t
+            real(wp),dimension(:),intent(in)     :: x
+            real(wp),intent(out)                 :: g
+            g = 1.0_wp
+        end subroutine never
+
+        subroutine report(me,t,x)
+            class(rk_class),intent(inout)        :: me
+            real(wp),intent(in)                  :: t
+            real(wp),dimension(:),intent(in)     :: x
+            t_stop = t
+        end subroutine report
+
+    end program rk_test_stiffness
+!*****************************************************************************************
@@ -0,0 +1,135 @@
+!*****************************************************************************************
+!>
+!  Unit test for the trajectory recorder ([[rklib_recorder]]).
+!
+!  Integrates the harmonic oscillator \( \ddot{x} = -x \) with the trajectory
+!  recorded in memory and in a file, and checks that they are the same (the file
+!  is read back with its header).
+
+    program rk_test_trajectory
+
+    use rklib_module, wp => rk_module_rk
+    use iso_fortran_env, only: int32, int64
+
+    implicit none
+
+    integer,parameter :: n = 2  !! number of state variables
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 100.0_wp
+    real(wp),parameter :: h = 1.0e-3_wp !! fixed step size (so that the file buffer is written several times)
+    character(len=*),parameter :: file = 'rk_test_trajectory.bin'
+
+    type(rk4_class) :: s
+    type(rkdp54_class) :: s2
+    type(rklib_stats) :: stats
+    real(wp),dimension(n) :: x0, xf
+    real(wp),dimension(:),allocatable :: t, t_file
+    real(wp),dimension(:,:),allocatable :: x, x_file
+    character(len=32) :: method
+    integer :: istatus
+    integer :: i
+
+    write(*,*) ''
+    write(*,*) '--------------------'
+    write(*,*) ' rk_test_trajectory'
+    write(*,*) '--------------------'
+    write(*,*) ''
+
+    x0 = [1.0_wp, 0.0_wp]
+
+    ! in memory:
+    call s%initialize(n=n,f=fun,record_trajectory=.true.)
+    call s%integrate(t0,x0,h,tf,xf)
+    if (s%failed()) error stop 'integration failed'
+    call s%trajectory(t,x)
+    write(*,*) 'number of records: ', size(t)
+    stats = s%statistics()
+    if (size(t) /= stats%num_steps + 1) error stop 'wrong number of records'
+    if (t(1) /= t0 .or. t(size(t)) /= tf) error stop 'wrong first or last time'
+    if (any(x(:,size(t)) /= xf)) error stop 'wrong last state'
+    if (maxval(abs(x(1,:) - cos(t))) > 1.0e-8_wp) error stop 'inaccurate trajectory'
+
+    ! in a file:
+    call s%initialize(n=n,f=fun,trajectory_file=file)
+    call s%integrate(t0,x0,h,tf,xf)
+    if (s%failed()) error stop 'integration failed'
+    call s%trajectory(t_file,x_file)
+    if (size(t_file) /= 0) error stop 'trajectory file also in memory'
+    call read_trajectory(t_file,x_file,method)
+    if (method /= 'rk4') error stop 'wrong method in the file'
+    if (size(t_file) /= size(t)) error stop 'wrong number of records in the file'
+    if (any(t_file /= t) .or. any(x_file /= x)) error stop 'wrong records in the file'
+
+    ! with a time interval between the records:
+    call s%initialize(n=n,f=fun,record_trajectory=.true.,trajectory_interval=1.0_wp)
+    call s%integrate(t0,x0,h,tf,xf)
+    call s%trajectory(t,x)
+    write(*,*) 'number of records (interval = 1): ', size(t)
+    if (size(t) < 100 .or. size(t) > 102) error stop 'wrong number of decimated records'
+    if (any(t(2:size(t)-1) - t(1:size(t)-2) < 1.0_wp - 10*h)) error stop 'records are too close'
+    if (t(size(t)) /= tf) error stop 'last point not recorded'
+
+    ! variable step, stopped by the user (the file must be finished anyway):
+    call s2%initialize(n=n,f=fun_stop,rtol=[1.0e-10_wp],atol=[1.0e-10_wp],trajectory_file=file)
+    call s2%integrate(t0,x0,0.0_wp,tf,xf)
+    call read_trajectory(t_file,x_file,method)
+    if (method /= 'rkdp54') error stop 'wrong method in the file'
+    write(*,*) 'number of records (stopped): ', size(t_file)
+    stats = s2%statistics()
+    if (size(t_file) /= stats%num_steps + 1) error stop 'wrong number of records in the file'
+    if (t_file(size(t_file)) > 1.0_wp) error stop 'wrong last record'
+
+    ! a file that cannot be written:
+    call s%initialize(n=n,f=fun,trajectory_file='no/such/directory/trajectory.bin')
+    call s%integrate(t0,x0,h,tf,xf)
+    call s%status(istatus)
+    if (istatus /= RKLIB_ERROR_TRAJECTORY_FILE) error stop 'file error not detected'
+    if (abs(xf(1) - cos(tf)) > 1.0e-8_wp) error stop 'integration not done'
+
+    open(newunit=i, file=file)
+    close(i, status='delete')
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        subroutine fun(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            xdot = [x(2), -x(1)]
+        end subroutine fun
+
+        subroutine fun_stop(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            xdot = [x(2), -x(1)]
+            if (t > 1.0_wp) call me%stop()
+        end subroutine fun_stop
+
+        subroutine read_trajectory(t,x,method)
+            !! read a trajectory file (and check its header)
+            real(wp),dimension(:),allocatable,intent(out) :: t
+            real(wp),dimension(:,:),allocatable,intent(out) :: x
+            character(len=32),intent(out) :: method
+            character(len=8) :: magic
+            integer(int32) :: version, real_size, nx, reserved
+            integer(int64) :: m
+            real(wp),dimension(:,:),allocatable :: records
+            integer :: iunit
+            open(newunit=iunit, file=file, access='stream', form='unformatted', status='old', action='read')
+            read(iunit) magic, version, real_size, nx, reserved, m, method
+            if (magic /= 'RKLIBTRJ' .or. version /= 1) error stop 'invalid trajectory file'
+            if (real_size /= storage_size(1.0_wp)/8 .or. nx /= n) error stop 'wrong header'
+            allocate(records(0:n,m))
+            read(iunit) records
+            close(iunit)
+            t = records(0,:)
+            x = records(1:,:)
+        end subroutine read_trajectory
+
+    end program rk_test_trajectory
+!*****************************************************************************************
@@ -0,0 +1,95 @@
+!*****************************************************************************************
+!>
+!  Unit test for the method auto-tuner ([[rklib_tune]]).
+!
+!  The two-body problem is tuned for an accuracy of `1e-8` (with the number of function
+!  evaluations as the cost, so the result is reproducible), and the result is saved in
+!  a cache file. The second call must return it from the cache.
+
+    program rk_test_tuner
+
+    use rklib_module, wp => rk_module_rk
+
+    implicit none
+
+    integer,parameter :: n = 4  !! number of state variables
+    real(wp),parameter :: t0 = 0.0_wp
+    real(wp),parameter :: tf = 10.0_wp
+    real(wp),parameter :: accuracy = 1.0e-8_wp
+    character(len=*),parameter :: file = 'rk_test_tuner.txt'
+
+    type(rklib_tuning) :: tuning, cached, other
+    type(stepsize_class) :: sz
+    class(rk_class),allocatable :: s
+    real(wp),dimension(n) :: x0, xf, xf_ref
+    integer :: iunit, evals
+
+    write(*,*) ''
+    write(*,*) '----------------'
+    write(*,*) ' rk_test_tuner'
+    write(*,*) '----------------'
+    write(*,*) ''
+
+    open(newunit=iunit, file=file)
+    close(iunit, status='delete')
+
+    x0 = [1.0_wp, 0.0_wp, 0.0_wp, 1.2_wp] ! an elliptic orbit
+
+    call rklib_tune('twobody e=0.44', twobody, t0, x0, tf, accuracy, tuning, &
+                    cache_file=file, minimize_time=.false.)
+    write(*,*) 'method = ', tuning%method, ' tol = ', tuning%tol, ' evaluations = ', tuning%num_f_evals
+    write(*,*) 'safety_factor = ', tuning%safety_factor, ' hfactor = ', tuning%hfactor_reject, &
+               tuning%hfactor_accept, ' p_exponent_offset = ', tuning%p_exponent_offset
+    if (tuning%method == '') error stop 'no method found'
+    if (tuning%from_cache) error stop 'the result should not be from the cache'
+    if (tuning%error > accuracy) error stop 'the accuracy is not reached'
+
+    ! another problem in the same file:
+    call rklib_tune('circular', twobody, t0, [1.0_wp, 0.0_wp, 0.0_wp, 1.0_wp], tf, accuracy, other, &
+                    cache_file=file, minimize_time=.false., xf_ref=[cos(tf), sin(tf), -sin(tf), cos(tf)])
+    if (other%method == '') error stop 'no method found (circular)'
+
+    ! from the cache:
+    call rklib_tune('twobody e=0.44', twobody, t0, x0, tf, accuracy, cached, cache_file=file)
+    if (.not. cached%from_cache) error stop 'the result should be from the cache'
+    if (cached%method /= tuning%method .or. cached%tol /= tuning%tol .or. &
+        cached%safety_factor /= tuning%safety_factor .or. &
+        cached%hfactor_reject /= tuning%hfactor_reject .or. &
+        cached%hfactor_accept /= tuning%hfactor_accept .or. &
+        cached%p_exponent_offset /= tuning%p_exponent_offset .or. &
+        cached%num_f_evals /= tuning%num_f_evals) error stop 'wrong result from the cache'
+
+    ! use the result:
+    call rklib_allocate(s, tuning%method)
+    call tuning%apply(sz)
+    select type (s)
+    class is (rk_variable_step_class)
+        call s%initialize(n=n,f=twobody,rtol=[tuning%tol],atol=[tuning%tol],stepsize_method=sz)
+        call s%integrate(t0,x0,0.0_wp,tf,xf)
+        call s%evaluations(num_f_evals=evals)
+        call s%initialize(n=n,f=twobody,rtol=[1.0e-13_wp],atol=[1.0e-13_wp])
+        call s%integrate(t0,x0,0.0_wp,tf,xf_ref)
+    end select
+    write(*,*) 'error = ', maxval(abs(xf - xf_ref))
+    if (evals /= tuning%num_f_evals) error stop 'the tuned integration is different'
+    if (maxval(abs(xf - xf_ref)) > accuracy) error stop 'the accuracy is not reached (tuned integration)'
+
+    open(newunit=iunit, file=file)
+    close(iunit, status='delete')
+
+    write(*,*) 'PASSED'
+
+    contains
+
+        subroutine twobody(me,t,x,xdot)
+            class(rk_class),intent(inout)         :: me
+            real(wp),intent(in)                   :: t
+            real(wp),dimension(:),intent(in)      :: x
+            real(wp),dimension(:),intent(out)     :: xdot
+            real(wp) :: r3
+            r3 = norm2(x(1:2))**3
+            xdot = [x(3), x(4), -x(1)/r3, -x(2)/r3]
+        end subroutine twobody
+
+    end program rk_test_tuner
+!*****************************************************************************************
@@ -316,7 +316,8 @@
     integer :: icase
     integer :: p_exponent_offset
     logical :: relative_err
-    real(wp) :: t0,tf,x0(n),dt,xf(n),x02(n),gf,tf_actual
+    real(wp) :: t0,tf,x0(n),dt,xf(n),x02(n),gf,tf_actual,tf_event
+    integer :: num_f_evals, num_g_evals
     real(wp) :: safety_factor, hfactor_accept
     real(wp) :: a,p,ecc,inc,raan,aop,tru
     real(wp),dimension(3) :: r,v
@@ -460,6 +461,27 @@
         write(*,'(A/,*(F15.6/))') 'Event func :',gf
         write(*,'(A,I5)') 'Function evaluations:', fevals
         !write(*,'(A,I5)') 'Number of rejected steps:',s2%num_rejected_steps
+        call s2%evaluations(num_f_evals,num_g_evals)
+        write(*,'(A,2I6)') 'f and g evaluations:', num_f_evals, num_g_evals
+        tf_event = tf_actual
+
+        write(*,*) ' Event test - using an interpolant of the step'
+
+        call s2%initialize(n=n,f=twobody,g=twobody_event,&
+                           rtol=[1.0e-12_wp],atol=[1.0e-12_wp],&
+                           stepsize_method=sz,&
+                           solver = root_method_brent,&
+                           interpolate_events = .true.)
+        call s2%integrate_to_event(t0,x0,dt,tf,tol,tf_actual,xf,gf)
+        call s2%status(ierr)
+        call s2%evaluations(num_f_evals,num_g_evals)
+
+        write(*,*) ''
+        write(*,'(A,I5)')         'ierr:       ',ierr
+        write(*,'(A/,*(F15.6/))') 'Final time: ',tf_actual
+        write(*,'(A/,*(F15.6/))') 'Event func :',gf
+        write(*,'(A,2I6)') 'f and g evaluations:', num_f_evals, num_g_evals
+        write(*,'(A,E20.12)') 'Difference in event time:', tf_actual - tf_event
 
     end select
 
@@ -2,6 +2,10 @@
 !*****************************************************************************************
 !>
 !  Unit tests for step size adjustment routines.
+!
+!  Also compares the controllers on the two-body problem: the PI and PID
+!  controllers must reject fewer steps, and use fewer function evaluations,
+!  than the elementary controller.
 
     program step_size_test
 
@@ -17,6 +21,15 @@
     integer                :: p      !! order of the method
     real(wp)               :: hnew   !! new step size
     logical                :: accept !! if the step is accepted
+    integer                :: ic     !! controller counter
+    type(rkdp54_class)     :: s_rkdp54
+    type(rkv65e_class)     :: s_rkv65e
+    type(rkv78_class)      :: s_rkv78
+    type(rkv89_class)      :: s_rkv89
+    integer,dimension(3)   :: num_rejected, num_f_evals !! totals for each controller
+    character(len=*),dimension(3),parameter :: controller_names = ['elementary','PI        ','PID       ']
+
+    real(wp),parameter :: mu = 398600.436233_wp !! Earth gravitational parameter (km^3/s^2)
 
     write(*,*) ''
     write(*,*) '---------------'
@@ -45,5 +58,65 @@
     call s2%compute_stepsize(1,h,tol,err,p,hnew,accept)
     write(*,*) 'accept_mode=2,relative_err=T : hnew = ', hnew
 
+    ! controller memory:
+    call s1%destroy()
+    call s1%initialize(controller=RKLIB_CONTROLLER_PI)
+    call s1%compute_stepsize(1,h,tol,err,p,hnew,accept)
+    if (accept) error stop 'step should be rejected'
+    h = hnew
+    call s1%compute_stepsize(1,h,tol,err/1000.0_wp,p,hnew,accept)
+    if (.not. accept .or. hnew > h) error stop 'step size should not increase after a rejected step'
+    write(*,*) 'controller=PI, after rejection : hnew = ', hnew
+
+    write(*,*) ''
+    write(*,'(A12,2A12)') 'controller', 'rejected', 'f evals'
+    do ic = RKLIB_CONTROLLER_ELEMENTARY, RKLIB_CONTROLLER_PID
+        num_rejected(ic) = 0
+        num_f_evals(ic) = 0
+        call run_controller_test(s_rkdp54,ic)
+        call run_controller_test(s_rkv65e,ic)
+        call run_controller_test(s_rkv78,ic)
+        call run_controller_test(s_rkv89,ic)
+        write(*,'(A12,2I12)') trim(controller_names(ic)), num_rejected(ic), num_f_evals(ic)
+    end do
+    if (any(num_rejected(2:) >= num_rejected(1))) error stop 'the controllers did not reduce the rejected steps'
+    if (any(num_f_evals(2:) >= num_f_evals(1))) error stop 'the controllers did not reduce the function evaluations'
+
+    contains
+
+        subroutine run_controller_test(s, controller)
+            !! integrate the two-body problem with a range of tolerances
+            class(rk_variable_step_class),intent(inout) :: s
+            integer,intent(in) :: controller
+            type(stepsize_class) :: sz
+            real(wp),dimension(6) :: x0, xf
+            real(wp) :: rtol
+            integer :: i, n_rejected, n_f_evals
+            x0 = [10000.0_wp,10000.0_wp,10000.0_wp,1.0_wp,2.0_wp,3.0_wp]
+            do i = 4, 11
+                rtol = 10.0_wp ** (-i)
+                call sz%initialize(controller=controller)
+                call s%initialize(n=6,f=twobody,rtol=[rtol],atol=[rtol],stepsize_method=sz)
+                call s%integrate(0.0_wp,x0,10.0_wp,100000.0_wp,xf)
+                if (s%failed()) error stop 'integration failed'
+                call s%info(num_rejected_steps=n_rejected)
+                call s%evaluations(n_f_evals)
+                num_rejected(controller) = num_rejected(controller) + n_rejected
+                num_f_evals(controller) = num_f_evals(controller) + n_f_evals
+            end do
+        end subroutine run_controller_test
+
+        subroutine twobody(me,t,x,xdot)
+            !! derivative routine for two-body orbit propagation
+            class(rk_class),intent(inout)     :: me
+            real(wp),intent(in)               :: t
+            real(wp),dimension(:),intent(in)  :: x
+            real(wp),dimension(:),intent(out) :: xdot
+            real(wp),dimension(3) :: r
+            r = x(1:3)
+            xdot(1:3) = x(4:6)
+            xdot(4:6) = -mu/norm2(r)**3 * r
+        end subroutine twobody
+
     end program step_size_test
 !*****************************************************************************************